@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+关键词自动机 - 由多组关键词预编译的Aho-Corasick匹配器，一次扫描返回命中的全部关键词组
+"""
+
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Mapping
+
+
+class KeywordMatcher:
+    """Aho-Corasick多模式匹配器
+
+    匹配语义与 `keyword in text.lower()` 相同（子串匹配、忽略大小写），
+    但无论有多少组关键词，每段文本只扫描一遍。
+    """
+
+    def __init__(self, groups: Mapping[str, Iterable[str]]):
+        """
+        构建自动机
+
+        Args:
+            groups: 关键词组名 -> 关键词列表，同一个关键词可以属于多个组
+        """
+        self.groups: Dict[str, FrozenSet[str]] = {
+            name: frozenset(keyword.lower() for keyword in keywords if keyword)
+            for name, keywords in groups.items()
+        }
+
+        # 字典树：每个状态的转移表、失败指针和到达该状态时命中的关键词组
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[FrozenSet[str]] = [frozenset()]
+
+        outputs: List[set] = [set()]
+        for name, keywords in self.groups.items():
+            for keyword in keywords:
+                state = 0
+                for char in keyword:
+                    next_state = self._goto[state].get(char)
+                    if next_state is None:
+                        next_state = len(self._goto)
+                        self._goto[state][char] = next_state
+                        self._goto.append({})
+                        self._fail.append(0)
+                        outputs.append(set())
+                    state = next_state
+                outputs[state].add(name)
+
+        # 按层构建失败指针，并把失败链上的输出合并进来，匹配时无需沿失败链收集
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                outputs[next_state] |= outputs[self._fail[next_state]]
+                queue.append(next_state)
+
+        self._output = [frozenset(names) for names in outputs]
+
+    def match(self, text: str) -> FrozenSet[str]:
+        """返回文本中命中的全部关键词组名"""
+        if not text:
+            return frozenset()
+
+        goto, fail, output = self._goto, self._fail, self._output
+        matched = set()
+        state = 0
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                matched |= output[state]
+        return frozenset(matched)
@@ -6,15 +6,95 @@ AI新闻累积更新系统 - 集成智能翻译引擎
 
 import os
 import json
-import urllib.request
 import urllib.parse
 import time
+import random
 import hashlib
+import inspect
+import multiprocessing
+import pickle
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from typing import Optional
+from translation.core import http_transport
+from translation.core.interfaces import TranslationResult
 from translation.services.enhanced_news_translator import EnhancedNewsTranslator
 from translation.services.siliconflow_translator import SiliconFlowTranslator
 from translation.services.baidu_translator import BaiduTranslator
 from translation.services.tencent_translator import TencentTranslator
+from translation.core.rate_limiter import RateLimiterRegistry
+from translation.core.circuit_breaker import CircuitBreakerConfig, CircuitBreakerRegistry
+from translation.core.cache_system import SmartTranslationCache
+from translation.core.cache_metrics import LatencyHistogram
+from translation.core.cache_warmup import extract_translation_pairs, iter_json_articles
+from news_index import ArticleIndex, title_hash
+from site_manifest import BuildManifest, content_hash
+from site_templates import DETAIL_ASSETS, DETAIL_PAGE
+from keyword_matcher import KeywordMatcher
+
+# 分类、重要性评分和分析模板选择使用的关键词组（匹配时忽略大小写）
+NEWS_KEYWORD_GROUPS = {
+    # 分类
+    'openai_gpt': ('openai', 'chatgpt', 'gpt'),
+    'google_gmail': ('google', 'gmail'),
+    'microsoft_copilot': ('microsoft', 'copilot'),
+    'meta': ('meta',),
+    'playstation': ('playstation', 'ps5', 'sony'),
+    'xbox': ('xbox', 'microsoft gaming'),
+    'nintendo': ('nintendo',),
+    'steam': ('steam', 'valve'),
+    'esports': ('esports',),
+    'crypto': ('bitcoin', 'cryptocurrency', 'crypto'),
+    'stock_trading': ('stock', 'market', 'trading'),
+    'fintech': ('fintech', 'finance'),
+    'blockchain': ('blockchain',),
+    'apple': ('apple',),
+    'google': ('google',),
+    'microsoft': ('microsoft',),
+    'innovation': ('startup', 'innovation'),
+    # 重要性评分
+    'major_event': ('breakthrough', 'revolutionary', 'major', 'launch'),
+    'flagship_ai': ('openai', 'gpt-5', 'gpt-4'),
+    'big_tech': ('google', 'microsoft', 'meta'),
+    # 分析模板
+    'openai_chatgpt': ('openai', 'chatgpt'),
+    'game_consoles': ('xbox', 'playstation', 'nintendo'),
+    'bitcoin_crypto': ('bitcoin', 'crypto'),
+    'stock_market': ('stock', 'market'),
+}
+
+# 启动时编译一次，每段文本只扫描一遍即可得到全部命中的关键词组
+NEWS_KEYWORDS = KeywordMatcher(NEWS_KEYWORD_GROUPS)
+
+def _render_detail_chunk(news_chunk):
+    """渲染一组详情页（可在工作进程中执行），返回 (HTML, 单页耗时秒数) 列表"""
+    rendered = []
+    for news in news_chunk:
+        start_time = time.perf_counter()
+        html = AINewsAccumulator._render_detail_page(news)
+        rendered.append((html, time.perf_counter() - start_time))
+    return rendered
+
+@dataclass
+class TranslationOutcome:
+    """一次降级翻译的结构化结果，替代实例上的共享状态"""
+    text: str
+    text_type: str
+    service_name: str = "none"
+    confidence: float = 0.0
+    method: str = "failed"  # ai_translation / rule_based / original_text / failed
+    elapsed_seconds: float = 0.0
+    attempts: int = 0
+    result: Optional[TranslationResult] = None
+    from_cache: bool = False  # 是否命中翻译缓存
+    
+    @property
+    def is_ai_translated(self):
+        """是否由翻译服务成功翻译"""
+        return self.result is not None
+
 
 class AINewsAccumulator:
     def __init__(self):
@@ -22,21 +102,204 @@ class AINewsAccumulator:
         self.gnews_api_key = os.getenv('GNEWS_API_KEY', 'c3cb6fef0f86251ada2b515017b97143')
         self.gnews_base_url = "https://gnews.io/api/v4"
         self.news_data_file = 'docs/news_data.json'
+        # 已发布文章的持久化索引（与新闻数据一起提交），合并时只处理新增和过期的文章
+        self.news_index_file = 'docs/news_index.json'
+        # 静态站点构建清单，记录各页面的内容哈希，只重新生成变化的页面
+        self.site_manifest_file = 'docs/build_manifest.json'
+        self.retention_days = int(os.getenv('NEWS_RETENTION_DAYS', '3'))
+        self.article_index = None
+        # 启动时用于预热翻译缓存的已发布数据
+        self.warmup_data_files = [
+            self.news_data_file,
+            'docs/enhanced_news_data.json',
+            'docs/enhanced_chinese_news_data.json'
+        ]
+        
+        # 新闻抓取配置
+        self.fetch_max_workers = int(os.getenv('GNEWS_FETCH_WORKERS', '5'))
+        self.fetch_time_budget = float(os.getenv('GNEWS_FETCH_BUDGET', '45'))  # 全局时间预算（秒）
+        self.fetch_category_deadline = 40  # 单个类别（含重试）的截止时间（秒）
+        
+        # 详情页渲染配置：进程数和每个任务渲染的页面数
+        # 预编译模板下单页渲染约几十微秒，启动进程池的开销通常更大，默认单进程渲染
+        self.render_max_workers = int(os.getenv('SITE_RENDER_WORKERS', '1'))
+        self.render_chunk_size = max(1, int(os.getenv('SITE_RENDER_CHUNK_SIZE', '500')))
         
         # 初始化翻译引擎
         self.siliconflow_api_key = os.getenv('SILICONFLOW_API_KEY')
         self.primary_translator = None
         self.fallback_translators = []
-        self._last_translation_result = None  # 存储最后的翻译结果用于元数据
+        
+        # 并行翻译配置：并发数和按服务商的每分钟请求上限
+        self.translation_max_workers = int(os.getenv('TRANSLATION_MAX_WORKERS', '6'))
+        self.translation_batch_size = int(os.getenv('TRANSLATION_BATCH_SIZE', '10'))  # 0表示禁用批量翻译
+        self.rate_limiters = RateLimiterRegistry()
+        self.rate_limiters.register('siliconflow', int(os.getenv('SILICONFLOW_RPM', '300')))
+        self.rate_limiters.register('baidu', int(os.getenv('BAIDU_RPM', '60')))
+        self.rate_limiters.register('tencent', int(os.getenv('TENCENT_RPM', '300')))
+        # 按翻译服务熔断，连续失败的服务在冷却期内直接跳过
+        self.circuit_breakers = CircuitBreakerRegistry(CircuitBreakerConfig(
+            failure_threshold=int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', '5')),
+            recovery_timeout=float(os.getenv('CIRCUIT_RECOVERY_SECONDS', '120'))
+        ))
         self._init_translation_engines()
         
+        # 翻译缓存：跨运行、跨类别复用已翻译的标题和描述
+        self.translation_cache = self._init_translation_cache()
+        self.translation_cache_fingerprint = self._get_translation_cache_fingerprint()
+        self.cache_stats = {'hits': 0, 'misses': 0, 'stored': 0}
+        self._warm_up_translation_cache()
+        
+    def _init_translation_cache(self):
+        """初始化多级翻译缓存（TRANSLATION_CACHE_ENABLED=0 时禁用）"""
+        if os.getenv('TRANSLATION_CACHE_ENABLED', '1') == '0':
+            print("⚠️ 翻译缓存已禁用")
+            return None
+        
+        cache_dir = os.getenv('TRANSLATION_CACHE_DIR', 'translation_cache')
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            cache = SmartTranslationCache({
+                'memory_cache_size': int(os.getenv('TRANSLATION_CACHE_MEMORY_SIZE', '5000')),
+                'file_cache_dir': os.path.join(cache_dir, 'files'),
+                'db_cache_path': os.path.join(cache_dir, 'translations.db'),
+                'cache_ttl_days': int(os.getenv('TRANSLATION_CACHE_TTL_DAYS', '30')),
+                # 并行翻译时不在工作线程中同步写盘，run()结束时close()写入剩余缓存项
+                'write_policy': SmartTranslationCache.WRITE_BEHIND,
+                'auto_cleanup': False
+            })
+            print(f"✅ 翻译缓存初始化成功（{cache_dir}）")
+            return cache
+        except Exception as e:
+            print(f"⚠️ 翻译缓存初始化失败，不使用缓存: {e}")
+            return None
+    
+    def _get_translation_cache_fingerprint(self):
+        """翻译缓存指纹：模型、提示词模板或术语词典变化后旧缓存惰性失效"""
+        parts = []
+        for translator in [self.primary_translator, *self.fallback_translators]:
+            if translator is None:
+                continue
+            if hasattr(translator, 'get_cache_fingerprint'):
+                parts.append(translator.get_cache_fingerprint())
+            else:
+                parts.append(getattr(translator, 'model', translator.get_service_name()))
+        # 提示词之外的改动（如后处理规则）可以手动提升版本号
+        parts.append(f"prompt-v{os.getenv('TRANSLATION_PROMPT_VERSION', '1')}")
+        return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()[:16]
+    
+    def _cache_namespace(self, text_type, category):
+        """缓存键的目标语言部分，区分字段类型和类别（影响提示词）"""
+        return f"zh|{text_type}|{category}"
+    
+    def _warm_up_translation_cache(self):
+        """用已发布的新闻数据预热翻译缓存（TRANSLATION_CACHE_WARMUP=0 时禁用）
+        
+        保留和重新抓取的文章直接命中内存缓存，不再重复翻译。
+        只预热当前指纹的译文；累积器第一次写入新闻数据之前，没有记录指纹的旧译文按当前指纹采用，
+        写入时由_stamp_legacy_fingerprints补记指纹，此后没有指纹的译文视为过时。
+        """
+        if not self.translation_cache or os.getenv('TRANSLATION_CACHE_WARMUP', '1') == '0':
+            return
+        
+        adopt_legacy = not self._fingerprints_recorded()
+        # 旧格式数据没有记录搜索类别，对所有类别都预热
+        categories = sorted({query['category'] for query in [*self._get_search_queries(), self._get_backup_ai_query()]})
+        
+        def iter_entries():
+            for path in self.warmup_data_files:
+                if not os.path.exists(path):
+                    continue
+                try:
+                    for article in iter_json_articles(path):
+                        for pair in extract_translation_pairs(article):
+                            fingerprint = pair.fingerprint
+                            if fingerprint is None and adopt_legacy:
+                                fingerprint = self.translation_cache_fingerprint
+                            # 指纹不同的译文不是来自当前模型和提示词，留给重新翻译
+                            if fingerprint != self.translation_cache_fingerprint:
+                                continue
+                            result = TranslationResult(
+                                original_text=pair.original_text,
+                                translated_text=pair.translated_text,
+                                source_language='en',
+                                target_language='zh',
+                                service_name=pair.service_name,
+                                confidence_score=pair.confidence,
+                                timestamp=datetime.now()
+                            )
+                            for category in ([pair.category] if pair.category is not None else categories):
+                                yield pair.original_text, result, 'en', self._cache_namespace(pair.text_type, category)
+                except (OSError, ValueError) as e:
+                    print(f"⚠️ 读取预热数据失败 {path}: {e}")
+        
+        start_time = time.monotonic()
+        try:
+            warmed = self.translation_cache.warm_up(iter_entries(), self.translation_cache_fingerprint)
+        except Exception as e:
+            print(f"⚠️ 翻译缓存预热失败: {e}")
+            return
+        if warmed:
+            print(f"🔥 翻译缓存预热 {warmed} 条（耗时 {time.monotonic() - start_time:.2f} 秒）")
+    
+    def _fingerprints_recorded(self):
+        """累积器是否已在新闻数据中写入过翻译指纹"""
+        if not os.path.exists(self.news_data_file):
+            return False
+        try:
+            return any(
+                isinstance(article.get('translation_metadata'), dict) and
+                article['translation_metadata'].get('cache_fingerprint')
+                for article in iter_json_articles(self.news_data_file)
+            )
+        except (OSError, ValueError):
+            return False
+    
+    def _stamp_legacy_fingerprints(self, news_items):
+        """给已发布数据中没有记录指纹的旧译文补记当前指纹
+        
+        只在累积器第一次写入新闻数据时发生，之后的预热就能使用这些译文；
+        修改模型或提示词后它们与其他译文一样按指纹过时。
+        """
+        stamped = 0
+        for item in news_items:
+            metadata = item.get('translation_metadata')
+            if isinstance(metadata, dict) and not metadata.get('cache_fingerprint'):
+                metadata['cache_fingerprint'] = self.translation_cache_fingerprint
+                stamped += 1
+        if stamped:
+            print(f"🏷️ 为 {stamped} 条旧译文补记翻译指纹")
+    
+    def _start_cache_rewarm(self):
+        """后台重新翻译访问最多的过时缓存项，避免修改提示词后缓存全部失效
+        
+        由run()在本次新文章翻译完成后调用，构造累积器本身不会启动后台线程。
+        """
+        limit = int(os.getenv('TRANSLATION_CACHE_REWARM_LIMIT', '50'))  # 0表示禁用
+        if not self.translation_cache or not self.primary_translator or limit <= 0:
+            return
+        
+        self.translation_cache.start_rewarm(self._rewarm_translate, self.translation_cache_fingerprint, limit)
+    
+    def _rewarm_translate(self, text, source_lang, target_lang):
+        """重新预热时的翻译回调，从缓存键的目标语言部分还原字段类型和类别"""
+        parts = target_lang.split('|')
+        if source_lang != 'en' or len(parts) != 3 or parts[0] != 'zh':
+            return None
+        
+        _, text_type, category = parts
+        outcome = self._translate_with_fallback(text, category, text_type)
+        return outcome.result if outcome.is_ai_translated else None
+    
     def _init_translation_engines(self):
         """初始化翻译引擎，实现多级降级处理"""
         try:
             # 主翻译器：增强版新闻翻译器（硅基流动）
+            # 各翻译器的每次HTTP请求（含重试和长描述分段）都向所属服务商的限流器申请令牌
             self.primary_translator = EnhancedNewsTranslator(
                 api_key=self.siliconflow_api_key,
-                model="Qwen/Qwen2.5-7B-Instruct"
+                model="Qwen/Qwen2.5-7B-Instruct",
+                rate_limiter=self.rate_limiters.get('siliconflow')
             )
             print("✅ 主翻译器（增强版新闻翻译器）初始化成功")
             
@@ -44,7 +307,8 @@ class AINewsAccumulator:
             try:
                 fallback1 = SiliconFlowTranslator(
                     api_key=self.siliconflow_api_key,
-                    model="meta-llama/Meta-Llama-3.1-8B-Instruct"
+                    model="meta-llama/Meta-Llama-3.1-8B-Instruct",
+                    rate_limiter=self.rate_limiters.get('siliconflow')
                 )
                 self.fallback_translators.append(fallback1)
                 print("✅ 备用翻译器1（标准硅基流动）初始化成功")
@@ -56,7 +320,8 @@ class AINewsAccumulator:
                 baidu_app_id = os.getenv('BAIDU_APP_ID')
                 baidu_secret_key = os.getenv('BAIDU_SECRET_KEY')
                 if baidu_app_id and baidu_secret_key:
-                    fallback2 = BaiduTranslator(baidu_app_id, baidu_secret_key)
+                    fallback2 = BaiduTranslator(baidu_app_id, baidu_secret_key,
+                                                rate_limiter=self.rate_limiters.get('baidu'))
                     self.fallback_translators.append(fallback2)
                     print("✅ 备用翻译器2（百度翻译）初始化成功")
                 else:
@@ -69,7 +334,8 @@ class AINewsAccumulator:
                 tencent_secret_id = os.getenv('TENCENT_SECRET_ID')
                 tencent_secret_key = os.getenv('TENCENT_SECRET_KEY')
                 if tencent_secret_id and tencent_secret_key:
-                    fallback3 = TencentTranslator(tencent_secret_id, tencent_secret_key)
+                    fallback3 = TencentTranslator(tencent_secret_id, tencent_secret_key,
+                                                  rate_limiter=self.rate_limiters.get('tencent'))
                     self.fallback_translators.append(fallback3)
                     print("✅ 备用翻译器3（腾讯翻译）初始化成功")
                 else:
@@ -81,103 +347,174 @@ class AINewsAccumulator:
             print(f"❌ 主翻译器初始化失败: {e}")
             self.primary_translator = None
         
-    def get_latest_news(self):
-        """获取最新科技、游戏、经济新闻"""
-        all_articles = []
-        
-        # 定义多个搜索类别 - 扩展到3天，增加数量
-        search_queries = [
+    def _get_search_queries(self):
+        """定义多个搜索类别 - 扩展到3天，增加数量"""
+        return [
             {
                 'query': 'AI OR OpenAI OR ChatGPT OR "artificial intelligence"',
                 'category': 'AI科技',
-                'max': '15'  # 增加AI新闻数量
+                'max': '15',  # 增加AI新闻数量
+                'retries': 3,  # AI科技重试3次
+                'timeout': 20
             },
             {
                 'query': 'gaming OR PlayStation OR Xbox OR Nintendo',
                 'category': '游戏科技', 
-                'max': '10'
+                'max': '10',
+                'retries': 1,
+                'timeout': 20
             },
             {
                 'query': 'stock OR bitcoin OR finance OR cryptocurrency',
                 'category': '经济金融',
-                'max': '10'
+                'max': '10',
+                'retries': 1,
+                'timeout': 20
             },
             {
                 'query': 'Apple OR Google OR Microsoft OR Meta OR technology',
                 'category': '科技创新',
-                'max': '10'
+                'max': '10',
+                'retries': 1,
+                'timeout': 20
             }
         ]
+    
+    def _get_backup_ai_query(self):
+        """AI科技备用搜索策略，主查询失败后才发出"""
+        return {
+            'query': 'OpenAI OR ChatGPT OR "artificial intelligence"',
+            'category': 'AI科技',
+            'max': '10',
+            'retries': 1,
+            'timeout': 15
+        }
+    
+    def _fetch_category(self, search_config, from_date, deadline):
+        """抓取单个类别的新闻
+        
+        Args:
+            search_config: 搜索配置
+            from_date: 起始日期（YYYY-MM-DD）
+            deadline: 该类别的截止时间（time.monotonic()时间点）
+        
+        Returns:
+            list: 带有search_category标记的文章列表，失败时抛出最后一次异常
+        """
+        params = {
+            'apikey': self.gnews_api_key,
+            'q': search_config['query'],
+            'lang': 'en',
+            'max': search_config['max'],
+            'sortby': 'publishedAt',
+            'from': from_date  # 添加时间范围：从3天前开始
+        }
+        url = f"{self.gnews_base_url}/search?{urllib.parse.urlencode(params)}"
+        max_retries = search_config.get('retries', 1)
+        last_error = None
         
-        for search_config in search_queries:
-            max_retries = 3 if search_config['category'] == 'AI科技' else 1  # AI科技重试3次
+        for attempt in range(max_retries):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
             
-            for attempt in range(max_retries):
-                try:
-                    # 计算3天前的日期
-                    from datetime import datetime, timedelta
-                    three_days_ago = (datetime.now() - timedelta(days=3)).strftime('%Y-%m-%d')
-                    
-                    params = {
-                        'apikey': self.gnews_api_key,
-                        'q': search_config['query'],
-                        'lang': 'en',
-                        'max': search_config['max'],
-                        'sortby': 'publishedAt',
-                        'from': three_days_ago  # 添加时间范围：从3天前开始
-                    }
-                    
-                    query_string = urllib.parse.urlencode(params)
-                    url = f"{self.gnews_base_url}/search?{query_string}"
-                    
-                    with urllib.request.urlopen(url, timeout=20) as response:  # 增加超时时间
-                        result = json.loads(response.read().decode('utf-8'))
-                    
-                    articles = result.get('articles', [])
-                    # 为每篇文章添加搜索类别标记
-                    for article in articles:
-                        article['search_category'] = search_config['category']
-                    
-                    all_articles.extend(articles)
-                    print(f"✅ {search_config['category']}获取 {len(articles)} 条新闻")
-                    break  # 成功获取，跳出重试循环
-                    
-                except Exception as e:
-                    if attempt < max_retries - 1:
-                        print(f"⚠️ {search_config['category']}第{attempt+1}次尝试失败，重试中...")
-                        time.sleep(2)  # 等待2秒后重试
-                    else:
-                        print(f"❌ 获取{search_config['category']}新闻失败: {str(e)}")
-                        
-                        # 如果是AI科技新闻失败，使用备用搜索
-                        if search_config['category'] == 'AI科技':
-                            try:
-                                print("🔄 尝试备用AI搜索策略...")
-                                backup_params = {
-                                    'apikey': self.gnews_api_key,
-                                    'q': 'OpenAI OR ChatGPT OR "artificial intelligence"',
-                                    'lang': 'en',
-                                    'max': '10',
-                                    'sortby': 'publishedAt',
-                                    'from': three_days_ago  # 备用策略也使用3天范围
-                                }
-                                backup_query = urllib.parse.urlencode(backup_params)
-                                backup_url = f"{self.gnews_base_url}/search?{backup_query}"
-                                
-                                with urllib.request.urlopen(backup_url, timeout=15) as backup_response:
-                                    backup_result = json.loads(backup_response.read().decode('utf-8'))
-                                
-                                backup_articles = backup_result.get('articles', [])
-                                for article in backup_articles:
-                                    article['search_category'] = 'AI科技'
-                                
-                                all_articles.extend(backup_articles)
-                                print(f"✅ AI科技备用策略获取 {len(backup_articles)} 条新闻")
-                            except:
-                                print("❌ AI科技备用策略也失败")
-                    continue
+            try:
+                # 单次请求超时不超过剩余时间，保证不会拖过截止时间；与翻译服务共享长连接池
+                timeout = min(search_config.get('timeout', 20), remaining)
+                with http_transport.urlopen(url, timeout=timeout) as response:
+                    result = json.loads(response.read().decode('utf-8'))
+                
+                articles = result.get('articles', [])
+                # 为每篇文章添加搜索类别标记
+                for article in articles:
+                    article['search_category'] = search_config['category']
+                return articles
+                
+            except Exception as e:
+                last_error = e
+                if attempt < max_retries - 1:
+                    # 带抖动的退避，避免多个类别同时重试
+                    delay = random.uniform(0.5, 1.5) * (attempt + 1)
+                    if time.monotonic() + delay >= deadline:
+                        break
+                    print(f"⚠️ {search_config['category']}第{attempt+1}次尝试失败，{delay:.1f}秒后重试...")
+                    time.sleep(delay)
+        
+        raise last_error or TimeoutError(f"{search_config['category']}超出截止时间")
+    
+    def get_latest_news(self):
+        """获取最新科技、游戏、经济新闻
         
-        print(f"✅ 总共获取 {len(all_articles)} 条最新新闻")
+        所有类别查询并发发出，每个类别有独立截止时间；AI科技主查询失败后才发出备用查询。
+        全局时间预算耗尽时返回已完成类别的部分结果。
+        """
+        all_articles = []
+        start_time = time.monotonic()
+        global_deadline = start_time + self.fetch_time_budget
+        category_deadline = min(start_time + self.fetch_category_deadline, global_deadline)
+        
+        # 计算3天前的日期
+        three_days_ago = (datetime.now() - timedelta(days=3)).strftime('%Y-%m-%d')
+        
+        search_queries = self._get_search_queries()
+        backup_query = self._get_backup_ai_query()
+        all_queries = search_queries + [backup_query]
+        backup_index = len(all_queries) - 1
+        
+        executor = ThreadPoolExecutor(max_workers=self.fetch_max_workers)
+        try:
+            future_to_index = {
+                executor.submit(self._fetch_category, query, three_days_ago, category_deadline): index
+                for index, query in enumerate(search_queries)
+            }
+            pending = set(future_to_index)
+            while pending:
+                remaining = global_deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = future_to_index[future]
+                    if index != backup_index and all_queries[index]['category'] == 'AI科技' and future.exception():
+                        # AI科技主查询失败，使用备用搜索策略
+                        print("🔄 尝试备用AI搜索策略...")
+                        backup_deadline = min(time.monotonic() + self.fetch_category_deadline, global_deadline)
+                        backup_future = executor.submit(self._fetch_category, backup_query,
+                                                        three_days_ago, backup_deadline)
+                        future_to_index[backup_future] = backup_index
+                        pending.add(backup_future)
+        finally:
+            # 不等待超出预算的请求，其超时已被截止时间限制
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        # 按类别顺序整理结果，保证输出顺序稳定
+        results = {}
+        for future, index in future_to_index.items():
+            query = all_queries[index]
+            if future in pending:
+                print(f"⏱️ {query['category']}超出时间预算，跳过")
+                continue
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                if index == backup_index:
+                    print("❌ AI科技备用策略也失败")
+                else:
+                    print(f"❌ 获取{query['category']}新闻失败: {str(e)}")
+        
+        for index, search_config in enumerate(search_queries):
+            if index in results:
+                articles = results[index]
+                all_articles.extend(articles)
+                print(f"✅ {search_config['category']}获取 {len(articles)} 条新闻")
+            elif search_config['category'] == 'AI科技' and backup_index in results:
+                # 如果是AI科技新闻失败，使用备用搜索结果
+                backup_articles = results[backup_index]
+                all_articles.extend(backup_articles)
+                print(f"✅ AI科技备用策略获取 {len(backup_articles)} 条新闻")
+        
+        elapsed = time.monotonic() - start_time
+        print(f"✅ 总共获取 {len(all_articles)} 条最新新闻（耗时 {elapsed:.1f} 秒）")
         return all_articles
     
     def load_existing_news(self):
@@ -223,14 +560,18 @@ class AINewsAccumulator:
     
     def translate_title(self, title, search_category=""):
         """使用AI智能翻译标题"""
+        return self._translate_title(title, search_category).text
+    
+    def _translate_title(self, title, search_category="", skip_primary=False):
+        """翻译标题，返回结构化翻译结果（skip_primary见_translate_with_fallback）"""
         if not title:
-            return "📰 科技资讯更新"
+            return TranslationOutcome(text="📰 科技资讯更新", text_type="title", method="rule_based")
         
         # 使用多级降级翻译策略
-        translated_title = self._translate_with_fallback(title, search_category, "title")
+        outcome = self._translate_with_fallback(title, search_category, "title", skip_primary=skip_primary)
         
         # 如果翻译失败，使用规则翻译作为最后保障
-        if not translated_title:
+        if not outcome.text:
             print(f"⚠️ 标题翻译完全失败，使用规则翻译: {title}")
             category_prefix = {
                 'AI科技': '🤖', 
@@ -238,19 +579,42 @@ class AINewsAccumulator:
                 '经济金融': '💰',
                 '科技创新': '💻'
             }.get(search_category, '📰')
-            # 清空翻译结果，标记为规则翻译
-            self._last_translation_result = None
-            return f"{category_prefix} {title}"
+            # 标记为规则翻译
+            outcome.text = f"{category_prefix} {title}"
+            outcome.method = "rule_based"
         
-        return translated_title
+        return outcome
+    
+    def _circuit_allows(self, translator):
+        """调用翻译器前检查熔断器"""
+        return self.circuit_breakers.allow_request(translator.get_service_name())
     
-    def _translate_with_fallback(self, text, category="", text_type="title", title_context=""):
-        """多级降级翻译策略"""
+    def _record_translator_result(self, translator, success, error=None):
+        """把实际调用结果反馈给熔断器"""
+        if success:
+            self.circuit_breakers.record_success(translator.get_service_name())
+        else:
+            self.circuit_breakers.record_failure(translator.get_service_name(), error)
+    
+    def _translate_with_fallback(self, text, category="", text_type="title", title_context="",
+                                 skip_primary=False):
+        """多级降级翻译策略
+        
+        Args:
+            skip_primary: 跳过主翻译器直接使用备用翻译器（主翻译器的批量请求刚刚失败时使用）
+        
+        Returns:
+            TranslationOutcome: 翻译结果，所有翻译器失败时text为空字符串
+        """
+        outcome = TranslationOutcome(text="", text_type=text_type)
         if not text or not text.strip():
-            return ""
+            return outcome
+        
+        start_time = time.monotonic()
         
-        # 尝试主翻译器（增强版新闻翻译器）
-        if self.primary_translator:
+        # 尝试主翻译器（增强版新闻翻译器），熔断中则直接跳过
+        if self.primary_translator and not skip_primary and self._circuit_allows(self.primary_translator):
+            outcome.attempts += 1
             try:
                 if text_type == "title" and hasattr(self.primary_translator, 'translate_news_title'):
                     result = self.primary_translator.translate_news_title(text, category)
@@ -261,42 +625,62 @@ class AINewsAccumulator:
                     result = self.primary_translator.translate_text(text)
                 
                 if not result.error_message and result.translated_text:
+                    self._record_translator_result(self.primary_translator, True)
                     print(f"✅ 增强版翻译器成功翻译{text_type}（置信度: {result.confidence_score:.3f}）")
-                    # 保存翻译结果的详细信息用于元数据
-                    self._last_translation_result = result
-                    return result.translated_text
+                    return self._complete_outcome(outcome, result, start_time)
                 else:
+                    self._record_translator_result(self.primary_translator, False, result.error_message)
                     print(f"⚠️ 增强版翻译器翻译{text_type}失败: {result.error_message}")
             except Exception as e:
+                self._record_translator_result(self.primary_translator, False, str(e))
                 print(f"⚠️ 增强版翻译器异常: {str(e)}")
         
         # 尝试备用翻译器
         for i, translator in enumerate(self.fallback_translators):
+            if not self._circuit_allows(translator):
+                continue
+            outcome.attempts += 1
             try:
                 result = translator.translate_text(text)
                 if not result.error_message and result.translated_text:
+                    self._record_translator_result(translator, True)
                     print(f"✅ 备用翻译器{i+1}成功翻译{text_type}（置信度: {result.confidence_score:.3f}）")
-                    # 保存备用翻译器的结果
-                    self._last_translation_result = result
-                    return result.translated_text
+                    return self._complete_outcome(outcome, result, start_time)
                 else:
+                    self._record_translator_result(translator, False, result.error_message)
                     print(f"⚠️ 备用翻译器{i+1}翻译{text_type}失败: {result.error_message}")
             except Exception as e:
+                self._record_translator_result(translator, False, str(e))
                 print(f"⚠️ 备用翻译器{i+1}异常: {str(e)}")
                 continue
         
         print(f"❌ 所有翻译器都失败，{text_type}翻译失败")
-        # 清空翻译结果
-        self._last_translation_result = None
-        return ""
+        outcome.elapsed_seconds = time.monotonic() - start_time
+        return outcome
+    
+    def _complete_outcome(self, outcome, result, start_time):
+        """用成功的翻译结果填充结构化结果"""
+        outcome.text = result.translated_text
+        outcome.service_name = result.service_name
+        outcome.confidence = result.confidence_score
+        outcome.method = "ai_translation"
+        outcome.elapsed_seconds = time.monotonic() - start_time
+        outcome.result = result
+        return outcome
     
     def _get_translation_metadata(self, original_title, original_description, 
-                                translated_title, translated_description, category):
-        """生成详细的翻译元数据"""
+                                translated_title, translated_description, category,
+                                title_outcome=None, description_outcome=None):
+        """生成详细的翻译元数据
+        
+        title_outcome/description_outcome为对应的TranslationOutcome，
+        提供实际使用的翻译服务、置信度和耗时。
+        """
         metadata = {
             "translation_time": datetime.now().isoformat(),
             "category": category,
             "translation_engine": "enhanced_news_translator",
+            "cache_fingerprint": self.translation_cache_fingerprint,
             "title_translation": {
                 "service": "none",
                 "confidence": 0.0,
@@ -305,7 +689,9 @@ class AINewsAccumulator:
                 "original_length": len(original_title) if original_title else 0,
                 "translated_length": len(translated_title) if translated_title else 0,
                 "is_ai_translated": False,
-                "translation_status": "failed"
+                "translation_status": "failed",
+                "translation_seconds": round(title_outcome.elapsed_seconds, 3) if title_outcome else 0.0,
+                "from_cache": bool(title_outcome and title_outcome.from_cache)
             },
             "description_translation": {
                 "service": "none", 
@@ -316,7 +702,9 @@ class AINewsAccumulator:
                 "translated_length": len(translated_description) if translated_description else 0,
                 "is_segmented": False,
                 "is_ai_translated": False,
-                "translation_status": "failed"
+                "translation_status": "failed",
+                "translation_seconds": round(description_outcome.elapsed_seconds, 3) if description_outcome else 0.0,
+                "from_cache": bool(description_outcome and description_outcome.from_cache)
             },
             "overall_quality": {
                 "average_confidence": 0.0,
@@ -340,14 +728,10 @@ class AINewsAccumulator:
                 metadata["title_translation"]["translation_status"] = "success"
                 title_success = True
                 
-                # 获取翻译服务信息
-                if self.primary_translator and hasattr(self.primary_translator, 'get_service_name'):
-                    service_name = self.primary_translator.get_service_name()
-                    metadata["title_translation"]["service"] = service_name
-                
-                # 使用实际的翻译结果置信度
-                if self._last_translation_result and hasattr(self._last_translation_result, 'confidence_score'):
-                    confidence = self._last_translation_result.confidence_score
+                # 使用实际的翻译服务和置信度
+                if title_outcome and title_outcome.is_ai_translated:
+                    metadata["title_translation"]["service"] = title_outcome.service_name
+                    confidence = title_outcome.confidence
                     metadata["title_translation"]["confidence"] = confidence
                     metadata["title_translation"]["quality_score"] = confidence
                 else:
@@ -373,18 +757,14 @@ class AINewsAccumulator:
                 metadata["description_translation"]["translation_status"] = "success"
                 description_success = True
                 
-                # 获取翻译服务信息
-                if self.primary_translator and hasattr(self.primary_translator, 'get_service_name'):
-                    service_name = self.primary_translator.get_service_name()
-                    metadata["description_translation"]["service"] = service_name
-                
                 # 检查是否为分段翻译
                 if '\n\n' in translated_description:
                     metadata["description_translation"]["is_segmented"] = True
                 
-                # 使用实际的翻译结果置信度
-                if self._last_translation_result and hasattr(self._last_translation_result, 'confidence_score'):
-                    confidence = self._last_translation_result.confidence_score
+                # 使用实际的翻译服务和置信度
+                if description_outcome and description_outcome.is_ai_translated:
+                    metadata["description_translation"]["service"] = description_outcome.service_name
+                    confidence = description_outcome.confidence
                     metadata["description_translation"]["confidence"] = confidence
                     metadata["description_translation"]["quality_score"] = confidence
                 else:
@@ -486,22 +866,29 @@ class AINewsAccumulator:
     
     def translate_description(self, description, title="", search_category=""):
         """使用AI智能翻译描述"""
+        return self._translate_description(description, title, search_category).text
+    
+    def _translate_description(self, description, title="", search_category="", skip_primary=False):
+        """翻译描述，返回结构化翻译结果（skip_primary见_translate_with_fallback）"""
         if not description:
-            return f"《原文无描述》相关{search_category or '科技'}资讯，详情请查看原文链接。"
+            return TranslationOutcome(
+                text=f"《原文无描述》相关{search_category or '科技'}资讯，详情请查看原文链接。",
+                text_type="description",
+                method="original_text"
+            )
         
         # 使用多级降级翻译策略，传递标题作为上下文
-        translated_description = self._translate_with_fallback(
-            description, search_category, "description", title
+        outcome = self._translate_with_fallback(
+            description, search_category, "description", title, skip_primary=skip_primary
         )
         
         # 如果翻译失败，返回原文标记
-        if not translated_description:
+        if not outcome.text:
             print(f"⚠️ 描述翻译完全失败，返回原文: {description[:50]}...")
-            # 清空翻译结果，标记为原文
-            self._last_translation_result = None
-            return f"《英文原文》 {description}"
+            outcome.text = f"《英文原文》 {description}"
+            outcome.method = "original_text"
         
-        return translated_description
+        return outcome
     
     def _generate_description_from_title(self, title, search_category):
         """从标题生成描述"""
@@ -522,59 +909,59 @@ class AINewsAccumulator:
         ]
         return generic_descriptions[title_hash]
     
-    def categorize_news(self, title, search_category=""):
-        """新闻分类"""
-        title_lower = title.lower()
+    def categorize_news(self, title, search_category="", matched_groups=None):
+        """新闻分类（matched_groups为标题已命中的关键词组，未提供时现场匹配）"""
+        matched = NEWS_KEYWORDS.match(title) if matched_groups is None else matched_groups
         
         # 基于搜索类别的精准分类
         if search_category == 'AI科技':
-            if 'openai' in title_lower or 'chatgpt' in title_lower or 'gpt' in title_lower:
+            if 'openai_gpt' in matched:
                 return {'name': 'OpenAI', 'color': '#34C759', 'icon': '🤖'}
-            elif 'google' in title_lower or 'gmail' in title_lower:
+            elif 'google_gmail' in matched:
                 return {'name': '谷歌AI', 'color': '#007AFF', 'icon': '🔍'}
-            elif 'microsoft' in title_lower or 'copilot' in title_lower:
+            elif 'microsoft_copilot' in matched:
                 return {'name': '微软AI', 'color': '#5856D6', 'icon': '💼'}
-            elif 'meta' in title_lower:
+            elif 'meta' in matched:
                 return {'name': 'Meta AI', 'color': '#1877F2', 'icon': '🌐'}
             else:
                 return {'name': 'AI科技', 'color': '#FF6B35', 'icon': '🤖'}
                 
         elif search_category == '游戏科技':
-            if any(word in title_lower for word in ['playstation', 'ps5', 'sony']):
+            if 'playstation' in matched:
                 return {'name': 'PlayStation', 'color': '#003087', 'icon': '🎮'}
-            elif any(word in title_lower for word in ['xbox', 'microsoft gaming']):
+            elif 'xbox' in matched:
                 return {'name': 'Xbox', 'color': '#107C10', 'icon': '🎯'}
-            elif 'nintendo' in title_lower:
+            elif 'nintendo' in matched:
                 return {'name': '任天堂', 'color': '#E60012', 'icon': '🎲'}
-            elif any(word in title_lower for word in ['steam', 'valve']):
+            elif 'steam' in matched:
                 return {'name': 'Steam', 'color': '#1B2838', 'icon': '🚂'}
-            elif 'esports' in title_lower:
+            elif 'esports' in matched:
                 return {'name': '电竞', 'color': '#FF6B35', 'icon': '🏆'}
             else:
                 return {'name': '游戏科技', 'color': '#9B59B6', 'icon': '🎮'}
                 
         elif search_category == '经济金融':
-            if any(word in title_lower for word in ['bitcoin', 'cryptocurrency', 'crypto']):
+            if 'crypto' in matched:
                 return {'name': '加密货币', 'color': '#F7931A', 'icon': '₿'}
-            elif any(word in title_lower for word in ['stock', 'market', 'trading']):
+            elif 'stock_trading' in matched:
                 return {'name': '股市', 'color': '#27AE60', 'icon': '📈'}
-            elif any(word in title_lower for word in ['fintech', 'finance']):
+            elif 'fintech' in matched:
                 return {'name': '金融科技', 'color': '#3498DB', 'icon': '💳'}
-            elif 'blockchain' in title_lower:
+            elif 'blockchain' in matched:
                 return {'name': '区块链', 'color': '#2C3E50', 'icon': '⛓️'}
             else:
                 return {'name': '经济金融', 'color': '#E67E22', 'icon': '💰'}
                 
         elif search_category == '科技创新':
-            if 'apple' in title_lower:
+            if 'apple' in matched:
                 return {'name': '苹果', 'color': '#000000', 'icon': '🍎'}
-            elif 'google' in title_lower:
+            elif 'google' in matched:
                 return {'name': '谷歌', 'color': '#4285F4', 'icon': '🔍'}
-            elif 'microsoft' in title_lower:
+            elif 'microsoft' in matched:
                 return {'name': '微软', 'color': '#00BCF2', 'icon': '💼'}
-            elif 'meta' in title_lower:
+            elif 'meta' in matched:
                 return {'name': 'Meta', 'color': '#1877F2', 'icon': '🌐'}
-            elif any(word in title_lower for word in ['startup', 'innovation']):
+            elif 'innovation' in matched:
                 return {'name': '创新', 'color': '#E74C3C', 'icon': '🚀'}
             else:
                 return {'name': '科技创新', 'color': '#95A5A6', 'icon': '💻'}
@@ -582,86 +969,329 @@ class AINewsAccumulator:
         # 默认分类
         return {'name': '科技资讯', 'color': '#6B7280', 'icon': '📱'}
     
-    def get_importance_score(self, title):
-        """重要性评分"""
-        title_lower = title.lower()
+    def get_importance_score(self, title, matched_groups=None):
+        """重要性评分（matched_groups为标题已命中的关键词组，未提供时现场匹配）"""
+        matched = NEWS_KEYWORDS.match(title) if matched_groups is None else matched_groups
         score = 1
         
         # 高重要性关键词
-        if any(word in title_lower for word in ['breakthrough', 'revolutionary', 'major', 'launch']):
+        if 'major_event' in matched:
             score += 3
-        if any(word in title_lower for word in ['openai', 'gpt-5', 'gpt-4']):
+        if 'flagship_ai' in matched:
             score += 2
-        if any(word in title_lower for word in ['google', 'microsoft', 'meta']):
+        if 'big_tech' in matched:
             score += 1
         
         return min(score, 5)
     
-    def merge_news_data(self, existing_news, new_articles):
-        """合并新旧新闻数据"""
-        # 创建现有新闻的URL映射
-        existing_urls = {news.get('url', ''): news for news in existing_news}
-        merged_news = []
-        added_count = 0
-        
-        # 首先添加新文章
-        for i, article in enumerate(new_articles):
-            article_url = article.get('url', '')
+    def _build_news_item(self, article, title_outcome, description_outcome):
+        """根据翻译结果构建单条新文章"""
+        search_category = article.get('search_category', '')
+        chinese_title = title_outcome.text
+        chinese_description = description_outcome.text
+        # 分类和重要性评分共用一次关键词匹配
+        matched_groups = NEWS_KEYWORDS.match(chinese_title)
+        
+        # 获取翻译元数据
+        translation_metadata = self._get_translation_metadata(
+            article.get('title', ''), 
+            article.get('description', ''),
+            chinese_title,
+            chinese_description,
+            search_category,
+            title_outcome,
+            description_outcome
+        )
+        
+        return {
+            "id": self.generate_news_id(article),
+            "title": chinese_title,
+            "original_title": article.get('title', ''),
+            "description": chinese_description,
+            "original_description": article.get('description', ''),
+            "url": article.get('url', ''),
+            "source": article.get('source', {}).get('name', '未知来源'),
+            "publishedAt": article.get('publishedAt', ''),
+            "image": article.get('image', ''),
+            "category": self.categorize_news(chinese_title, search_category, matched_groups),
+            "importance": self.get_importance_score(chinese_title, matched_groups),
+            "added_time": datetime.now().isoformat(),
+            "search_category": search_category,
+            "translation_metadata": translation_metadata  # 新增翻译元数据
+        }
+    
+    def _supports_batch_translation(self):
+        """主翻译器是否支持批量提示词模式"""
+        return (
+            self.translation_batch_size > 1 and
+            self.primary_translator is not None and
+            hasattr(self.primary_translator, 'translate_news_titles_batch') and
+            hasattr(self.primary_translator, 'translate_news_descriptions_batch')
+        )
+    
+    def _translate_batch_chunk(self, chunk, category, text_type):
+        """用一次批量请求翻译同类别的一组文章字段
+        
+        Args:
+            chunk: [(序号, 文章)]列表
+            category: 搜索类别
+            text_type: "title" 或 "description"
+        
+        Returns:
+            list: [(text_type, 序号, TranslationOutcome)]
+        """
+        start_time = time.monotonic()
+        titles = [article.get('title', '') for _, article in chunk]
+        
+        results = [None] * len(chunk)
+        batch_failed = True  # 批量请求未发出、异常或没有任何可用结果
+        if self._circuit_allows(self.primary_translator):
+            try:
+                # 失败条目不在翻译器内部逐条重试，由下面的降级链处理
+                if text_type == "title":
+                    results = self.primary_translator.translate_news_titles_batch(titles, category, fallback=False)
+                else:
+                    descriptions = [article.get('description', '') for _, article in chunk]
+                    results = self.primary_translator.translate_news_descriptions_batch(
+                        descriptions, titles, category, fallback=False
+                    )
+                batch_failed = not any(r is not None and not r.error_message for r in results)
+                self._record_translator_result(self.primary_translator, not batch_failed)
+                print(f"✅ {category}批量翻译{text_type} {len(chunk)} 条")
+            except Exception as e:
+                self._record_translator_result(self.primary_translator, False, str(e))
+                print(f"⚠️ {category}批量翻译{text_type}异常: {str(e)}")
+        
+        outcomes = []
+        for (index, article), result in zip(chunk, results):
+            if result is not None and not result.error_message and result.translated_text:
+                outcome = TranslationOutcome(text="", text_type=text_type, attempts=1)
+                outcome = self._complete_outcome(outcome, result, start_time)
+            else:
+                # 批量结果不可用时该条目走降级链；整批失败时主翻译器大概率仍不可用，直接使用备用翻译器。
+                # 带错误信息的结果来自主翻译器的单条路径（如长描述），同样不再重试主翻译器
+                skip_primary = batch_failed or result is not None
+                if text_type == "title":
+                    outcome = self._translate_title(article.get('title', ''), category, skip_primary=skip_primary)
+                else:
+                    outcome = self._translate_description(article.get('description', ''), article.get('title', ''),
+                                                          category, skip_primary=skip_primary)
+            outcomes.append((text_type, index, outcome))
+        
+        return outcomes
+    
+    def _translate_single_article_field(self, index, article, text_type):
+        """逐条翻译文章字段，返回[(text_type, 序号, TranslationOutcome)]"""
+        search_category = article.get('search_category', '')
+        if text_type == "title":
+            outcome = self._translate_title(article.get('title', ''), search_category)
+        else:
+            outcome = self._translate_description(
+                article.get('description', ''), article.get('title', ''), search_category
+            )
+        return [(text_type, index, outcome)]
+    
+    def _submit_translations(self, executor, articles, skip=()):
+        """提交所有文章的标题和描述翻译任务
+        
+        支持批量模式时，同类别文章按translation_batch_size分块合并请求；
+        空字段不参与批量，走逐条路径。skip中的 (text_type, 序号) 已有结果，不再提交。
+        """
+        futures = []
+        skip = set(skip)
+        
+        if not self._supports_batch_translation():
+            for index, article in enumerate(articles):
+                for text_type in ("title", "description"):
+                    if (text_type, index) in skip:
+                        continue
+                    futures.append(executor.submit(self._translate_single_article_field, index, article, text_type))
+            return futures
+        
+        for text_type in ("title", "description"):
+            field = 'title' if text_type == "title" else 'description'
+            chunks_by_category = {}
+            for index, article in enumerate(articles):
+                if (text_type, index) in skip:
+                    continue
+                if not article.get(field):
+                    futures.append(executor.submit(self._translate_single_article_field, index, article, text_type))
+                    continue
+                category = article.get('search_category', '')
+                chunks_by_category.setdefault(category, []).append((index, article))
             
-            # 检查是否已存在
-            if article_url not in existing_urls:
-                # 获取搜索类别
-                search_category = article.get('search_category', '')
-                
-                # 处理新文章
-                chinese_title = self.translate_title(article.get('title', ''), search_category)
-                chinese_description = self.translate_description(
-                    article.get('description', ''),
-                    article.get('title', ''),
-                    search_category
+            for category, items in chunks_by_category.items():
+                for start in range(0, len(items), self.translation_batch_size):
+                    chunk = items[start:start + self.translation_batch_size]
+                    futures.append(executor.submit(self._translate_batch_chunk, chunk, category, text_type))
+        
+        return futures
+    
+    def _lookup_cached_translations(self, articles):
+        """批量查询翻译缓存
+        
+        Returns:
+            dict: (text_type, 序号) -> 命中缓存的TranslationOutcome
+        """
+        if not self.translation_cache:
+            return {}
+        
+        # 按（字段, 类别）分组，每组一次批量查询
+        groups = {}
+        for index, article in enumerate(articles):
+            for text_type, field in (("title", 'title'), ("description", 'description')):
+                text = article.get(field)
+                if text and text.strip():
+                    groups.setdefault((text_type, article.get('search_category', '')), []).append((index, text))
+        
+        cached = {}
+        for (text_type, category), items in groups.items():
+            try:
+                found = self.translation_cache.get_cached_translations(
+                    [text for _, text in items], 'en', self._cache_namespace(text_type, category),
+                    self.translation_cache_fingerprint
                 )
+            except Exception as e:
+                print(f"⚠️ 查询翻译缓存失败: {e}")
+                found = {}
+            
+            for index, text in items:
+                entry = found.get(text)
+                if entry is None:
+                    self.cache_stats['misses'] += 1
+                    continue
                 
-                # 获取翻译元数据
-                translation_metadata = self._get_translation_metadata(
-                    article.get('title', ''), 
-                    article.get('description', ''),
-                    chinese_title,
-                    chinese_description,
-                    search_category
+                self.cache_stats['hits'] += 1
+                result = entry.translation_result
+                cached[(text_type, index)] = TranslationOutcome(
+                    text=result.translated_text,
+                    text_type=text_type,
+                    service_name=result.service_name,
+                    confidence=result.confidence_score,
+                    method="ai_translation",
+                    result=result,
+                    from_cache=True
                 )
-                
-                news_item = {
-                    "id": self.generate_news_id(article),
-                    "title": chinese_title,
-                    "original_title": article.get('title', ''),
-                    "description": chinese_description,
-                    "original_description": article.get('description', ''),
-                    "url": article_url,
-                    "source": article.get('source', {}).get('name', '未知来源'),
-                    "publishedAt": article.get('publishedAt', ''),
-                    "image": article.get('image', ''),
-                    "category": self.categorize_news(chinese_title, search_category),
-                    "importance": self.get_importance_score(chinese_title),
-                    "added_time": datetime.now().isoformat(),
-                    "search_category": search_category,
-                    "translation_metadata": translation_metadata  # 新增翻译元数据
-                }
-                merged_news.append(news_item)
-                added_count += 1
-        
-        # 然后添加保留的历史新闻（3天内）
-        retained_count = 0
-        for news in existing_news:
-            if self.is_news_recent(news.get('publishedAt'), days=3):
-                merged_news.append(news)
-                retained_count += 1
-        
-        # 按发布时间倒序排列
-        merged_news.sort(key=lambda x: x.get('publishedAt', ''), reverse=True)
+        
+        return cached
+    
+    def _store_translations(self, articles, title_outcomes, description_outcomes):
+        """将本次由翻译服务成功翻译的结果写入缓存"""
+        if not self.translation_cache:
+            return
+        
+        groups = {}
+        for index, article in enumerate(articles):
+            for text_type, field, outcome in (("title", 'title', title_outcomes[index]),
+                                              ("description", 'description', description_outcomes[index])):
+                if outcome is None or outcome.from_cache or not outcome.is_ai_translated:
+                    continue
+                namespace = self._cache_namespace(text_type, article.get('search_category', ''))
+                groups.setdefault(namespace, {})[article.get(field)] = outcome.result
+        
+        for namespace, translations in groups.items():
+            if self.translation_cache.cache_translations(translations, 'en', namespace,
+                                                         self.translation_cache_fingerprint):
+                self.cache_stats['stored'] += len(translations)
+    
+    def _process_new_articles(self, articles):
+        """使用有界线程池并行翻译新文章的标题和描述，结果按输入顺序返回"""
+        if not articles:
+            return []
+        
+        max_workers = max(1, min(self.translation_max_workers, len(articles) * 2))
+        mode = f"批量模式，每批 {self.translation_batch_size} 条" if self._supports_batch_translation() else "逐条模式"
+        print(f"🔄 并行处理 {len(articles)} 条新文章（并发数: {max_workers}，{mode}）")
+        
+        start_time = time.monotonic()
+        title_outcomes = [None] * len(articles)
+        description_outcomes = [None] * len(articles)
+        
+        # 先批量查询缓存，命中的字段不再请求翻译服务
+        cached = self._lookup_cached_translations(articles)
+        for (text_type, index), outcome in cached.items():
+            if text_type == "title":
+                title_outcomes[index] = outcome
+            else:
+                description_outcomes[index] = outcome
+        if cached:
+            print(f"💾 翻译缓存命中 {len(cached)} 个字段")
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # 标题和描述互不依赖（描述只使用原文标题作为上下文），全部同时提交
+            futures = self._submit_translations(executor, articles, skip=cached.keys())
+            for future in futures:
+                for text_type, index, outcome in future.result():
+                    if text_type == "title":
+                        title_outcomes[index] = outcome
+                    else:
+                        description_outcomes[index] = outcome
+        
+        self._store_translations(articles, title_outcomes, description_outcomes)
+        
+        # 按输入顺序（即发布时间顺序）重新组装
+        news_items = [
+            self._build_news_item(article, title_outcomes[i], description_outcomes[i])
+            for i, article in enumerate(articles)
+        ]
+        
+        print(f"✅ 新文章处理完成（耗时 {time.monotonic() - start_time:.1f} 秒）")
+        return news_items
+    
+    def _load_article_index(self, existing_news):
+        """读取文章索引，并与现有新闻数据对齐（只补充或移除不一致的文章）"""
+        index = ArticleIndex.load(self.news_index_file)
+        loaded_count = len(index)
+        changed = index.reconcile(existing_news)
+        if changed:
+            print(f"🗂️ 文章索引已同步: 读取 {loaded_count} 条，补充/移除 {changed} 条")
+        return index
+    
+    def merge_news_data(self, existing_news, new_articles):
+        """基于持久化文章索引增量合并新旧新闻数据
+        
+        新文章按URL和规范化标题去重；过期文章按发布时间从索引头部整段移除；
+        输出顺序直接取自索引，不再对全部新闻重新排序。
+        """
+        index = self._load_article_index(existing_news)
+        
+        # 筛选需要处理的新文章（同一批次中多个类别返回的重复文章只处理一次）
+        pending_articles = []
+        pending_urls = set()
+        pending_titles = set()
+        for article in new_articles:
+            article_url = article.get('url', '')
+            article_title = title_hash(article.get('title', ''))
+            if (article_url in pending_urls or article_title in pending_titles or
+                    index.find_duplicate(article_url, article.get('title', ''))):
+                continue
+            pending_urls.add(article_url)
+            pending_titles.add(article_title)
+            pending_articles.append(article)
+        
+        # 首先处理新文章，发布时间无法解析的不进入索引，排在本次输出末尾
+        news_by_id = {news.get('id'): news for news in existing_news}
+        unindexed_news = []
+        new_items = self._process_new_articles(pending_articles)
+        for news in new_items:
+            if index.add(news):
+                news_by_id[news['id']] = news
+            else:
+                unindexed_news.append(news)
+        added_count = len(new_items)
+        
+        # 然后移除超出保留期的历史新闻（is_news_recent的days天内即发布时间晚于days+1天前）
+        cutoff = time.time() - (self.retention_days + 1) * 86400
+        expired_count = len(index.expire(cutoff))
+        
+        merged_news = [news_by_id[news_id] for news_id in index.newest_first()]
+        merged_news.extend(unindexed_news)
+        retained_count = len(merged_news) - added_count
+        self.article_index = index
         
         print(f"📊 新闻合并完成:")
         print(f"   📈 新增新闻: {added_count} 条")
-        print(f"   📚 保留历史: {retained_count} 条")
+        print(f"   📚 保留历史: {retained_count} 条（过期移除 {expired_count} 条）")
         print(f"   📰 总计新闻: {len(merged_news)} 条")
         
         return merged_news
@@ -681,13 +1311,13 @@ class AINewsAccumulator:
         except:
             return datetime.now().strftime("%Y-%m-%d %H:%M")
     
-    def generate_ai_analysis(self, title, description):
-        """基于真实新闻内容生成AI观点分析"""
-        title_lower = title.lower()
-        desc_lower = description.lower() if description else ""
+    @staticmethod
+    def generate_ai_analysis(title, description, matched_groups=None):
+        """基于真实新闻内容生成AI观点分析（matched_groups为标题已命中的关键词组，未提供时现场匹配）"""
+        matched = NEWS_KEYWORDS.match(title) if matched_groups is None else matched_groups
         
         # 基于内容关键词生成针对性分析
-        if 'openai' in title_lower or 'chatgpt' in title_lower:
+        if 'openai_chatgpt' in matched:
             return f'''
         <div class="ai-analysis">
             <h4>🔬 OpenAI技术突破分析</h4>
@@ -702,7 +1332,7 @@ class AINewsAccumulator:
             <p>预计OpenAI将继续在多模态AI、专业领域应用等方向发力，同时面临来自谷歌、微软等巨头的激烈竞争。企业应关注AI工具的实际应用价值，避免盲目跟风。</p>
         </div>'''
         
-        elif 'google' in title_lower or 'gmail' in title_lower:
+        elif 'google_gmail' in matched:
             return f'''
         <div class="ai-analysis">
             <h4>🔬 谷歌AI战略布局</h4>
@@ -717,7 +1347,7 @@ class AINewsAccumulator:
             <p>谷歌在AI基础研究方面具有领先优势，但在消费级AI产品的商业化速度上仍需加快步伐。企业级客户应重点关注其云服务和开发工具的更新动态。</p>
         </div>'''
             
-        elif 'microsoft' in title_lower:
+        elif 'microsoft' in matched:
             return f'''
         <div class="ai-analysis">
             <h4>🔬 微软AI企业化策略</h4>
@@ -732,7 +1362,7 @@ class AINewsAccumulator:
             <p>微软的订阅制服务模式为AI功能的持续更新提供了稳定收入来源。企业用户应评估AI工具对生产力提升的实际效果，合理规划技术投入。</p>
         </div>'''
             
-        elif 'xbox' in title_lower or 'playstation' in title_lower or 'nintendo' in title_lower:
+        elif 'game_consoles' in matched:
             return f'''
         <div class="ai-analysis">
             <h4>🔬 游戏行业发展分析</h4>
@@ -747,7 +1377,7 @@ class AINewsAccumulator:
             <p>云游戏、VR/AR技术、AI辅助游戏开发等新兴技术将重塑游戏行业。投资者应关注技术创新能力强、用户粘性高的优质游戏公司。</p>
         </div>'''
             
-        elif 'bitcoin' in title_lower or 'crypto' in title_lower:
+        elif 'bitcoin_crypto' in matched:
             return f'''
         <div class="ai-analysis">
             <h4>🔬 加密货币市场分析</h4>
@@ -762,7 +1392,7 @@ class AINewsAccumulator:
             <p>数字资产投资需要充分了解技术原理和市场风险。建议投资者采用分散投资策略，控制仓位规模，关注监管政策变化对市场的影响。</p>
         </div>'''
             
-        elif 'stock' in title_lower or 'market' in title_lower:
+        elif 'stock_market' in matched:
             return f'''
         <div class="ai-analysis">
             <h4>🔬 股市行情技术分析</h4>
@@ -793,13 +1423,13 @@ class AINewsAccumulator:
             <p>企业应关注技术发展趋势，加强研发投入，提升核心竞争力。同时注重用户体验优化，建立可持续的商业模式。</p>
         </div>'''
 
-    def generate_investment_analysis(self, title, description):
-        """基于真实新闻内容生成投资方向分析"""
-        title_lower = title.lower()
-        desc_lower = description.lower() if description else ""
+    @staticmethod
+    def generate_investment_analysis(title, description, matched_groups=None):
+        """基于真实新闻内容生成投资方向分析（matched_groups为标题已命中的关键词组，未提供时现场匹配）"""
+        matched = NEWS_KEYWORDS.match(title) if matched_groups is None else matched_groups
         
         # 基于内容关键词生成针对性投资分析
-        if 'openai' in title_lower or 'chatgpt' in title_lower:
+        if 'openai_chatgpt' in matched:
             return f'''
         <div class="investment-analysis">
             <h4>📊 OpenAI相关投资机会</h4>
@@ -824,7 +1454,7 @@ class AINewsAccumulator:
             <p class="risk-warning">⚠️ <strong>风险提示：</strong>AI技术发展存在不确定性，投资需谨慎评估技术商业化风险。</p>
         </div>'''
         
-        elif 'google' in title_lower or 'gmail' in title_lower:
+        elif 'google_gmail' in matched:
             return f'''
         <div class="investment-analysis">
             <h4>📊 谷歌AI布局投资价值</h4>
@@ -849,7 +1479,7 @@ class AINewsAccumulator:
             <p class="risk-warning">⚠️ <strong>风险提示：</strong>监管政策变化和竞争加剧可能影响盈利预期。</p>
         </div>'''
             
-        elif 'microsoft' in title_lower:
+        elif 'microsoft' in matched:
             return f'''
         <div class="investment-analysis">
             <h4>📊 微软AI生态投资机会</h4>
@@ -874,7 +1504,7 @@ class AINewsAccumulator:
             <p class="risk-warning">⚠️ <strong>风险提示：</strong>企业IT支出波动和AI技术替代风险需要关注。</p>
         </div>'''
             
-        elif 'xbox' in title_lower or 'playstation' in title_lower or 'nintendo' in title_lower:
+        elif 'game_consoles' in matched:
             return f'''
         <div class="investment-analysis">
             <h4>📊 游戏行业投资机会</h4>
@@ -899,7 +1529,7 @@ class AINewsAccumulator:
             <p class="risk-warning">⚠️ <strong>风险提示：</strong>游戏监管政策和用户偏好变化可能影响行业发展。</p>
         </div>'''
             
-        elif 'bitcoin' in title_lower or 'crypto' in title_lower:
+        elif 'bitcoin_crypto' in matched:
             return f'''
         <div class="investment-analysis">
             <h4>📊 数字资产投资分析</h4>
@@ -924,7 +1554,7 @@ class AINewsAccumulator:
             <p class="risk-warning">⚠️ <strong>风险提示：</strong>数字资产波动极大，投资前需充分了解风险并做好资金管理。</p>
         </div>'''
             
-        elif 'stock' in title_lower or 'market' in title_lower:
+        elif 'stock_market' in matched:
             return f'''
         <div class="investment-analysis">
             <h4>📊 股市投资策略分析</h4>
@@ -1377,810 +2007,210 @@ class AINewsAccumulator:
 </body>
 </html>'''
         
-        # 保存HTML文件
-        with open('docs/index.html', 'w', encoding='utf-8') as f:
-            f.write(index_html)
+        # 保存HTML文件（内容未变化时不重写）
+        manifest = BuildManifest.load(self.site_manifest_file, 'docs')
+        manifest.write_page('index.html', index_html)
+        
+        # 写入详情页共享的CSS/JS（文件名带内容哈希），删除旧版本的资源文件
+        for asset in DETAIL_ASSETS:
+            manifest.write_page(asset.path, asset.content)
+        manifest.remove_stale([asset.path for asset in DETAIL_ASSETS], prefix='assets/')
         
-        # 生成详情页
-        os.makedirs('docs/news', exist_ok=True)
+        # 生成详情页：新闻内容和模板指纹都未变化的详情页直接跳过
+        template_fingerprint = self._get_detail_template_fingerprint()
+        detail_pages = []
+        pending_pages = []
         for news in news_data:
-            ai_analysis = self.generate_ai_analysis(news.get('original_title', news['title']), news.get('original_description', news['description']))
-            investment_analysis = self.generate_investment_analysis(news.get('original_title', news['title']), news.get('original_description', news['description']))
-            
-            # 获取翻译质量信息
-            translation_metadata = news.get('translation_metadata', {})
-            title_translation = translation_metadata.get('title_translation', {})
-            description_translation = translation_metadata.get('description_translation', {})
-            
-            # 计算整体翻译质量评分
-            title_quality = title_translation.get('quality_score', 0.0)
-            desc_quality = description_translation.get('quality_score', 0.0)
-            overall_quality = (title_quality + desc_quality) / 2 if title_quality and desc_quality else 0.0
-            
-            # 生成翻译质量指示器
-            def get_quality_indicator(score):
-                if score >= 0.8:
-                    return "🟢 优秀", "#10B981"
-                elif score >= 0.6:
-                    return "🟡 良好", "#F59E0B"
-                elif score >= 0.4:
-                    return "🟠 一般", "#F97316"
-                else:
-                    return "🔴 较差", "#EF4444"
-            
-            quality_text, quality_color = get_quality_indicator(overall_quality)
-            
-            # 生成完整的详情页HTML
-            detail_html = f'''<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{news['title']} - AI科技日报</title>
-    <style>
-        :root {{
-            --color-primary: #007AFF;
-            --color-success: #10B981;
-            --color-warning: #F59E0B;
-            --color-error: #EF4444;
-            --bg-primary: #FFFFFF;
-            --bg-secondary: #F2F2F7;
-            --bg-tertiary: #E5E5EA;
-            --text-primary: #000000;
-            --text-secondary: #3C3C43;
-            --text-tertiary: #8E8E93;
-            --spacing-sm: 8px;
-            --spacing-md: 16px;
-            --spacing-lg: 24px;
-            --radius-small: 8px;
-            --radius-medium: 12px;
-            --radius-large: 16px;
-            --shadow-light: 0 2px 8px rgba(0, 0, 0, 0.05);
-            --shadow-medium: 0 4px 16px rgba(0, 0, 0, 0.1);
-        }}
+            page = f'news/{news["id"]}.html'
+            detail_pages.append(page)
+            digest = None
+            if template_fingerprint:
+                digest = content_hash(template_fingerprint, json.dumps(news, ensure_ascii=False, sort_keys=True))
+                if manifest.is_current(page, digest):
+                    continue
+            pending_pages.append((page, digest, news))
         
-        [data-theme="dark"] {{
-            --color-primary: #0A84FF;
-            --bg-primary: #000000;
-            --bg-secondary: #1C1C1E;
-            --bg-tertiary: #2C2C2E;
-            --text-primary: #FFFFFF;
-            --text-secondary: #EBEBF5;
-            --text-tertiary: #8E8E93;
-            --shadow-light: 0 2px 8px rgba(255, 255, 255, 0.05);
-            --shadow-medium: 0 4px 16px rgba(255, 255, 255, 0.1);
-        }}
+        rendered_pages = self._render_detail_pages([news for _, _, news in pending_pages])
+        written_count = 0
+        for (page, digest, _), html in zip(pending_pages, rendered_pages):
+            if manifest.write_page(page, html, digest):
+                written_count += 1
         
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        # 删除过期文章的详情页（只删除本生成器生成过的页面）
+        removed_pages = manifest.remove_stale(detail_pages, prefix='news/')
+        manifest.save()
         
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, "SF Pro Text", "SF Pro Icons", "Helvetica Neue", "Helvetica", "Arial", sans-serif;
-            background-color: var(--bg-secondary);
-            color: var(--text-primary);
-            line-height: 1.6;
-            transition: all 0.3s ease;
-        }}
+        print(f"🏗️ 详情页: 重新生成 {written_count} 个，未变化 {len(news_data) - written_count} 个，删除过期 {len(removed_pages)} 个")
+        return True
+    
+    def _render_detail_pages(self, news_items):
+        """
+        渲染详情页，页面较多时按块分发到进程池
         
-        .container {{ max-width: 900px; margin: 0 auto; padding: 0 var(--spacing-md); }}
+        结果顺序与输入一致；进程池不可用时退回单进程渲染。
         
-        .header {{
-            background-color: var(--bg-primary);
-            padding: var(--spacing-lg) 0;
-            text-align: center;
-            position: sticky;
-            top: 0;
-            z-index: 100;
-            box-shadow: var(--shadow-light);
-        }}
+        Returns:
+            list: 与news_items一一对应的详情页HTML
+        """
+        if not news_items:
+            return []
         
-        .back-button {{
-            color: var(--color-primary);
-            text-decoration: none;
-            font-weight: 500;
-            display: inline-flex;
-            align-items: center;
-            gap: var(--spacing-sm);
-            margin-bottom: var(--spacing-sm);
-        }}
+        start_time = time.perf_counter()
+        workers = min(self.render_max_workers, -(-len(news_items) // self.render_chunk_size))
+        rendered = None
+        if workers > 1:
+            chunks = [news_items[i:i + self.render_chunk_size]
+                      for i in range(0, len(news_items), self.render_chunk_size)]
+            try:
+                # 使用spawn启动工作进程，避免在带有后台线程（缓存清理、预热）的进程中fork
+                with ProcessPoolExecutor(max_workers=workers,
+                                         mp_context=multiprocessing.get_context('spawn')) as executor:
+                    rendered = [page for chunk in executor.map(_render_detail_chunk, chunks) for page in chunk]
+            except (BrokenProcessPool, OSError, pickle.PicklingError) as e:
+                print(f"⚠️ 多进程渲染失败，改为单进程渲染: {str(e)}")
+                workers = 1
+        else:
+            workers = 1
+        
+        if rendered is None:
+            rendered = _render_detail_chunk(news_items)
+        
+        page_times = LatencyHistogram()
+        for _, seconds in rendered:
+            page_times.record(seconds)
+        print(f"🖨️ 渲染详情页 {len(rendered)} 个（{workers} 个进程，耗时 {time.perf_counter() - start_time:.2f} 秒），"
+              f"单页P50 {page_times.percentile(50) / 1000:.2f}ms，P95 {page_times.percentile(95) / 1000:.2f}ms，"
+              f"最大 {page_times.max_us / 1000:.2f}ms")
+        return [html for html, _ in rendered]
+    
+    def _get_detail_template_fingerprint(self):
+        """
+        详情页模板指纹：页面模板、共享资源、关键词组、详情页渲染方法或分析文案方法变化时指纹改变
         
-        .back-button:hover {{
-            opacity: 0.7;
-        }}
+        无法读取源码时返回None，此时渲染后按页面内容判断是否需要重写。
+        """
+        try:
+            sources = [
+                inspect.getsource(method) for method in
+                (self._render_detail_page, self.generate_ai_analysis, self.generate_investment_analysis)
+            ]
+        except (OSError, TypeError):
+            return None
+        keyword_groups = json.dumps(NEWS_KEYWORD_GROUPS, ensure_ascii=False, sort_keys=True)
+        return content_hash(DETAIL_PAGE.fingerprint, keyword_groups, *sources)
+    
+    @staticmethod
+    def _render_detail_page(news):
+        """渲染单条新闻的详情页HTML（不依赖实例状态，可在工作进程中调用）"""
+        original_title = news.get('original_title', news['title'])
+        original_description = news.get('original_description', news['description'])
+        matched_groups = NEWS_KEYWORDS.match(original_title)
+        ai_analysis = AINewsAccumulator.generate_ai_analysis(original_title, original_description, matched_groups)
+        investment_analysis = AINewsAccumulator.generate_investment_analysis(original_title, original_description, matched_groups)
+        
+        # 获取翻译质量信息
+        translation_metadata = news.get('translation_metadata', {})
+        title_translation = translation_metadata.get('title_translation', {})
+        description_translation = translation_metadata.get('description_translation', {})
+        
+        # 计算整体翻译质量评分
+        title_quality = title_translation.get('quality_score', 0.0)
+        desc_quality = description_translation.get('quality_score', 0.0)
+        overall_quality = (title_quality + desc_quality) / 2 if title_quality and desc_quality else 0.0
+        
+        # 生成翻译质量指示器
+        def get_quality_indicator(score):
+            if score >= 0.8:
+                return "🟢 优秀", "#10B981"
+            elif score >= 0.6:
+                return "🟡 良好", "#F59E0B"
+            elif score >= 0.4:
+                return "🟠 一般", "#F97316"
+            else:
+                return "🔴 较差", "#EF4444"
+        
+        quality_text, quality_color = get_quality_indicator(overall_quality)
+        
+        # 由预编译模板渲染，样式和脚本引用共享的资源文件
+        return DETAIL_PAGE.render({
+            'news_id': news['id'],
+            'title': news['title'],
+            'description': news['description'],
+            'original_title': news.get('original_title', news['title']),
+            'original_description': news.get('original_description', news['description']),
+            'url': news['url'],
+            'quality_text': quality_text,
+            'quality_color': quality_color,
+            'overall_quality': f"{overall_quality:.1%}",
+            'translation_service': title_translation.get('service', '未知'),
+            'title_confidence': f"{title_translation.get('confidence', 0):.1%}",
+            'description_confidence': f"{description_translation.get('confidence', 0):.1%}",
+            'translation_method': title_translation.get('method', 'AI翻译'),
+            'ai_analysis': ai_analysis,
+            'investment_analysis': investment_analysis
+        })
+    
+    def _report_cache_stats(self):
+        """输出本次运行的翻译缓存命中情况"""
+        hits = self.cache_stats['hits']
+        lookups = hits + self.cache_stats['misses']
+        hit_rate = hits / lookups * 100 if lookups else 0.0
+        print(f"💾 翻译缓存: 命中 {hits} / 查询 {lookups}（命中率 {hit_rate:.1f}%），新写入 {self.cache_stats['stored']} 条")
+        
+        stats = self.translation_cache.stats
+        if stats.stale_hits or stats.rewarmed_items:
+            print(f"   ♻️ 过时缓存 {stats.stale_hits} 条（已重新翻译），后台预热刷新 {stats.rewarmed_items} 条")
+        
+        tier_names = {'memory': '内存', 'file': '文件', 'database': '数据库'}
+        for tier, metrics in self.translation_cache.tier_metrics.items():
+            if metrics.lookups:
+                print(f"   {tier_names.get(tier, tier)}缓存: 命中率 {metrics.hit_rate * 100:.1f}%，"
+                      f"P95延迟 {metrics.latency.percentile(95) / 1000:.2f}ms，淘汰 {metrics.evictions} 条")
+    
+    def run(self):
+        """运行累积更新系统"""
+        print("🚀 开始AI新闻累积更新任务")
+        print("=" * 50)
         
-        .article {{
-            background-color: var(--bg-primary);
-            border-radius: var(--radius-large);
-            margin: var(--spacing-lg) 0;
-            padding: var(--spacing-lg);
-            box-shadow: var(--shadow-light);
-        }}
+        # 1. 加载现有新闻
+        existing_news = self.load_existing_news()
         
-        /* 翻译控制面板 */
-        .translation-controls {{
-            background-color: var(--bg-secondary);
-            border-radius: var(--radius-medium);
-            padding: var(--spacing-md);
-            margin-bottom: var(--spacing-lg);
-            display: flex;
-            flex-wrap: wrap;
-            gap: var(--spacing-md);
-            align-items: center;
-            justify-content: space-between;
-        }}
+        # 2. 获取最新新闻
+        new_articles = self.get_latest_news()
+        if not new_articles:
+            print("❌ 无法获取新闻，使用现有数据")
+            new_articles = []
         
-        .language-toggle {{
-            display: flex;
-            background-color: var(--bg-tertiary);
-            border-radius: var(--radius-small);
-            padding: 4px;
-        }}
+        # 3. 合并新旧数据
+        merged_news = self.merge_news_data(existing_news, new_articles)
         
-        .language-btn {{
-            padding: var(--spacing-sm) var(--spacing-md);
-            border: none;
-            background: transparent;
-            color: var(--text-secondary);
-            cursor: pointer;
-            border-radius: var(--radius-small);
-            font-weight: 500;
-            transition: all 0.2s ease;
-        }}
+        # 4. 保存合并后的数据
+        self._stamp_legacy_fingerprints(merged_news)
+        os.makedirs('docs', exist_ok=True)
+        with open(self.news_data_file, 'w', encoding='utf-8') as f:
+            json.dump(merged_news, f, ensure_ascii=False, indent=2)
+        if self.article_index is not None:
+            self.article_index.save()
         
-        .language-btn.active {{
-            background-color: var(--color-primary);
-            color: white;
-        }}
-        
-        .quality-indicator {{
-            display: flex;
-            align-items: center;
-            gap: var(--spacing-sm);
-            font-size: 0.875rem;
-            font-weight: 500;
-        }}
-        
-        .quality-score {{
-            background-color: var(--bg-primary);
-            padding: 4px 8px;
-            border-radius: var(--radius-small);
-            font-size: 0.75rem;
-            font-weight: 600;
-        }}
-        
-        /* 内容区域 */
-        .content-section {{
-            margin-bottom: var(--spacing-lg);
-        }}
-        
-        .section-header {{
-            display: flex;
-            align-items: center;
-            gap: var(--spacing-sm);
-            margin-bottom: var(--spacing-md);
-            font-size: 0.875rem;
-            font-weight: 600;
-            color: var(--text-secondary);
-        }}
-        
-        .article-title {{
-            font-size: 1.75rem;
-            font-weight: 700;
-            margin-bottom: var(--spacing-md);
-            color: var(--text-primary);
-            line-height: 1.3;
-        }}
-        
-        .article-description {{
-            font-size: 1.125rem;
-            color: var(--text-secondary);
-            margin-bottom: var(--spacing-lg);
-            line-height: 1.6;
-        }}
-        
-        /* 对照显示 */
-        .comparison-view {{
-            display: none;
-        }}
-        
-        .comparison-view.active {{
-            display: block;
-        }}
-        
-        .comparison-item {{
-            background-color: var(--bg-secondary);
-            border-radius: var(--radius-medium);
-            padding: var(--spacing-md);
-            margin-bottom: var(--spacing-md);
-        }}
-        
-        .comparison-label {{
-            font-size: 0.75rem;
-            font-weight: 600;
-            color: var(--text-tertiary);
-            margin-bottom: var(--spacing-sm);
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        
-        .comparison-content {{
-            font-size: 1rem;
-            line-height: 1.6;
-        }}
-        
-        .comparison-content.chinese {{
-            color: var(--text-primary);
-            font-weight: 500;
-        }}
-        
-        .comparison-content.english {{
-            color: var(--text-secondary);
-            font-style: italic;
-        }}
-        
-        /* 翻译详情 */
-        .translation-details {{
-            background-color: var(--bg-secondary);
-            border-radius: var(--radius-medium);
-            padding: var(--spacing-md);
-            margin: var(--spacing-lg) 0;
-        }}
-        
-        .translation-details h4 {{
-            font-size: 1rem;
-            font-weight: 600;
-            margin-bottom: var(--spacing-md);
-            color: var(--text-primary);
-            display: flex;
-            align-items: center;
-            gap: var(--spacing-sm);
-        }}
-        
-        .translation-meta {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: var(--spacing-md);
-        }}
-        
-        .meta-item {{
-            background-color: var(--bg-primary);
-            padding: var(--spacing-sm) var(--spacing-md);
-            border-radius: var(--radius-small);
-        }}
-        
-        .meta-label {{
-            font-size: 0.75rem;
-            color: var(--text-tertiary);
-            margin-bottom: 2px;
-        }}
-        
-        .meta-value {{
-            font-size: 0.875rem;
-            font-weight: 500;
-            color: var(--text-primary);
-        }}
-        
-        /* 用户反馈 */
-        .feedback-section {{
-            background-color: var(--bg-secondary);
-            border-radius: var(--radius-medium);
-            padding: var(--spacing-md);
-            margin: var(--spacing-lg) 0;
-        }}
-        
-        .feedback-buttons {{
-            display: flex;
-            gap: var(--spacing-sm);
-            margin-top: var(--spacing-md);
-        }}
-        
-        .feedback-btn {{
-            padding: var(--spacing-sm) var(--spacing-md);
-            border: 1px solid var(--bg-tertiary);
-            background-color: var(--bg-primary);
-            color: var(--text-primary);
-            border-radius: var(--radius-small);
-            cursor: pointer;
-            font-size: 0.875rem;
-            transition: all 0.2s ease;
-        }}
-        
-        .feedback-btn:hover {{
-            background-color: var(--color-primary);
-            color: white;
-            border-color: var(--color-primary);
-        }}
-        
-        .feedback-btn.selected {{
-            background-color: var(--color-primary);
-            color: white;
-            border-color: var(--color-primary);
-        }}
-        
-        /* AI分析和投资分析样式保持不变 */
-        .ai-analysis, .investment-analysis {{
-            margin: var(--spacing-lg) 0;
-            padding: var(--spacing-lg);
-            background-color: var(--bg-secondary);
-            border-radius: var(--radius-large);
-        }}
-        
-        .ai-analysis h4, .investment-analysis h4 {{
-            font-size: 1.1rem;
-            font-weight: 600;
-            color: var(--text-primary);
-            margin: var(--spacing-md) 0 var(--spacing-md) 0;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }}
-        
-        .investment-targets {{
-            background-color: var(--bg-primary);
-            padding: var(--spacing-md);
-            border-radius: 12px;
-            margin: var(--spacing-md) 0;
-        }}
-        
-        .risk-warning {{
-            background-color: #FFF3CD;
-            border: 1px solid #FFEAA7;
-            padding: var(--spacing-md);
-            border-radius: 8px;
-            margin-top: var(--spacing-md);
-            font-size: 0.9rem;
-        }}
-        
-        [data-theme="dark"] .risk-warning {{
-            background-color: #332B00;
-            border-color: #665500;
-        }}
-        
-        .read-original {{
-            background-color: var(--color-primary);
-            color: white;
-            padding: 12px 24px;
-            border-radius: 12px;
-            text-decoration: none;
-            font-weight: 600;
-            display: inline-block;
-            transition: opacity 0.2s ease;
-        }}
-        
-        .read-original:hover {{
-            opacity: 0.8;
-        }}
-        
-        .theme-toggle {{
-            position: fixed;
-            top: 20px;
-            right: 20px;
-            background: var(--bg-secondary);
-            border: none;
-            border-radius: 20px;
-            padding: 8px 16px;
-            color: var(--text-primary);
-            cursor: pointer;
-            z-index: 1000;
-            box-shadow: var(--shadow-light);
-            transition: all 0.2s ease;
-        }}
-        
-        .theme-toggle:hover {{
-            transform: scale(1.05);
-        }}
-        
-        /* 响应式设计 */
-        @media (max-width: 768px) {{
-            .container {{ padding: 0 var(--spacing-sm); }}
-            
-            .translation-controls {{
-                flex-direction: column;
-                align-items: stretch;
-            }}
-            
-            .quality-indicator {{
-                justify-content: center;
-            }}
-            
-            .translation-meta {{
-                grid-template-columns: 1fr;
-            }}
-            
-            .feedback-buttons {{
-                flex-wrap: wrap;
-            }}
-            
-            .article-title {{
-                font-size: 1.5rem;
-            }}
-            
-            .theme-toggle {{
-                padding: 8px;
-                border-radius: 50%;
-                width: 40px;
-                height: 40px;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <button class="theme-toggle" onclick="toggleTheme()">🌙</button>
-    
-    <div class="header">
-        <div class="container">
-            <a href="../index.html" class="back-button">← 返回首页</a>
-            <h1>AI科技日报</h1>
-        </div>
-    </div>
-    
-    <div class="container">
-        <article class="article">
-            <!-- 翻译控制面板 -->
-            <div class="translation-controls">
-                <div class="language-toggle">
-                    <button class="language-btn active" onclick="showChinese()" id="chinese-btn">
-                        🇨🇳 中文
-                    </button>
-                    <button class="language-btn" onclick="showComparison()" id="comparison-btn">
-                        🔄 对照
-                    </button>
-                    <button class="language-btn" onclick="showEnglish()" id="english-btn">
-                        🇺🇸 英文
-                    </button>
-                </div>
-                
-                <div class="quality-indicator">
-                    <span style="color: {quality_color};">{quality_text}</span>
-                    <span class="quality-score" style="background-color: {quality_color}; color: white;">
-                        {overall_quality:.1%}
-                    </span>
-                </div>
-            </div>
-            
-            <!-- 中文内容（默认显示） -->
-            <div id="chinese-content" class="content-view">
-                <div class="content-section">
-                    <div class="section-header">
-                        <span>📰</span>
-                        <span>新闻标题</span>
-                    </div>
-                    <h1 class="article-title">{news['title']}</h1>
-                </div>
-                
-                <div class="content-section">
-                    <div class="section-header">
-                        <span>📝</span>
-                        <span>新闻描述</span>
-                    </div>
-                    <p class="article-description">{news['description']}</p>
-                </div>
-            </div>
-            
-            <!-- 英文内容 -->
-            <div id="english-content" class="content-view" style="display: none;">
-                <div class="content-section">
-                    <div class="section-header">
-                        <span>📰</span>
-                        <span>Original Title</span>
-                    </div>
-                    <h1 class="article-title">{news.get('original_title', news['title'])}</h1>
-                </div>
-                
-                <div class="content-section">
-                    <div class="section-header">
-                        <span>📝</span>
-                        <span>Original Description</span>
-                    </div>
-                    <p class="article-description">{news.get('original_description', news['description'])}</p>
-                </div>
-            </div>
-            
-            <!-- 对照内容 -->
-            <div id="comparison-content" class="content-view comparison-view">
-                <div class="content-section">
-                    <div class="section-header">
-                        <span>📰</span>
-                        <span>标题对照</span>
-                    </div>
-                    <div class="comparison-item">
-                        <div class="comparison-label">中文翻译</div>
-                        <div class="comparison-content chinese">{news['title']}</div>
-                    </div>
-                    <div class="comparison-item">
-                        <div class="comparison-label">英文原文</div>
-                        <div class="comparison-content english">{news.get('original_title', news['title'])}</div>
-                    </div>
-                </div>
-                
-                <div class="content-section">
-                    <div class="section-header">
-                        <span>📝</span>
-                        <span>描述对照</span>
-                    </div>
-                    <div class="comparison-item">
-                        <div class="comparison-label">中文翻译</div>
-                        <div class="comparison-content chinese">{news['description']}</div>
-                    </div>
-                    <div class="comparison-item">
-                        <div class="comparison-label">英文原文</div>
-                        <div class="comparison-content english">{news.get('original_description', news['description'])}</div>
-                    </div>
-                </div>
-            </div>
-            
-            <!-- 翻译详情信息 -->
-            <div class="translation-details">
-                <h4>
-                    <span>🔍</span>
-                    <span>翻译详情</span>
-                </h4>
-                <div class="translation-meta">
-                    <div class="meta-item">
-                        <div class="meta-label">翻译服务</div>
-                        <div class="meta-value">{title_translation.get('service', '未知')}</div>
-                    </div>
-                    <div class="meta-item">
-                        <div class="meta-label">标题置信度</div>
-                        <div class="meta-value">{title_translation.get('confidence', 0):.1%}</div>
-                    </div>
-                    <div class="meta-item">
-                        <div class="meta-label">描述置信度</div>
-                        <div class="meta-value">{description_translation.get('confidence', 0):.1%}</div>
-                    </div>
-                    <div class="meta-item">
-                        <div class="meta-label">翻译方法</div>
-                        <div class="meta-value">{title_translation.get('method', 'AI翻译')}</div>
-                    </div>
-                </div>
-            </div>
-            
-            <!-- 用户反馈区域 -->
-            <div class="feedback-section">
-                <h4>
-                    <span>💬</span>
-                    <span>翻译质量反馈</span>
-                </h4>
-                <p style="font-size: 0.875rem; color: var(--text-secondary); margin-bottom: var(--spacing-md);">
-                    您觉得这篇新闻的翻译质量如何？您的反馈将帮助我们改进翻译服务。
-                </p>
-                <div class="feedback-buttons">
-                    <button class="feedback-btn" onclick="submitFeedback('excellent', '{news['id']}')">
-                        😍 非常好
-                    </button>
-                    <button class="feedback-btn" onclick="submitFeedback('good', '{news['id']}')">
-                        👍 不错
-                    </button>
-                    <button class="feedback-btn" onclick="submitFeedback('average', '{news['id']}')">
-                        😐 一般
-                    </button>
-                    <button class="feedback-btn" onclick="submitFeedback('poor', '{news['id']}')">
-                        👎 较差
-                    </button>
-                </div>
-                <div id="feedback-message" style="margin-top: var(--spacing-sm); font-size: 0.875rem; color: var(--color-success); display: none;">
-                    感谢您的反馈！
-                </div>
-            </div>
-            
-            {ai_analysis}
-            
-            {investment_analysis}
-            
-            <div style="text-align: center; margin-top: var(--spacing-lg);">
-                <a href="{news['url']}" target="_blank" class="read-original">阅读原文</a>
-            </div>
-        </article>
-    </div>
-    
-    <script>
-        // 主题切换功能
-        function toggleTheme() {{
-            const body = document.body;
-            const themeToggle = document.querySelector('.theme-toggle');
-            
-            if (body.getAttribute('data-theme') === 'dark') {{
-                body.setAttribute('data-theme', 'light');
-                themeToggle.textContent = '🌙';
-                localStorage.setItem('theme', 'light');
-            }} else {{
-                body.setAttribute('data-theme', 'dark');
-                themeToggle.textContent = '☀️';
-                localStorage.setItem('theme', 'dark');
-            }}
-        }}
-        
-        // 语言切换功能
-        function showChinese() {{
-            // 隐藏所有内容视图
-            document.getElementById('chinese-content').style.display = 'block';
-            document.getElementById('english-content').style.display = 'none';
-            document.getElementById('comparison-content').style.display = 'none';
-            
-            // 更新按钮状态
-            updateLanguageButtons('chinese');
-            
-            // 保存用户偏好
-            localStorage.setItem('preferredLanguage', 'chinese');
-        }}
-        
-        function showEnglish() {{
-            document.getElementById('chinese-content').style.display = 'none';
-            document.getElementById('english-content').style.display = 'block';
-            document.getElementById('comparison-content').style.display = 'none';
-            
-            updateLanguageButtons('english');
-            localStorage.setItem('preferredLanguage', 'english');
-        }}
-        
-        function showComparison() {{
-            document.getElementById('chinese-content').style.display = 'none';
-            document.getElementById('english-content').style.display = 'none';
-            document.getElementById('comparison-content').style.display = 'block';
-            
-            updateLanguageButtons('comparison');
-            localStorage.setItem('preferredLanguage', 'comparison');
-        }}
-        
-        function updateLanguageButtons(activeMode) {{
-            const buttons = {{
-                'chinese': document.getElementById('chinese-btn'),
-                'english': document.getElementById('english-btn'),
-                'comparison': document.getElementById('comparison-btn')
-            }};
-            
-            // 移除所有active类
-            Object.values(buttons).forEach(btn => btn.classList.remove('active'));
-            
-            // 添加active类到当前按钮
-            if (buttons[activeMode]) {{
-                buttons[activeMode].classList.add('active');
-            }}
-        }}
-        
-        // 用户反馈功能
-        function submitFeedback(rating, newsId) {{
-            // 更新按钮状态
-            const feedbackButtons = document.querySelectorAll('.feedback-btn');
-            feedbackButtons.forEach(btn => btn.classList.remove('selected'));
-            
-            // 标记选中的按钮
-            event.target.classList.add('selected');
-            
-            // 显示感谢消息
-            const messageEl = document.getElementById('feedback-message');
-            messageEl.style.display = 'block';
-            
-            // 保存反馈到本地存储（实际应用中应该发送到服务器）
-            const feedback = {{
-                newsId: newsId,
-                rating: rating,
-                timestamp: new Date().toISOString()
-            }};
-            
-            let feedbackHistory = JSON.parse(localStorage.getItem('translationFeedback') || '[]');
-            feedbackHistory.push(feedback);
-            localStorage.setItem('translationFeedback', JSON.stringify(feedbackHistory));
-            
-            console.log('用户反馈已保存:', feedback);
-            
-            // 3秒后隐藏消息
-            setTimeout(() => {{
-                messageEl.style.display = 'none';
-            }}, 3000);
-        }}
-        
-        // 页面加载完成后的初始化
-        document.addEventListener('DOMContentLoaded', function() {{
-            // 恢复主题设置
-            const savedTheme = localStorage.getItem('theme') || 'light';
-            const themeToggle = document.querySelector('.theme-toggle');
-            
-            if (savedTheme === 'dark') {{
-                document.body.setAttribute('data-theme', 'dark');
-                themeToggle.textContent = '☀️';
-            }}
-            
-            // 恢复语言偏好
-            const preferredLanguage = localStorage.getItem('preferredLanguage') || 'chinese';
-            switch(preferredLanguage) {{
-                case 'english':
-                    showEnglish();
-                    break;
-                case 'comparison':
-                    showComparison();
-                    break;
-                default:
-                    showChinese();
-                    break;
-            }}
-            
-            // 检查是否已经对此新闻提供过反馈
-            const newsId = '{news['id']}';
-            const feedbackHistory = JSON.parse(localStorage.getItem('translationFeedback') || '[]');
-            const existingFeedback = feedbackHistory.find(f => f.newsId === newsId);
-            
-            if (existingFeedback) {{
-                // 如果已经反馈过，显示之前的选择
-                const feedbackButtons = document.querySelectorAll('.feedback-btn');
-                feedbackButtons.forEach(btn => {{
-                    if (btn.textContent.includes(getRatingEmoji(existingFeedback.rating))) {{
-                        btn.classList.add('selected');
-                    }}
-                }});
-            }}
-        }});
-        
-        // 获取评分对应的emoji
-        function getRatingEmoji(rating) {{
-            const emojiMap = {{
-                'excellent': '😍',
-                'good': '👍',
-                'average': '😐',
-                'poor': '👎'
-            }};
-            return emojiMap[rating] || '';
-        }}
-        
-        // 键盘快捷键支持
-        document.addEventListener('keydown', function(e) {{
-            if (e.altKey) {{
-                switch(e.key) {{
-                    case '1':
-                        e.preventDefault();
-                        showChinese();
-                        break;
-                    case '2':
-                        e.preventDefault();
-                        showComparison();
-                        break;
-                    case '3':
-                        e.preventDefault();
-                        showEnglish();
-                        break;
-                }}
-            }}
-        }});
-    </script>
-</body>
-</html>'''
-            
-            with open(f'docs/news/{news["id"]}.html', 'w', encoding='utf-8') as f:
-                f.write(detail_html)
-        
-        return True
-    
-    def run(self):
-        """运行累积更新系统"""
-        print("🚀 开始AI新闻累积更新任务")
-        print("=" * 50)
-        
-        # 1. 加载现有新闻
-        existing_news = self.load_existing_news()
-        
-        # 2. 获取最新新闻
-        new_articles = self.get_latest_news()
-        if not new_articles:
-            print("❌ 无法获取新闻，使用现有数据")
-            new_articles = []
-        
-        # 3. 合并新旧数据
-        merged_news = self.merge_news_data(existing_news, new_articles)
-        
-        # 4. 保存合并后的数据
-        os.makedirs('docs', exist_ok=True)
-        with open(self.news_data_file, 'w', encoding='utf-8') as f:
-            json.dump(merged_news, f, ensure_ascii=False, indent=2)
+        # 新文章已翻译完，后台重新预热不再与其争抢主翻译器、限流器和熔断器
+        self._start_cache_rewarm()
         
         # 5. 生成HTML站点
         success = self.generate_html_site(merged_news)
         
+        open_circuits = self.circuit_breakers.get_open_circuits()
+        if open_circuits:
+            print(f"⚡ 本次运行中熔断的翻译服务: {', '.join(open_circuits)}")
+        
+        if self.translation_cache:
+            # 关闭时等待后台预热结束，统计才完整
+            self.translation_cache.close()
+            self._report_cache_stats()
+        
         if success:
             print("✅ 累积更新系统运行完成")
             print(f"   📊 总新闻数量: {len(merged_news)} 条")
-            print(f"   📅 时间范围: 最近3天")
+            print(f"   📅 时间范围: 最近{self.retention_days}天")
             print("   🌐 网站已更新")
         else:
             print("❌ HTML站点生成失败")
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+持久化文章索引 - 按URL、规范化标题哈希和发布时间索引已发布的新闻，支持增量合并
+"""
+
+import bisect
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from translation.core.cache_keys import KeyNormalizer
+
+
+# 不去除标题末尾的来源后缀：破折号后的内容可能是标题正文，如 "Review - Worth It"
+_title_normalizer = KeyNormalizer(('unicode', 'quotes', 'whitespace', 'case'))
+
+
+def parse_published_at(value) -> Optional[float]:
+    """解析发布时间为时间戳，无法解析时返回None（不带时区的时间按本地时间处理）"""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except (ValueError, OverflowError, OSError):
+        return None
+
+
+def title_hash(title: str) -> str:
+    """规范化标题（统一Unicode和引号样式，忽略大小写和多余空白）后的哈希"""
+    return hashlib.sha1(_title_normalizer(title or '').encode('utf-8')).hexdigest()[:16]
+
+
+@dataclass
+class IndexEntry:
+    """索引中的一篇文章"""
+    news_id: str
+    url: str
+    title_hash: str
+    published_ts: float
+    seq: int  # 加入索引的顺序，发布时间相同时后加入的排在前面
+
+
+class ArticleIndex:
+    """已发布文章的持久化索引
+
+    _order 按 (发布时间, 加入顺序) 升序保存，新文章通常直接追加到末尾，
+    过期文章从头部整段删除，输出顺序无需重新排序。
+    """
+
+    VERSION = 2  # 标题规范化规则变化时递增，旧索引作废后由reconcile重建
+
+    def __init__(self, path: str):
+        """
+        初始化空索引
+
+        Args:
+            path: 索引文件路径
+        """
+        self.path = path
+        self.entries: Dict[str, IndexEntry] = {}
+        self._by_url: Dict[str, str] = {}
+        self._by_title: Dict[str, str] = {}
+        self._order: List[Tuple[float, int, str]] = []
+        self._next_seq = 0
+
+    @classmethod
+    def load(cls, path: str) -> "ArticleIndex":
+        """读取索引文件，文件不存在、版本不符或已损坏时返回空索引"""
+        index = cls(path)
+        if not os.path.exists(path):
+            return index
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != cls.VERSION:
+                return index
+            for news_id, url, hashed_title, published_ts, seq in data['entries']:
+                index._insert(IndexEntry(news_id, url, hashed_title, published_ts, seq))
+            index._next_seq = max(data.get('next_seq', 0), index._next_seq)
+        except (OSError, ValueError, KeyError, TypeError):
+            return cls(path)
+
+        return index
+
+    def save(self):
+        """原子地写入索引文件"""
+        data = {
+            'version': self.VERSION,
+            'next_seq': self._next_seq,
+            'entries': [
+                [entry.news_id, entry.url, entry.title_hash, entry.published_ts, entry.seq]
+                for entry in (self.entries[news_id] for _, _, news_id in self._order)
+            ]
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_path, self.path)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, news_id: str) -> bool:
+        return news_id in self.entries
+
+    def _insert(self, entry: IndexEntry):
+        """加入索引（同ID的旧记录先移除）"""
+        if entry.news_id in self.entries:
+            self.remove(entry.news_id)
+        self.entries[entry.news_id] = entry
+        if entry.url:
+            self._by_url[entry.url] = entry.news_id
+        self._by_title[entry.title_hash] = entry.news_id
+        bisect.insort(self._order, (entry.published_ts, entry.seq, entry.news_id))
+        self._next_seq = max(self._next_seq, entry.seq + 1)
+
+    def add(self, news: dict) -> bool:
+        """
+        将新闻加入索引
+
+        Returns:
+            bool: 发布时间无法解析时不加入索引，返回False
+        """
+        published_ts = parse_published_at(news.get('publishedAt'))
+        if published_ts is None:
+            return False
+
+        original_title = news.get('original_title') or news.get('title', '')
+        self._insert(IndexEntry(news['id'], news.get('url', ''), title_hash(original_title),
+                                published_ts, self._next_seq))
+        return True
+
+    def remove(self, news_id: str):
+        """移出索引"""
+        entry = self.entries.pop(news_id, None)
+        if entry is None:
+            return
+        if self._by_url.get(entry.url) == news_id:
+            del self._by_url[entry.url]
+        if self._by_title.get(entry.title_hash) == news_id:
+            del self._by_title[entry.title_hash]
+        position = bisect.bisect_left(self._order, (entry.published_ts, entry.seq, news_id))
+        if position < len(self._order) and self._order[position][2] == news_id:
+            del self._order[position]
+
+    def find_duplicate(self, url: str, title: str) -> Optional[str]:
+        """按URL或规范化标题查找已收录的文章，返回其ID"""
+        if url and url in self._by_url:
+            return self._by_url[url]
+        return self._by_title.get(title_hash(title))
+
+    def reconcile(self, news_items: Iterable[dict]) -> int:
+        """
+        与实际的新闻数据对齐：移除数据中已不存在的文章，补充索引中缺少的文章
+
+        只有缺少的文章需要解析发布时间，索引与数据一致时不做额外工作。
+
+        Returns:
+            int: 补充和移除的文章数
+        """
+        present = set()
+        changed = 0
+        for news in news_items:
+            news_id = news.get('id')
+            if not news_id:
+                continue
+            present.add(news_id)
+            if news_id not in self.entries and self.add(news):
+                changed += 1
+
+        for news_id in [news_id for news_id in self.entries if news_id not in present]:
+            self.remove(news_id)
+            changed += 1
+        return changed
+
+    def expire(self, cutoff_ts: float) -> List[str]:
+        """移除发布时间早于cutoff_ts的文章，返回被移除的ID"""
+        position = bisect.bisect_left(self._order, (cutoff_ts,))
+        if position == 0:
+            return []
+
+        expired = [news_id for _, _, news_id in self._order[:position]]
+        del self._order[:position]
+        for news_id in expired:
+            entry = self.entries.pop(news_id)
+            if self._by_url.get(entry.url) == news_id:
+                del self._by_url[entry.url]
+            if self._by_title.get(entry.title_hash) == news_id:
+                del self._by_title[entry.title_hash]
+        return expired
+
+    def newest_first(self) -> List[str]:
+        """按发布时间从新到旧返回文章ID"""
+        return [news_id for _, _, news_id in reversed(self._order)]
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+静态站点构建清单 - 记录每个生成页面的内容哈希，增量重建时跳过未变化的页面
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, List, Optional
+
+
+def content_hash(*parts: str) -> str:
+    """计算页面输入（或内容）的哈希"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()[:32]
+
+
+def write_atomic(path: str, content: str):
+    """先写临时文件再替换，避免部署时读到写了一半的页面"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+
+class BuildManifest:
+    """站点构建清单
+
+    pages 记录 页面路径（相对站点根目录） -> 内容哈希。只有清单中记录过的页面
+    才由本生成器管理，过期时删除；其他脚本生成的页面不受影响。
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, site_root: str):
+        """
+        初始化空清单
+
+        Args:
+            path: 清单文件路径
+            site_root: 站点根目录，页面路径相对于该目录
+        """
+        self.path = path
+        self.site_root = site_root
+        self.pages: Dict[str, str] = {}
+
+    @classmethod
+    def load(cls, path: str, site_root: str) -> "BuildManifest":
+        """读取清单，文件不存在、版本不符或已损坏时返回空清单（即全部重建）"""
+        manifest = cls(path, site_root)
+        if not os.path.exists(path):
+            return manifest
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == cls.VERSION and isinstance(data.get('pages'), dict):
+                manifest.pages = dict(data['pages'])
+        except (OSError, ValueError):
+            pass
+        return manifest
+
+    def save(self):
+        """原子地写入清单"""
+        data = {'version': self.VERSION, 'pages': dict(sorted(self.pages.items()))}
+        write_atomic(self.path, json.dumps(data, ensure_ascii=False, indent=0))
+
+    def is_current(self, page: str, digest: Optional[str]) -> bool:
+        """页面已按相同的哈希生成且文件仍然存在"""
+        return (digest is not None and self.pages.get(page) == digest and
+                os.path.exists(os.path.join(self.site_root, page)))
+
+    def write_page(self, page: str, content: str, digest: Optional[str] = None) -> bool:
+        """
+        写入页面并记录哈希
+
+        Args:
+            page: 相对站点根目录的页面路径
+            content: 页面内容
+            digest: 页面输入的哈希；为None时使用内容哈希，内容未变化时不写文件
+
+        Returns:
+            bool: 是否实际写入了文件
+        """
+        if digest is None:
+            digest = content_hash(content)
+            if self.is_current(page, digest):
+                return False
+
+        path = os.path.join(self.site_root, page)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_atomic(path, content)
+        self.pages[page] = digest
+        return True
+
+    def remove_stale(self, current_pages: Iterable[str], prefix: str = '') -> List[str]:
+        """
+        删除清单中以prefix开头、但本次不再生成的页面
+
+        Returns:
+            List[str]: 被删除的页面路径
+        """
+        current = set(current_pages)
+        stale = [page for page in self.pages if page.startswith(prefix) and page not in current]
+        for page in stale:
+            try:
+                os.remove(os.path.join(self.site_root, page))
+            except FileNotFoundError:
+                pass
+            del self.pages[page]
+        return stale
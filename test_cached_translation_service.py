@@ -28,7 +28,8 @@ def test_cached_translation_service():
         translation_config = {
             'siliconflow': {
                 'api_key': 'sk-test-key'  # 测试用的API密钥
-            }
+            },
+            'feedback_db_path': os.path.join(temp_dir, 'translation_feedback.db')
         }
         
         cache_config = {
@@ -6,6 +6,7 @@
 
 import sys
 import os
+import tempfile
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from translation.services.enhanced_translation_manager import EnhancedTranslationManager
@@ -17,10 +18,12 @@ def test_enhanced_translation_manager():
     print("=== 增强翻译管理器测试 ===")
     
     # 配置信息（使用模拟配置）
+    temp_dir = tempfile.TemporaryDirectory()
     config = {
         'siliconflow': {
             'api_key': 'sk-test-key'  # 测试用的API密钥
-        }
+        },
+        'feedback_db_path': os.path.join(temp_dir.name, 'translation_feedback.db')
     }
     
     # 初始化管理器
@@ -117,6 +120,7 @@ def test_enhanced_translation_manager():
         print(f"优化翻译测试失败: {e}")
     
     print("\n=== 测试完成 ===")
+    temp_dir.cleanup()
 
 
 if __name__ == "__main__":
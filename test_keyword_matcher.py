@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试关键词自动机
+"""
+
+import os
+import sys
+import unittest
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from keyword_matcher import KeywordMatcher
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    """关键词自动机测试"""
+
+    def setUp(self):
+        """测试初始化"""
+        self.matcher = KeywordMatcher({
+            'openai': ('openai', 'chatgpt', 'gpt'),
+            'flagship': ('gpt-4', 'gpt-5'),
+            'console': ('xbox', 'microsoft gaming'),
+            'big_tech': ('microsoft', 'meta'),
+        })
+
+    def test_one_pass_returns_all_groups(self):
+        """测试一次扫描返回所有命中的组，包括互相重叠和嵌套的关键词"""
+        self.assertEqual(self.matcher.match('OpenAI ships GPT-4 on Microsoft Gaming'),
+                         {'openai', 'flagship', 'console', 'big_tech'})
+        self.assertEqual(self.matcher.match('Metaverse update'), {'big_tech'})  # 子串匹配，与 in 一致
+        self.assertEqual(self.matcher.match('gpt-4'), {'openai', 'flagship'})
+
+    def test_no_match(self):
+        """测试未命中和空文本"""
+        self.assertEqual(self.matcher.match('Nintendo Switch sales'), frozenset())
+        self.assertEqual(self.matcher.match(''), frozenset())
+        self.assertEqual(self.matcher.match('microsof gamin'), frozenset())
+
+
+if __name__ == '__main__':
+    unittest.main()
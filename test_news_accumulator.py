@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试新闻累积器的并发抓取和并行翻译流程（不访问网络）
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import urllib.error
+import urllib.parse
+from datetime import datetime
+from unittest.mock import Mock, patch
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_accumulator import AINewsAccumulator
+from translation.core.circuit_breaker import CircuitBreakerRegistry
+from translation.core.interfaces import TranslationResult
+from translation.core.rate_limiter import RateLimiterRegistry
+from translation.services.enhanced_news_translator import EnhancedNewsTranslator
+
+
+AI_QUERY = 'AI OR OpenAI OR ChatGPT OR "artificial intelligence"'
+BACKUP_AI_QUERY = 'OpenAI OR ChatGPT OR "artificial intelligence"'
+
+
+class FakeGNews:
+    """按查询词返回固定结果的GNews接口替身，记录每次请求"""
+
+    def __init__(self, failing=(), delays=None):
+        self.failing = set(failing)
+        self.delays = delays or {}
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def urlopen(self, url, timeout=None):
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(url).query)['q'][0]
+        with self._lock:
+            self.requests.append(query)
+        time.sleep(self.delays.get(query, 0.0))
+        if query in self.failing:
+            raise urllib.error.URLError('connection refused')
+        articles = [{'title': f'{query} story', 'url': f'https://example.com/{len(query)}'}]
+        return io.BytesIO(json.dumps({'articles': articles}).encode('utf-8'))
+
+
+class TestNewsFetching(unittest.TestCase):
+    """并发抓取新闻测试"""
+
+    def setUp(self):
+        """测试初始化（只需要抓取相关的配置）"""
+        self.accumulator = AINewsAccumulator.__new__(AINewsAccumulator)
+        self.accumulator.gnews_api_key = 'test-key'
+        self.accumulator.gnews_base_url = 'https://gnews.example/api/v4'
+        self.accumulator.fetch_max_workers = 5
+        self.accumulator.fetch_time_budget = 5.0
+        self.accumulator.fetch_category_deadline = 4.0
+
+    def _fetch(self, gnews):
+        with patch('news_accumulator.http_transport.urlopen', side_effect=gnews.urlopen), \
+                patch('news_accumulator.random.uniform', return_value=0.0):
+            return self.accumulator.get_latest_news()
+
+    def test_categories_fetched_concurrently_without_backup(self):
+        """测试各类别并发抓取，AI科技主查询成功时不发出备用查询"""
+        queries = [query['query'] for query in self.accumulator._get_search_queries()]
+        gnews = FakeGNews(delays={query: 0.2 for query in queries})
+
+        start_time = time.monotonic()
+        articles = self._fetch(gnews)
+
+        self.assertLess(time.monotonic() - start_time, 0.6)
+        self.assertEqual(sorted(gnews.requests), sorted(queries))
+        self.assertNotIn(BACKUP_AI_QUERY, gnews.requests)
+        self.assertEqual([article['title'] for article in articles], [f'{query} story' for query in queries])
+        self.assertEqual(articles[0]['search_category'], 'AI科技')
+
+    def test_backup_query_after_ai_failure(self):
+        """测试AI科技主查询重试失败后才发出备用查询，并使用其结果"""
+        gnews = FakeGNews(failing={AI_QUERY})
+
+        articles = self._fetch(gnews)
+
+        self.assertEqual(gnews.requests.count(AI_QUERY), 3)
+        self.assertEqual(gnews.requests.count(BACKUP_AI_QUERY), 1)
+        self.assertGreater(gnews.requests.index(BACKUP_AI_QUERY), max(
+            position for position, query in enumerate(gnews.requests) if query == AI_QUERY
+        ))
+        self.assertEqual(articles[0]['title'], f'{BACKUP_AI_QUERY} story')
+        self.assertEqual(articles[0]['search_category'], 'AI科技')
+
+    def test_time_budget_returns_partial_results(self):
+        """测试全局时间预算耗尽时返回已完成类别的结果"""
+        slow_query = self.accumulator._get_search_queries()[1]['query']
+        gnews = FakeGNews(delays={slow_query: 1.0})
+        self.accumulator.fetch_time_budget = 0.3
+
+        start_time = time.monotonic()
+        articles = self._fetch(gnews)
+
+        self.assertLess(time.monotonic() - start_time, 0.8)
+        self.assertEqual(len(articles), 3)
+        self.assertNotIn(f'{slow_query} story', [article['title'] for article in articles])
+
+
+class FakeTranslator:
+    """记录调用的翻译器替身，failing中的文本翻译失败"""
+
+    def __init__(self, name, delay=0.0, failing=()):
+        self.name = name
+        self.delay = delay
+        self.failing = set(failing)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get_service_name(self):
+        return self.name
+
+    def translate_text(self, text, source_lang='en', target_lang='zh'):
+        with self._lock:
+            self.calls.append(text)
+        time.sleep(self.delay)
+        if text in self.failing:
+            return TranslationResult(text, '', source_lang, target_lang, self.name, 0.0, datetime.now(),
+                                     error_message='service unavailable')
+        return TranslationResult(text, f'{self.name}译:{text}', source_lang, target_lang, self.name, 0.9,
+                                 datetime.now())
+
+    def translate_news_title(self, title, category=''):
+        return self.translate_text(title)
+
+    def translate_news_description(self, description, title='', category=''):
+        return self.translate_text(description)
+
+
+class FakeBatchTranslator(FakeTranslator):
+    """支持批量提示词模式的翻译器替身，batch_error不为空时批量请求抛出异常，failing中的条目解析失败"""
+
+    def __init__(self, name, batch_error=None, failing=()):
+        super().__init__(name, failing=failing)
+        self.batch_error = batch_error
+        self.batch_calls = 0
+
+    def _translate_batch(self, texts):
+        self.batch_calls += 1
+        if self.batch_error:
+            raise RuntimeError(self.batch_error)
+        return [
+            None if text in self.failing else
+            TranslationResult(text, f'{self.name}批译:{text}', 'en', 'zh', self.name, 0.9, datetime.now())
+            for text in texts
+        ]
+
+    def translate_news_titles_batch(self, titles, category='', fallback=True):
+        return self._translate_batch(titles)
+
+    def translate_news_descriptions_batch(self, descriptions, titles=None, category='', fallback=True):
+        return self._translate_batch(descriptions)
+
+
+def make_translation_accumulator(primary, fallbacks=()):
+    """创建只包含翻译相关配置的累积器（不使用缓存，逐条翻译）"""
+    accumulator = AINewsAccumulator.__new__(AINewsAccumulator)
+    accumulator.primary_translator = primary
+    accumulator.fallback_translators = list(fallbacks)
+    accumulator.translation_max_workers = 6
+    accumulator.translation_batch_size = 0
+    accumulator.rate_limiters = RateLimiterRegistry()
+    accumulator.rate_limiters.register('siliconflow', 0)
+    accumulator.circuit_breakers = CircuitBreakerRegistry()
+    accumulator.translation_cache = None
+    accumulator.translation_cache_fingerprint = 'test'
+    accumulator.cache_stats = {'hits': 0, 'misses': 0, 'stored': 0}
+    return accumulator
+
+
+def make_articles(count, category='AI科技'):
+    """按发布时间从新到旧生成测试文章"""
+    return [
+        {'title': f'OpenAI story {i}', 'description': f'Description {i}', 'url': f'https://example.com/{i}',
+         'publishedAt': f'2026-10-{17 - i:02d}T00:00:00Z', 'search_category': category,
+         'source': {'name': 'Example'}}
+        for i in range(count)
+    ]
+
+
+class TestParallelTranslation(unittest.TestCase):
+    """新文章并行翻译测试"""
+
+    def test_parallel_translation_keeps_input_order(self):
+        """测试标题和描述并发翻译，结果按输入顺序组装"""
+        primary = FakeTranslator('primary', delay=0.1)
+        accumulator = make_translation_accumulator(primary)
+        articles = make_articles(6)
+
+        start_time = time.monotonic()
+        news_items = accumulator._process_new_articles(articles)
+
+        self.assertLess(time.monotonic() - start_time, 0.8)  # 逐条串行需要1.2秒
+        self.assertEqual(len(primary.calls), 12)
+        self.assertEqual([item['original_title'] for item in news_items],
+                         [article['title'] for article in articles])
+        self.assertEqual(news_items[0]['title'], 'primary译:OpenAI story 0')
+        self.assertEqual(news_items[0]['description'], 'primary译:Description 0')
+
+    def test_every_http_request_goes_through_provider_limiter(self):
+        """测试主翻译器的每次HTTP请求（含重试）都向服务商限流器申请一个令牌"""
+        primary = EnhancedNewsTranslator(api_key='test')
+        accumulator = make_translation_accumulator(primary, [FakeTranslator('fallback')])
+        accumulator.translation_batch_size = 10
+        limiter = accumulator.rate_limiters.get('siliconflow')
+        primary.rate_limiter = limiter
+        primary.retry_delay = 0
+
+        with patch('translation.core.http_transport.urlopen', side_effect=RuntimeError('upstream timeout')) as urlopen:
+            accumulator._process_new_articles(make_articles(5))
+
+        self.assertEqual(urlopen.call_count, 2 * primary.max_retries)  # 标题和描述各一次批量请求
+        self.assertEqual(limiter.total_acquired, urlopen.call_count)
+
+    def test_duplicate_articles_in_batch_processed_once(self):
+        """测试同一批次中多个类别返回的同一篇文章只翻译一次"""
+        primary = FakeTranslator('primary')
+        accumulator = make_translation_accumulator(primary)
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        accumulator.news_index_file = os.path.join(temp_dir.name, 'news_index.json')
+        accumulator.retention_days = 3000
+        articles = make_articles(2)
+        duplicate = dict(articles[0], search_category='科技创新')
+
+        merged = accumulator.merge_news_data([], articles + [duplicate])
+
+        self.assertEqual(len(merged), 2)
+        self.assertEqual(len(primary.calls), 4)
+
+
+class TestTranslationOutcomes(unittest.TestCase):
+    """结构化翻译结果测试"""
+
+    def test_metadata_names_service_that_translated_each_field(self):
+        """测试元数据记录各字段实际使用的翻译服务，并发翻译的文章互不覆盖"""
+        primary = FakeTranslator('primary', failing={'OpenAI story 0'})
+        fallback = FakeTranslator('fallback')
+        accumulator = make_translation_accumulator(primary, [fallback])
+
+        news_items = accumulator._process_new_articles(make_articles(3))
+
+        metadata = news_items[0]['translation_metadata']
+        self.assertEqual(news_items[0]['title'], 'fallback译:OpenAI story 0')
+        self.assertEqual(metadata['title_translation']['service'], 'fallback')
+        self.assertEqual(metadata['description_translation']['service'], 'primary')
+        for item in news_items[1:]:
+            self.assertEqual(item['translation_metadata']['title_translation']['service'], 'primary')
+
+    def test_outcome_reports_attempts_and_method(self):
+        """测试降级结果记录尝试次数和翻译方式"""
+        primary = FakeTranslator('primary', failing={'Hello'})
+        fallback = FakeTranslator('fallback', failing={'Hello'})
+        accumulator = make_translation_accumulator(primary, [fallback])
+
+        outcome = accumulator._translate_title('Hello', 'AI科技')
+        self.assertEqual(outcome.attempts, 2)
+        self.assertEqual(outcome.method, 'rule_based')
+        self.assertFalse(outcome.is_ai_translated)
+        self.assertEqual(outcome.text, '🤖 Hello')
+
+        outcome = accumulator._translate_title('World', 'AI科技')
+        self.assertEqual((outcome.attempts, outcome.method, outcome.service_name), (1, 'ai_translation', 'primary'))
+        self.assertTrue(outcome.is_ai_translated)
+
+
+class TestBatchTranslationFallback(unittest.TestCase):
+    """批量翻译失败后的逐条降级测试"""
+
+    def test_failed_batch_skips_primary_for_each_item(self):
+        """测试整批请求失败时逐条降级不再请求主翻译器"""
+        primary = FakeBatchTranslator('primary', batch_error='upstream timeout')
+        fallback = FakeTranslator('fallback')
+        accumulator = make_translation_accumulator(primary, [fallback])
+        accumulator.translation_batch_size = 10
+
+        news_items = accumulator._process_new_articles(make_articles(3))
+
+        self.assertEqual(primary.batch_calls, 2)  # 标题和描述各一批
+        self.assertEqual(primary.calls, [])
+        self.assertEqual(len(fallback.calls), 6)
+        self.assertEqual(news_items[0]['title'], 'fallback译:OpenAI story 0')
+
+    def test_partially_failed_batch_retries_primary(self):
+        """测试批量结果中个别条目缺失时，该条目仍先逐条请求主翻译器"""
+        primary = FakeBatchTranslator('primary', failing={'OpenAI story 1'})
+        fallback = FakeTranslator('fallback')
+        accumulator = make_translation_accumulator(primary, [fallback])
+        accumulator.translation_batch_size = 10
+
+        news_items = accumulator._process_new_articles(make_articles(3))
+
+        self.assertEqual(primary.calls, ['OpenAI story 1'])
+        self.assertEqual(fallback.calls, ['OpenAI story 1'])  # 主翻译器逐条也失败
+        self.assertEqual(news_items[0]['title'], 'primary批译:OpenAI story 0')
+        self.assertEqual(news_items[1]['title'], 'fallback译:OpenAI story 1')
+
+    def test_failed_batch_not_retried_inside_real_translator(self):
+        """测试真实翻译器整批失败时只发出批量请求，逐条降级交给累积器的降级链"""
+        primary = EnhancedNewsTranslator(api_key='test')
+        fallback = FakeTranslator('fallback')
+        accumulator = make_translation_accumulator(primary, [fallback])
+        accumulator.translation_batch_size = 10
+
+        with patch.object(primary, '_make_request', side_effect=RuntimeError('upstream timeout')) as mock_request:
+            news_items = accumulator._process_new_articles(make_articles(5))
+
+        self.assertEqual(mock_request.call_count, 2)  # 标题和描述各一次批量请求
+        self.assertEqual(len(fallback.calls), 10)
+        self.assertEqual(news_items[4]['title'], 'fallback译:OpenAI story 4')
+
+
+class TestTranslationCacheWarmUp(unittest.TestCase):
+    """翻译缓存预热测试"""
+
+    def _published_news(self, title, fingerprint):
+        metadata = {'title_translation': {'is_ai_translated': True, 'service': 'primary', 'confidence': 0.9}}
+        if fingerprint is not None:
+            metadata['cache_fingerprint'] = fingerprint
+        return {'original_title': title, 'title': f'中文标题：{title}', 'search_category': 'AI科技',
+                'translation_metadata': metadata}
+
+    def _warmup_accumulator(self, news_data_file, warmup_data_files):
+        """创建只包含预热配置的累积器，返回 (累积器, 记录预热条目的列表)"""
+        warmed = []
+        accumulator = AINewsAccumulator.__new__(AINewsAccumulator)
+        accumulator.news_data_file = news_data_file
+        accumulator.warmup_data_files = warmup_data_files
+        accumulator.translation_cache_fingerprint = 'current'
+        accumulator.translation_cache = Mock()
+        accumulator.translation_cache.warm_up.side_effect = lambda entries, fingerprint: warmed.extend(entries) or 0
+        return accumulator, warmed
+
+    def test_only_current_fingerprint_is_warmed(self):
+        """测试新闻数据已记录指纹后只预热当前指纹的译文，没有记录指纹或指纹不同的译文视为过时"""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        data_file = os.path.join(temp_dir.name, 'news_data.json')
+        with open(data_file, 'w', encoding='utf-8') as f:
+            json.dump([self._published_news('Current story', 'current'),
+                       self._published_news('Legacy story', None),
+                       self._published_news('Stale story', 'previous')], f, ensure_ascii=False)
+
+        accumulator, warmed = self._warmup_accumulator(data_file, [data_file])
+
+        accumulator._warm_up_translation_cache()
+
+        self.assertEqual([(text, namespace) for text, _, _, namespace in warmed],
+                         [('Current story', 'zh|title|AI科技')])
+
+    def test_legacy_translations_adopted_until_fingerprints_written(self):
+        """测试首次写入前采用没有指纹的已发布译文，写入时补记指纹后旧格式数据不再采用"""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        data_file = os.path.join(temp_dir.name, 'news_data.json')
+        enhanced_file = os.path.join(temp_dir.name, 'enhanced_news_data.json')
+        news_items = [self._published_news('Legacy story', None)]
+        with open(data_file, 'w', encoding='utf-8') as f:
+            json.dump(news_items, f, ensure_ascii=False)
+        with open(enhanced_file, 'w', encoding='utf-8') as f:
+            json.dump([{'title': 'Enhanced story', 'translated_title': '增强版标题'}], f, ensure_ascii=False)
+        accumulator, warmed = self._warmup_accumulator(data_file, [data_file, enhanced_file])
+
+        accumulator._warm_up_translation_cache()
+
+        namespaces = {text: [] for text, _, _, _ in warmed}
+        for text, _, _, namespace in warmed:
+            namespaces[text].append(namespace)
+        self.assertEqual(namespaces['Legacy story'], ['zh|title|AI科技'])
+        self.assertIn('zh|title|游戏科技', namespaces['Enhanced story'])  # 旧格式数据没有类别，对所有类别预热
+
+        accumulator._stamp_legacy_fingerprints(news_items)
+        with open(data_file, 'w', encoding='utf-8') as f:
+            json.dump(news_items, f, ensure_ascii=False)
+        warmed.clear()
+
+        accumulator._warm_up_translation_cache()
+
+        self.assertEqual(news_items[0]['translation_metadata']['cache_fingerprint'], 'current')
+        self.assertEqual([text for text, _, _, _ in warmed], ['Legacy story'])
+
+    def test_rewarm_starts_after_new_articles_translated(self):
+        """测试后台重新预热在合并（翻译）新文章之后才启动，不与实时翻译争抢主翻译器"""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        events = []
+        accumulator = make_translation_accumulator(FakeTranslator('primary'))
+        accumulator.news_data_file = os.path.join(temp_dir.name, 'news_data.json')
+        accumulator.article_index = None
+        accumulator.retention_days = 7
+        accumulator.translation_cache = Mock()
+        accumulator.translation_cache.start_rewarm.side_effect = lambda *args: events.append('rewarm')
+        accumulator.load_existing_news = Mock(return_value=[])
+        accumulator.get_latest_news = Mock(return_value=make_articles(1))
+        accumulator.merge_news_data = Mock(side_effect=lambda existing, new: events.append('merge') or [])
+        accumulator.generate_html_site = Mock(return_value=True)
+        accumulator._report_cache_stats = Mock()
+
+        with patch.dict(os.environ, {'TRANSLATION_CACHE_REWARM_LIMIT': '5'}), patch('os.makedirs'):
+            self.assertTrue(accumulator.run())
+
+        self.assertEqual(events, ['merge', 'rewarm'])
+        accumulator.translation_cache.close.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
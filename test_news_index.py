@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试持久化文章索引
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from datetime import datetime, timezone
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_index import ArticleIndex
+
+
+def _news(news_id, url, title, hours_ago):
+    published = datetime.fromtimestamp(time.time() - hours_ago * 3600, tz=timezone.utc)
+    return {'id': news_id, 'url': url, 'original_title': title, 'title': f"中文{title}",
+            'publishedAt': published.strftime('%Y-%m-%dT%H:%M:%SZ')}
+
+
+class TestArticleIndex(unittest.TestCase):
+    """文章索引测试"""
+
+    def setUp(self):
+        """测试初始化"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'news_index.json')
+
+    def tearDown(self):
+        """测试清理"""
+        self.temp_dir.cleanup()
+
+    def test_order_dedupe_and_expire(self):
+        """测试按发布时间排序、URL和标题去重以及过期移除"""
+        index = ArticleIndex(self.path)
+        self.assertTrue(index.add(_news('a', 'u1', 'Old story', 100)))
+        self.assertTrue(index.add(_news('b', 'u2', 'Fresh story', 1)))
+        self.assertTrue(index.add(_news('c', 'u3', 'Middle story', 10)))
+        self.assertFalse(index.add({'id': 'd', 'url': 'u4', 'title': 'No date', 'publishedAt': ''}))
+
+        self.assertEqual(index.newest_first(), ['b', 'c', 'a'])
+        self.assertEqual(index.find_duplicate('u2', 'anything'), 'b')
+        self.assertEqual(index.find_duplicate('other', '  middle   STORY '), 'c')
+        self.assertIsNone(index.find_duplicate('other', 'Unrelated'))
+
+        # 破折号后的内容属于标题正文，不能当作来源后缀忽略
+        self.assertTrue(index.add(_news('e', 'u5', 'Review - Worth It', 5)))
+        self.assertIsNone(index.find_duplicate('u6', 'Review - Not Worth It'))
+        self.assertIsNone(index.find_duplicate('u6', 'Review'))
+
+        self.assertEqual(index.expire(time.time() - 50 * 3600), ['a'])
+        self.assertEqual(index.newest_first(), ['b', 'e', 'c'])
+        self.assertIsNone(index.find_duplicate('u1', 'Old story'))
+
+    def test_save_load_and_reconcile(self):
+        """测试持久化后与新闻数据对齐"""
+        index = ArticleIndex(self.path)
+        for news in (_news('a', 'u1', 'First', 3), _news('b', 'u2', 'Second', 2)):
+            index.add(news)
+        index.save()
+
+        loaded = ArticleIndex.load(self.path)
+        self.assertEqual(loaded.newest_first(), ['b', 'a'])
+
+        # 数据中删除了a、新增了c
+        changed = loaded.reconcile([_news('b', 'u2', 'Second', 2), _news('c', 'u3', 'Third', 1)])
+        self.assertEqual(changed, 2)
+        self.assertEqual(loaded.newest_first(), ['c', 'b'])
+        self.assertEqual(loaded.reconcile([_news('b', 'u2', 'Second', 2), _news('c', 'u3', 'Third', 1)]), 0)
+
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('{broken')
+        self.assertEqual(len(ArticleIndex.load(self.path)), 0)
+
+        # 旧版本的索引（标题哈希规则不同）作废
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'version': ArticleIndex.VERSION - 1, 'next_seq': 1,
+                       'entries': [['a', 'u1', 'stale-hash', 1.0, 0]]}, f)
+        self.assertEqual(len(ArticleIndex.load(self.path)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
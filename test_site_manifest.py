@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试静态站点构建清单
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from site_manifest import BuildManifest, content_hash
+
+
+class TestBuildManifest(unittest.TestCase):
+    """构建清单测试"""
+
+    def setUp(self):
+        """测试初始化"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.site_root = self.temp_dir.name
+        self.manifest_path = os.path.join(self.site_root, 'build_manifest.json')
+
+    def tearDown(self):
+        """测试清理"""
+        self.temp_dir.cleanup()
+
+    def _page_path(self, page):
+        return os.path.join(self.site_root, page)
+
+    def test_skip_unchanged_and_remove_stale(self):
+        """测试未变化的页面跳过、过期页面删除、未记录的页面保留"""
+        manifest = BuildManifest(self.manifest_path, self.site_root)
+        self.assertTrue(manifest.write_page('news/a.html', 'A', content_hash('a-v1')))
+        self.assertTrue(manifest.write_page('news/b.html', 'B', content_hash('b-v1')))
+        self.assertTrue(manifest.write_page('index.html', 'index'))
+        with open(self._page_path('news/other.html'), 'w', encoding='utf-8') as f:
+            f.write('其他脚本生成的页面')
+        manifest.save()
+
+        manifest = BuildManifest.load(self.manifest_path, self.site_root)
+        self.assertTrue(manifest.is_current('news/a.html', content_hash('a-v1')))
+        self.assertFalse(manifest.is_current('news/a.html', content_hash('a-v2')))
+        self.assertFalse(manifest.write_page('index.html', 'index'))  # 内容相同不重写
+
+        self.assertEqual(manifest.remove_stale(['news/a.html'], prefix='news/'), ['news/b.html'])
+        self.assertFalse(os.path.exists(self._page_path('news/b.html')))
+        self.assertTrue(os.path.exists(self._page_path('news/other.html')))
+        self.assertIn('index.html', manifest.pages)
+
+        # 页面文件被删除后需要重新生成
+        os.remove(self._page_path('news/a.html'))
+        self.assertFalse(manifest.is_current('news/a.html', content_hash('a-v1')))
+
+    def test_corrupt_manifest_rebuilds_everything(self):
+        """测试清单损坏时视为空清单"""
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            f.write('{broken')
+        self.assertEqual(BuildManifest.load(self.manifest_path, self.site_root).pages, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
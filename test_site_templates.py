@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试预编译页面模板、共享资源和详情页渲染
+"""
+
+import os
+import sys
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import patch
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_accumulator import AINewsAccumulator
+from site_templates import DETAIL_ASSETS, DETAIL_PAGE, CompiledTemplate, StaticAsset
+
+
+class TestCompiledTemplate(unittest.TestCase):
+    """预编译模板测试"""
+
+    def test_render_and_constants(self):
+        """测试占位符渲染和编译时常量"""
+        template = CompiledTemplate('<a href="{{ href }}">{{title}}</a>{{ title }}', {'href': '/x.css'})
+        self.assertEqual(template.fields, ['title', 'title'])
+        self.assertEqual(template.render({'title': 'AI'}), '<a href="/x.css">AI</a>AI')
+        self.assertNotEqual(template.fingerprint, CompiledTemplate('{{ title }}').fingerprint)
+        self.assertEqual(CompiledTemplate('{{ title }}').render({'title': 1}), '1')
+
+        with self.assertRaises(KeyError):
+            template.render({})
+
+    def test_detail_page_references_assets(self):
+        """测试详情页引用带哈希的共享资源而不是内联样式和脚本"""
+        self.assertNotIn('detail_css', DETAIL_PAGE.fields)
+        values = {field_name: '' for field_name in DETAIL_PAGE.fields}
+        html = DETAIL_PAGE.render(values)
+        self.assertNotIn('<style>', html)
+        for asset in DETAIL_ASSETS:
+            self.assertIn(f'../{asset.path}', html)
+
+        changed = StaticAsset('detail', 'css', 'body {}')
+        self.assertNotEqual(changed.path, StaticAsset('detail', 'css', 'body { color: red; }').path)
+        self.assertTrue(changed.path.startswith('assets/detail.') and changed.path.endswith('.css'))
+
+
+class TestDetailPageRendering(unittest.TestCase):
+    """详情页渲染测试"""
+
+    def setUp(self):
+        """测试初始化（只需要渲染相关的配置）"""
+        self.accumulator = AINewsAccumulator.__new__(AINewsAccumulator)
+        self.accumulator.render_chunk_size = 2
+        self.news_items = [
+            {'id': f'news{i}', 'title': f'标题{i}', 'description': '描述', 'url': f'https://example.com/{i}',
+             'original_title': f'OpenAI news {i}', 'original_description': 'Description'}
+            for i in range(5)
+        ]
+
+    def test_process_pool_matches_serial(self):
+        """测试多进程渲染结果与单进程一致且顺序不变"""
+        self.accumulator.render_max_workers = 1
+        serial = self.accumulator._render_detail_pages(self.news_items)
+        self.accumulator.render_max_workers = 2
+        parallel = self.accumulator._render_detail_pages(self.news_items)
+
+        self.assertEqual(parallel, serial)
+        self.assertIn('data-news-id="news3"', serial[3])
+
+    def test_fallback_when_pool_unavailable(self):
+        """测试进程池不可用时退回单进程渲染"""
+        self.accumulator.render_max_workers = 4
+        with patch('news_accumulator.ProcessPoolExecutor', side_effect=BrokenProcessPool('no workers')):
+            pages = self.accumulator._render_detail_pages(self.news_items)
+        self.assertEqual(len(pages), 5)
+        self.assertEqual(self.accumulator._render_detail_pages([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
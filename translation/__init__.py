@@ -6,6 +6,7 @@
 
 from .core.interfaces import (
     ITranslationService,
+    IAsyncTranslationService,
     ITranslationCache,
     IQualityAssessor,
     TranslationResult,
@@ -24,6 +25,7 @@ __version__ = "1.0.0"
 __all__ = [
     # 接口
     'ITranslationService',
+    'IAsyncTranslationService',
     'ITranslationCache', 
     'IQualityAssessor',
     # 数据模型
@@ -6,6 +6,7 @@
 
 from .interfaces import (
     ITranslationService,
+    IAsyncTranslationService,
     ITranslationCache,
     IQualityAssessor,
     TranslationResult,
@@ -17,6 +18,7 @@ from .interfaces import (
 
 __all__ = [
     'ITranslationService',
+    'IAsyncTranslationService',
     'ITranslationCache',
     'IQualityAssessor',
     'TranslationResult',
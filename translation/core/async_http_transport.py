@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+异步HTTP传输层 - 基于asyncio streams的按主机长连接池，供异步翻译服务使用
+"""
+
+import asyncio
+import io
+import os
+import ssl
+import sys
+import http.client
+import urllib.error
+import urllib.parse
+import urllib.request
+import weakref
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple, Union
+
+
+_DEFAULT_USER_AGENT = f"Python-urllib/{sys.version_info.major}.{sys.version_info.minor}"
+
+
+class _StaleConnectionError(Exception):
+    """复用的连接已被服务端关闭"""
+
+
+class AsyncResponse:
+    """异步请求的响应，内容已完整读取，用法与urllib响应的read()一致"""
+
+    def __init__(self, url: str, status: int, reason: str, headers: http.client.HTTPMessage, body: bytes):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self._body = body
+
+    def read(self) -> bytes:
+        """获取响应内容"""
+        return self._body
+
+    def getcode(self) -> int:
+        """获取HTTP状态码"""
+        return self.status
+
+
+class AsyncHostConnectionPool:
+    """单个主机的异步长连接池，用信号量限制并发连接数"""
+
+    def __init__(self, scheme: str, host: str, port: int, max_connections: int = 100,
+                 ssl_context: Optional[ssl.SSLContext] = None):
+        """
+        初始化连接池
+
+        Args:
+            scheme: http 或 https
+            host: 主机名
+            port: 端口
+            max_connections: 同时使用的最大连接数，超出的请求排队等待
+            ssl_context: HTTPS连接使用的SSL上下文
+        """
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.max_connections = max_connections
+        self.ssl_context = ssl_context
+        self.semaphore = asyncio.Semaphore(max_connections)
+        self._idle: Deque[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = deque()
+
+        # 统计信息
+        self.connections_created = 0
+        self.connections_reused = 0
+
+    async def acquire(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter, bool]:
+        """取出一个连接（调用方需已持有信号量），返回 (reader, writer, 是否复用)"""
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                self.connections_reused += 1
+                return reader, writer, True
+            writer.close()
+
+        reader, writer = await asyncio.open_connection(
+            self.host, self.port,
+            ssl=self.ssl_context if self.scheme == 'https' else None
+        )
+        self.connections_created += 1
+        return reader, writer, False
+
+    def release(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """归还可复用的连接"""
+        if writer.is_closing() or len(self._idle) >= self.max_connections:
+            writer.close()
+            return
+        self._idle.append((reader, writer))
+
+    def close(self):
+        """关闭所有空闲连接"""
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+    def get_statistics(self) -> Dict[str, int]:
+        """获取连接池统计信息"""
+        return {
+            'idle_connections': len(self._idle),
+            'max_connections': self.max_connections,
+            'connections_created': self.connections_created,
+            'connections_reused': self.connections_reused
+        }
+
+
+class AsyncHttpTransport:
+    """异步HTTP/1.1传输层，单个事件循环内共享
+
+    注意：连接和信号量绑定创建它们的事件循环，不能跨事件循环使用；
+    不支持环境变量代理配置。
+    """
+
+    def __init__(self, max_connections_per_host: int = 100, timeout: float = 30.0):
+        """
+        初始化异步传输层
+
+        Args:
+            max_connections_per_host: 每个主机的最大并发连接数
+            timeout: 调用方未指定时使用的默认超时（秒），覆盖建连、发送和读取全过程
+        """
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.ssl_context = ssl.create_default_context()
+        self._pools: Dict[Tuple[str, str, int], AsyncHostConnectionPool] = {}
+
+        # 统计信息
+        self.total_requests = 0
+        self.stale_retries = 0
+
+    def _get_pool(self, scheme: str, host: str, port: int) -> AsyncHostConnectionPool:
+        """获取主机连接池，不存在时创建"""
+        key = (scheme, host, port)
+        if key not in self._pools:
+            self._pools[key] = AsyncHostConnectionPool(
+                scheme, host, port, self.max_connections_per_host, self.ssl_context
+            )
+        return self._pools[key]
+
+    async def urlopen(self, request: Union[str, urllib.request.Request],
+                      timeout: Optional[float] = None) -> AsyncResponse:
+        """
+        发送请求并读取完整响应
+
+        Args:
+            request: URL或urllib.request.Request对象
+            timeout: 超时时间（秒），None表示使用默认值
+
+        Returns:
+            AsyncResponse: 响应
+
+        Raises:
+            urllib.error.HTTPError: 响应状态码 >= 400
+            urllib.error.URLError: 连接失败
+            asyncio.TimeoutError: 请求超时
+        """
+        if isinstance(request, str):
+            request = urllib.request.Request(request)
+        timeout = self.timeout if timeout is None else timeout
+
+        parsed = urllib.parse.urlsplit(request.full_url)
+        scheme = parsed.scheme.lower()
+        if scheme not in ('http', 'https'):
+            raise urllib.error.URLError(f"unsupported scheme: {scheme}")
+        port = parsed.port or (443 if scheme == 'https' else 80)
+
+        path = parsed.path or '/'
+        if parsed.query:
+            path = f"{path}?{parsed.query}"
+
+        self.total_requests += 1
+        pool = self._get_pool(scheme, parsed.hostname, port)
+        host_header = parsed.hostname if parsed.port is None else f"{parsed.hostname}:{parsed.port}"
+        payload = self._encode_request(request, path, host_header)
+
+        async with pool.semaphore:
+            status, reason, headers, body = await asyncio.wait_for(
+                self._send(pool, payload, request.get_method() == 'HEAD'), timeout
+            )
+
+        if status >= 400:
+            raise urllib.error.HTTPError(request.full_url, status, reason, headers, io.BytesIO(body))
+        return AsyncResponse(request.full_url, status, reason, headers, body)
+
+    @staticmethod
+    def _encode_request(request: urllib.request.Request, path: str, host_header: str) -> bytes:
+        """序列化HTTP/1.1请求"""
+        headers = {'Host': host_header}
+        headers.update(dict(request.header_items()))
+        headers.setdefault('User-agent', _DEFAULT_USER_AGENT)
+        headers['Accept-Encoding'] = 'identity'
+        headers['Connection'] = 'keep-alive'
+
+        body = request.data or b''
+        if request.data is not None:
+            headers.setdefault('Content-type', 'application/x-www-form-urlencoded')
+            headers['Content-Length'] = str(len(body))
+
+        lines = [f"{request.get_method()} {path} HTTP/1.1"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        return ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1') + body
+
+    async def _send(self, pool: AsyncHostConnectionPool, payload: bytes,
+                    head_request: bool) -> Tuple[int, str, http.client.HTTPMessage, bytes]:
+        """在池连接上完成一次请求，复用的连接已失效时换新连接重试一次"""
+        while True:
+            try:
+                reader, writer, reused = await pool.acquire()
+            except OSError as e:
+                raise urllib.error.URLError(e)
+
+            try:
+                writer.write(payload)
+                await writer.drain()
+                status, reason, headers, body, keep_alive = await self._read_response(reader, head_request)
+            except (_StaleConnectionError, ConnectionResetError, BrokenPipeError,
+                    asyncio.IncompleteReadError) as e:
+                writer.close()
+                if reused:
+                    self.stale_retries += 1
+                    continue
+                raise urllib.error.URLError(e)
+            except BaseException:
+                # 包括取消和超时：连接状态未知，不能复用
+                writer.close()
+                raise
+
+            if keep_alive:
+                pool.release(reader, writer)
+            else:
+                writer.close()
+            return status, reason, headers, body
+
+    @staticmethod
+    async def _read_response(reader: asyncio.StreamReader,
+                             head_request: bool) -> Tuple[int, str, http.client.HTTPMessage, bytes, bool]:
+        """读取响应行、响应头和响应体"""
+        status_line = await reader.readline()
+        if not status_line:
+            raise _StaleConnectionError("connection closed before response")
+
+        parts = status_line.decode('latin-1').rstrip('\r\n').split(' ', 2)
+        if len(parts) < 2 or not parts[0].startswith('HTTP/'):
+            raise urllib.error.URLError(f"bad status line: {status_line!r}")
+        version, status = parts[0], int(parts[1])
+        reason = parts[2] if len(parts) > 2 else ''
+
+        header_lines = []
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            header_lines.append(line)
+        headers = http.client.parse_headers(io.BytesIO(b''.join(header_lines) + b'\r\n'))
+
+        connection_header = (headers.get('Connection') or '').lower()
+        keep_alive = version != 'HTTP/1.0' and connection_header != 'close'
+
+        if head_request or status in (204, 304) or 100 <= status < 200:
+            body = b''
+        elif (headers.get('Transfer-Encoding') or '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size_line = await reader.readline()
+                size = int(size_line.split(b';', 1)[0].strip(), 16)
+                if size == 0:
+                    # 跳过trailer
+                    while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b''.join(chunks)
+        elif headers.get('Content-Length') is not None:
+            body = await reader.readexactly(int(headers['Content-Length']))
+        else:
+            body = await reader.read()
+            keep_alive = False
+
+        return status, reason, headers, body, keep_alive
+
+    def close(self):
+        """关闭所有空闲连接"""
+        for pool in self._pools.values():
+            pool.close()
+        self._pools.clear()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """获取传输层统计信息"""
+        hosts = {}
+        created = reused = 0
+        for (scheme, host, port), pool in self._pools.items():
+            pool_stats = pool.get_statistics()
+            created += pool_stats['connections_created']
+            reused += pool_stats['connections_reused']
+            hosts[f"{scheme}://{host}:{port}"] = pool_stats
+
+        return {
+            'total_requests': self.total_requests,
+            'stale_retries': self.stale_retries,
+            'connections_created': created,
+            'connections_reused': reused,
+            'reuse_rate': reused / (created + reused) if created + reused else 0.0,
+            'hosts': hosts
+        }
+
+
+# 每个事件循环一个传输层实例，事件循环结束后自动释放
+_transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncHttpTransport]" = weakref.WeakKeyDictionary()
+
+
+def get_default_transport() -> AsyncHttpTransport:
+    """获取当前事件循环共享的异步传输层（并发连接数和默认超时可通过环境变量配置）"""
+    loop = asyncio.get_running_loop()
+    transport = _transports.get(loop)
+    if transport is None:
+        transport = AsyncHttpTransport(
+            max_connections_per_host=int(os.getenv('ASYNC_HTTP_MAX_CONNECTIONS', '100')),
+            timeout=float(os.getenv('HTTP_TIMEOUT', '30'))
+        )
+        _transports[loop] = transport
+    return transport
+
+
+async def urlopen(request: Union[str, urllib.request.Request], timeout: Optional[float] = None) -> AsyncResponse:
+    """通过当前事件循环共享的异步传输层发送请求"""
+    return await get_default_transport().urlopen(request, timeout)
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+翻译缓存键 - 文本规范化流水线与MinHash近似重复查找
+"""
+
+import hashlib
+import re
+import threading
+import unicodedata
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple, Union
+
+
+Normalizer = Callable[[str], str]
+
+_QUOTE_TRANSLATION = str.maketrans({
+    '‘': "'", '’': "'", '‚': "'", '‛': "'", '′': "'",
+    '“': '"', '”': '"', '„': '"', '‟': '"', '″': '"',
+    '«': '"', '»': '"',
+    '–': '-', '—': '-', '−': '-',
+})
+
+# 可识别的新闻来源名称，标题末尾的 " - Reuters"、" | The Verge" 等后缀才会被去除。
+# 不匹配任意大写词组，否则 "Review - Worth It" 与 "Review - Not Worth It" 会被视为同一标题
+KNOWN_NEWS_SOURCES = (
+    'Reuters', 'Bloomberg', 'Associated Press', 'AP', 'AP News', 'AFP',
+    'BBC', 'BBC News', 'CNN', 'CNBC', 'NPR', 'Axios', 'Forbes', 'Fortune',
+    'The Verge', 'TechCrunch', 'Wired', 'Engadget', 'Ars Technica', 'VentureBeat',
+    'ZDNet', 'ZDNET', 'CNET', 'The Information', 'MIT Technology Review',
+    'The Wall Street Journal', 'Wall Street Journal', 'WSJ', 'Financial Times', 'FT',
+    'The New York Times', 'New York Times', 'The Washington Post', 'The Guardian',
+    'Business Insider', 'Insider', 'MarketWatch', 'Yahoo Finance', "Barron's",
+    'The Economist', 'Nikkei Asia', 'South China Morning Post', 'SCMP',
+)
+
+# 标题末尾的来源后缀，如 " - Reuters"、" | The Verge"、" — BBC News"
+_SOURCE_SUFFIX_PATTERN = re.compile(
+    r"\s+[-|–—]\s+(?:"
+    + '|'.join(re.escape(source) for source in sorted(KNOWN_NEWS_SOURCES, key=len, reverse=True))
+    + r")\s*$",
+    re.IGNORECASE
+)
+# 只对标题长度的文本去除来源后缀，避免误删正文末尾内容
+_SOURCE_SUFFIX_MAX_TEXT_LENGTH = 300
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def normalize_unicode(text: str) -> str:
+    """统一Unicode兼容字符（全角字母、连字等）"""
+    return unicodedata.normalize('NFKC', text)
+
+
+def normalize_quotes(text: str) -> str:
+    """将弯引号和长短破折号替换为ASCII字符"""
+    return text.translate(_QUOTE_TRANSLATION)
+
+
+def normalize_whitespace(text: str) -> str:
+    """合并连续空白并去除首尾空白"""
+    return _WHITESPACE_PATTERN.sub(' ', text).strip()
+
+
+def strip_source_suffix(text: str) -> str:
+    """去除标题末尾的已知新闻来源后缀（见KNOWN_NEWS_SOURCES）"""
+    if len(text) > _SOURCE_SUFFIX_MAX_TEXT_LENGTH:
+        return text
+    stripped = _SOURCE_SUFFIX_PATTERN.sub('', text)
+    # 整个文本都像来源名时保留原文
+    return stripped if stripped.strip() else text
+
+
+def normalize_case(text: str) -> str:
+    """忽略大小写"""
+    return text.casefold()
+
+
+KEY_NORMALIZERS: Dict[str, Normalizer] = {
+    'unicode': normalize_unicode,
+    'quotes': normalize_quotes,
+    'whitespace': normalize_whitespace,
+    'source_suffix': strip_source_suffix,
+    'case': normalize_case,
+}
+
+# 默认不去除来源后缀：破折号后的内容可能是标题正文，去除与否由调用方按数据来源选择
+DEFAULT_KEY_NORMALIZERS = ('unicode', 'quotes', 'whitespace', 'case')
+
+
+class KeyNormalizer:
+    """缓存键规范化流水线，按顺序执行各规范化步骤"""
+
+    def __init__(self, steps: Optional[Sequence[Union[str, Normalizer]]] = None):
+        """
+        初始化规范化流水线
+
+        Args:
+            steps: 规范化步骤，可以是KEY_NORMALIZERS中的名称或自定义函数；
+                   None表示使用默认步骤，空列表表示不做规范化
+        """
+        if steps is None:
+            steps = DEFAULT_KEY_NORMALIZERS
+
+        self.steps: List[Normalizer] = []
+        for step in steps:
+            if callable(step):
+                self.steps.append(step)
+            elif step in KEY_NORMALIZERS:
+                self.steps.append(KEY_NORMALIZERS[step])
+            else:
+                raise ValueError(f"未知的缓存键规范化步骤: {step}")
+
+    def __call__(self, text: str) -> str:
+        """规范化文本"""
+        for step in self.steps:
+            text = step(text)
+        return text
+
+
+def tokenize(text: str) -> FrozenSet[str]:
+    """提取文本中的词集合"""
+    return frozenset(_TOKEN_PATTERN.findall(text.lower()))
+
+
+def jaccard_similarity(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """两个词集合的Jaccard相似度"""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class MinHashIndex:
+    """MinHash局部敏感哈希近似重复索引（线程安全）
+
+    每个文本的词集合计算 bands*rows 个MinHash值，按段建立倒排表，
+    共享任意一段的已索引文本作为候选，再用精确的Jaccard相似度确认。
+    默认8段x4行时，相似度0.8的文本被召回的概率约为99.6%。
+    """
+
+    _PRIME = (1 << 61) - 1
+
+    def __init__(self, threshold: float = 0.8, min_tokens: int = 6, bands: int = 8, rows: int = 4):
+        """
+        初始化索引
+
+        Args:
+            threshold: Jaccard相似度阈值，不低于该值视为近似重复
+            min_tokens: 参与近似匹配的最少词数，过短的文本容易误匹配
+            bands: LSH段数
+            rows: 每段包含的MinHash值个数
+        """
+        self.threshold = threshold
+        self.min_tokens = min_tokens
+        self.bands = bands
+        self.rows = rows
+
+        # 固定种子生成哈希函数参数，保证不同进程的签名一致
+        seed = hashlib.blake2b(b'minhash', digest_size=8).digest()
+        self._coefficients = []
+        for i in range(bands * rows):
+            digest = hashlib.blake2b(seed + i.to_bytes(4, 'big'), digest_size=16).digest()
+            a = int.from_bytes(digest[:8], 'big') % self._PRIME or 1
+            b = int.from_bytes(digest[8:], 'big') % self._PRIME
+            self._coefficients.append((a, b))
+
+        self._buckets: List[Dict[Tuple[int, ...], Set[str]]] = [{} for _ in range(bands)]
+        self._entries: Dict[str, Tuple[FrozenSet[str], Tuple[Tuple[int, ...], ...]]] = {}
+        self._lock = threading.Lock()
+
+    def _signature(self, tokens: FrozenSet[str]) -> Tuple[Tuple[int, ...], ...]:
+        """计算MinHash签名并按段拆分"""
+        hashes = [int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+                  for token in tokens]
+        values = [min((a * h + b) % self._PRIME for h in hashes) for a, b in self._coefficients]
+        return tuple(tuple(values[i * self.rows:(i + 1) * self.rows]) for i in range(self.bands))
+
+    def add(self, key: str, text: str):
+        """加入索引"""
+        tokens = tokenize(text)
+        if len(tokens) < self.min_tokens:
+            return
+
+        signature = self._signature(tokens)
+        with self._lock:
+            self._remove_locked(key)
+            self._entries[key] = (tokens, signature)
+            for buckets, band in zip(self._buckets, signature):
+                buckets.setdefault(band, set()).add(key)
+
+    def remove(self, key: str):
+        """移出索引"""
+        with self._lock:
+            self._remove_locked(key)
+
+    def _remove_locked(self, key: str):
+        """移出索引（调用方需持有锁）"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for buckets, band in zip(self._buckets, entry[1]):
+            bucket = buckets.get(band)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del buckets[band]
+
+    def contains(self, key: str) -> bool:
+        """键是否已在索引中"""
+        with self._lock:
+            return key in self._entries
+
+    def find(self, text: str) -> Optional[Tuple[str, float]]:
+        """
+        查找最相似的已索引文本
+
+        Returns:
+            Optional[Tuple[str, float]]: (键, 相似度)，没有达到阈值的候选时返回None
+        """
+        tokens = tokenize(text)
+        if len(tokens) < self.min_tokens:
+            return None
+
+        signature = self._signature(tokens)
+        best: Optional[Tuple[str, float]] = None
+        with self._lock:
+            candidates = set()
+            for buckets, band in zip(self._buckets, signature):
+                candidates.update(buckets.get(band, ()))
+
+            for key in candidates:
+                similarity = jaccard_similarity(tokens, self._entries[key][0])
+                if similarity >= self.threshold and (best is None or similarity > best[1]):
+                    best = (key, similarity)
+
+        return best
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+翻译缓存指标 - 分级延迟直方图、读写字节数和淘汰次数，跨进程累计保存到SQLite
+"""
+
+import bisect
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Tuple
+
+
+# 延迟直方图各桶的上限（微秒），超出最后一个上限的记录计入溢出桶
+LATENCY_BUCKETS_US = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000, 250000, 1000000)
+
+# 数据库中溢出桶的上限标记
+_OVERFLOW_BUCKET = -1
+
+
+class LatencyHistogram:
+    """固定分桶的延迟直方图，可合并、可求近似分位数"""
+
+    def __init__(self, bounds: Tuple[int, ...] = LATENCY_BUCKETS_US):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total_us = 0.0
+        self.max_us = 0.0
+
+    @property
+    def count(self) -> int:
+        """记录总数"""
+        return sum(self.counts)
+
+    def record(self, seconds: float):
+        """记录一次耗时"""
+        us = seconds * 1e6
+        self.counts[bisect.bisect_left(self.bounds, us)] += 1
+        self.total_us += us
+        self.max_us = max(self.max_us, us)
+
+    def merge(self, other: "LatencyHistogram"):
+        """合并另一个相同分桶的直方图"""
+        if other.bounds != self.bounds:
+            raise ValueError("直方图分桶不一致，无法合并")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total_us += other.total_us
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, p: float) -> float:
+        """
+        近似分位数（微秒），返回所在桶的上限；落在溢出桶时返回最大值
+
+        Args:
+            p: 分位，取值0-100
+        """
+        total = self.count
+        if total == 0:
+            return 0.0
+
+        target = total * p / 100
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if bucket_count and seen >= target:
+                if index < len(self.bounds):
+                    return float(min(self.bounds[index], self.max_us))
+                return self.max_us
+        return self.max_us
+
+    def summary(self) -> Dict:
+        """输出平均值、分位数和各桶计数"""
+        total = self.count
+        return {
+            'count': total,
+            'avg_us': self.total_us / total if total else 0.0,
+            'p50_us': self.percentile(50),
+            'p95_us': self.percentile(95),
+            'p99_us': self.percentile(99),
+            'max_us': self.max_us,
+            # [桶上限（微秒，None表示溢出桶）, 计数]
+            'buckets': [[bound, bucket_count] for bound, bucket_count
+                        in zip(list(self.bounds) + [None], self.counts)]
+        }
+
+
+@dataclass
+class TierMetrics:
+    """单级缓存的指标"""
+    lookups: int = 0
+    hits: int = 0
+    bytes_read: int = 0
+    writes: int = 0
+    bytes_written: int = 0
+    evictions: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def hit_rate(self) -> float:
+        """命中率"""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def merge(self, other: "TierMetrics"):
+        """累加另一份指标"""
+        self.lookups += other.lookups
+        self.hits += other.hits
+        self.bytes_read += other.bytes_read
+        self.writes += other.writes
+        self.bytes_written += other.bytes_written
+        self.evictions += other.evictions
+        self.latency.merge(other.latency)
+
+    def is_empty(self) -> bool:
+        """是否没有任何记录"""
+        return not (self.lookups or self.writes or self.evictions or self.latency.count)
+
+    def summary(self) -> Dict:
+        """输出统计字典"""
+        return {
+            'lookups': self.lookups,
+            'hits': self.hits,
+            'hit_rate': self.hit_rate,
+            'bytes_read': self.bytes_read,
+            'writes': self.writes,
+            'bytes_written': self.bytes_written,
+            'evictions': self.evictions,
+            'latency': self.latency.summary()
+        }
+
+
+class CacheMetricsStore:
+    """在SQLite中累计保存各级缓存指标
+
+    每次保存只追加增量（UPSERT累加），多个进程共用同一个数据库时不会相互覆盖。
+    """
+
+    _CREATE_SQL = (
+        """
+        CREATE TABLE IF NOT EXISTS cache_tier_metrics (
+            tier TEXT PRIMARY KEY,
+            lookups INTEGER NOT NULL DEFAULT 0,
+            hits INTEGER NOT NULL DEFAULT 0,
+            bytes_read INTEGER NOT NULL DEFAULT 0,
+            writes INTEGER NOT NULL DEFAULT 0,
+            bytes_written INTEGER NOT NULL DEFAULT 0,
+            evictions INTEGER NOT NULL DEFAULT 0,
+            latency_total_us REAL NOT NULL DEFAULT 0,
+            latency_max_us REAL NOT NULL DEFAULT 0,
+            updated_at TEXT
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS cache_latency_buckets (
+            tier TEXT NOT NULL,
+            upper_us INTEGER NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (tier, upper_us)
+        )
+        """
+    )
+    _UPSERT_TIER_SQL = """
+        INSERT INTO cache_tier_metrics
+        (tier, lookups, hits, bytes_read, writes, bytes_written, evictions,
+         latency_total_us, latency_max_us, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(tier) DO UPDATE SET
+            lookups = lookups + excluded.lookups,
+            hits = hits + excluded.hits,
+            bytes_read = bytes_read + excluded.bytes_read,
+            writes = writes + excluded.writes,
+            bytes_written = bytes_written + excluded.bytes_written,
+            evictions = evictions + excluded.evictions,
+            latency_total_us = latency_total_us + excluded.latency_total_us,
+            latency_max_us = MAX(latency_max_us, excluded.latency_max_us),
+            updated_at = excluded.updated_at
+    """
+    _UPSERT_BUCKET_SQL = """
+        INSERT INTO cache_latency_buckets (tier, upper_us, count) VALUES (?, ?, ?)
+        ON CONFLICT(tier, upper_us) DO UPDATE SET count = count + excluded.count
+    """
+
+    def __init__(self, pool):
+        """
+        初始化指标存储
+
+        Args:
+            pool: 提供connection()上下文管理器的SQLite连接池
+        """
+        self.pool = pool
+        with self.pool.connection() as conn:
+            for sql in self._CREATE_SQL:
+                conn.execute(sql)
+
+    def add(self, deltas: Dict[str, TierMetrics]):
+        """累加各级缓存的指标增量"""
+        deltas = {tier: metrics for tier, metrics in deltas.items() if not metrics.is_empty()}
+        if not deltas:
+            return
+
+        updated_at = datetime.now().isoformat()
+        tier_rows = []
+        bucket_rows = []
+        for tier, metrics in deltas.items():
+            tier_rows.append((
+                tier, metrics.lookups, metrics.hits, metrics.bytes_read, metrics.writes,
+                metrics.bytes_written, metrics.evictions, metrics.latency.total_us,
+                metrics.latency.max_us, updated_at
+            ))
+            bounds = list(metrics.latency.bounds) + [_OVERFLOW_BUCKET]
+            bucket_rows.extend(
+                (tier, bound, bucket_count)
+                for bound, bucket_count in zip(bounds, metrics.latency.counts) if bucket_count
+            )
+
+        with self.pool.connection() as conn:
+            conn.executemany(self._UPSERT_TIER_SQL, tier_rows)
+            conn.executemany(self._UPSERT_BUCKET_SQL, bucket_rows)
+
+    def load(self) -> Dict[str, TierMetrics]:
+        """读取累计的各级缓存指标"""
+        with self.pool.connection() as conn:
+            return _load_metrics(conn)
+
+    def reset(self):
+        """清空累计的指标"""
+        with self.pool.connection() as conn:
+            conn.execute("DELETE FROM cache_tier_metrics")
+            conn.execute("DELETE FROM cache_latency_buckets")
+
+
+def _load_metrics(conn: sqlite3.Connection) -> Dict[str, TierMetrics]:
+    """从数据库连接读取指标"""
+    metrics: Dict[str, TierMetrics] = {}
+    for row in conn.execute("""
+        SELECT tier, lookups, hits, bytes_read, writes, bytes_written, evictions,
+               latency_total_us, latency_max_us
+        FROM cache_tier_metrics
+    """):
+        tier_metrics = TierMetrics(
+            lookups=row[1], hits=row[2], bytes_read=row[3], writes=row[4],
+            bytes_written=row[5], evictions=row[6]
+        )
+        tier_metrics.latency.total_us = row[7]
+        tier_metrics.latency.max_us = row[8]
+        metrics[row[0]] = tier_metrics
+
+    for tier, upper_us, bucket_count in conn.execute("SELECT tier, upper_us, count FROM cache_latency_buckets"):
+        histogram = metrics.setdefault(tier, TierMetrics()).latency
+        if upper_us == _OVERFLOW_BUCKET:
+            histogram.counts[-1] += bucket_count
+        else:
+            # 分桶上限调整过时，旧记录计入不小于原上限的第一个桶
+            histogram.counts[bisect.bisect_left(histogram.bounds, upper_us)] += bucket_count
+
+    return metrics
+
+
+def load_cache_metrics(db_path: str) -> Dict[str, Dict]:
+    """
+    只读地读取缓存数据库中累计的各级缓存指标，供监控仪表板使用
+
+    Returns:
+        Dict[str, Dict]: 缓存级别 -> 统计字典；数据库或指标表不存在时返回空字典
+    """
+    try:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    except sqlite3.OperationalError:
+        return {}
+
+    try:
+        return {tier: metrics.summary() for tier, metrics in _load_metrics(conn).items()}
+    except sqlite3.OperationalError:
+        return {}
+    finally:
+        conn.close()
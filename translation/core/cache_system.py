@@ -4,20 +4,30 @@
 智能翻译缓存系统 - 多级缓存架构实现
 """
 
+import atexit
 import hashlib
+import heapq
+import itertools
 import json
 import sqlite3
 import pickle
 import threading
 import time
 import os
-from typing import Dict, Optional, List, Tuple
+import struct
+import weakref
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, Optional, List, Set, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import logging
 
 from translation.core.interfaces import ITranslationCache, TranslationResult, CachedTranslation
+from translation.core.cache_keys import KeyNormalizer, MinHashIndex
+from translation.core.cache_metrics import CacheMetricsStore, TierMetrics
 
 
 @dataclass
@@ -29,6 +39,11 @@ class CacheStats:
     memory_cache_hits: int = 0
     file_cache_hits: int = 0
     db_cache_hits: int = 0
+    write_buffer_hits: int = 0
+    near_duplicate_hits: int = 0
+    stale_hits: int = 0
+    rewarmed_items: int = 0
+    warmed_items: int = 0
     total_cached_items: int = 0
     cache_size_bytes: int = 0
     
@@ -48,246 +63,704 @@ class CacheStats:
 
 
 class MemoryCache:
-    """内存缓存层"""
+    """内存缓存层
     
-    def __init__(self, max_size: int = 1000, ttl_seconds: int = 3600):
+    OrderedDict按访问顺序维护LRU，淘汰和命中均为O(1)；
+    TTL过期时间放入最小堆，清理时只弹出已到期的项。
+    """
+    
+    # 估算单个缓存项的固定开销（对象头、元组、字典槽位等）
+    ITEM_OVERHEAD_BYTES = 256
+    
+    def __init__(self, max_size: int = 1000, ttl_seconds: int = 3600, max_bytes: Optional[int] = None):
         """
         初始化内存缓存
         
         Args:
             max_size: 最大缓存项数
             ttl_seconds: 生存时间（秒）
+            max_bytes: 最大占用字节数（估算值），None表示只按项数限制
         """
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self.cache: Dict[str, Tuple[CachedTranslation, float]] = {}
-        self.access_times: Dict[str, float] = {}
+        self.max_bytes = max_bytes
+        # 键 -> (缓存项, 写入时间)，顺序即LRU顺序（末尾为最近访问）
+        self.cache: "OrderedDict[str, Tuple[CachedTranslation, float]]" = OrderedDict()
+        self._item_bytes: Dict[str, int] = {}
+        self._expiry_heap: List[Tuple[float, float, str]] = []  # (过期时间, 写入时间, 键)
+        self.current_bytes = 0
         self.lock = threading.RLock()
+        
+        # 操作统计
+        self.op_stats = {
+            'get_count': 0,
+            'get_time': 0.0,
+            'put_count': 0,
+            'put_time': 0.0,
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expirations': 0
+        }
+    
+    def _estimate_bytes(self, value: CachedTranslation) -> int:
+        """估算缓存项占用的字节数"""
+        result = value.translation_result
+        text_bytes = len(result.original_text.encode('utf-8')) + len(result.translated_text.encode('utf-8'))
+        return text_bytes + len(value.content_hash) + len(result.service_name) + self.ITEM_OVERHEAD_BYTES
+    
+    def _remove(self, key: str):
+        """移除缓存项并更新字节统计（调用方需持有锁）"""
+        del self.cache[key]
+        self.current_bytes -= self._item_bytes.pop(key, 0)
     
     def get(self, key: str) -> Optional[CachedTranslation]:
         """获取缓存项"""
+        start = time.perf_counter()
         with self.lock:
-            if key not in self.cache:
-                return None
-            
-            cached_item, timestamp = self.cache[key]
-            
-            # 检查是否过期
-            if time.time() - timestamp > self.ttl_seconds:
-                del self.cache[key]
-                if key in self.access_times:
-                    del self.access_times[key]
-                return None
-            
-            # 更新访问时间
-            self.access_times[key] = time.time()
-            cached_item.usage_count += 1
-            
-            return cached_item
+            try:
+                entry = self.cache.get(key)
+                if entry is None:
+                    self.op_stats['misses'] += 1
+                    return None
+                
+                cached_item, timestamp = entry
+                
+                # 检查是否过期
+                if time.time() - timestamp > self.ttl_seconds:
+                    self._remove(key)
+                    self.op_stats['expirations'] += 1
+                    self.op_stats['misses'] += 1
+                    return None
+                
+                # 标记为最近访问
+                self.cache.move_to_end(key)
+                cached_item.usage_count += 1
+                self.op_stats['hits'] += 1
+                
+                return cached_item
+            finally:
+                self.op_stats['get_count'] += 1
+                self.op_stats['get_time'] += time.perf_counter() - start
     
     def put(self, key: str, value: CachedTranslation):
         """存储缓存项"""
+        start = time.perf_counter()
         with self.lock:
             current_time = time.time()
             
-            # 如果缓存已满，移除最久未访问的项
-            if len(self.cache) >= self.max_size and key not in self.cache:
-                self._evict_lru()
+            if key in self.cache:
+                self._remove(key)
             
+            item_bytes = self._estimate_bytes(value)
             self.cache[key] = (value, current_time)
-            self.access_times[key] = current_time
+            self._item_bytes[key] = item_bytes
+            self.current_bytes += item_bytes
+            heapq.heappush(self._expiry_heap, (current_time + self.ttl_seconds, current_time, key))
+            
+            # 超出项数或字节上限时淘汰最久未访问的项（不淘汰刚写入的项）
+            while len(self.cache) > 1 and (
+                len(self.cache) > self.max_size or
+                (self.max_bytes is not None and self.current_bytes > self.max_bytes)
+            ):
+                self._evict_lru()
+            
+            # 覆盖写入会在堆中留下失效记录，过多时重建
+            if len(self._expiry_heap) > 2 * len(self.cache) + 64:
+                self._rebuild_expiry_heap()
+            
+            self.op_stats['put_count'] += 1
+            self.op_stats['put_time'] += time.perf_counter() - start
+    
+    def get_many(self, keys: List[str]) -> Dict[str, CachedTranslation]:
+        """批量获取缓存项（只加锁一次），返回命中的 键 -> 缓存项"""
+        start = time.perf_counter()
+        found = {}
+        with self.lock:
+            current_time = time.time()
+            for key in keys:
+                entry = self.cache.get(key)
+                if entry is None:
+                    self.op_stats['misses'] += 1
+                    continue
+                
+                cached_item, timestamp = entry
+                if current_time - timestamp > self.ttl_seconds:
+                    self._remove(key)
+                    self.op_stats['expirations'] += 1
+                    self.op_stats['misses'] += 1
+                    continue
+                
+                self.cache.move_to_end(key)
+                cached_item.usage_count += 1
+                self.op_stats['hits'] += 1
+                found[key] = cached_item
+            
+            self.op_stats['get_count'] += len(keys)
+            self.op_stats['get_time'] += time.perf_counter() - start
+        return found
+    
+    def put_many(self, items: Dict[str, CachedTranslation]):
+        """批量存储缓存项（只加锁一次）"""
+        with self.lock:
+            for key, value in items.items():
+                self.put(key, value)
     
     def _evict_lru(self):
         """移除最久未访问的项"""
-        if not self.access_times:
+        if not self.cache:
             return
         
-        # 找到最久未访问的键
-        lru_key = min(self.access_times.keys(), key=lambda k: self.access_times[k])
-        
-        # 移除该项
-        if lru_key in self.cache:
-            del self.cache[lru_key]
-        del self.access_times[lru_key]
+        lru_key = next(iter(self.cache))
+        self._remove(lru_key)
+        self.op_stats['evictions'] += 1
+    
+    def _rebuild_expiry_heap(self):
+        """按当前缓存项重建过期堆（调用方需持有锁）"""
+        self._expiry_heap = [
+            (timestamp + self.ttl_seconds, timestamp, key)
+            for key, (_, timestamp) in self.cache.items()
+        ]
+        heapq.heapify(self._expiry_heap)
     
     def clear_expired(self) -> int:
-        """清理过期项"""
+        """清理过期项，只处理堆顶已到期的记录"""
         with self.lock:
             current_time = time.time()
-            expired_keys = []
+            expired_count = 0
             
-            for key, (_, timestamp) in self.cache.items():
-                if current_time - timestamp > self.ttl_seconds:
-                    expired_keys.append(key)
+            while self._expiry_heap and self._expiry_heap[0][0] < current_time:
+                _, timestamp, key = heapq.heappop(self._expiry_heap)
+                entry = self.cache.get(key)
+                # 键已被删除或重新写入时，堆中的记录已失效
+                if entry is not None and entry[1] == timestamp:
+                    self._remove(key)
+                    expired_count += 1
             
-            for key in expired_keys:
-                del self.cache[key]
-                if key in self.access_times:
-                    del self.access_times[key]
-            
-            return len(expired_keys)
+            self.op_stats['expirations'] += expired_count
+            return expired_count
     
     def size(self) -> int:
         """获取缓存大小"""
         return len(self.cache)
     
+    def size_bytes(self) -> int:
+        """获取缓存占用的估算字节数"""
+        return self.current_bytes
+    
+    def get_statistics(self) -> Dict[str, float]:
+        """获取内存缓存统计信息（延迟单位为微秒）"""
+        with self.lock:
+            stats = dict(self.op_stats)
+            stats['items'] = len(self.cache)
+            stats['bytes'] = self.current_bytes
+            stats['avg_get_us'] = stats['get_time'] / stats['get_count'] * 1e6 if stats['get_count'] else 0.0
+            stats['avg_put_us'] = stats['put_time'] / stats['put_count'] * 1e6 if stats['put_count'] else 0.0
+            return stats
+    
     def clear(self):
         """清空缓存"""
         with self.lock:
             self.cache.clear()
-            self.access_times.clear()
+            self._item_bytes.clear()
+            self._expiry_heap.clear()
+            self.current_bytes = 0
 
 
 class FileCache:
-    """文件缓存层"""
+    """文件缓存层 - 追加写入的日志分段存储
+    
+    所有缓存项顺序追加到分段文件中，内存索引记录每个键所在的分段和偏移；
+    覆盖和删除只追加新记录（删除为墓碑记录），失效数据占比过高时压缩重写。
+    每条记录带CRC32校验，启动时重建索引并丢弃损坏或写了一半的记录。
+    
+    记录格式: [负载长度 4字节][CRC32 4字节][pickle((键, 缓存项或None))]
+    """
+    
+    SEGMENT_SUFFIX = ".seg"
+    _HEADER = struct.Struct(">II")
     
-    def __init__(self, cache_dir: str = "translation_cache", max_files: int = 10000):
+    def __init__(self, cache_dir: str = "translation_cache", max_files: int = 10000,
+                 segment_max_bytes: int = 16 * 1024 * 1024, compaction_ratio: float = 0.5):
         """
         初始化文件缓存
         
         Args:
             cache_dir: 缓存目录
-            max_files: 最大文件数
+            max_files: 最大缓存项数（沿用原参数名）
+            segment_max_bytes: 单个分段文件的最大字节数，超出后切换到新分段
+            compaction_ratio: 失效数据占比超过该值时压缩
         """
         self.cache_dir = Path(cache_dir)
         self.max_files = max_files
-        self.cache_dir.mkdir(exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes
+        self.compaction_ratio = compaction_ratio
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.lock = threading.RLock()
+        
+        # 键 -> (分段编号, 偏移, 记录长度, 过期时间戳)，按写入顺序排列
+        self._index: "OrderedDict[str, Tuple[int, int, int, float]]" = OrderedDict()
+        # 读取次数只记录在内存中，不为了计数重写数据
+        self._usage_counts: Dict[str, int] = {}
+        self._readers: Dict[int, BinaryIO] = {}
+        self._writer: Optional[BinaryIO] = None
+        self._active_segment = 0
+        self._active_size = 0
+        self.live_bytes = 0
+        self.dead_bytes = 0
+        self.corrupted_records = 0
+        self.compactions = 0
+        self.evictions = 0  # 因过期或超出容量被移除的缓存项数
+        
+        with self.lock:
+            self._load_segments()
+            self._migrate_legacy_files()
     
-    def _get_file_path(self, key: str) -> Path:
-        """获取缓存文件路径"""
-        # 使用哈希值的前两位作为子目录，避免单个目录文件过多
-        hash_prefix = key[:2]
-        subdir = self.cache_dir / hash_prefix
-        subdir.mkdir(exist_ok=True)
-        return subdir / f"{key}.cache"
+    # ---- 分段文件 ----
     
-    def get(self, key: str) -> Optional[CachedTranslation]:
-        """获取缓存项"""
-        file_path = self._get_file_path(key)
+    def _segment_path(self, segment_id: int) -> Path:
+        """获取分段文件路径"""
+        return self.cache_dir / f"{segment_id:08d}{self.SEGMENT_SUFFIX}"
+    
+    def _segment_ids(self) -> List[int]:
+        """按编号列出已有的分段"""
+        ids = []
+        for path in self.cache_dir.glob(f"*{self.SEGMENT_SUFFIX}"):
+            try:
+                ids.append(int(path.stem))
+            except ValueError:
+                continue
+        return sorted(ids)
+    
+    def _load_segments(self):
+        """扫描所有分段重建索引"""
+        segment_ids = self._segment_ids()
+        for segment_id in segment_ids:
+            self._scan_segment(segment_id)
         
-        if not file_path.exists():
-            return None
+        self._active_segment = segment_ids[-1] if segment_ids else 1
+        self._open_writer()
+    
+    def _scan_segment(self, segment_id: int):
+        """顺序读取分段中的记录，遇到损坏的记录时截断其后的内容"""
+        path = self._segment_path(segment_id)
+        offset = 0
+        with open(path, 'rb') as f:
+            data = f.read()
         
-        try:
-            with open(file_path, 'rb') as f:
-                cached_item = pickle.load(f)
+        while offset + self._HEADER.size <= len(data):
+            length, checksum = self._HEADER.unpack_from(data, offset)
+            payload = data[offset + self._HEADER.size:offset + self._HEADER.size + length]
+            if len(payload) < length or zlib.crc32(payload) != checksum:
+                break
             
-            # 检查是否过期
-            if datetime.now() > cached_item.expires_at:
-                file_path.unlink(missing_ok=True)
-                return None
+            try:
+                key, value = pickle.loads(payload)
+            except Exception:
+                break
             
-            # 更新访问时间
-            file_path.touch()
-            cached_item.usage_count += 1
+            record_size = self._HEADER.size + length
+            self._apply_record(key, value, segment_id, offset, record_size)
+            offset += record_size
+        
+        if offset < len(data):
+            # 写了一半或校验失败的尾部记录，截断后继续追加
+            self.corrupted_records += 1
+            logging.warning(f"文件缓存分段 {path} 在偏移 {offset} 处损坏，已截断")
+            with open(path, 'r+b') as f:
+                f.truncate(offset)
+    
+    def _apply_record(self, key: str, value: Optional[CachedTranslation],
+                      segment_id: int, offset: int, record_size: int):
+        """将一条记录应用到索引"""
+        self._drop_from_index(key)
+        if value is None:
+            # 墓碑记录本身也是失效数据
+            self.dead_bytes += record_size
+            return
+        
+        self._index[key] = (segment_id, offset, record_size, value.expires_at.timestamp())
+        self.live_bytes += record_size
+    
+    def _drop_from_index(self, key: str) -> bool:
+        """从索引中移除键，原记录计入失效数据"""
+        entry = self._index.pop(key, None)
+        self._usage_counts.pop(key, None)
+        if entry is None:
+            return False
+        
+        self.live_bytes -= entry[2]
+        self.dead_bytes += entry[2]
+        return True
+    
+    def _open_writer(self):
+        """打开当前分段用于追加"""
+        path = self._segment_path(self._active_segment)
+        self._writer = open(path, 'ab')
+        self._active_size = self._writer.tell()
+    
+    def _reader(self, segment_id: int):
+        """获取分段的读句柄（复用已打开的句柄）"""
+        reader = self._readers.get(segment_id)
+        if reader is None:
+            reader = open(self._segment_path(segment_id), 'rb')
+            self._readers[segment_id] = reader
+        return reader
+    
+    def _append(self, records: List[Tuple[str, Optional[CachedTranslation]]]):
+        """追加一批记录并更新索引（调用方需持有锁）"""
+        for key, value in records:
+            payload = pickle.dumps((key, value), protocol=pickle.HIGHEST_PROTOCOL)
             
-            # 重新保存以更新使用计数
-            with open(file_path, 'wb') as f:
-                pickle.dump(cached_item, f)
+            if self._active_size and self._active_size + len(payload) > self.segment_max_bytes:
+                self._writer.close()
+                self._active_segment += 1
+                self._open_writer()
             
-            return cached_item
+            record = self._HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+            offset = self._active_size
+            self._writer.write(record)
+            self._active_size += len(record)
+            self._apply_record(key, value, self._active_segment, offset, len(record))
         
-        except Exception as e:
-            logging.warning(f"读取文件缓存失败 {file_path}: {e}")
-            file_path.unlink(missing_ok=True)
-            return None
+        self._writer.flush()
+    
+    def _read(self, key: str) -> Optional[CachedTranslation]:
+        """按索引读取记录并校验（调用方需持有锁）"""
+        segment_id, offset, record_size, _ = self._index[key]
+        reader = self._reader(segment_id)
+        reader.seek(offset)
+        data = reader.read(record_size)
+        
+        length, checksum = self._HEADER.unpack_from(data)
+        payload = data[self._HEADER.size:]
+        if len(payload) != length or zlib.crc32(payload) != checksum:
+            raise ValueError("checksum mismatch")
+        
+        stored_key, value = pickle.loads(payload)
+        if stored_key != key:
+            raise ValueError("key mismatch")
+        return value
+    
+    # ---- 缓存接口 ----
+    
+    def get(self, key: str) -> Optional[CachedTranslation]:
+        """获取缓存项"""
+        return self.get_many([key]).get(key)
+    
+    def get_many(self, keys: List[str]) -> Dict[str, CachedTranslation]:
+        """批量获取缓存项，返回命中的 键 -> 缓存项"""
+        found = {}
+        expired = []
+        now = time.time()
+        
+        with self.lock:
+            for key in keys:
+                entry = self._index.get(key)
+                if entry is None or key in found:
+                    continue
+                
+                # 检查是否过期（索引中保存了过期时间，无需读取数据）
+                if now > entry[3]:
+                    expired.append((key, None))
+                    self.evictions += 1
+                    continue
+                
+                try:
+                    cached_item = self._read(key)
+                except Exception as e:
+                    logging.warning(f"读取文件缓存失败 {key}: {e}")
+                    self.corrupted_records += 1
+                    expired.append((key, None))
+                    continue
+                
+                usage_count = self._usage_counts.get(key, 0) + 1
+                self._usage_counts[key] = usage_count
+                cached_item.usage_count += usage_count
+                found[key] = cached_item
+            
+            if expired:
+                self._append(expired)
+        
+        return found
     
     def put(self, key: str, value: CachedTranslation):
         """存储缓存项"""
+        self.put_many({key: value})
+    
+    def put_many(self, items: Dict[str, CachedTranslation]):
+        """批量存储缓存项"""
+        if not items:
+            return
+        
         with self.lock:
-            # 检查文件数量限制
-            if self._count_files() >= self.max_files:
+            # 检查缓存项数量限制
+            new_keys = sum(1 for key in items if key not in self._index)
+            if len(self._index) + new_keys > self.max_files:
                 self._cleanup_old_files()
             
-            file_path = self._get_file_path(key)
-            
             try:
-                with open(file_path, 'wb') as f:
-                    pickle.dump(value, f)
+                self._append(list(items.items()))
             except Exception as e:
-                logging.error(f"写入文件缓存失败 {file_path}: {e}")
+                logging.error(f"写入文件缓存失败 {self.cache_dir}: {e}")
+                return
+            
+            self._maybe_compact()
     
-    def _count_files(self) -> int:
-        """统计缓存文件数量"""
-        count = 0
-        for subdir in self.cache_dir.iterdir():
-            if subdir.is_dir():
-                count += len(list(subdir.glob("*.cache")))
-        return count
+    def delete(self, key: str):
+        """删除缓存项"""
+        with self.lock:
+            if key in self._index:
+                self._append([(key, None)])
     
     def _cleanup_old_files(self, cleanup_ratio: float = 0.2):
-        """清理旧文件"""
-        files_with_mtime = []
-        
-        # 收集所有缓存文件及其修改时间
-        for subdir in self.cache_dir.iterdir():
-            if subdir.is_dir():
-                for cache_file in subdir.glob("*.cache"):
-                    try:
-                        mtime = cache_file.stat().st_mtime
-                        files_with_mtime.append((cache_file, mtime))
-                    except OSError:
-                        continue
-        
-        # 按修改时间排序，删除最旧的文件
-        files_with_mtime.sort(key=lambda x: x[1])
-        cleanup_count = int(len(files_with_mtime) * cleanup_ratio)
-        
-        for cache_file, _ in files_with_mtime[:cleanup_count]:
-            try:
-                cache_file.unlink()
-            except OSError:
-                continue
+        """淘汰最早写入的缓存项（调用方需持有锁）"""
+        cleanup_count = max(1, int(len(self._index) * cleanup_ratio))
+        oldest = list(itertools.islice(self._index, cleanup_count))
+        self._append([(key, None) for key in oldest])
+        self.evictions += len(oldest)
     
     def clear_expired(self) -> int:
-        """清理过期文件"""
-        expired_count = 0
-        current_time = datetime.now()
-        
+        """清理过期项"""
+        with self.lock:
+            now = time.time()
+            expired = [key for key, entry in self._index.items() if now > entry[3]]
+            if expired:
+                self._append([(key, None) for key in expired])
+                self.evictions += len(expired)
+                self._maybe_compact()
+            return len(expired)
+    
+    # ---- 压缩 ----
+    
+    def _maybe_compact(self):
+        """失效数据占比过高时压缩（调用方需持有锁）"""
+        total = self.live_bytes + self.dead_bytes
+        if total >= self.segment_max_bytes // 4 and self.dead_bytes > total * self.compaction_ratio:
+            self.compact()
+    
+    def compact(self):
+        """将有效记录重写到新分段并删除旧分段"""
+        with self.lock:
+            old_segments = self._segment_ids()
+            self._close_handles()
+            
+            new_segment = (old_segments[-1] if old_segments else 0) + 1
+            temp_path = self.cache_dir / f"{new_segment:08d}.compacting"
+            new_index: "OrderedDict[str, Tuple[int, int, int, float]]" = OrderedDict()
+            offset = 0
+            
+            with open(temp_path, 'wb') as out:
+                for key, (segment_id, old_offset, record_size, expires_ts) in self._index.items():
+                    reader = self._reader(segment_id)
+                    reader.seek(old_offset)
+                    out.write(reader.read(record_size))
+                    new_index[key] = (new_segment, offset, record_size, expires_ts)
+                    offset += record_size
+            
+            self._close_handles()
+            os.replace(temp_path, self._segment_path(new_segment))
+            for segment_id in old_segments:
+                self._segment_path(segment_id).unlink(missing_ok=True)
+            
+            self._index = new_index
+            self.live_bytes = offset
+            self.dead_bytes = 0
+            self.compactions += 1
+            self._active_segment = new_segment
+            self._open_writer()
+    
+    # ---- 维护 ----
+    
+    def _migrate_legacy_files(self):
+        """导入旧版每键一个pickle文件的缓存并删除原文件"""
+        legacy_items = {}
         for subdir in self.cache_dir.iterdir():
-            if subdir.is_dir():
-                for cache_file in subdir.glob("*.cache"):
-                    try:
-                        with open(cache_file, 'rb') as f:
-                            cached_item = pickle.load(f)
-                        
-                        if current_time > cached_item.expires_at:
-                            cache_file.unlink()
-                            expired_count += 1
-                    
-                    except Exception:
-                        # 如果文件损坏，也删除它
-                        cache_file.unlink(missing_ok=True)
-                        expired_count += 1
+            if not subdir.is_dir():
+                continue
+            for cache_file in subdir.glob("*.cache"):
+                try:
+                    with open(cache_file, 'rb') as f:
+                        cached_item = pickle.load(f)
+                    if datetime.now() <= cached_item.expires_at:
+                        legacy_items[cache_file.stem] = cached_item
+                except Exception:
+                    pass
+                cache_file.unlink(missing_ok=True)
         
-        return expired_count
+        if legacy_items:
+            self._append(list(legacy_items.items()))
+            logging.info(f"已将 {len(legacy_items)} 个旧版文件缓存迁移到分段存储")
+    
+    def _close_handles(self):
+        """关闭所有文件句柄（调用方需持有锁）"""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        for reader in self._readers.values():
+            reader.close()
+        self._readers.clear()
+    
+    def close(self):
+        """关闭文件句柄"""
+        with self.lock:
+            self._close_handles()
+    
+    def size(self) -> int:
+        """获取缓存项数量"""
+        return len(self._index)
+    
+    def get_statistics(self) -> Dict[str, int]:
+        """获取分段存储统计信息"""
+        with self.lock:
+            return {
+                'items': len(self._index),
+                'segments': len(self._segment_ids()),
+                'live_bytes': self.live_bytes,
+                'dead_bytes': self.dead_bytes,
+                'corrupted_records': self.corrupted_records,
+                'compactions': self.compactions,
+                'evictions': self.evictions
+            }
     
     def clear(self):
         """清空文件缓存"""
-        for subdir in self.cache_dir.iterdir():
-            if subdir.is_dir():
-                for cache_file in subdir.glob("*.cache"):
-                    cache_file.unlink(missing_ok=True)
+        with self.lock:
+            self._close_handles()
+            for segment_id in self._segment_ids():
+                self._segment_path(segment_id).unlink(missing_ok=True)
+            
+            self._index.clear()
+            self._usage_counts.clear()
+            self.live_bytes = 0
+            self.dead_bytes = 0
+            self._active_segment = 1
+            self._open_writer()
+
+
+class SQLiteConnectionPool:
+    """SQLite连接池（线程安全），连接启用WAL日志模式"""
+    
+    def __init__(self, db_path: str, pool_size: int = 4, timeout: float = 30.0):
+        """
+        初始化连接池
+        
+        Args:
+            db_path: 数据库文件路径
+            pool_size: 最多保留的空闲连接数
+            timeout: 等待数据库锁的超时时间（秒）
+        """
+        self.db_path = db_path
+        # 内存数据库每个连接相互独立，只能使用单个连接
+        self.pool_size = 1 if db_path == ':memory:' else pool_size
+        self.timeout = timeout
+        self._idle: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._semaphore = threading.BoundedSemaphore(self.pool_size)
+    
+    def _new_connection(self) -> sqlite3.Connection:
+        """创建新连接并设置WAL模式"""
+        conn = sqlite3.connect(
+            self.db_path, timeout=self.timeout, check_same_thread=False, cached_statements=128
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
+    @contextmanager
+    def connection(self):
+        """取出一个连接，正常结束时提交事务，出错时回滚"""
+        self._semaphore.acquire()
+        try:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                conn = self._new_connection()
+            
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                with self._lock:
+                    self._idle.append(conn)
+        finally:
+            self._semaphore.release()
+    
+    def close(self):
+        """关闭所有空闲连接"""
+        with self._lock:
+            while self._idle:
+                self._idle.pop().close()
 
 
 class DatabaseCache:
-    """数据库缓存层（持久化存储）"""
+    """数据库缓存层（持久化存储）
+    
+    读取命中只执行SELECT；访问次数和最近访问时间先记录在内存中，
+    定期或积累到一定数量后批量写回数据库。
+    """
+    
+    # SQLite单条语句的参数个数上限为999，批量查询按此分块
+    MAX_QUERY_PARAMS = 500
+    
+    _COLUMNS = """
+        content_hash, original_text, translated_text, source_language,
+        target_language, service_name, confidence_score, quality_score,
+        created_at, expires_at, usage_count, fingerprint, cache_namespace
+    """
+    _SELECT_MANY_SQL = f"""
+        SELECT {_COLUMNS} FROM translation_cache WHERE content_hash IN ({{placeholders}})
+    """
+    _SELECT_STALE_SQL = f"""
+        SELECT {_COLUMNS} FROM translation_cache
+        WHERE cache_namespace IS NOT NULL
+          AND (fingerprint IS NULL OR fingerprint != ?)
+          AND expires_at >= ? AND usage_count >= ?
+        ORDER BY usage_count DESC, COALESCE(last_accessed, created_at) DESC
+        LIMIT ?
+    """
+    _DELETE_SQL = "DELETE FROM translation_cache WHERE content_hash = ?"
+    _INSERT_SQL = """
+        INSERT OR REPLACE INTO translation_cache 
+        (content_hash, original_text, translated_text, source_language, 
+         target_language, service_name, confidence_score, quality_score,
+         created_at, expires_at, usage_count, last_accessed, fingerprint, cache_namespace)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    _UPDATE_ACCESS_SQL = """
+        UPDATE translation_cache 
+        SET usage_count = usage_count + ?, last_accessed = ?
+        WHERE content_hash = ?
+    """
     
-    def __init__(self, db_path: str = "translation_cache.db"):
+    def __init__(self, db_path: str = "translation_cache.db", pool_size: int = 4,
+                 stats_flush_interval: float = 30.0, stats_flush_threshold: int = 500):
         """
         初始化数据库缓存
         
         Args:
             db_path: 数据库文件路径
+            pool_size: 连接池大小
+            stats_flush_interval: 访问统计写回间隔（秒）
+            stats_flush_threshold: 待写回的访问记录达到该数量时立即写回
         """
         self.db_path = db_path
         self.lock = threading.RLock()
+        self.pool = SQLiteConnectionPool(db_path, pool_size)
+        self.stats_flush_interval = stats_flush_interval
+        self.stats_flush_threshold = stats_flush_threshold
+        # 键 -> (新增访问次数, 最近访问时间)
+        self._pending_access: Dict[str, Tuple[int, str]] = {}
+        self._last_flush = time.monotonic()
+        self.evictions = 0  # 因过期被删除的缓存项数
         self._init_database()
     
     def _init_database(self):
         """初始化数据库"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.pool.connection() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS translation_cache (
                     content_hash TEXT PRIMARY KEY,
@@ -301,10 +774,18 @@ class DatabaseCache:
                     created_at TEXT NOT NULL,
                     expires_at TEXT NOT NULL,
                     usage_count INTEGER DEFAULT 0,
-                    last_accessed TEXT
+                    last_accessed TEXT,
+                    fingerprint TEXT,
+                    cache_namespace TEXT
                 )
             """)
             
+            # 旧版数据库补充新增的列
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(translation_cache)")}
+            for column in ('fingerprint', 'cache_namespace'):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE translation_cache ADD COLUMN {column} TEXT")
+            
             # 创建索引
             conn.execute("CREATE INDEX IF NOT EXISTS idx_expires_at ON translation_cache(expires_at)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_service_name ON translation_cache(service_name)")
@@ -312,63 +793,89 @@ class DatabaseCache:
     
     def get(self, key: str) -> Optional[CachedTranslation]:
         """获取缓存项"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT * FROM translation_cache WHERE content_hash = ?
-            """, (key,))
-            
-            row = cursor.fetchone()
-            if not row:
-                return None
+        return self.get_many([key]).get(key)
+    
+    def get_many(self, keys: List[str]) -> Dict[str, CachedTranslation]:
+        """批量获取缓存项（每批一次IN查询），返回命中的 键 -> 缓存项"""
+        keys = list(dict.fromkeys(keys))
+        rows = []
+        expired_keys = []
+        now = datetime.now()
+        
+        with self.pool.connection() as conn:
+            for i in range(0, len(keys), self.MAX_QUERY_PARAMS):
+                chunk = keys[i:i + self.MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                for row in conn.execute(self._SELECT_MANY_SQL.format(placeholders=placeholders), chunk):
+                    # 检查是否过期
+                    if now > datetime.fromisoformat(row[9]):
+                        expired_keys.append((row[0],))
+                    else:
+                        rows.append(row)
             
-            # 检查是否过期
-            expires_at = datetime.fromisoformat(row[9])
-            if datetime.now() > expires_at:
+            if expired_keys:
                 # 删除过期项
-                conn.execute("DELETE FROM translation_cache WHERE content_hash = ?", (key,))
-                return None
-            
-            # 更新访问信息
-            usage_count = row[10] + 1
-            conn.execute("""
-                UPDATE translation_cache 
-                SET usage_count = ?, last_accessed = ?
-                WHERE content_hash = ?
-            """, (usage_count, datetime.now().isoformat(), key))
-            
-            # 构造返回对象
-            translation_result = TranslationResult(
-                original_text=row[1],
-                translated_text=row[2],
-                source_language=row[3],
-                target_language=row[4],
-                service_name=row[5],
-                confidence_score=row[6],
-                timestamp=datetime.fromisoformat(row[8]),
-                quality_score=row[7]
-            )
+                conn.executemany(self._DELETE_SQL, expired_keys)
+        
+        # 记录访问信息，稍后批量写回
+        found = {}
+        accessed_at = now.isoformat()
+        with self.lock:
+            self.evictions += len(expired_keys)
+            for (key,) in expired_keys:
+                self._pending_access.pop(key, None)
             
-            cached_translation = CachedTranslation(
-                content_hash=row[0],
-                translation_result=translation_result,
-                created_at=datetime.fromisoformat(row[8]),
-                expires_at=expires_at,
-                usage_count=usage_count
-            )
-            # 确保content_hash与数据库中的一致
-            cached_translation.content_hash = row[0]
-            return cached_translation
+            for row in rows:
+                pending_count, _ = self._pending_access.get(row[0], (0, None))
+                pending_count += 1
+                self._pending_access[row[0]] = (pending_count, accessed_at)
+                found[row[0]] = self._row_to_cached(row, row[10] + pending_count)
+        
+        if found:
+            self._maybe_flush_access_stats()
+        return found
+    
+    @staticmethod
+    def _row_to_cached(row: Tuple, usage_count: int) -> CachedTranslation:
+        """由查询结果构造缓存项"""
+        translation_result = TranslationResult(
+            original_text=row[1],
+            translated_text=row[2],
+            source_language=row[3],
+            target_language=row[4],
+            service_name=row[5],
+            confidence_score=row[6],
+            timestamp=datetime.fromisoformat(row[8]),
+            quality_score=row[7]
+        )
+        
+        return CachedTranslation(
+            content_hash=row[0],  # 确保content_hash与数据库中的一致
+            translation_result=translation_result,
+            created_at=datetime.fromisoformat(row[8]),
+            expires_at=datetime.fromisoformat(row[9]),
+            usage_count=usage_count,
+            fingerprint=row[11],
+            cache_namespace=row[12]
+        )
     
     def put(self, key: str, value: CachedTranslation):
         """存储缓存项"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO translation_cache 
-                (content_hash, original_text, translated_text, source_language, 
-                 target_language, service_name, confidence_score, quality_score,
-                 created_at, expires_at, usage_count, last_accessed)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+        self.put_many({key: value})
+    
+    def put_many(self, items: Dict[str, CachedTranslation]):
+        """批量存储缓存项（单个事务）"""
+        if not items:
+            return
+        
+        with self.lock:
+            # 覆盖写入后旧记录的访问统计不再适用
+            for value in items.values():
+                self._pending_access.pop(value.content_hash, None)
+        
+        accessed_at = datetime.now().isoformat()
+        with self.pool.connection() as conn:
+            conn.executemany(self._INSERT_SQL, [(
                 value.content_hash,  # 使用CachedTranslation中的content_hash
                 value.translation_result.original_text,
                 value.translation_result.translated_text,
@@ -380,21 +887,79 @@ class DatabaseCache:
                 value.created_at.isoformat(),
                 value.expires_at.isoformat(),
                 value.usage_count,
-                datetime.now().isoformat()
-            ))
+                accessed_at,
+                value.fingerprint,
+                value.cache_namespace
+            ) for value in items.values()])
+        
+        self._maybe_flush_access_stats()
+    
+    def get_stale_entries(self, fingerprint: str, limit: int, min_usage: int = 0) -> List[CachedTranslation]:
+        """获取指纹与当前不一致的缓存项，按访问次数从高到低、最近访问优先排列"""
+        self.flush_access_stats()
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                self._SELECT_STALE_SQL, (fingerprint, datetime.now().isoformat(), min_usage, limit)
+            ).fetchall()
+        return [self._row_to_cached(row, row[10]) for row in rows]
+    
+    def get_recent_texts(self, limit: int) -> List[Tuple[str, str, str, str]]:
+        """获取最近写入的未过期缓存项原文，返回 (内容哈希, 原文, 源语言, 目标语言) 列表"""
+        with self.pool.connection() as conn:
+            return conn.execute("""
+                SELECT content_hash, original_text, source_language, target_language
+                FROM translation_cache WHERE expires_at >= ?
+                ORDER BY created_at DESC LIMIT ?
+            """, (datetime.now().isoformat(), limit)).fetchall()
+    
+    def _maybe_flush_access_stats(self):
+        """达到写回间隔或积累数量时写回访问统计"""
+        with self.lock:
+            due = (len(self._pending_access) >= self.stats_flush_threshold or
+                   (self._pending_access and time.monotonic() - self._last_flush >= self.stats_flush_interval))
+        if due:
+            self.flush_access_stats()
+    
+    def flush_access_stats(self) -> int:
+        """将内存中的访问统计批量写回数据库，返回写回的记录数"""
+        with self.lock:
+            pending, self._pending_access = self._pending_access, {}
+            self._last_flush = time.monotonic()
+        
+        if not pending:
+            return 0
+        
+        try:
+            with self.pool.connection() as conn:
+                conn.executemany(self._UPDATE_ACCESS_SQL, [
+                    (count, last_accessed, key) for key, (count, last_accessed) in pending.items()
+                ])
+        except sqlite3.Error as e:
+            logging.getLogger(__name__).warning(f"写回缓存访问统计失败: {e}")
+            return 0
+        
+        return len(pending)
+    
+    def close(self):
+        """写回访问统计并关闭连接池"""
+        self.flush_access_stats()
+        self.pool.close()
     
     def clear_expired(self) -> int:
         """清理过期项"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.pool.connection() as conn:
             cursor = conn.execute("""
                 DELETE FROM translation_cache WHERE expires_at < ?
             """, (datetime.now().isoformat(),))
-            
-            return cursor.rowcount
+        
+        with self.lock:
+            self.evictions += cursor.rowcount
+        return cursor.rowcount
     
     def get_cache_stats(self) -> Dict[str, int]:
         """获取缓存统计信息"""
-        with sqlite3.connect(self.db_path) as conn:
+        self.flush_access_stats()
+        with self.pool.connection() as conn:
             # 总缓存项数
             total_items = conn.execute("SELECT COUNT(*) FROM translation_cache").fetchone()[0]
             
@@ -419,7 +984,20 @@ class DatabaseCache:
 
 
 class SmartTranslationCache(ITranslationCache):
-    """智能翻译缓存系统 - 多级缓存架构"""
+    """智能翻译缓存系统 - 多级缓存架构
+    
+    写入策略（write_policy）:
+        write_through（默认）: 同步写入所有缓存层
+        write_behind: 同步写内存缓存，文件和数据库由后台线程批量写入；
+                      使用方应在结束时调用close()，未关闭就被回收的实例会丢失尚未落盘的缓存项
+    下级缓存命中后提升到文件缓存同样遵循写入策略，读取路径不做同步磁盘写入。
+    """
+    
+    WRITE_THROUGH = 'write_through'
+    WRITE_BEHIND = 'write_behind'
+    
+    # 分级统计的缓存级别
+    TIERS = ('memory', 'file', 'database')
     
     def __init__(self, config: Optional[Dict] = None):
         """
@@ -434,21 +1012,59 @@ class SmartTranslationCache(ITranslationCache):
         # 初始化各级缓存
         self.memory_cache = MemoryCache(
             max_size=self.config.get('memory_cache_size', 1000),
-            ttl_seconds=self.config.get('memory_ttl_seconds', 3600)
+            ttl_seconds=self.config.get('memory_ttl_seconds', 3600),
+            max_bytes=self.config.get('memory_cache_max_bytes')
         )
         
-        self.file_cache = FileCache(
-            cache_dir=self.config.get('file_cache_dir', 'translation_cache'),
-            max_files=self.config.get('max_cache_files', 10000)
-        )
+        self.file_cache: Optional[FileCache] = None
+        if self.config.get('enable_file_cache', True):
+            self.file_cache = FileCache(
+                cache_dir=self.config.get('file_cache_dir', 'translation_cache'),
+                max_files=self.config.get('max_cache_files', 10000)
+            )
         
         self.db_cache = DatabaseCache(
-            db_path=self.config.get('db_cache_path', 'translation_cache.db')
+            db_path=self.config.get('db_cache_path', 'translation_cache.db'),
+            pool_size=self.config.get('db_pool_size', 4),
+            stats_flush_interval=self.config.get('db_stats_flush_interval', 30.0)
         )
         
         # 缓存统计
         self.stats = CacheStats()
         
+        # 分级指标：本进程累计值和尚未保存到数据库的增量
+        self._metrics_lock = threading.Lock()
+        self.tier_metrics: Dict[str, TierMetrics] = {tier: TierMetrics() for tier in self.TIERS}
+        self._metrics_delta: Dict[str, TierMetrics] = {tier: TierMetrics() for tier in self.TIERS}
+        self._eviction_marks: Dict[str, int] = {tier: 0 for tier in self.TIERS}
+        self.metrics_store: Optional[CacheMetricsStore] = None
+        if self.config.get('persist_metrics', True):
+            self.metrics_store = CacheMetricsStore(self.db_cache.pool)
+        
+        # 缓存键规范化和近似重复查找
+        self.key_normalizer = KeyNormalizer(self.config.get('key_normalizers'))
+        self.near_duplicate_threshold = self.config.get('near_duplicate_threshold', 0.8)
+        self._near_duplicate_indexes: Optional[Dict[Tuple[str, str], MinHashIndex]] = None
+        if self.config.get('near_duplicate_lookup', False):
+            self._near_duplicate_indexes = {}
+            self._load_near_duplicate_index(self.config.get('near_duplicate_preload_limit', 5000))
+        
+        # 写入策略
+        self.write_policy = self.config.get('write_policy', self.WRITE_THROUGH)
+        if self.write_policy not in (self.WRITE_THROUGH, self.WRITE_BEHIND):
+            raise ValueError(f"不支持的缓存写入策略: {self.write_policy}")
+        self.write_batch_size = self.config.get('write_batch_size', 100)
+        self.write_flush_interval = self.config.get('write_flush_interval', 1.0)
+        # 待写入的缓存项: 内容哈希 -> (缓存项, 是否写入数据库)
+        self._pending_writes: Dict[str, Tuple[CachedTranslation, bool]] = {}
+        self._write_condition = threading.Condition()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._atexit_hook: Optional[Callable[[], None]] = None
+        self._rewarm_thread: Optional[threading.Thread] = None
+        self._closed = False
+        if self.write_policy == self.WRITE_BEHIND:
+            self._start_writer_thread()
+        
         # 自动清理配置
         self.auto_cleanup_enabled = self.config.get('auto_cleanup', True)
         self.cleanup_interval = self.config.get('cleanup_interval_hours', 24)
@@ -459,83 +1075,525 @@ class SmartTranslationCache(ITranslationCache):
             self._start_cleanup_thread()
     
     def _generate_cache_key(self, text: str, source_lang: str, target_lang: str) -> str:
-        """生成缓存键（基于内容哈希）"""
-        content = f"{text}|{source_lang}|{target_lang}"
+        """生成缓存键（基于规范化后的内容哈希）"""
+        content = f"{self.key_normalizer(text)}|{source_lang}|{target_lang}"
         return hashlib.sha256(content.encode('utf-8')).hexdigest()
     
+    # ---- 近似重复查找 ----
+    
+    def _get_near_duplicate_index(self, source_lang: str, target_lang: str) -> MinHashIndex:
+        """获取语言对的近似重复索引，不存在时创建"""
+        pair = (source_lang, target_lang)
+        index = self._near_duplicate_indexes.get(pair)
+        if index is None:
+            index = MinHashIndex(self.near_duplicate_threshold)
+            self._near_duplicate_indexes[pair] = index
+        return index
+    
+    def _load_near_duplicate_index(self, limit: int):
+        """用数据库中最近的缓存项预热近似重复索引"""
+        try:
+            rows = self.db_cache.get_recent_texts(limit)
+        except sqlite3.Error as e:
+            self.logger.warning(f"加载近似重复索引失败: {e}")
+            return
+        
+        for content_hash, original_text, source_lang, target_lang in rows:
+            self._get_near_duplicate_index(source_lang, target_lang).add(
+                content_hash, self.key_normalizer(original_text)
+            )
+    
+    def _index_texts(self, keys: Dict[str, str], source_lang: str, target_lang: str):
+        """将已缓存的文本加入近似重复索引（原文 -> 缓存键）"""
+        if self._near_duplicate_indexes is None:
+            return
+        
+        index = self._get_near_duplicate_index(source_lang, target_lang)
+        for text, key in keys.items():
+            index.add(key, self.key_normalizer(text))
+    
+    def _resolve_keys(self, texts: List[str], source_lang: str,
+                      target_lang: str) -> Tuple[Dict[str, str], Set[str]]:
+        """
+        计算文本对应的缓存键；未缓存过的文本改用近似重复文本的缓存键
+        
+        Returns:
+            Tuple[Dict[str, str], Set[str]]: (原文 -> 缓存键, 使用近似重复键的原文集合)
+        """
+        keys = {text: self._generate_cache_key(text, source_lang, target_lang) for text in texts}
+        redirected = set()
+        if self._near_duplicate_indexes is None:
+            return keys, redirected
+        
+        index = self._near_duplicate_indexes.get((source_lang, target_lang))
+        if index is None:
+            return keys, redirected
+        
+        for text, key in keys.items():
+            if index.contains(key):
+                continue
+            match = index.find(self.key_normalizer(text))
+            if match is not None:
+                keys[text] = match[0]
+                redirected.add(text)
+        return keys, redirected
+    
+    
     def get_translation(self, content_hash: str) -> Optional[CachedTranslation]:
         """获取缓存的翻译"""
-        self.stats.total_requests += 1
-        
-        # 1. 首先检查内存缓存
-        cached_item = self.memory_cache.get(content_hash)
-        if cached_item:
-            self.stats.cache_hits += 1
-            self.stats.memory_cache_hits += 1
-            return cached_item
-        
-        # 2. 检查文件缓存
-        cached_item = self.file_cache.get(content_hash)
-        if cached_item:
-            self.stats.cache_hits += 1
-            self.stats.file_cache_hits += 1
-            # 将结果放入内存缓存
-            self.memory_cache.put(content_hash, cached_item)
-            return cached_item
-        
-        # 3. 检查数据库缓存
-        cached_item = self.db_cache.get(content_hash)
-        if cached_item:
-            self.stats.cache_hits += 1
-            self.stats.db_cache_hits += 1
-            # 将结果放入上级缓存
-            self.file_cache.put(content_hash, cached_item)
-            self.memory_cache.put(content_hash, cached_item)
-            return cached_item
-        
-        # 缓存未命中
-        self.stats.cache_misses += 1
-        return None
+        return self.get_many([content_hash]).get(content_hash)
     
-    def save_translation(self, content_hash: str, translation: TranslationResult) -> bool:
-        """保存翻译到缓存"""
+    def get_many(self, content_hashes: List[str],
+                 fingerprint: Optional[str] = None) -> Dict[str, CachedTranslation]:
+        """
+        批量获取缓存的翻译，每级缓存只查询一次，下级命中的结果批量提升到上级缓存
+        
+        Args:
+            content_hashes: 内容哈希列表
+            fingerprint: 当前的翻译指纹，指定时指纹不一致的缓存项视为过时（按未命中处理）
+        
+        Returns:
+            Dict[str, CachedTranslation]: 命中的 内容哈希 -> 缓存项
+        """
+        content_hashes = list(dict.fromkeys(content_hashes))
+        self.stats.total_requests += len(content_hashes)
+        
+        # 1. 内存缓存
+        start = time.perf_counter()
+        found = self.memory_cache.get_many(content_hashes)
+        self._record_lookup('memory', len(content_hashes), found, time.perf_counter() - start)
+        self.stats.memory_cache_hits += len(found)
+        
+        # 2. 尚未落盘的写入队列
+        remaining = [key for key in content_hashes if key not in found]
+        pending_hits = self._get_pending(remaining) if remaining else {}
+        self.stats.write_buffer_hits += len(pending_hits)
+        found.update(pending_hits)
+        
+        # 3. 文件缓存
+        remaining = [key for key in remaining if key not in pending_hits]
+        file_hits = {}
+        if remaining and self.file_cache:
+            start = time.perf_counter()
+            file_hits = self.file_cache.get_many(remaining)
+            self._record_lookup('file', len(remaining), file_hits, time.perf_counter() - start)
+        self.stats.file_cache_hits += len(file_hits)
+        found.update(file_hits)
+        
+        # 4. 数据库缓存
+        remaining = [key for key in remaining if key not in file_hits]
+        db_hits = {}
+        if remaining:
+            start = time.perf_counter()
+            db_hits = self.db_cache.get_many(remaining)
+            self._record_lookup('database', len(remaining), db_hits, time.perf_counter() - start)
+        self.stats.db_cache_hits += len(db_hits)
+        found.update(db_hits)
+        
+        # 惰性失效：指纹不一致的缓存项不返回也不提升，等待重新翻译后覆盖
+        if fingerprint is not None:
+            stale = {key for key, item in found.items() if item.fingerprint != fingerprint}
+            if stale:
+                self.stats.stale_hits += len(stale)
+                found = {key: item for key, item in found.items() if key not in stale}
+                pending_hits = {key: item for key, item in pending_hits.items() if key not in stale}
+                file_hits = {key: item for key, item in file_hits.items() if key not in stale}
+                db_hits = {key: item for key, item in db_hits.items() if key not in stale}
+        
+        # 将结果批量放入上级缓存
+        promoted = {**pending_hits, **file_hits, **db_hits}
+        if promoted:
+            self.memory_cache.put_many(promoted)
+            self._record_writes('memory', promoted)
+        if db_hits and self.file_cache:
+            self._write_lower_tiers(db_hits, write_db=False)
+        
+        self.stats.cache_hits += len(found)
+        self.stats.cache_misses += len(content_hashes) - len(found)
+        return found
+    
+    def _create_cached_translation(self, content_hash: str, translation: TranslationResult,
+                                   fingerprint: Optional[str] = None,
+                                   cache_namespace: Optional[str] = None) -> CachedTranslation:
+        """创建缓存项"""
+        expires_at = datetime.now() + timedelta(
+            days=self.config.get('cache_ttl_days', 30)
+        )
+        
+        return CachedTranslation(
+            content_hash=content_hash,
+            translation_result=translation,
+            created_at=datetime.now(),
+            expires_at=expires_at,
+            usage_count=0,
+            fingerprint=fingerprint,
+            cache_namespace=cache_namespace
+        )
+    
+    def put_many(self, translations: Dict[str, TranslationResult], fingerprint: Optional[str] = None,
+                 cache_namespace: Optional[str] = None) -> bool:
+        """
+        批量保存翻译：内存缓存同步写入，文件和数据库按写入策略处理
+        
+        Args:
+            translations: 内容哈希 -> 翻译结果
+            fingerprint: 产生这些翻译的模型/提示词/术语指纹
+            cache_namespace: 生成缓存键时的语言参数，记录后可用于重新预热
+        """
+        if not translations:
+            return True
+        
         try:
-            # 创建缓存项
-            expires_at = datetime.now() + timedelta(
-                days=self.config.get('cache_ttl_days', 30)
-            )
-            
-            cached_translation = CachedTranslation(
-                content_hash=content_hash,
-                translation_result=translation,
-                created_at=datetime.now(),
-                expires_at=expires_at,
-                usage_count=0
-            )
+            items = {
+                content_hash: self._create_cached_translation(content_hash, translation, fingerprint, cache_namespace)
+                for content_hash, translation in translations.items()
+            }
             
-            # 保存到所有缓存层
-            self.memory_cache.put(content_hash, cached_translation)
-            self.file_cache.put(content_hash, cached_translation)
-            self.db_cache.put(content_hash, cached_translation)
+            self.memory_cache.put_many(items)
+            self._record_writes('memory', items)
+            self._write_lower_tiers(items, write_db=True)
             
-            self.stats.total_cached_items += 1
+            self.stats.total_cached_items += len(items)
             return True
         
         except Exception as e:
-            self.logger.error(f"保存缓存失败: {e}")
+            self.logger.error(f"批量保存缓存失败: {e}")
             return False
     
+    def save_translation(self, content_hash: str, translation: TranslationResult) -> bool:
+        """保存翻译到缓存"""
+        return self.put_many({content_hash: translation})
+    
+    # ---- 写入队列 ----
+    
+    def _write_lower_tiers(self, items: Dict[str, CachedTranslation], write_db: bool):
+        """按写入策略写入文件和数据库缓存"""
+        if self.write_policy == self.WRITE_THROUGH or self._closed:
+            self._write_batch({key: (item, write_db) for key, item in items.items()})
+            return
+        
+        with self._write_condition:
+            for key, item in items.items():
+                previous = self._pending_writes.get(key)
+                # 同一键多次写入只保留最新内容，但不丢失写数据库的要求
+                self._pending_writes[key] = (item, write_db or (previous is not None and previous[1]))
+            if len(self._pending_writes) >= self.write_batch_size:
+                self._write_condition.notify()
+    
+    def _get_pending(self, content_hashes: List[str]) -> Dict[str, CachedTranslation]:
+        """从写入队列中查找尚未落盘的缓存项"""
+        with self._write_condition:
+            if not self._pending_writes:
+                return {}
+            return {
+                key: self._pending_writes[key][0]
+                for key in content_hashes if key in self._pending_writes
+            }
+    
+    def _write_batch(self, batch: Dict[str, Tuple[CachedTranslation, bool]]):
+        """将一批缓存项写入文件和数据库缓存"""
+        if self.file_cache:
+            file_items = {key: item for key, (item, _) in batch.items()}
+            self.file_cache.put_many(file_items)
+            self._record_writes('file', file_items)
+        db_items = {key: item for key, (item, write_db) in batch.items() if write_db}
+        if db_items:
+            self.db_cache.put_many(db_items)
+            self._record_writes('database', db_items)
+    
+    # ---- 分级指标 ----
+    
+    def _record_lookup(self, tier: str, lookups: int, hits: Dict[str, CachedTranslation], elapsed: float):
+        """记录一次批量查询的命中数、读取字节数和耗时"""
+        bytes_read = sum(self.memory_cache._estimate_bytes(item) for item in hits.values())
+        with self._metrics_lock:
+            for metrics in (self.tier_metrics[tier], self._metrics_delta[tier]):
+                metrics.lookups += lookups
+                metrics.hits += len(hits)
+                metrics.bytes_read += bytes_read
+                metrics.latency.record(elapsed)
+    
+    def _record_writes(self, tier: str, items: Dict[str, CachedTranslation]):
+        """记录写入的缓存项数和字节数"""
+        bytes_written = sum(self.memory_cache._estimate_bytes(item) for item in items.values())
+        with self._metrics_lock:
+            for metrics in (self.tier_metrics[tier], self._metrics_delta[tier]):
+                metrics.writes += len(items)
+                metrics.bytes_written += bytes_written
+    
+    def _collect_evictions(self):
+        """从各级缓存采集新增的淘汰次数（内存缓存包括过期移除）"""
+        memory_ops = self.memory_cache.get_statistics()
+        counts = {
+            'memory': memory_ops['evictions'] + memory_ops['expirations'],
+            'file': self.file_cache.evictions if self.file_cache else 0,
+            'database': self.db_cache.evictions
+        }
+        with self._metrics_lock:
+            for tier, count in counts.items():
+                new_evictions = count - self._eviction_marks[tier]
+                self._eviction_marks[tier] = count
+                self.tier_metrics[tier].evictions += new_evictions
+                self._metrics_delta[tier].evictions += new_evictions
+    
+    def persist_metrics(self) -> bool:
+        """将尚未保存的分级指标累加到数据库"""
+        if self.metrics_store is None:
+            return False
+        
+        self._collect_evictions()
+        with self._metrics_lock:
+            delta, self._metrics_delta = self._metrics_delta, {tier: TierMetrics() for tier in self.TIERS}
+        
+        try:
+            self.metrics_store.add(delta)
+            return True
+        except sqlite3.Error as e:
+            self.logger.warning(f"保存缓存指标失败: {e}")
+            with self._metrics_lock:
+                for tier, metrics in delta.items():
+                    self._metrics_delta[tier].merge(metrics)
+            return False
+    
+    def get_tier_metrics(self, lifetime: bool = False) -> Dict[str, Dict]:
+        """
+        获取分级指标
+        
+        Args:
+            lifetime: True返回数据库中跨运行累计的指标（含本进程尚未保存的部分），
+                      False只返回本进程的指标
+        """
+        self._collect_evictions()
+        with self._metrics_lock:
+            if not lifetime or self.metrics_store is None:
+                return {tier: metrics.summary() for tier, metrics in self.tier_metrics.items()}
+            delta = {tier: TierMetrics() for tier in self.TIERS}
+            for tier, metrics in self._metrics_delta.items():
+                delta[tier].merge(metrics)
+        
+        totals = self.metrics_store.load()
+        for tier, metrics in delta.items():
+            totals.setdefault(tier, TierMetrics()).merge(metrics)
+        return {tier: metrics.summary() for tier, metrics in totals.items()}
+    
+    def flush(self) -> int:
+        """立即写入队列中的全部缓存项，返回写入数量"""
+        with self._write_condition:
+            batch, self._pending_writes = self._pending_writes, {}
+        
+        if not batch:
+            return 0
+        
+        try:
+            self._write_batch(batch)
+        except Exception as e:
+            self.logger.error(f"缓存批量写入失败: {e}")
+            with self._write_condition:
+                # 放回队列等待下次写入，期间更新过的键以新内容为准
+                for key, value in batch.items():
+                    self._pending_writes.setdefault(key, value)
+            return 0
+        
+        return len(batch)
+    
+    def _start_writer_thread(self):
+        """启动后台写入线程，并在进程退出时写入剩余缓存项
+        
+        写入线程和退出回调只持有弱引用，不会阻止未关闭的实例被回收。
+        """
+        cache_ref = weakref.ref(self)
+        condition = self._write_condition
+        flush_interval = self.write_flush_interval
+        batch_size = self.write_batch_size
+        
+        def writer_worker():
+            while True:
+                with condition:
+                    cache = cache_ref()
+                    if cache is None:
+                        return
+                    closed = cache._closed
+                    should_wait = not closed and len(cache._pending_writes) < batch_size
+                    # 等待期间不持有实例
+                    del cache
+                    if should_wait:
+                        condition.wait(flush_interval)
+                
+                cache = cache_ref()
+                if cache is None:
+                    return
+                cache.flush()
+                closed = cache._closed
+                del cache
+                if closed:
+                    return
+        
+        self._writer_thread = threading.Thread(target=writer_worker, daemon=True)
+        self._writer_thread.start()
+        
+        def flush_at_exit():
+            cache = cache_ref()
+            if cache is not None:
+                cache.close()
+        
+        self._atexit_hook = flush_at_exit
+        atexit.register(flush_at_exit)
+    
+    def close(self):
+        """写入队列中的缓存项并关闭各级缓存"""
+        with self._write_condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._write_condition.notify_all()
+        
+        if self._atexit_hook is not None:
+            atexit.unregister(self._atexit_hook)
+            self._atexit_hook = None
+        
+        if self._rewarm_thread is not None:
+            # 正在进行的单条翻译完成后停止
+            self._rewarm_thread.join(timeout=60)
+        if self._writer_thread is not None:
+            self._writer_thread.join(timeout=30)
+        self.flush()
+        self.persist_metrics()
+        
+        if self.file_cache:
+            self.file_cache.close()
+        self.db_cache.close()
+    
     def get_cached_translation(self, text: str, source_lang: str = 'en', 
-                             target_lang: str = 'zh') -> Optional[CachedTranslation]:
+                             target_lang: str = 'zh', fingerprint: Optional[str] = None) -> Optional[CachedTranslation]:
         """根据文本内容获取缓存的翻译"""
-        content_hash = self._generate_cache_key(text, source_lang, target_lang)
-        return self.get_translation(content_hash)
+        return self.get_cached_translations([text], source_lang, target_lang, fingerprint).get(text)
     
     def cache_translation(self, text: str, translation: TranslationResult,
-                         source_lang: str = 'en', target_lang: str = 'zh') -> bool:
+                         source_lang: str = 'en', target_lang: str = 'zh',
+                         fingerprint: Optional[str] = None) -> bool:
         """缓存翻译结果"""
-        content_hash = self._generate_cache_key(text, source_lang, target_lang)
-        return self.save_translation(content_hash, translation)
+        return self.cache_translations({text: translation}, source_lang, target_lang, fingerprint)
+    
+    def get_cached_translations(self, texts: List[str], source_lang: str = 'en', target_lang: str = 'zh',
+                                fingerprint: Optional[str] = None) -> Dict[str, CachedTranslation]:
+        """根据文本内容批量获取缓存的翻译，返回 原文 -> 缓存项"""
+        keys, redirected = self._resolve_keys(texts, source_lang, target_lang)
+        found = self.get_many(list(keys.values()), fingerprint)
+        
+        results = {text: found[key] for text, key in keys.items() if key in found}
+        self.stats.near_duplicate_hits += sum(1 for text in redirected if text in results)
+        return results
+    
+    def cache_translations(self, translations: Dict[str, TranslationResult], source_lang: str = 'en',
+                           target_lang: str = 'zh', fingerprint: Optional[str] = None) -> bool:
+        """批量缓存翻译结果（原文 -> 翻译结果）"""
+        keys = {text: self._generate_cache_key(text, source_lang, target_lang) for text in translations}
+        success = self.put_many(
+            {keys[text]: translation for text, translation in translations.items()},
+            fingerprint, json.dumps([source_lang, target_lang], ensure_ascii=False)
+        )
+        if success:
+            self._index_texts(keys, source_lang, target_lang)
+        return success
+    
+    # ---- 预热 ----
+    
+    def warm_up(self, entries: Iterable[Tuple[str, TranslationResult, str, str]],
+                fingerprint: Optional[str] = None, batch_size: int = 500) -> int:
+        """
+        用已有的翻译结果预热内存缓存
+        
+        预热数据来自已发布的内容，每次启动都可以重新获得，因此只写入内存缓存，不写入文件和数据库。
+        
+        Args:
+            entries: (原文, 翻译结果, 源语言, 目标语言) 的可迭代对象，按批消费
+            fingerprint: 预热数据对应的翻译指纹
+            batch_size: 每批写入的条数
+        
+        Returns:
+            int: 写入内存缓存的条数
+        """
+        warmed = 0
+        for batch in self._batched(entries, batch_size):
+            items = {}
+            indexed: Dict[Tuple[str, str], Dict[str, str]] = {}
+            for text, translation, source_lang, target_lang in batch:
+                key = self._generate_cache_key(text, source_lang, target_lang)
+                items[key] = self._create_cached_translation(
+                    key, translation, fingerprint, json.dumps([source_lang, target_lang], ensure_ascii=False)
+                )
+                indexed.setdefault((source_lang, target_lang), {})[text] = key
+            
+            self.memory_cache.put_many(items)
+            self._record_writes('memory', items)
+            for (source_lang, target_lang), keys in indexed.items():
+                self._index_texts(keys, source_lang, target_lang)
+            warmed += len(items)
+        
+        self.stats.warmed_items += warmed
+        return warmed
+    
+    @staticmethod
+    def _batched(iterable: Iterable, size: int) -> Iterator[List]:
+        """按固定大小分批"""
+        iterator = iter(iterable)
+        while True:
+            batch = list(itertools.islice(iterator, size))
+            if not batch:
+                return
+            yield batch
+    
+    # ---- 重新预热 ----
+    
+    def rewarm(self, translate: Callable[[str, str, str], Optional[TranslationResult]],
+               fingerprint: str, limit: int = 50, min_usage: int = 0) -> int:
+        """
+        用当前配置重新翻译访问最多的过时缓存项，保持原缓存键不变
+        
+        Args:
+            translate: 翻译函数 (原文, 源语言, 目标语言) -> 翻译结果，失败时返回None
+            fingerprint: 当前的翻译指纹
+            limit: 最多重新翻译的条数
+            min_usage: 只处理访问次数不少于该值的缓存项
+        
+        Returns:
+            int: 成功刷新的条数
+        """
+        self.flush()
+        refreshed = 0
+        for entry in self.db_cache.get_stale_entries(fingerprint, limit, min_usage):
+            if self._closed:
+                break
+            
+            source_lang, target_lang = json.loads(entry.cache_namespace)
+            try:
+                result = translate(entry.translation_result.original_text, source_lang, target_lang)
+            except Exception as e:
+                self.logger.warning(f"重新预热缓存项失败: {e}")
+                continue
+            
+            if result is None or result.error_message or not result.translated_text:
+                continue
+            if self.put_many({entry.content_hash: result}, fingerprint, entry.cache_namespace):
+                refreshed += 1
+        
+        self.stats.rewarmed_items += refreshed
+        if refreshed:
+            self.logger.info(f"重新预热了 {refreshed} 个过时缓存项")
+        return refreshed
+    
+    def start_rewarm(self, translate: Callable[[str, str, str], Optional[TranslationResult]],
+                     fingerprint: str, limit: int = 50, min_usage: int = 0) -> threading.Thread:
+        """在后台线程中执行rewarm，关闭缓存时停止"""
+        def rewarm_worker():
+            try:
+                self.rewarm(translate, fingerprint, limit, min_usage)
+            except Exception as e:
+                self.logger.error(f"后台重新预热任务失败: {e}")
+        
+        self._rewarm_thread = threading.Thread(target=rewarm_worker, daemon=True)
+        self._rewarm_thread.start()
+        return self._rewarm_thread
     
     def clear_expired_cache(self) -> int:
         """清理过期缓存"""
@@ -543,7 +1601,8 @@ class SmartTranslationCache(ITranslationCache):
         
         # 清理各级缓存的过期项
         total_cleared += self.memory_cache.clear_expired()
-        total_cleared += self.file_cache.clear_expired()
+        if self.file_cache:
+            total_cleared += self.file_cache.clear_expired()
         total_cleared += self.db_cache.clear_expired()
         
         self.logger.info(f"清理了 {total_cleared} 个过期缓存项")
@@ -563,6 +1622,18 @@ class SmartTranslationCache(ITranslationCache):
             'file_cache_hits': self.stats.file_cache_hits,
             'db_cache_hits': self.stats.db_cache_hits,
             'memory_cache_size': self.memory_cache.size(),
+            'memory_cache_bytes': self.memory_cache.size_bytes(),
+            'write_buffer_hits': self.stats.write_buffer_hits,
+            'near_duplicate_hits': self.stats.near_duplicate_hits,
+            'stale_hits': self.stats.stale_hits,
+            'rewarmed_items': self.stats.rewarmed_items,
+            'warmed_items': self.stats.warmed_items,
+            'memory_cache_ops': self.memory_cache.get_statistics(),
+            'tier_metrics': self.get_tier_metrics(),
+            'lifetime_tier_metrics': self.get_tier_metrics(lifetime=True),
+            'file_cache_stats': self.file_cache.get_statistics() if self.file_cache else None,
+            'write_policy': self.write_policy,
+            'pending_writes': len(self._pending_writes),
             'database_stats': db_stats,
             'last_cleanup': self.last_cleanup.isoformat()
         }
@@ -578,6 +1649,7 @@ class SmartTranslationCache(ITranslationCache):
                     # 执行清理
                     self.clear_expired_cache()
                     self.last_cleanup = datetime.now()
+                    self.persist_metrics()
                     
                 except Exception as e:
                     self.logger.error(f"后台清理任务失败: {e}")
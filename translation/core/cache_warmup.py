@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+翻译缓存预热 - 流式读取已发布的新闻数据，提取原文与译文对
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional, TextIO
+
+
+_WHITESPACE = re.compile(r"\s*")
+_CJK_PATTERN = re.compile(r"[一-鿿]")
+
+# 数据中没有记录置信度的已发布译文使用的置信度
+DEFAULT_PUBLISHED_CONFIDENCE = 0.8
+
+
+@dataclass
+class WarmupEntry:
+    """一条可用于预热的翻译"""
+    text_type: str  # title 或 description
+    original_text: str
+    translated_text: str
+    category: Optional[str]  # 翻译时的搜索类别，数据中没有记录时为None
+    service_name: str
+    confidence: float
+    fingerprint: Optional[str] = None  # 翻译时的缓存指纹，旧数据没有记录时为None
+
+
+class _JsonStreamReader:
+    """按块读取JSON文本，逐个解码顶层结构中的值，不把整个文件读入内存"""
+
+    def __init__(self, stream: TextIO, chunk_size: int):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """读取下一块，丢弃已解析的部分"""
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """跳过空白，返回下一个字符（文件结束时返回空字符串）"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        """消费指定的结构字符"""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"JSON格式错误: 期望 {char!r}，实际为 {found!r}")
+        self.pos += 1
+
+    def decode(self) -> Any:
+        """解码下一个完整的JSON值"""
+        while True:
+            self.peek()
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # 值恰好结束在缓冲区末尾时可能不完整（如被截断的数字），读取更多后重新解码
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+
+def _iter_array(reader: _JsonStreamReader) -> Iterator[Any]:
+    """逐个解码数组元素"""
+    reader.expect('[')
+    if reader.peek() == ']':
+        reader.pos += 1
+        return
+
+    while True:
+        yield reader.decode()
+        separator = reader.peek()
+        reader.pos += 1
+        if separator == ']':
+            return
+        if separator != ',':
+            raise ValueError(f"JSON格式错误: 数组中出现 {separator!r}")
+
+
+def iter_json_articles(path: str, key: str = 'articles', chunk_size: int = 64 * 1024) -> Iterator[dict]:
+    """
+    流式读取新闻数据文件中的文章
+
+    支持顶层为文章数组，或顶层为对象、文章数组位于指定键下的格式。
+
+    Args:
+        path: JSON文件路径
+        key: 顶层为对象时文章数组所在的键
+        chunk_size: 每次读取的字符数
+
+    Raises:
+        ValueError: 文件不是合法的JSON
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = _JsonStreamReader(f, chunk_size)
+        first = reader.peek()
+
+        if first == '[':
+            articles = _iter_array(reader)
+        elif first == '{':
+            articles = _iter_object_array(reader, key)
+        else:
+            raise ValueError(f"不支持的新闻数据格式: {path}")
+
+        for article in articles:
+            if isinstance(article, dict):
+                yield article
+
+
+def _iter_object_array(reader: _JsonStreamReader, key: str) -> Iterator[Any]:
+    """在顶层对象中查找指定键的数组并逐个解码，其他键的值解码后丢弃"""
+    reader.expect('{')
+    while reader.peek() not in ('}', ''):
+        name = reader.decode()
+        reader.expect(':')
+        if name == key and reader.peek() == '[':
+            yield from _iter_array(reader)
+            return
+
+        reader.decode()
+        if reader.peek() == ',':
+            reader.pos += 1
+
+
+def _is_translation(original: Any, translated: Any) -> bool:
+    """译文非空、不同于原文且包含中文"""
+    return (isinstance(original, str) and isinstance(translated, str) and
+            bool(original.strip()) and translated.strip() != original.strip() and
+            bool(_CJK_PATTERN.search(translated)))
+
+
+def extract_translation_pairs(article: dict) -> List[WarmupEntry]:
+    """
+    从一条已发布的新闻中提取AI翻译的标题和描述
+
+    支持三种格式：
+        news_data.json（original_title/title，带translation_metadata）
+        enhanced_news_data.json（title/translated_title，summary/translated_summary）
+        enhanced_chinese_news_data.json（title/description，译文在ai_translation中）
+    规则翻译、原文占位等非AI翻译的内容不会返回。
+    """
+    entries = []
+
+    if 'original_title' in article:
+        metadata = article.get('translation_metadata') or {}
+        for text_type, original_key, translated_key in (('title', 'original_title', 'title'),
+                                                         ('description', 'original_description', 'description')):
+            info = metadata.get(f"{text_type}_translation") or {}
+            original, translated = article.get(original_key), article.get(translated_key)
+            if not info.get('is_ai_translated') or info.get('service', 'none') == 'none':
+                continue
+            if _is_translation(original, translated):
+                entries.append(WarmupEntry(
+                    text_type, original, translated, article.get('search_category', ''),
+                    info['service'], info.get('confidence', DEFAULT_PUBLISHED_CONFIDENCE),
+                    metadata.get('cache_fingerprint')
+                ))
+
+    elif isinstance(article.get('ai_translation'), dict):
+        translation = article['ai_translation']
+        confidences = translation.get('translation_confidence') or {}
+        service = translation.get('translation_service') or 'published_news_data'
+        for text_type in ('title', 'description'):
+            original, translated = article.get(text_type), translation.get(f"translated_{text_type}")
+            if _is_translation(original, translated):
+                entries.append(WarmupEntry(
+                    text_type, original, translated, None, service,
+                    confidences.get(text_type, DEFAULT_PUBLISHED_CONFIDENCE)
+                ))
+
+    elif 'translated_title' in article:
+        for text_type, original_key in (('title', 'title'), ('description', 'summary')):
+            original, translated = article.get(original_key), article.get(f"translated_{original_key}")
+            if _is_translation(original, translated):
+                entries.append(WarmupEntry(
+                    text_type, original, translated, None, 'published_news_data',
+                    DEFAULT_PUBLISHED_CONFIDENCE
+                ))
+
+    return entries
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+翻译服务熔断器 - 按服务名称跳过已知不可用的服务
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, List, Optional
+
+
+class CircuitState(Enum):
+    """熔断器状态枚举"""
+    CLOSED = "closed"  # 正常放行
+    OPEN = "open"  # 熔断中，直接跳过
+    HALF_OPEN = "half_open"  # 冷却结束，放行少量试探请求
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """熔断器配置"""
+    failure_threshold: int = 5  # 连续失败多少次后熔断
+    recovery_timeout: float = 60.0  # 熔断冷却时间（秒）
+    half_open_max_calls: int = 1  # 半开状态允许同时进行的试探请求数
+    success_threshold: int = 1  # 半开状态连续成功多少次后恢复
+
+
+class CircuitBreaker:
+    """单个服务的熔断器（线程安全）"""
+
+    def __init__(self, name: str, config: Optional[CircuitBreakerConfig] = None):
+        """
+        初始化熔断器
+
+        Args:
+            name: 服务名称
+            config: 熔断器配置
+        """
+        self.name = name
+        self.config = config or CircuitBreakerConfig()
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._half_open_successes = 0
+        self._half_open_in_flight = 0
+        self._opened_at = 0.0
+
+        # 统计信息
+        self.total_successes = 0
+        self.total_failures = 0
+        self.rejected_calls = 0
+        self.times_opened = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def state(self) -> CircuitState:
+        """当前状态（冷却结束的熔断器自动转为半开）"""
+        with self._lock:
+            self._refresh_state()
+            return self._state
+
+    def _refresh_state(self):
+        """冷却时间已过时由打开转为半开（调用方需持有锁）"""
+        if self._state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self.config.recovery_timeout:
+            self._transition(CircuitState.HALF_OPEN)
+
+    def _transition(self, new_state: CircuitState):
+        """切换状态（调用方需持有锁）"""
+        old_state = self._state
+        self._state = new_state
+        self._half_open_successes = 0
+        self._half_open_in_flight = 0
+
+        if new_state == CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+            self.times_opened += 1
+        elif new_state == CircuitState.CLOSED:
+            self._consecutive_failures = 0
+
+        self.logger.info(f"熔断器 {self.name} 状态变化: {old_state.value} -> {new_state.value}")
+
+    def allow_request(self) -> bool:
+        """
+        是否允许调用该服务
+
+        半开状态下获得许可的调用必须随后调用record_success、record_failure或release_permit。
+        """
+        with self._lock:
+            self._refresh_state()
+
+            if self._state == CircuitState.CLOSED:
+                return True
+
+            if self._state == CircuitState.HALF_OPEN and self._half_open_in_flight < self.config.half_open_max_calls:
+                self._half_open_in_flight += 1
+                return True
+
+            self.rejected_calls += 1
+            return False
+
+    def record_success(self):
+        """记录一次成功调用"""
+        with self._lock:
+            self.total_successes += 1
+            self._refresh_state()
+
+            if self._state == CircuitState.CLOSED:
+                self._consecutive_failures = 0
+            elif self._state == CircuitState.HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                self._half_open_successes += 1
+                if self._half_open_successes >= self.config.success_threshold:
+                    self._transition(CircuitState.CLOSED)
+            else:
+                # 熔断期间健康检查成功，提前进入半开状态试探
+                self._transition(CircuitState.HALF_OPEN)
+
+    def record_failure(self, error: Optional[str] = None):
+        """记录一次失败调用"""
+        with self._lock:
+            self.total_failures += 1
+            self.last_error = error
+            self._refresh_state()
+
+            if self._state == CircuitState.CLOSED:
+                self._consecutive_failures += 1
+                if self._consecutive_failures >= self.config.failure_threshold:
+                    self._transition(CircuitState.OPEN)
+            elif self._state == CircuitState.HALF_OPEN:
+                # 试探失败，重新熔断
+                self._transition(CircuitState.OPEN)
+            else:
+                # 熔断期间仍然失败，重新计算冷却时间
+                self._opened_at = time.monotonic()
+
+    def release_permit(self):
+        """归还一次未产生结果的调用许可（如调用被取消），不计入成功或失败"""
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+
+    def reset(self):
+        """重置为关闭状态"""
+        with self._lock:
+            self._transition(CircuitState.CLOSED)
+
+    def get_statistics(self) -> Dict:
+        """获取熔断器统计信息"""
+        with self._lock:
+            self._refresh_state()
+            remaining = 0.0
+            if self._state == CircuitState.OPEN:
+                remaining = max(0.0, self.config.recovery_timeout - (time.monotonic() - self._opened_at))
+
+            return {
+                'state': self._state.value,
+                'consecutive_failures': self._consecutive_failures,
+                'total_successes': self.total_successes,
+                'total_failures': self.total_failures,
+                'rejected_calls': self.rejected_calls,
+                'times_opened': self.times_opened,
+                'cooldown_remaining': remaining,
+                'last_error': self.last_error
+            }
+
+
+class CircuitBreakerRegistry:
+    """按服务名称管理熔断器"""
+
+    def __init__(self, config: Optional[CircuitBreakerConfig] = None):
+        """
+        初始化熔断器注册表
+
+        Args:
+            config: 新建熔断器使用的默认配置
+        """
+        self.config = config or CircuitBreakerConfig()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> CircuitBreaker:
+        """获取服务熔断器，不存在时创建"""
+        with self._lock:
+            if name not in self._breakers:
+                self._breakers[name] = CircuitBreaker(name, self.config)
+            return self._breakers[name]
+
+    def allow_request(self, name: str) -> bool:
+        """是否允许调用指定服务"""
+        return self.get(name).allow_request()
+
+    def record_success(self, name: str):
+        """记录指定服务的成功调用"""
+        self.get(name).record_success()
+
+    def record_failure(self, name: str, error: Optional[str] = None):
+        """记录指定服务的失败调用"""
+        self.get(name).record_failure(error)
+
+    def release_permit(self, name: str):
+        """归还指定服务未产生结果的调用许可"""
+        self.get(name).release_permit()
+
+    def get_open_circuits(self) -> List[str]:
+        """获取处于熔断状态的服务列表"""
+        with self._lock:
+            breakers = list(self._breakers.items())
+        return [name for name, breaker in breakers if breaker.state == CircuitState.OPEN]
+
+    def get_statistics(self) -> Dict[str, Dict]:
+        """获取所有熔断器的统计信息"""
+        with self._lock:
+            breakers = list(self._breakers.items())
+        return {name: breaker.get_statistics() for name, breaker in breakers}
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP传输层 - 按主机复用的长连接池，供所有翻译服务共享
+"""
+
+import io
+import os
+import ssl
+import sys
+import threading
+import time
+import http.client
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple, Union
+
+
+# 复用的连接在发送前已被服务端关闭时会抛出这些异常，换新连接重试一次
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+_DEFAULT_USER_AGENT = f"Python-urllib/{sys.version_info.major}.{sys.version_info.minor}"
+
+# 与urllib.request.HTTPRedirectHandler一致：跟随的状态码和最大跳转次数
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+_MAX_REDIRECTS = 10
+
+
+class HostConnectionPool:
+    """单个主机的长连接池（线程安全）"""
+
+    def __init__(self, scheme: str, host: str, port: Optional[int],
+                 pool_size: int = 10, idle_timeout: float = 60.0,
+                 ssl_context: Optional[ssl.SSLContext] = None):
+        """
+        初始化连接池
+
+        Args:
+            scheme: http 或 https
+            host: 主机名
+            port: 端口，None表示使用协议默认端口
+            pool_size: 最多保留的空闲连接数，超出的连接用完即关闭
+            idle_timeout: 空闲连接最长保留时间（秒），超时后不再复用
+            ssl_context: HTTPS连接使用的SSL上下文
+        """
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.ssl_context = ssl_context
+        self._idle: Deque[Tuple[http.client.HTTPConnection, float]] = deque()
+        self._lock = threading.Lock()
+
+        # 统计信息
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.connections_discarded = 0
+
+    def _new_connection(self, timeout: float) -> http.client.HTTPConnection:
+        """创建新连接（实际建连在首次请求时进行）"""
+        if self.scheme == 'https':
+            connection = http.client.HTTPSConnection(
+                self.host, self.port, timeout=timeout, context=self.ssl_context
+            )
+        else:
+            connection = http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+
+        with self._lock:
+            self.connections_created += 1
+        return connection
+
+    def acquire(self, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """
+        取出一个连接
+
+        Returns:
+            Tuple[HTTPConnection, bool]: (连接, 是否为复用的连接)
+        """
+        now = time.monotonic()
+        with self._lock:
+            while self._idle:
+                connection, released_at = self._idle.pop()  # 优先使用最近归还的连接
+                if now - released_at <= self.idle_timeout and connection.sock is not None:
+                    self.connections_reused += 1
+                    connection.timeout = timeout
+                    connection.sock.settimeout(timeout)
+                    return connection, True
+                self.connections_discarded += 1
+                connection.close()
+
+        return self._new_connection(timeout), False
+
+    def release(self, connection: http.client.HTTPConnection):
+        """归还连接，服务端已关闭或池已满时直接关闭"""
+        if connection.sock is None:
+            return
+
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append((connection, time.monotonic()))
+                return
+            self.connections_discarded += 1
+
+        connection.close()
+
+    def discard(self, connection: http.client.HTTPConnection):
+        """关闭出错的连接"""
+        with self._lock:
+            self.connections_discarded += 1
+        connection.close()
+
+    def close(self):
+        """关闭所有空闲连接"""
+        with self._lock:
+            while self._idle:
+                connection, _ = self._idle.pop()
+                connection.close()
+
+    def get_statistics(self) -> Dict[str, int]:
+        """获取连接池统计信息"""
+        with self._lock:
+            return {
+                'idle_connections': len(self._idle),
+                'connections_created': self.connections_created,
+                'connections_reused': self.connections_reused,
+                'connections_discarded': self.connections_discarded
+            }
+
+
+class PooledResponse:
+    """连接池响应，用法与urllib.request.urlopen返回的响应一致"""
+
+    def __init__(self, response: http.client.HTTPResponse, url: str,
+                 connection: http.client.HTTPConnection, pool: HostConnectionPool):
+        self._response = response
+        self._connection = connection
+        self._pool = pool
+        self.url = url
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.msg
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        """读取响应内容"""
+        return self._response.read(amt)
+
+    def getcode(self) -> int:
+        """获取HTTP状态码"""
+        return self.status
+
+    def geturl(self) -> str:
+        """获取请求URL"""
+        return self.url
+
+    def info(self):
+        """获取响应头"""
+        return self.headers
+
+    def close(self):
+        """关闭响应；内容已完整读取时连接归还连接池"""
+        if self._connection is None:
+            return
+
+        connection, self._connection = self._connection, None
+        if self._response.isclosed():
+            self._pool.release(connection)
+        else:
+            # 未读完的响应会污染后续请求，不能复用
+            self._response.close()
+            self._pool.discard(connection)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class HttpTransport:
+    """共享HTTP传输层，按 (协议, 主机, 端口) 维护长连接池"""
+
+    def __init__(self, pool_size: int = 10, timeout: float = 30.0, idle_timeout: float = 60.0):
+        """
+        初始化传输层
+
+        Args:
+            pool_size: 每个主机最多保留的空闲连接数
+            timeout: 调用方未指定时使用的默认超时（秒）
+            idle_timeout: 空闲连接最长保留时间（秒）
+        """
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.ssl_context = ssl.create_default_context()
+        self._pools: Dict[Tuple[str, str, Optional[int]], HostConnectionPool] = {}
+        self._lock = threading.Lock()
+
+        # 统计信息
+        self.total_requests = 0
+        self.stale_retries = 0
+        self.proxied_requests = 0
+        self.redirects_followed = 0
+
+    def _get_pool(self, scheme: str, host: str, port: Optional[int]) -> HostConnectionPool:
+        """获取主机连接池，不存在时创建"""
+        key = (scheme, host, port)
+        with self._lock:
+            if key not in self._pools:
+                self._pools[key] = HostConnectionPool(
+                    scheme, host, port, self.pool_size, self.idle_timeout, self.ssl_context
+                )
+            return self._pools[key]
+
+    @staticmethod
+    def _uses_proxy(scheme: str, host: str) -> bool:
+        """是否配置了代理（走代理的请求交给urllib处理）"""
+        proxies = urllib.request.getproxies()
+        return scheme in proxies and not urllib.request.proxy_bypass(host)
+
+    def urlopen(self, request: Union[str, urllib.request.Request],
+                timeout: Optional[float] = None) -> Any:
+        """
+        发送请求，接口与urllib.request.urlopen一致
+
+        Args:
+            request: URL或urllib.request.Request对象
+            timeout: 超时时间（秒），None表示使用默认值
+
+        Returns:
+            PooledResponse: 可作为上下文管理器使用的响应
+
+        按urllib的规则跟随重定向（最多10次）。
+
+        Raises:
+            urllib.error.HTTPError: 响应状态码 >= 400，或无法跟随的重定向
+            urllib.error.URLError: 连接失败
+        """
+        if isinstance(request, str):
+            request = urllib.request.Request(request)
+        timeout = self.timeout if timeout is None else timeout
+
+        with self._lock:
+            self.total_requests += 1
+
+        redirects = 0
+        response = self._open(request, timeout)
+        while response.status in _REDIRECT_CODES:
+            # 重定向目标可能是另一台主机，从目标主机的连接池重新取连接
+            request = self._redirect_request(request, response, redirects)
+            redirects += 1
+            with self._lock:
+                self.redirects_followed += 1
+            response = self._open(request, timeout)
+
+        if response.status >= 400:
+            body = response.read()
+            response.close()
+            raise urllib.error.HTTPError(
+                request.full_url, response.status, response.reason, response.headers, io.BytesIO(body)
+            )
+        return response
+
+    def _open(self, request: urllib.request.Request, timeout: float) -> Any:
+        """发送单个请求，不处理重定向和错误状态码"""
+        parsed = urllib.parse.urlsplit(request.full_url)
+        scheme = parsed.scheme.lower()
+        if scheme not in ('http', 'https'):
+            raise urllib.error.URLError(f"unsupported scheme: {scheme}")
+
+        if self._uses_proxy(scheme, parsed.hostname or ''):
+            with self._lock:
+                self.proxied_requests += 1
+            return urllib.request.urlopen(request, timeout=timeout)
+
+        path = parsed.path or '/'
+        if parsed.query:
+            path = f"{path}?{parsed.query}"
+
+        headers = dict(request.header_items())
+        headers.setdefault('User-agent', _DEFAULT_USER_AGENT)
+        if request.data is not None:
+            headers.setdefault('Content-type', 'application/x-www-form-urlencoded')
+
+        pool = self._get_pool(scheme, parsed.hostname, parsed.port)
+        response, connection = self._send(pool, request.get_method(), path, request.data, headers, timeout)
+        return PooledResponse(response, request.full_url, connection, pool)
+
+    @staticmethod
+    def _redirect_request(request: urllib.request.Request, response: PooledResponse,
+                          redirects: int) -> urllib.request.Request:
+        """
+        按urllib.request.HTTPRedirectHandler的规则构造跳转后的请求
+
+        GET/HEAD请求跟随所有重定向，POST只跟随301/302/303；跳转后的请求不带请求体。
+
+        Raises:
+            urllib.error.HTTPError: 不允许跳转、没有目标地址或超过最大跳转次数
+        """
+        body = response.read()
+        response.close()
+
+        method = request.get_method()
+        location = response.headers.get('Location') or response.headers.get('URI')
+        new_url = urllib.parse.urljoin(request.full_url, location) if location else None
+        allowed = method in ('GET', 'HEAD') or (response.status in (301, 302, 303) and method == 'POST')
+        if redirects >= _MAX_REDIRECTS:
+            reason = "The HTTP server returned a redirect error that would lead to an infinite loop."
+        elif not allowed or new_url is None:
+            reason = response.reason
+        elif urllib.parse.urlsplit(new_url).scheme.lower() not in ('http', 'https'):
+            reason = f"redirection to {new_url} not allowed"
+        else:
+            headers = {
+                name: value for name, value in request.headers.items()
+                if name.lower() not in ('content-length', 'content-type')
+            }
+            return urllib.request.Request(new_url, headers=headers,
+                                          origin_req_host=request.origin_req_host, unverifiable=True)
+
+        raise urllib.error.HTTPError(request.full_url, response.status, reason, response.headers, io.BytesIO(body))
+
+    def _send(self, pool: HostConnectionPool, method: str, path: str, body: Optional[bytes],
+              headers: Dict[str, str], timeout: float) -> Tuple[http.client.HTTPResponse, http.client.HTTPConnection]:
+        """在池连接上发送请求，复用的连接已失效时换新连接重试一次"""
+        while True:
+            connection, reused = pool.acquire(timeout)
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                return connection.getresponse(), connection
+            except _STALE_CONNECTION_ERRORS as e:
+                pool.discard(connection)
+                if reused:
+                    with self._lock:
+                        self.stale_retries += 1
+                    continue
+                raise urllib.error.URLError(e)
+            except OSError as e:
+                pool.discard(connection)
+                raise urllib.error.URLError(e)
+            except Exception:
+                pool.discard(connection)
+                raise
+
+    def close(self):
+        """关闭所有连接池"""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.close()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """获取传输层统计信息，包括各主机的连接复用情况"""
+        with self._lock:
+            pools = dict(self._pools)
+            stats = {
+                'total_requests': self.total_requests,
+                'stale_retries': self.stale_retries,
+                'proxied_requests': self.proxied_requests,
+                'redirects_followed': self.redirects_followed,
+            }
+
+        hosts = {}
+        created = reused = 0
+        for (scheme, host, port), pool in pools.items():
+            pool_stats = pool.get_statistics()
+            created += pool_stats['connections_created']
+            reused += pool_stats['connections_reused']
+            hosts[f"{scheme}://{host}" + (f":{port}" if port else "")] = pool_stats
+
+        stats['connections_created'] = created
+        stats['connections_reused'] = reused
+        stats['reuse_rate'] = reused / (created + reused) if created + reused else 0.0
+        stats['hosts'] = hosts
+        return stats
+
+
+_default_transport: Optional[HttpTransport] = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> HttpTransport:
+    """获取全局共享的传输层（连接池大小和默认超时可通过环境变量配置）"""
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = HttpTransport(
+                pool_size=int(os.getenv('HTTP_POOL_SIZE', '10')),
+                timeout=float(os.getenv('HTTP_TIMEOUT', '30')),
+                idle_timeout=float(os.getenv('HTTP_IDLE_TIMEOUT', '60'))
+            )
+        return _default_transport
+
+
+def urlopen(request: Union[str, urllib.request.Request], timeout: Optional[float] = None) -> Any:
+    """通过全局共享的传输层发送请求"""
+    return get_default_transport().urlopen(request, timeout)
@@ -4,6 +4,7 @@
 翻译服务核心接口定义
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
@@ -63,6 +64,8 @@ class CachedTranslation:
     created_at: datetime
     expires_at: datetime
     usage_count: int = 0
+    fingerprint: Optional[str] = None  # 模型/提示词/术语指纹，用于判断缓存是否过时
+    cache_namespace: Optional[str] = None  # 生成缓存键时的语言参数（JSON），用于重新预热
 
 
 class ITranslationService(ABC):
@@ -89,6 +92,26 @@ class ITranslationService(ABC):
         pass
 
 
+class IAsyncTranslationService(ABC):
+    """异步翻译服务接口，供单事件循环上的高并发流水线使用"""
+    
+    @abstractmethod
+    async def atranslate_text(self, text: str, source_lang: str = 'en', target_lang: str = 'zh') -> TranslationResult:
+        """异步翻译单个文本"""
+        pass
+    
+    async def atranslate_batch(self, texts: List[str], source_lang: str = 'en', target_lang: str = 'zh') -> List[TranslationResult]:
+        """异步批量翻译文本，默认并发翻译各条文本并按输入顺序返回"""
+        return list(await asyncio.gather(
+            *(self.atranslate_text(text, source_lang, target_lang) for text in texts)
+        ))
+    
+    @abstractmethod
+    def get_service_name(self) -> str:
+        """获取服务名称"""
+        pass
+
+
 class ITranslationCache(ABC):
     """翻译缓存接口"""
     
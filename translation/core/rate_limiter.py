@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+翻译服务限流器 - 基于令牌桶的按服务商限流
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+
+class RateLimiter:
+    """令牌桶限流器（线程安全）"""
+
+    def __init__(self, max_requests_per_minute: int, burst: Optional[int] = None):
+        """
+        初始化限流器
+
+        Args:
+            max_requests_per_minute: 每分钟最大请求数，小于等于0表示不限流
+            burst: 允许的突发请求数，默认为每秒速率（至少为1）
+        """
+        self.max_requests_per_minute = max_requests_per_minute
+        self.rate = max_requests_per_minute / 60.0
+        self.capacity = float(burst if burst is not None else max(1, int(self.rate)))
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+        # 统计信息
+        self.total_acquired = 0
+        self.total_wait_time = 0.0
+
+    @property
+    def unlimited(self) -> bool:
+        """是否不限流"""
+        return self.max_requests_per_minute <= 0
+
+    def _refill(self):
+        """按流逝时间补充令牌"""
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.last_refill = now
+
+    def try_acquire(self) -> bool:
+        """尝试立即获取一个令牌"""
+        with self._lock:
+            if self.unlimited:
+                self.total_acquired += 1
+                return True
+
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                self.total_acquired += 1
+                return True
+            return False
+
+    def get_wait_time(self) -> float:
+        """获取下一个令牌可用前需要等待的秒数"""
+        if self.unlimited:
+            return 0.0
+
+        with self._lock:
+            self._refill()
+            if self.tokens >= 1:
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        阻塞获取一个令牌
+
+        Args:
+            timeout: 最长等待时间（秒），None表示一直等待
+
+        Returns:
+            bool: 是否成功获取令牌
+        """
+        start_time = time.monotonic()
+
+        while True:
+            if self.try_acquire():
+                self._record_wait(start_time)
+                return True
+
+            wait_time = self._next_wait(start_time, timeout)
+            if wait_time is None:
+                return False
+            time.sleep(wait_time)
+
+    async def aacquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        异步获取一个令牌，等待期间不阻塞事件循环
+
+        Args:
+            timeout: 最长等待时间（秒），None表示一直等待
+
+        Returns:
+            bool: 是否成功获取令牌
+        """
+        start_time = time.monotonic()
+
+        while True:
+            if self.try_acquire():
+                self._record_wait(start_time)
+                return True
+
+            wait_time = self._next_wait(start_time, timeout)
+            if wait_time is None:
+                return False
+            await asyncio.sleep(wait_time)
+
+    def _next_wait(self, start_time: float, timeout: Optional[float]) -> Optional[float]:
+        """计算下一次尝试前的等待秒数，已超时返回None"""
+        wait_time = self.get_wait_time()
+        if timeout is not None:
+            remaining = timeout - (time.monotonic() - start_time)
+            if remaining <= 0:
+                return None
+            wait_time = min(wait_time, remaining)
+        return max(wait_time, 0.001)
+
+    def _record_wait(self, start_time: float):
+        """累计获取令牌的等待时间"""
+        with self._lock:
+            self.total_wait_time += time.monotonic() - start_time
+
+    def get_statistics(self) -> Dict[str, float]:
+        """获取限流统计信息"""
+        with self._lock:
+            return {
+                'max_requests_per_minute': self.max_requests_per_minute,
+                'total_acquired': self.total_acquired,
+                'total_wait_time': self.total_wait_time
+            }
+
+
+class RateLimiterRegistry:
+    """按服务商名称管理限流器"""
+
+    def __init__(self, default_requests_per_minute: int = 0):
+        """
+        初始化限流器注册表
+
+        Args:
+            default_requests_per_minute: 未注册服务商使用的默认限流值（0表示不限流）
+        """
+        self.default_requests_per_minute = default_requests_per_minute
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, max_requests_per_minute: int, burst: Optional[int] = None) -> RateLimiter:
+        """注册（或替换）服务商限流器"""
+        limiter = RateLimiter(max_requests_per_minute, burst)
+        with self._lock:
+            self._limiters[name] = limiter
+        return limiter
+
+    def get(self, name: str) -> RateLimiter:
+        """获取服务商限流器，不存在时按默认值创建"""
+        with self._lock:
+            if name not in self._limiters:
+                self._limiters[name] = RateLimiter(self.default_requests_per_minute)
+            return self._limiters[name]
+
+    def acquire(self, name: str, timeout: Optional[float] = None) -> bool:
+        """获取指定服务商的一个令牌"""
+        return self.get(name).acquire(timeout)
+
+    def get_statistics(self) -> Dict[str, Dict[str, float]]:
+        """获取所有服务商的限流统计"""
+        with self._lock:
+            return {name: limiter.get_statistics() for name, limiter in self._limiters.items()}
@@ -15,6 +15,7 @@ from enum import Enum
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .interfaces import ITranslationService, ServiceStatus, TranslationResult
+from .circuit_breaker import CircuitBreakerRegistry
 
 
 class HealthStatus(Enum):
@@ -60,17 +61,20 @@ class HealthCheckConfig:
 class ServiceHealthMonitor:
     """服务健康监控器"""
     
-    def __init__(self, services: List[ITranslationService], config: Optional[HealthCheckConfig] = None):
+    def __init__(self, services: List[ITranslationService], config: Optional[HealthCheckConfig] = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None):
         """
         初始化健康监控器
         
         Args:
             services: 翻译服务列表
             config: 健康检查配置
+            circuit_breakers: 熔断器注册表，健康检查和实际调用结果都会反馈给它
         """
         self.services = {service.get_service_name(): service for service in services}
         self.config = config or HealthCheckConfig()
         self.logger = logging.getLogger(__name__)
+        self.circuit_breakers = circuit_breakers or CircuitBreakerRegistry()
         
         # 健康状态信息
         self.health_info: Dict[str, ServiceHealthInfo] = {}
@@ -132,6 +136,8 @@ class ServiceHealthMonitor:
     def _perform_health_checks(self):
         """执行健康检查"""
         self.monitoring_stats['total_checks'] += 1
+        if not self.services:
+            return
         
         # 使用线程池并行检查所有服务
         with ThreadPoolExecutor(max_workers=len(self.services)) as executor:
@@ -223,6 +229,12 @@ class ServiceHealthMonitor:
    
     def _update_health_info(self, service_name: str, new_info: ServiceHealthInfo):
         """更新健康信息"""
+        # 健康检查结果同样反馈给熔断器
+        if new_info.consecutive_failures == 0:
+            self.circuit_breakers.record_success(service_name)
+        else:
+            self.circuit_breakers.record_failure(service_name, new_info.last_error)
+        
         with self._lock:
             old_status = self.health_info[service_name].status
             self.health_info[service_name] = new_info
@@ -233,6 +245,8 @@ class ServiceHealthMonitor:
     
     def _handle_check_failure(self, service_name: str, error: str):
         """处理检查失败"""
+        self.circuit_breakers.record_failure(service_name, error)
+        
         with self._lock:
             current_info = self.health_info[service_name]
             consecutive_failures = current_info.consecutive_failures + 1
@@ -283,6 +297,21 @@ class ServiceHealthMonitor:
         """添加状态变化回调"""
         self._status_change_callbacks.append(callback)
     
+    def allow_request(self, service_name: str) -> bool:
+        """调用服务前检查熔断器，熔断中的服务应直接跳过"""
+        return self.circuit_breakers.allow_request(service_name)
+    
+    def release_permit(self, service_name: str):
+        """归还未产生结果的调用（如被取消的对冲请求）所占用的熔断器许可"""
+        self.circuit_breakers.release_permit(service_name)
+    
+    def record_call_result(self, service_name: str, success: bool, error: Optional[str] = None):
+        """记录一次实际翻译调用的结果"""
+        if success:
+            self.circuit_breakers.record_success(service_name)
+        else:
+            self.circuit_breakers.record_failure(service_name, error)
+    
     def get_service_health(self, service_name: str) -> Optional[ServiceHealthInfo]:
         """获取服务健康信息"""
         return self.health_info.get(service_name)
@@ -352,7 +381,8 @@ class ServiceHealthMonitor:
                 'success_rate': health_info.get_success_rate(),
                 'uptime_percentage': health_info.uptime_percentage,
                 'consecutive_failures': health_info.consecutive_failures,
-                'last_error': health_info.last_error
+                'last_error': health_info.last_error,
+                'circuit_state': self.circuit_breakers.get(service_name).state.value
             }
         
         return summary
\ No newline at end of file
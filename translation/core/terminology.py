@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+术语替换引擎 - 将整个术语词典编译为一个基于字典树的正则，一次扫描完成最长匹配替换
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Tuple
+
+
+# 替换语义（匹配规则、优先级）变化时递增，使依赖术语替换结果的翻译缓存失效。
+# 1为逐条 re.sub 的旧实现，2为一次扫描的最长匹配
+TERMINOLOGY_ENGINE_VERSION = 2
+
+
+class TermDictionary(dict):
+    """记录修改次数的术语词典
+
+    与普通dict用法相同，TerminologyEngine据此以O(1)判断词典是否被修改、是否需要重新编译。
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self.version += 1
+        return value
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self.version += 1
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self.version += 1
+        return item
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+
+def _trie_pattern(terms: List[str]) -> str:
+    """由术语构建字典树形式的正则，公共前缀只匹配一次，较长的术语优先"""
+    trie: Dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = None  # 术语结束标记
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # 可选的贪婪分组先尝试更长的术语，失败时回溯到当前位置结束的较短术语
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+@lru_cache(maxsize=32)
+def _compile(items: Tuple[Tuple[str, str], ...]) -> Tuple[Optional["re.Pattern"], Dict[str, str]]:
+    """编译术语表，相同的术语表在多个翻译器实例之间共享编译结果"""
+    lookup: Dict[str, str] = {}
+    for term, translation in items:
+        if term:
+            lookup.setdefault(term.lower(), translation)
+    if not lookup:
+        return None, lookup
+    pattern = re.compile(r'\b(?:' + _trie_pattern(list(lookup)) + r')\b', re.IGNORECASE)
+    return pattern, lookup
+
+
+class TerminologyEngine:
+    """术语替换引擎
+
+    替换语义与逐条 re.sub(r'\\b术语\\b', 译文, flags=re.IGNORECASE) 相同（整词、忽略大小写），
+    但只扫描一遍：同一位置有多个术语时取最长的，已替换的译文不会被再次替换。
+    多个词典按顺序优先，忽略大小写后相同的术语取先出现的译文。
+    """
+
+    def __init__(self, *dictionaries: Mapping[str, str]):
+        """
+        编译术语词典
+
+        Args:
+            dictionaries: 按优先级排列的术语词典（英文术语 -> 译文）
+        """
+        self._sources = dictionaries
+        self._versions = [getattr(dictionary, 'version', None) for dictionary in dictionaries]
+        self._items = tuple(
+            (term, translation) for dictionary in dictionaries for term, translation in dictionary.items()
+        )
+        self._pattern, self._lookup = _compile(self._items)
+
+    def is_current(self, *dictionaries: Mapping[str, str]) -> bool:
+        """编译后词典是否未被替换或修改（TermDictionary只比较版本号，其他映射逐项比较）"""
+        if len(dictionaries) != len(self._sources):
+            return False
+        for dictionary, source, version in zip(dictionaries, self._sources, self._versions):
+            if dictionary is not source:
+                return False
+            if version is None or getattr(dictionary, 'version', None) != version:
+                break
+        else:
+            return True
+        return tuple(item for dictionary in dictionaries for item in dictionary.items()) == self._items
+
+    def __len__(self) -> int:
+        return len(self._lookup)
+
+    def translate_term(self, term: str) -> Optional[str]:
+        """查询单个术语的译文（忽略大小写）"""
+        return self._lookup.get(term.lower())
+
+    def replace(self, text: str) -> str:
+        """一次扫描替换文本中的全部术语"""
+        if not text or self._pattern is None:
+            return text
+        lookup = self._lookup
+        return self._pattern.sub(lambda match: lookup.get(match.group(0).lower(), match.group(0)), text)
@@ -6,12 +6,20 @@
 """
 
 import json
+import os
 from datetime import datetime, timedelta
 from flask import Flask, render_template_string, jsonify, request
+from translation.core.cache_metrics import load_cache_metrics
 from translation.monitoring.translation_monitor import get_monitor
 
 app = Flask(__name__)
 
+# 翻译缓存数据库（与新闻累积系统的缓存目录一致）
+TRANSLATION_CACHE_DB = os.getenv(
+    'TRANSLATION_CACHE_DB',
+    os.path.join(os.getenv('TRANSLATION_CACHE_DIR', 'translation_cache'), 'translations.db')
+)
+
 # HTML模板
 DASHBOARD_TEMPLATE = '''
 <!DOCTYPE html>
@@ -155,6 +163,21 @@ DASHBOARD_TEMPLATE = '''
             background: #5a6fd8;
         }
         
+        .cache-table {
+            width: 100%;
+            border-collapse: collapse;
+        }
+        
+        .cache-table th, .cache-table td {
+            padding: 8px;
+            text-align: right;
+            border-bottom: 1px solid #eee;
+        }
+        
+        .cache-table th:first-child, .cache-table td:first-child {
+            text-align: left;
+        }
+        
         .auto-refresh {
             position: fixed;
             top: 20px;
@@ -200,6 +223,22 @@ DASHBOARD_TEMPLATE = '''
             <canvas id="responseTimeChart" width="400" height="200"></canvas>
         </div>
         
+        <!-- 翻译缓存 -->
+        <div class="chart-container">
+            <h3>💾 翻译缓存（累计）</h3>
+            <table class="cache-table">
+                <thead>
+                    <tr>
+                        <th>缓存级别</th><th>查询</th><th>命中率</th><th>P50</th><th>P95</th><th>P99</th>
+                        <th>读取</th><th>写入</th><th>淘汰</th>
+                    </tr>
+                </thead>
+                <tbody id="cacheStats">
+                    <!-- 动态加载 -->
+                </tbody>
+            </table>
+        </div>
+        
         <!-- 报警信息 -->
         <div class="alerts-section">
             <h3>🚨 最近报警</h3>
@@ -267,11 +306,57 @@ DASHBOARD_TEMPLATE = '''
                 updateCharts(data.trends);
                 updateAlerts(data.recent_alerts);
                 
+                const cacheResponse = await fetch('/api/cache-statistics');
+                updateCacheStats((await cacheResponse.json()).tiers || {});
+                
             } catch (error) {
                 console.error('加载数据失败:', error);
             }
         }
         
+        // 格式化字节数和延迟
+        function formatBytes(bytes) {
+            const units = ['B', 'KB', 'MB', 'GB'];
+            let index = 0;
+            while (bytes >= 1024 && index < units.length - 1) {
+                bytes /= 1024;
+                index++;
+            }
+            return `${bytes.toFixed(index ? 1 : 0)}${units[index]}`;
+        }
+        
+        function formatMicros(us) {
+            return us >= 1000 ? `${(us / 1000).toFixed(1)}ms` : `${us.toFixed(0)}μs`;
+        }
+        
+        // 更新翻译缓存统计
+        function updateCacheStats(tiers) {
+            const names = {memory: '内存', file: '文件', database: '数据库'};
+            const container = document.getElementById('cacheStats');
+            const rows = Object.keys(names).filter(tier => tiers[tier]);
+            if (rows.length === 0) {
+                container.innerHTML = '<tr><td colspan="9">暂无缓存统计数据</td></tr>';
+                return;
+            }
+            
+            container.innerHTML = rows.map(tier => {
+                const stats = tiers[tier];
+                return `
+                    <tr>
+                        <td>${names[tier]}</td>
+                        <td>${stats.lookups}</td>
+                        <td class="${stats.hit_rate >= 0.5 ? 'success' : 'warning'}">${(stats.hit_rate * 100).toFixed(1)}%</td>
+                        <td>${formatMicros(stats.latency.p50_us)}</td>
+                        <td>${formatMicros(stats.latency.p95_us)}</td>
+                        <td>${formatMicros(stats.latency.p99_us)}</td>
+                        <td>${formatBytes(stats.bytes_read)}</td>
+                        <td>${formatBytes(stats.bytes_written)}</td>
+                        <td>${stats.evictions}</td>
+                    </tr>
+                `;
+            }).join('');
+        }
+        
         // 更新总体统计
         function updateOverallStats(stats) {
             const container = document.getElementById('overallStats');
@@ -475,6 +560,17 @@ def get_quality_report():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/cache-statistics')
+def get_cache_statistics():
+    """获取翻译缓存各级累计的命中率、延迟直方图、读写字节数和淘汰次数"""
+    try:
+        return jsonify({
+            'db_path': TRANSLATION_CACHE_DB,
+            'tiers': load_cache_metrics(TRANSLATION_CACHE_DB)
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 def _get_trends_data(monitor, days=7):
     """获取趋势数据"""
     try:
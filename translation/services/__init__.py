@@ -8,10 +8,13 @@ from .baidu_translator import BaiduTranslator
 from .tencent_translator import TencentTranslator
 from .google_translator import GoogleTranslator
 from .siliconflow_translator import SiliconFlowTranslator
+from .async_adapter import AsyncTranslationAdapter, as_async_service
 
 __all__ = [
     'BaiduTranslator',
     'TencentTranslator',
     'GoogleTranslator',
-    'SiliconFlowTranslator'
+    'SiliconFlowTranslator',
+    'AsyncTranslationAdapter',
+    'as_async_service'
 ]
\ No newline at end of file
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+同步翻译服务的异步适配器
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import List, Optional
+
+from ..core.interfaces import ITranslationService, IAsyncTranslationService, TranslationResult, ServiceStatus
+from .rule_based_translator import RuleBasedTranslator
+
+
+class AsyncTranslationAdapter(ITranslationService, IAsyncTranslationService):
+    """将同步ITranslationService包装为IAsyncTranslationService
+
+    本地纯计算的服务（如RuleBasedTranslator）直接在事件循环上执行，不占用线程；
+    会阻塞的服务（同步HTTP调用）放到执行器中运行，避免卡住事件循环。
+    """
+
+    def __init__(self, service: ITranslationService, blocking: bool = True,
+                 executor: Optional[Executor] = None):
+        """
+        初始化适配器
+
+        Args:
+            service: 被包装的同步翻译服务
+            blocking: 服务调用是否会阻塞（网络IO等），为False时直接在事件循环上调用
+            executor: blocking为True时使用的执行器，None表示事件循环默认线程池
+        """
+        self.service = service
+        self.blocking = blocking
+        self.executor = executor
+
+    async def atranslate_text(self, text: str, source_lang: str = 'en', target_lang: str = 'zh') -> TranslationResult:
+        """异步翻译单个文本"""
+        if not self.blocking:
+            return self.service.translate_text(text, source_lang, target_lang)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self.service.translate_text, text, source_lang, target_lang
+        )
+
+    async def atranslate_batch(self, texts: List[str], source_lang: str = 'en', target_lang: str = 'zh') -> List[TranslationResult]:
+        """异步批量翻译，整批交给同步服务的translate_batch处理"""
+        if not self.blocking:
+            return self.service.translate_batch(texts, source_lang, target_lang)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self.service.translate_batch, texts, source_lang, target_lang
+        )
+
+    def translate_text(self, text: str, source_lang: str = 'en', target_lang: str = 'zh') -> TranslationResult:
+        """同步翻译单个文本"""
+        return self.service.translate_text(text, source_lang, target_lang)
+
+    def translate_batch(self, texts: List[str], source_lang: str = 'en', target_lang: str = 'zh') -> List[TranslationResult]:
+        """同步批量翻译"""
+        return self.service.translate_batch(texts, source_lang, target_lang)
+
+    def get_service_status(self) -> ServiceStatus:
+        """获取服务状态"""
+        return self.service.get_service_status()
+
+    def get_service_name(self) -> str:
+        """获取服务名称"""
+        return self.service.get_service_name()
+
+
+def as_async_service(service: ITranslationService, executor: Optional[Executor] = None) -> IAsyncTranslationService:
+    """
+    获取服务的异步版本
+
+    已原生支持异步的服务直接返回；RuleBasedTranslator不阻塞，包装后在事件循环上直接执行；
+    其他同步服务包装后在执行器中运行。
+    """
+    if isinstance(service, IAsyncTranslationService):
+        return service
+
+    blocking = not isinstance(service, RuleBasedTranslator)
+    return AsyncTranslationAdapter(service, blocking=blocking, executor=executor)
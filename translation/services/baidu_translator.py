@@ -6,32 +6,38 @@
 
 import os
 import json
+import asyncio
 import time
 import hashlib
 import random
 import urllib.request
 import urllib.parse
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
-from ..core.interfaces import ITranslationService, TranslationResult, ServiceStatus
+from ..core.interfaces import ITranslationService, IAsyncTranslationService, TranslationResult, ServiceStatus
+from ..core import http_transport, async_http_transport
+from ..core.rate_limiter import RateLimiter
 
 
-class BaiduTranslator(ITranslationService):
+class BaiduTranslator(ITranslationService, IAsyncTranslationService):
     """百度翻译API适配器"""
     
-    def __init__(self, app_id: Optional[str] = None, secret_key: Optional[str] = None):
+    def __init__(self, app_id: Optional[str] = None, secret_key: Optional[str] = None,
+                 rate_limiter: Optional[RateLimiter] = None):
         """初始化百度翻译服务
         
         Args:
             app_id: 百度翻译API的APP ID
             secret_key: 百度翻译API的密钥
+            rate_limiter: 服务商限流器，每次HTTP请求（含重试）从中申请令牌；None表示不限流
         """
         self.app_id = app_id or os.getenv('BAIDU_TRANSLATE_APP_ID')
         self.secret_key = secret_key or os.getenv('BAIDU_TRANSLATE_SECRET_KEY')
         self.base_url = "https://fanyi-api.baidu.com/api/trans/vip/translate"
         self.max_retries = 3
         self.retry_delay = 1.0
+        self.rate_limiter = rate_limiter
         
         if not self.app_id or not self.secret_key:
             raise ValueError("百度翻译API凭证未配置，请设置BAIDU_TRANSLATE_APP_ID和BAIDU_TRANSLATE_SECRET_KEY环境变量")
@@ -45,8 +51,8 @@ class BaiduTranslator(ITranslationService):
         sign_str = f"{self.app_id}{query}{salt}{self.secret_key}"
         return hashlib.md5(sign_str.encode('utf-8')).hexdigest()
     
-    def _make_request(self, query: str, from_lang: str = 'en', to_lang: str = 'zh') -> dict:
-        """发起翻译API请求"""
+    def _build_request(self, query: str, from_lang: str = 'en', to_lang: str = 'zh') -> urllib.request.Request:
+        """构建带签名的翻译API请求"""
         salt = str(random.randint(32768, 65536))
         sign = self._generate_sign(query, salt)
         
@@ -59,17 +65,21 @@ class BaiduTranslator(ITranslationService):
             'sign': sign
         }
         
-        data = urllib.parse.urlencode(params).encode('utf-8')
-        
+        return urllib.request.Request(
+            self.base_url,
+            data=urllib.parse.urlencode(params).encode('utf-8'),
+            headers={'Content-Type': 'application/x-www-form-urlencoded'}
+        )
+    
+    def _make_request(self, query: str, from_lang: str = 'en', to_lang: str = 'zh') -> dict:
+        """发起翻译API请求"""
         for attempt in range(self.max_retries):
             try:
-                request = urllib.request.Request(
-                    self.base_url,
-                    data=data,
-                    headers={'Content-Type': 'application/x-www-form-urlencoded'}
-                )
+                request = self._build_request(query, from_lang, to_lang)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
                 
-                with urllib.request.urlopen(request, timeout=10) as response:
+                with http_transport.urlopen(request, timeout=10) as response:
                     result = json.loads(response.read().decode('utf-8'))
                     
                 if 'error_code' in result:
@@ -91,6 +101,35 @@ class BaiduTranslator(ITranslationService):
                 else:
                     raise e
     
+    async def _amake_request(self, query: str, from_lang: str = 'en', to_lang: str = 'zh') -> dict:
+        """异步发起翻译API请求"""
+        for attempt in range(self.max_retries):
+            try:
+                request = self._build_request(query, from_lang, to_lang)
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.aacquire()
+                response = await async_http_transport.urlopen(request, timeout=10)
+                result = json.loads(response.read().decode('utf-8'))
+                
+                if 'error_code' in result:
+                    error_msg = self._get_error_message(result['error_code'])
+                    if attempt < self.max_retries - 1:
+                        print(f"百度翻译API错误 (尝试 {attempt + 1}/{self.max_retries}): {error_msg}")
+                        await asyncio.sleep(self.retry_delay * (attempt + 1))
+                        continue
+                    else:
+                        raise Exception(f"百度翻译API错误: {error_msg}")
+                
+                return result
+                
+            except Exception as e:
+                if attempt < self.max_retries - 1:
+                    print(f"百度翻译请求失败 (尝试 {attempt + 1}/{self.max_retries}): {str(e)}")
+                    await asyncio.sleep(self.retry_delay * (attempt + 1))
+                    continue
+                else:
+                    raise e
+    
     def _get_error_message(self, error_code: str) -> str:
         """获取错误码对应的错误信息"""
         error_messages = {
@@ -109,67 +148,79 @@ class BaiduTranslator(ITranslationService):
         }
         return error_messages.get(error_code, f'未知错误: {error_code}')
     
-    def translate_text(self, text: str, source_lang: str = 'en', target_lang: str = 'zh') -> TranslationResult:
-        """翻译单个文本"""
-        if not text or not text.strip():
+    def _get_language_codes(self, source_lang: str, target_lang: str) -> Tuple[str, str]:
+        """转换为百度翻译语言代码"""
+        lang_map = {
+            'en': 'en',
+            'zh': 'zh',
+            'zh-cn': 'zh',
+            'zh-tw': 'cht',
+            'ja': 'jp',
+            'ko': 'kor',
+            'fr': 'fra',
+            'de': 'de',
+            'es': 'spa',
+            'ru': 'ru'
+        }
+        
+        return lang_map.get(source_lang.lower(), source_lang), lang_map.get(target_lang.lower(), target_lang)
+    
+    def _create_error_result(self, text: str, source_lang: str, target_lang: str, error_message: str) -> TranslationResult:
+        """创建失败的翻译结果"""
+        return TranslationResult(
+            original_text=text,
+            translated_text="",
+            source_language=source_lang,
+            target_language=target_lang,
+            service_name=self.get_service_name(),
+            confidence_score=0.0,
+            timestamp=datetime.now(),
+            error_message=error_message
+        )
+    
+    def _parse_translation_response(self, text: str, result: dict, source_lang: str, target_lang: str) -> TranslationResult:
+        """从API响应中解析翻译结果"""
+        if 'trans_result' in result and result['trans_result']:
+            translated_text = result['trans_result'][0]['dst']
+            confidence_score = 0.9  # 百度翻译不提供置信度，使用默认值
+            
             return TranslationResult(
                 original_text=text,
-                translated_text="",
+                translated_text=translated_text,
                 source_language=source_lang,
                 target_language=target_lang,
                 service_name=self.get_service_name(),
-                confidence_score=0.0,
-                timestamp=datetime.now(),
-                error_message="输入文本为空"
+                confidence_score=confidence_score,
+                timestamp=datetime.now()
             )
+        else:
+            raise Exception("翻译结果为空")
+    
+    def translate_text(self, text: str, source_lang: str = 'en', target_lang: str = 'zh') -> TranslationResult:
+        """翻译单个文本"""
+        if not text or not text.strip():
+            return self._create_error_result(text, source_lang, target_lang, "输入文本为空")
         
         try:
-            # 百度翻译语言代码映射
-            lang_map = {
-                'en': 'en',
-                'zh': 'zh',
-                'zh-cn': 'zh',
-                'zh-tw': 'cht',
-                'ja': 'jp',
-                'ko': 'kor',
-                'fr': 'fra',
-                'de': 'de',
-                'es': 'spa',
-                'ru': 'ru'
-            }
-            
-            from_lang = lang_map.get(source_lang.lower(), source_lang)
-            to_lang = lang_map.get(target_lang.lower(), target_lang)
-            
+            from_lang, to_lang = self._get_language_codes(source_lang, target_lang)
             result = self._make_request(text, from_lang, to_lang)
-            
-            if 'trans_result' in result and result['trans_result']:
-                translated_text = result['trans_result'][0]['dst']
-                confidence_score = 0.9  # 百度翻译不提供置信度，使用默认值
+            return self._parse_translation_response(text, result, source_lang, target_lang)
                 
-                return TranslationResult(
-                    original_text=text,
-                    translated_text=translated_text,
-                    source_language=source_lang,
-                    target_language=target_lang,
-                    service_name=self.get_service_name(),
-                    confidence_score=confidence_score,
-                    timestamp=datetime.now()
-                )
-            else:
-                raise Exception("翻译结果为空")
+        except Exception as e:
+            return self._create_error_result(text, source_lang, target_lang, str(e))
+    
+    async def atranslate_text(self, text: str, source_lang: str = 'en', target_lang: str = 'zh') -> TranslationResult:
+        """异步翻译单个文本"""
+        if not text or not text.strip():
+            return self._create_error_result(text, source_lang, target_lang, "输入文本为空")
+        
+        try:
+            from_lang, to_lang = self._get_language_codes(source_lang, target_lang)
+            result = await self._amake_request(text, from_lang, to_lang)
+            return self._parse_translation_response(text, result, source_lang, target_lang)
                 
         except Exception as e:
-            return TranslationResult(
-                original_text=text,
-                translated_text="",
-                source_language=source_lang,
-                target_language=target_lang,
-                service_name=self.get_service_name(),
-                confidence_score=0.0,
-                timestamp=datetime.now(),
-                error_message=str(e)
-            )
+            return self._create_error_result(text, source_lang, target_lang, str(e))
     
     def translate_batch(self, texts: List[str], source_lang: str = 'en', target_lang: str = 'zh') -> List[TranslationResult]:
         """批量翻译文本"""
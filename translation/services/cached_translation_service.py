@@ -223,9 +223,11 @@ class CachedTranslationService:
                 'type': 'expired_only'
             }
         else:
-            # 清理所有缓存
+            # 清理所有缓存（先写入队列中的缓存项，保证数据库缓存完整）
+            self.cache.flush()
             self.cache.memory_cache.clear()
-            self.cache.file_cache.clear()
+            if self.cache.file_cache:
+                self.cache.file_cache.clear()
             # 注意：这里不清理数据库缓存，因为它是持久化存储
             
             return {
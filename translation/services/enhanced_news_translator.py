@@ -5,37 +5,53 @@
 """
 
 import os
+import re
 import json
+import hashlib
+import asyncio
 import time
 import urllib.request
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Tuple
 from datetime import datetime
 
-from ..core.interfaces import ITranslationService, TranslationResult, ServiceStatus
+from ..core.interfaces import ITranslationService, IAsyncTranslationService, TranslationResult, ServiceStatus
+from ..core import http_transport, async_http_transport
+from ..core.rate_limiter import RateLimiter
+from ..core.terminology import TERMINOLOGY_ENGINE_VERSION, TermDictionary, TerminologyEngine
 
 
-class EnhancedNewsTranslator(ITranslationService):
+class EnhancedNewsTranslator(ITranslationService, IAsyncTranslationService):
     """增强版新闻翻译器，专门针对新闻内容优化"""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "Qwen/Qwen2.5-7B-Instruct"):
+    def __init__(self, api_key: Optional[str] = None, model: str = "Qwen/Qwen2.5-7B-Instruct",
+                 rate_limiter: Optional[RateLimiter] = None):
         """初始化增强版新闻翻译器
         
         Args:
             api_key: 硅基流动API密钥
             model: 使用的模型名称
+            rate_limiter: 硅基流动服务商共享的限流器，每次HTTP请求（含重试和分段请求）从中申请令牌；
+                          None表示使用翻译器自己的限流器
         """
         self.api_key = api_key or os.getenv('SILICONFLOW_API_KEY')
         self.model = model
         self.base_url = "https://api.siliconflow.cn/v1/chat/completions"
         self.max_retries = 3
         self.retry_delay = 1.0
+        self.batch_size = 10  # 单次批量请求最多打包的文本数
+        self.batch_description_max_length = 800  # 超过该长度的描述走分段翻译，不参与批量
+        self.segment_max_workers = 4  # 长文本分段并发翻译的最大线程数
+        # 请求限流：与其他硅基流动请求共用服务商限流器，否则按每分钟300次单独限流
+        #（与原先分段请求0.2秒间隔的速率一致）
+        self.rate_limiter = rate_limiter or RateLimiter(300, burst=self.segment_max_workers)
         
         if not self.api_key:
             raise ValueError("硅基流动API密钥未配置，请设置SILICONFLOW_API_KEY环境变量")
         
         # 专业术语映射表 - 扩展版
-        self.tech_terms = {
+        self.tech_terms = TermDictionary({
             # AI和机器学习
             'OpenAI': 'OpenAI',
             'ChatGPT': 'ChatGPT', 
@@ -271,7 +287,8 @@ class EnhancedNewsTranslator(ITranslationService):
             'Linux': 'Linux',
             'Ubuntu': 'Ubuntu',
             'Chrome OS': 'Chrome OS'
-        }
+        })
+        self._terminology = None
         
         # 新闻类别特定的翻译策略
         self.category_strategies = {
@@ -301,6 +318,33 @@ class EnhancedNewsTranslator(ITranslationService):
         """获取服务名称"""
         return f"enhanced_news_{self.model.split('/')[-1]}"
     
+    def get_cache_fingerprint(self) -> str:
+        """
+        翻译缓存指纹：模型、各类别提示词模板、术语词典和术语替换引擎版本任一变化时指纹改变
+        
+        提示词用占位符渲染后参与哈希，修改提示词构造方法即可自动使旧缓存失效。
+        """
+        placeholder, title_placeholder = "{text}", "{title}"
+        prompts = []
+        for category in [""] + sorted(self.category_strategies):
+            prompts.extend([
+                self._create_title_translation_prompt(placeholder, category),
+                self._create_description_translation_prompt(placeholder, title_placeholder, category),
+                self._create_segment_translation_prompt(placeholder, title_placeholder, category, 0, 2),
+                self._create_batch_translation_prompt([placeholder], "title", category),
+                self._create_batch_translation_prompt([placeholder], "description", category, [title_placeholder]),
+            ])
+        
+        parts = {
+            'model': self.model,
+            'prompts': hashlib.sha256("\x00".join(prompts).encode('utf-8')).hexdigest(),
+            'terminology': hashlib.sha256(
+                json.dumps(self.tech_terms, ensure_ascii=False, sort_keys=True).encode('utf-8')
+            ).hexdigest(),
+            'terminology_engine': TERMINOLOGY_ENGINE_VERSION
+        }
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+    
     def _create_title_translation_prompt(self, title: str, category: str = "") -> str:
         """创建标题翻译的专门提示词"""
         
@@ -491,28 +535,23 @@ class EnhancedNewsTranslator(ITranslationService):
 - 使用标准的科技术语翻译
 - 确保信息传达的完整性""")
     
+    def _get_terminology(self) -> TerminologyEngine:
+        """获取编译好的术语引擎，术语表被修改或替换后重新编译"""
+        if self._terminology is None or not self._terminology.is_current(self.tech_terms):
+            self._terminology = TerminologyEngine(self.tech_terms)
+        return self._terminology
+    
     def _preprocess_text(self, text: str) -> str:
-        """预处理文本，替换专业术语"""
-        processed_text = text
-        
-        # 按长度排序，优先替换长术语
-        sorted_terms = sorted(self.tech_terms.items(), key=lambda x: len(x[0]), reverse=True)
-        
-        for en_term, zh_term in sorted_terms:
-            # 使用词边界匹配，避免部分匹配
-            import re
-            pattern = r'\b' + re.escape(en_term) + r'\b'
-            processed_text = re.sub(pattern, zh_term, processed_text, flags=re.IGNORECASE)
-        
-        return processed_text
+        """预处理文本，一次扫描替换专业术语（整词匹配，同一位置优先最长的术语）"""
+        return self._get_terminology().replace(text)
     
-    def _make_request(self, messages: List[Dict]) -> dict:
-        """发起API请求"""
+    def _build_request(self, messages: List[Dict], max_tokens: int = 2048) -> urllib.request.Request:
+        """构建API请求"""
         payload = {
             "model": self.model,
             "messages": messages,
             "temperature": 0.2,  # 更低温度确保翻译一致性
-            "max_tokens": 2048,
+            "max_tokens": max_tokens,
             "top_p": 0.8,
             "stream": False
         }
@@ -522,22 +561,32 @@ class EnhancedNewsTranslator(ITranslationService):
             "Content-Type": "application/json"
         }
         
+        return urllib.request.Request(
+            self.base_url,
+            data=json.dumps(payload).encode('utf-8'),
+            headers=headers
+        )
+    
+    def _get_api_error(self, result: dict) -> Optional[str]:
+        """提取API返回的错误信息"""
+        if 'error' in result:
+            error = result['error']
+            return f"{error.get('type', 'Unknown')}: {error.get('message', 'Unknown error')}"
+        return None
+    
+    def _make_request(self, messages: List[Dict], max_tokens: int = 2048) -> dict:
+        """发起API请求"""
         for attempt in range(self.max_retries):
             try:
-                data = json.dumps(payload).encode('utf-8')
-                request = urllib.request.Request(
-                    self.base_url,
-                    data=data,
-                    headers=headers
-                )
+                request = self._build_request(messages, max_tokens)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
                 
-                with urllib.request.urlopen(request, timeout=30) as response:
+                with http_transport.urlopen(request, timeout=30) as response:
                     result = json.loads(response.read().decode('utf-8'))
                     
-                if 'error' in result:
-                    error = result['error']
-                    error_msg = f"{error.get('type', 'Unknown')}: {error.get('message', 'Unknown error')}"
-                    
+                error_msg = self._get_api_error(result)
+                if error_msg:
                     if attempt < self.max_retries - 1:
                         print(f"API错误 (尝试 {attempt + 1}/{self.max_retries}): {error_msg}")
                         time.sleep(self.retry_delay * (attempt + 1))
@@ -555,6 +604,35 @@ class EnhancedNewsTranslator(ITranslationService):
                 else:
                     raise e
     
+    async def _amake_request(self, messages: List[Dict], max_tokens: int = 2048) -> dict:
+        """异步发起API请求"""
+        for attempt in range(self.max_retries):
+            try:
+                request = self._build_request(messages, max_tokens)
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.aacquire()
+                response = await async_http_transport.urlopen(request, timeout=30)
+                result = json.loads(response.read().decode('utf-8'))
+                
+                error_msg = self._get_api_error(result)
+                if error_msg:
+                    if attempt < self.max_retries - 1:
+                        print(f"API错误 (尝试 {attempt + 1}/{self.max_retries}): {error_msg}")
+                        await asyncio.sleep(self.retry_delay * (attempt + 1))
+                        continue
+                    else:
+                        raise Exception(f"API错误: {error_msg}")
+                
+                return result
+                
+            except Exception as e:
+                if attempt < self.max_retries - 1:
+                    print(f"请求失败 (尝试 {attempt + 1}/{self.max_retries}): {str(e)}")
+                    await asyncio.sleep(self.retry_delay * (attempt + 1))
+                    continue
+                else:
+                    raise e
+    
     def _calculate_enhanced_confidence(self, original: str, translated: str, 
                                      translation_type: str = "general") -> float:
         """计算增强的翻译置信度"""
@@ -741,70 +819,84 @@ class EnhancedNewsTranslator(ITranslationService):
         
         return cleaned_title, max(quality_score, 0.0)
     
-    def translate_news_title(self, title: str, category: str = "") -> TranslationResult:
-        """专门翻译新闻标题"""
-        if not title or not title.strip():
+    def _create_title_error_result(self, title: str, error_message: str) -> TranslationResult:
+        """创建失败的标题翻译结果"""
+        return TranslationResult(
+            original_text=title,
+            translated_text="",
+            source_language="en",
+            target_language="zh",
+            service_name=self.get_service_name(),
+            confidence_score=0.0,
+            timestamp=datetime.now(),
+            error_message=error_message
+        )
+    
+    def _create_title_messages(self, title: str, category: str = "") -> List[Dict]:
+        """预处理标题并创建标题翻译请求消息"""
+        # 预处理专业术语
+        processed_title = self._preprocess_text(title)
+        
+        # 创建专门的标题翻译提示
+        prompt = self._create_title_translation_prompt(processed_title, category)
+        return [{"role": "user", "content": prompt}]
+    
+    def _parse_title_response(self, title: str, result: dict, category: str = "") -> TranslationResult:
+        """从API响应中解析并验证标题译文"""
+        if 'choices' in result and result['choices']:
+            raw_translated_text = result['choices'][0]['message']['content'].strip()
+            
+            # 使用质量验证和优化
+            validated_title, quality_adjustment = self._validate_title_quality(
+                title, raw_translated_text, category
+            )
+            
+            if not validated_title:
+                raise Exception("标题翻译验证失败")
+            
+            # 计算置信度（结合质量调整）
+            base_confidence = self._calculate_enhanced_confidence(
+                title, validated_title, "title"
+            )
+            final_confidence = base_confidence * quality_adjustment
+            
             return TranslationResult(
                 original_text=title,
-                translated_text="",
+                translated_text=validated_title,
                 source_language="en",
                 target_language="zh",
                 service_name=self.get_service_name(),
-                confidence_score=0.0,
-                timestamp=datetime.now(),
-                error_message="标题为空"
+                confidence_score=final_confidence,
+                timestamp=datetime.now()
             )
+        else:
+            raise Exception("翻译结果为空")
+    
+    def translate_news_title(self, title: str, category: str = "") -> TranslationResult:
+        """专门翻译新闻标题"""
+        if not title or not title.strip():
+            return self._create_title_error_result(title, "标题为空")
         
         try:
-            # 预处理专业术语
-            processed_title = self._preprocess_text(title)
-            
-            # 创建专门的标题翻译提示
-            prompt = self._create_title_translation_prompt(processed_title, category)
-            messages = [{"role": "user", "content": prompt}]
-            
+            messages = self._create_title_messages(title, category)
             result = self._make_request(messages)
-            
-            if 'choices' in result and result['choices']:
-                raw_translated_text = result['choices'][0]['message']['content'].strip()
-                
-                # 使用质量验证和优化
-                validated_title, quality_adjustment = self._validate_title_quality(
-                    title, raw_translated_text, category
-                )
-                
-                if not validated_title:
-                    raise Exception("标题翻译验证失败")
-                
-                # 计算置信度（结合质量调整）
-                base_confidence = self._calculate_enhanced_confidence(
-                    title, validated_title, "title"
-                )
-                final_confidence = base_confidence * quality_adjustment
+            return self._parse_title_response(title, result, category)
                 
-                return TranslationResult(
-                    original_text=title,
-                    translated_text=validated_title,
-                    source_language="en",
-                    target_language="zh",
-                    service_name=self.get_service_name(),
-                    confidence_score=final_confidence,
-                    timestamp=datetime.now()
-                )
-            else:
-                raise Exception("翻译结果为空")
+        except Exception as e:
+            return self._create_title_error_result(title, str(e))
+    
+    async def atranslate_news_title(self, title: str, category: str = "") -> TranslationResult:
+        """异步翻译新闻标题"""
+        if not title or not title.strip():
+            return self._create_title_error_result(title, "标题为空")
+        
+        try:
+            messages = self._create_title_messages(title, category)
+            result = await self._amake_request(messages)
+            return self._parse_title_response(title, result, category)
                 
         except Exception as e:
-            return TranslationResult(
-                original_text=title,
-                translated_text="",
-                source_language="en",
-                target_language="zh",
-                service_name=self.get_service_name(),
-                confidence_score=0.0,
-                timestamp=datetime.now(),
-                error_message=str(e)
-            )
+            return self._create_title_error_result(title, str(e))
     
     def translate_news_description(self, description: str, title: str = "", category: str = "") -> TranslationResult:
         """专门翻译新闻描述，支持长文本智能分段处理"""
@@ -993,62 +1085,36 @@ class EnhancedNewsTranslator(ITranslationService):
             raise e
     
     def _translate_long_description(self, description: str, title: str = "", category: str = "") -> TranslationResult:
-        """智能分段翻译长文本描述"""
+        """智能分段翻译长文本描述，各段并发翻译后按原顺序合并"""
         try:
             # 智能分段
             segments = self._smart_segment_text(description)
-            translated_segments = []
-            total_confidence = 0.0
+            total = len(segments)
             
-            print(f"📄 长文本分为 {len(segments)} 段进行翻译")
+            print(f"📄 长文本分为 {total} 段进行翻译")
             
-            for i, segment in enumerate(segments):
-                if not segment.strip():
-                    translated_segments.append("")
-                    continue
-                
-                try:
-                    # 为每段创建上下文感知的翻译提示
-                    segment_prompt = self._create_segment_translation_prompt(
-                        segment, title, category, i, len(segments)
-                    )
-                    messages = [{"role": "user", "content": segment_prompt}]
-                    
-                    result = self._make_request(messages)
-                    
-                    if 'choices' in result and result['choices']:
-                        translated_segment = result['choices'][0]['message']['content'].strip()
-                        
-                        # 清理格式
-                        if translated_segment.startswith('翻译：'):
-                            translated_segment = translated_segment[3:].strip()
-                        
-                        translated_segments.append(translated_segment)
-                        
-                        # 计算段落置信度
-                        segment_confidence = self._calculate_enhanced_confidence(
-                            segment, translated_segment, "description"
-                        )
-                        total_confidence += segment_confidence
-                        
-                        print(f"✅ 第 {i+1}/{len(segments)} 段翻译完成")
-                        
-                        # 添加延迟避免频率限制
-                        if i < len(segments) - 1:
-                            time.sleep(0.2)
-                    else:
-                        print(f"⚠️ 第 {i+1} 段翻译失败，保留原文")
-                        translated_segments.append(segment)
-                        
-                except Exception as e:
-                    print(f"⚠️ 第 {i+1} 段翻译异常: {str(e)}")
-                    translated_segments.append(segment)
+            pending = [i for i, segment in enumerate(segments) if segment.strip()]
+            segment_results: Dict[int, Tuple[str, float]] = {}
+            
+            if pending:
+                max_workers = max(1, min(self.segment_max_workers, len(pending)))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        i: executor.submit(self._translate_segment, segments[i], title, category, i, total)
+                        for i in pending
+                    }
+                    for i, future in futures.items():
+                        segment_results[i] = future.result()
+            
+            # 按原顺序组装，空段保留为空，失败段由_translate_segment保留原文
+            translated_segments = [segment_results.get(i, ("", 0.0))[0] for i in range(total)]
+            total_confidence = sum(confidence for _, confidence in segment_results.values())
             
             # 合并翻译结果
             final_translation = self._merge_translated_segments(translated_segments)
             
             # 计算平均置信度
-            avg_confidence = total_confidence / len(segments) if segments else 0.0
+            avg_confidence = total_confidence / total if segments else 0.0
             
             return TranslationResult(
                 original_text=description,
@@ -1063,6 +1129,45 @@ class EnhancedNewsTranslator(ITranslationService):
         except Exception as e:
             raise e
     
+    def _translate_segment(self, segment: str, title: str, category: str,
+                           segment_index: int, total_segments: int) -> Tuple[str, float]:
+        """翻译单个段落，失败时保留原文
+        
+        Returns:
+            Tuple[str, float]: (译文或原文, 段落置信度)
+        """
+        try:
+            # 为每段创建上下文感知的翻译提示
+            segment_prompt = self._create_segment_translation_prompt(
+                segment, title, category, segment_index, total_segments
+            )
+            messages = [{"role": "user", "content": segment_prompt}]
+            
+            # _make_request按限流器申请令牌，代替原先段间的固定延迟
+            result = self._make_request(messages)
+            
+            if 'choices' in result and result['choices']:
+                translated_segment = result['choices'][0]['message']['content'].strip()
+                
+                # 清理格式
+                if translated_segment.startswith('翻译：'):
+                    translated_segment = translated_segment[3:].strip()
+                
+                # 计算段落置信度
+                segment_confidence = self._calculate_enhanced_confidence(
+                    segment, translated_segment, "description"
+                )
+                
+                print(f"✅ 第 {segment_index+1}/{total_segments} 段翻译完成")
+                return translated_segment, segment_confidence
+            
+            print(f"⚠️ 第 {segment_index+1} 段翻译失败，保留原文")
+            return segment, 0.0
+            
+        except Exception as e:
+            print(f"⚠️ 第 {segment_index+1} 段翻译异常: {str(e)}")
+            return segment, 0.0
+    
     def _smart_segment_text(self, text: str) -> List[str]:
         """智能分段文本，保持逻辑完整性"""
         if len(text) <= 600:  # 短文本不需要分段
@@ -1316,19 +1421,209 @@ class EnhancedNewsTranslator(ITranslationService):
         
         return "\n\n".join(merged)
     
+    def _create_batch_translation_prompt(self, texts: List[str], text_type: str = "title",
+                                         category: str = "", titles: Optional[List[str]] = None) -> str:
+        """创建批量翻译提示词，每条文本用[[序号]]标记"""
+        strategy = self.category_strategies.get(category, {
+            'focus': '准确传达核心信息',
+            'tone': '客观、专业',
+            'keywords': ['新闻', '资讯', '动态']
+        })
+        
+        if text_type == "title":
+            content_name = "新闻标题"
+            length_rule = "- 每条标题通常15-30个中文字符，突出核心信息"
+        else:
+            content_name = "新闻描述"
+            length_rule = "- 保持每条描述的完整信息，不要合并或拆分条目"
+        
+        numbered_items = []
+        for i, text in enumerate(texts, 1):
+            item = f"[[{i}]] {text}"
+            if titles and i <= len(titles) and titles[i - 1]:
+                item += f"\n（标题参考：{titles[i - 1]}）"
+            numbered_items.append(item)
+        
+        prompt = f"""你是一位专业的科技新闻翻译专家。请将以下{len(texts)}条英文{content_name}逐条翻译成中文，要求：
+
+【翻译原则】
+1. 准确性：保持原文的核心信息和关键事实
+2. 自然性：使用符合中文表达习惯的语言，避免直译
+3. 专业性：正确翻译专业术语和公司名称
+
+【类别特点】{category}
+- 关注重点：{strategy['focus']}
+- 语言风格：{strategy['tone']}
+
+【专业术语处理规则】
+- 知名品牌保持原名：OpenAI, ChatGPT, Tesla, Meta等
+- 公司名称使用通用中文名：Google→谷歌, Microsoft→微软, Apple→苹果
+- 数字信息保持原样：价格、日期、百分比、版本号等
+{length_rule}
+
+【格式要求】
+- 每条译文以对应的序号标记开头，例如：[[1]] 译文
+- 必须输出全部{len(texts)}条，序号与原文一一对应
+- 只返回带序号的译文，不要添加任何解释、引号或标题参考
+
+英文{content_name}：
+{chr(10).join(numbered_items)}
+
+中文译文："""
+        
+        return prompt
+    
+    def _parse_batch_response(self, content: str, expected_count: int) -> Dict[int, str]:
+        """解析批量翻译响应
+        
+        Returns:
+            Dict[int, str]: 序号（从0开始）到译文的映射，只包含格式有效的条目
+        """
+        parsed: Dict[int, str] = {}
+        duplicates = set()
+        
+        for match in re.finditer(r'\[\[(\d+)\]\](.*?)(?=\[\[\d+\]\]|\Z)', content, re.DOTALL):
+            index = int(match.group(1)) - 1
+            text = match.group(2).strip()
+            
+            if index < 0 or index >= expected_count or not text:
+                continue
+            
+            # 同一序号出现多次时无法判断哪条正确，全部丢弃
+            if index in parsed:
+                duplicates.add(index)
+                continue
+            
+            parsed[index] = text
+        
+        for index in duplicates:
+            parsed.pop(index, None)
+        
+        return parsed
+    
+    def _translate_chunk_combined(self, texts: List[str], text_type: str, category: str,
+                                  titles: Optional[List[str]] = None) -> List[Optional[TranslationResult]]:
+        """用一次请求翻译一组文本，解析失败的条目返回None"""
+        processed_texts = [self._preprocess_text(text) for text in texts]
+        prompt = self._create_batch_translation_prompt(processed_texts, text_type, category, titles)
+        messages = [{"role": "user", "content": prompt}]
+        
+        result = self._make_request(messages, max_tokens=4096)
+        if 'choices' not in result or not result['choices']:
+            raise Exception("批量翻译结果为空")
+        
+        content = result['choices'][0]['message']['content']
+        parsed = self._parse_batch_response(content, len(texts))
+        
+        results: List[Optional[TranslationResult]] = []
+        for i, original in enumerate(texts):
+            raw_translation = parsed.get(i)
+            if not raw_translation:
+                results.append(None)
+                continue
+            
+            if text_type == "title":
+                validated, quality_adjustment = self._validate_title_quality(original, raw_translation, category)
+            else:
+                title = titles[i] if titles and i < len(titles) else ""
+                validated, quality_adjustment = self._validate_description_quality(
+                    original, raw_translation, title, category
+                )
+            
+            if not validated:
+                results.append(None)
+                continue
+            
+            confidence = self._calculate_enhanced_confidence(original, validated, text_type)
+            results.append(TranslationResult(
+                original_text=original,
+                translated_text=validated,
+                source_language="en",
+                target_language="zh",
+                service_name=self.get_service_name(),
+                confidence_score=confidence * quality_adjustment,
+                timestamp=datetime.now()
+            ))
+        
+        return results
+    
+    def _translate_in_batches(self, texts: List[str], text_type: str, category: str,
+                              titles: Optional[List[str]] = None,
+                              fallback: bool = True) -> List[Optional[TranslationResult]]:
+        """分块批量翻译，只对解析失败的条目逐条回退
+        
+        fallback为False时不逐条回退，批量请求失败或解析失败的条目返回None，由调用方决定降级方式；
+        不参与批量的空文本和长描述仍按单条路径翻译。
+        """
+        results: List[Optional[TranslationResult]] = [None] * len(texts)
+        
+        # 空文本和长描述不参与批量
+        batch_indices = [
+            i for i, text in enumerate(texts)
+            if text and text.strip() and (
+                text_type == "title" or len(text) <= self.batch_description_max_length
+            )
+        ]
+        
+        for start in range(0, len(batch_indices), self.batch_size):
+            chunk_indices = batch_indices[start:start + self.batch_size]
+            chunk_texts = [texts[i] for i in chunk_indices]
+            chunk_titles = [titles[i] for i in chunk_indices] if titles else None
+            
+            try:
+                chunk_results = self._translate_chunk_combined(chunk_texts, text_type, category, chunk_titles)
+            except Exception as e:
+                print(f"批量翻译请求失败: {str(e)}")
+                chunk_results = [None] * len(chunk_indices)
+            
+            failed_count = sum(1 for result in chunk_results if result is None)
+            if failed_count:
+                print(f"⚠️ 批量翻译中 {failed_count}/{len(chunk_indices)} 条解析失败")
+            
+            for index, result in zip(chunk_indices, chunk_results):
+                results[index] = result
+        
+        # 回退：未成功的条目逐条翻译
+        batched = set(batch_indices)
+        for i, text in enumerate(texts):
+            if results[i] is not None or (not fallback and i in batched):
+                continue
+            if text_type == "title":
+                results[i] = self.translate_news_title(text, category)
+            else:
+                title = titles[i] if titles and i < len(titles) else ""
+                results[i] = self.translate_news_description(text, title, category)
+        
+        return results
+    
+    def translate_news_titles_batch(self, titles: List[str], category: str = "",
+                                    fallback: bool = True) -> List[Optional[TranslationResult]]:
+        """批量翻译新闻标题，每batch_size条合并为一次请求
+        
+        fallback为False时批量失败的标题返回None，不再逐条重试
+        """
+        return self._translate_in_batches(titles, "title", category, fallback=fallback)
+    
+    def translate_news_descriptions_batch(self, descriptions: List[str], titles: Optional[List[str]] = None,
+                                          category: str = "",
+                                          fallback: bool = True) -> List[Optional[TranslationResult]]:
+        """批量翻译较短的新闻描述，长描述仍走分段翻译
+        
+        fallback为False时批量失败的描述返回None，不再逐条重试
+        """
+        return self._translate_in_batches(descriptions, "description", category, titles, fallback=fallback)
+    
     def translate_text(self, text: str, source_lang: str = 'en', target_lang: str = 'zh') -> TranslationResult:
         """通用文本翻译接口"""
         return self.translate_news_title(text)  # 默认使用标题翻译逻辑
     
     def translate_batch(self, texts: List[str], source_lang: str = 'en', target_lang: str = 'zh') -> List[TranslationResult]:
-        """批量翻译"""
-        results = []
-        for text in texts:
-            result = self.translate_text(text, source_lang, target_lang)
-            results.append(result)
-            # 添加小延迟避免频率限制
-            time.sleep(0.1)
-        return results
+        """批量翻译（按标题逻辑合并请求）"""
+        return self.translate_news_titles_batch(texts)
+    
+    async def atranslate_text(self, text: str, source_lang: str = 'en', target_lang: str = 'zh') -> TranslationResult:
+        """异步通用文本翻译接口"""
+        return await self.atranslate_news_title(text)  # 默认使用标题翻译逻辑
     
     def get_service_status(self) -> ServiceStatus:
         """获取服务状态"""
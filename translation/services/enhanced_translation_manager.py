@@ -29,7 +29,7 @@ class EnhancedTranslationManager:
         初始化增强翻译管理器
         
         Args:
-            config: 配置字典，包含各服务的API密钥等
+            config: 配置字典，包含各服务的API密钥、反馈数据库路径（feedback_db_path）等
         """
         self.config = config or {}
         self.logger = logging.getLogger(__name__)
@@ -41,7 +41,7 @@ class EnhancedTranslationManager:
         self.quality_assessor = TranslationQualityAssessor()
         self.comparator = TranslationComparator(self.services, self.quality_assessor)
         self.adaptive_selector = AdaptiveTranslationSelector()
-        self.feedback_system = TranslationFeedbackSystem()
+        self.feedback_system = TranslationFeedbackSystem(self.config.get('feedback_db_path', 'translation_feedback.db'))
         
         # 统计信息
         self.translation_stats = {
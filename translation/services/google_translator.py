@@ -6,16 +6,18 @@ Google翻译API适配器
 
 import os
 import json
+import asyncio
 import time
 import urllib.request
 import urllib.parse
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
-from ..core.interfaces import ITranslationService, TranslationResult, ServiceStatus
+from ..core.interfaces import ITranslationService, IAsyncTranslationService, TranslationResult, ServiceStatus
+from ..core import http_transport, async_http_transport
 
 
-class GoogleTranslator(ITranslationService):
+class GoogleTranslator(ITranslationService, IAsyncTranslationService):
     """Google翻译API适配器"""
     
     def __init__(self, api_key: Optional[str] = None, project_id: Optional[str] = None):
@@ -39,27 +41,34 @@ class GoogleTranslator(ITranslationService):
         """获取服务名称"""
         return "google_translate"
     
+    def _build_request(self, url: str, params: dict) -> urllib.request.Request:
+        """构建Google翻译API请求"""
+        params['key'] = self.api_key
+        data = urllib.parse.urlencode(params).encode('utf-8')
+        return urllib.request.Request(
+            url,
+            data=data,
+            headers={'Content-Type': 'application/x-www-form-urlencoded'}
+        )
+    
+    def _get_api_error(self, result: dict) -> Optional[str]:
+        """提取API返回的错误信息"""
+        if 'error' in result:
+            error = result['error']
+            return f"{error.get('code', 'Unknown')}: {error.get('message', 'Unknown error')}"
+        return None
+    
     def _make_request(self, url: str, params: dict) -> dict:
         """发起Google翻译API请求"""
-        params['key'] = self.api_key
-        
         for attempt in range(self.max_retries):
             try:
-                # 构建请求
-                data = urllib.parse.urlencode(params).encode('utf-8')
-                request = urllib.request.Request(
-                    url,
-                    data=data,
-                    headers={'Content-Type': 'application/x-www-form-urlencoded'}
-                )
+                request = self._build_request(url, params)
                 
-                with urllib.request.urlopen(request, timeout=10) as response:
+                with http_transport.urlopen(request, timeout=10) as response:
                     result = json.loads(response.read().decode('utf-8'))
                     
-                if 'error' in result:
-                    error = result['error']
-                    error_msg = f"{error.get('code', 'Unknown')}: {error.get('message', 'Unknown error')}"
-                    
+                error_msg = self._get_api_error(result)
+                if error_msg:
                     if attempt < self.max_retries - 1:
                         print(f"Google翻译API错误 (尝试 {attempt + 1}/{self.max_retries}): {error_msg}")
                         time.sleep(self.retry_delay * (attempt + 1))
@@ -77,17 +86,56 @@ class GoogleTranslator(ITranslationService):
                 else:
                     raise e
     
+    async def _amake_request(self, url: str, params: dict) -> dict:
+        """异步发起Google翻译API请求"""
+        for attempt in range(self.max_retries):
+            try:
+                request = self._build_request(url, params)
+                response = await async_http_transport.urlopen(request, timeout=10)
+                result = json.loads(response.read().decode('utf-8'))
+                
+                error_msg = self._get_api_error(result)
+                if error_msg:
+                    if attempt < self.max_retries - 1:
+                        print(f"Google翻译API错误 (尝试 {attempt + 1}/{self.max_retries}): {error_msg}")
+                        await asyncio.sleep(self.retry_delay * (attempt + 1))
+                        continue
+                    else:
+                        raise Exception(f"Google翻译API错误: {error_msg}")
+                
+                return result
+                
+            except Exception as e:
+                if attempt < self.max_retries - 1:
+                    print(f"Google翻译请求失败 (尝试 {attempt + 1}/{self.max_retries}): {str(e)}")
+                    await asyncio.sleep(self.retry_delay * (attempt + 1))
+                    continue
+                else:
+                    raise e
+    
+    def _parse_detection_response(self, result: dict) -> Optional[str]:
+        """从API响应中解析检测到的语言"""
+        if 'data' in result and 'detections' in result['data']:
+            detections = result['data']['detections'][0]
+            if detections:
+                return detections[0]['language']
+        return None
+    
     def detect_language(self, text: str) -> Optional[str]:
         """检测文本语言"""
         try:
             params = {'q': text}
             result = self._make_request(self.detect_url, params)
-            
-            if 'data' in result and 'detections' in result['data']:
-                detections = result['data']['detections'][0]
-                if detections:
-                    return detections[0]['language']
+            return self._parse_detection_response(result)
+        except Exception:
             return None
+    
+    async def adetect_language(self, text: str) -> Optional[str]:
+        """异步检测文本语言"""
+        try:
+            params = {'q': text}
+            result = await self._amake_request(self.detect_url, params)
+            return self._parse_detection_response(result)
         except Exception:
             return None
     
@@ -112,50 +160,81 @@ class GoogleTranslator(ITranslationService):
         
         return min(max(base_confidence, 0.0), 1.0)
     
+    def _get_language_codes(self, source_lang: str, target_lang: str) -> Tuple[str, str]:
+        """转换为Google翻译语言代码"""
+        lang_map = {
+            'zh': 'zh-cn',
+            'zh-cn': 'zh-cn',
+            'zh-tw': 'zh-tw',
+            'en': 'en',
+            'ja': 'ja',
+            'ko': 'ko',
+            'fr': 'fr',
+            'de': 'de',
+            'es': 'es',
+            'ru': 'ru',
+            'it': 'it',
+            'pt': 'pt',
+            'ar': 'ar',
+            'th': 'th',
+            'vi': 'vi',
+            'hi': 'hi',
+            'tr': 'tr',
+            'pl': 'pl',
+            'nl': 'nl',
+            'sv': 'sv',
+            'da': 'da',
+            'no': 'no',
+            'fi': 'fi'
+        }
+        
+        return lang_map.get(source_lang.lower(), source_lang), lang_map.get(target_lang.lower(), target_lang)
+    
+    def _create_error_result(self, text: str, source_lang: str, target_lang: str, error_message: str) -> TranslationResult:
+        """创建失败的翻译结果"""
+        return TranslationResult(
+            original_text=text,
+            translated_text="",
+            source_language=source_lang,
+            target_language=target_lang,
+            service_name=self.get_service_name(),
+            confidence_score=0.0,
+            timestamp=datetime.now(),
+            error_message=error_message
+        )
+    
+    def _parse_translation_response(self, text: str, result: dict, source_lang: str, target_lang: str,
+                                     detected_lang: Optional[str] = None) -> TranslationResult:
+        """从API响应中解析翻译结果"""
+        if 'data' in result and 'translations' in result['data']:
+            translations = result['data']['translations']
+            if translations:
+                translated_text = translations[0]['translatedText']
+                
+                # 计算置信度
+                confidence_score = self._calculate_confidence(
+                    text, translated_text, detected_lang
+                )
+                
+                return TranslationResult(
+                    original_text=text,
+                    translated_text=translated_text,
+                    source_language=source_lang,
+                    target_language=target_lang,
+                    service_name=self.get_service_name(),
+                    confidence_score=confidence_score,
+                    timestamp=datetime.now()
+                )
+        
+        raise Exception("翻译结果为空")
+    
     def translate_text(self, text: str, source_lang: str = 'en', target_lang: str = 'zh') -> TranslationResult:
         """翻译单个文本"""
         if not text or not text.strip():
-            return TranslationResult(
-                original_text=text,
-                translated_text="",
-                source_language=source_lang,
-                target_language=target_lang,
-                service_name=self.get_service_name(),
-                confidence_score=0.0,
-                timestamp=datetime.now(),
-                error_message="输入文本为空"
-            )
+            return self._create_error_result(text, source_lang, target_lang, "输入文本为空")
         
         try:
-            # Google翻译语言代码映射
-            lang_map = {
-                'zh': 'zh-cn',
-                'zh-cn': 'zh-cn',
-                'zh-tw': 'zh-tw',
-                'en': 'en',
-                'ja': 'ja',
-                'ko': 'ko',
-                'fr': 'fr',
-                'de': 'de',
-                'es': 'es',
-                'ru': 'ru',
-                'it': 'it',
-                'pt': 'pt',
-                'ar': 'ar',
-                'th': 'th',
-                'vi': 'vi',
-                'hi': 'hi',
-                'tr': 'tr',
-                'pl': 'pl',
-                'nl': 'nl',
-                'sv': 'sv',
-                'da': 'da',
-                'no': 'no',
-                'fi': 'fi'
-            }
-            
-            source = lang_map.get(source_lang.lower(), source_lang)
-            target = lang_map.get(target_lang.lower(), target_lang)
+            source, target = self._get_language_codes(source_lang, target_lang)
             
             # 检测源语言（可选）
             detected_lang = None
@@ -172,40 +251,38 @@ class GoogleTranslator(ITranslationService):
             }
             
             result = self._make_request(self.base_url, params)
+            return self._parse_translation_response(text, result, source_lang, target_lang, detected_lang)
+                
+        except Exception as e:
+            return self._create_error_result(text, source_lang, target_lang, str(e))
+    
+    async def atranslate_text(self, text: str, source_lang: str = 'en', target_lang: str = 'zh') -> TranslationResult:
+        """异步翻译单个文本"""
+        if not text or not text.strip():
+            return self._create_error_result(text, source_lang, target_lang, "输入文本为空")
+        
+        try:
+            source, target = self._get_language_codes(source_lang, target_lang)
             
-            if 'data' in result and 'translations' in result['data']:
-                translations = result['data']['translations']
-                if translations:
-                    translated_text = translations[0]['translatedText']
-                    
-                    # 计算置信度
-                    confidence_score = self._calculate_confidence(
-                        text, translated_text, detected_lang
-                    )
-                    
-                    return TranslationResult(
-                        original_text=text,
-                        translated_text=translated_text,
-                        source_language=source_lang,
-                        target_language=target_lang,
-                        service_name=self.get_service_name(),
-                        confidence_score=confidence_score,
-                        timestamp=datetime.now()
-                    )
+            # 检测源语言（可选）
+            detected_lang = None
+            if source_lang == 'auto' or source_lang == '':
+                detected_lang = await self.adetect_language(text)
+                if detected_lang:
+                    source = detected_lang
+            
+            params = {
+                'q': text,
+                'source': source,
+                'target': target,
+                'format': 'text'
+            }
             
-            raise Exception("翻译结果为空")
+            result = await self._amake_request(self.base_url, params)
+            return self._parse_translation_response(text, result, source_lang, target_lang, detected_lang)
                 
         except Exception as e:
-            return TranslationResult(
-                original_text=text,
-                translated_text="",
-                source_language=source_lang,
-                target_language=target_lang,
-                service_name=self.get_service_name(),
-                confidence_score=0.0,
-                timestamp=datetime.now(),
-                error_message=str(e)
-            )
+            return self._create_error_result(text, source_lang, target_lang, str(e))
     
     def translate_batch(self, texts: List[str], source_lang: str = 'en', target_lang: str = 'zh') -> List[TranslationResult]:
         """批量翻译文本"""
@@ -260,7 +337,7 @@ class GoogleTranslator(ITranslationService):
             
             request = urllib.request.Request(url, method='GET')
             
-            with urllib.request.urlopen(request, timeout=15) as response:
+            with http_transport.urlopen(request, timeout=15) as response:
                 result = json.loads(response.read().decode('utf-8'))
             
             if 'data' in result and 'translations' in result['data']:
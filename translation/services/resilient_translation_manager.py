@@ -6,12 +6,18 @@
 """
 
 import logging
+import math
+import threading
 import time
-from typing import List, Dict, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Deque, List, Dict, Optional
 from datetime import datetime
 from dataclasses import dataclass
 
 from ..core.interfaces import ITranslationService, TranslationResult
+from ..core.circuit_breaker import CircuitBreakerConfig, CircuitBreakerRegistry
+from ..core.service_health_monitor import ServiceHealthMonitor
 from ..services.rule_based_translator import RuleBasedTranslator
 
 
@@ -38,6 +44,27 @@ class ResilientTranslationManager:
         self.services = self._initialize_services()
         self.rule_translator = RuleBasedTranslator()  # 最终降级方案
         
+        # 按服务熔断：健康检查和实际调用结果共同决定是否跳过服务
+        self.circuit_breakers = CircuitBreakerRegistry(CircuitBreakerConfig(
+            failure_threshold=self.config.get('circuit_failure_threshold', 5),
+            recovery_timeout=self.config.get('circuit_recovery_timeout', 60.0)
+        ))
+        self.health_monitor = ServiceHealthMonitor(self.services, circuit_breakers=self.circuit_breakers)
+        
+        # 对冲请求配置：主服务在延迟分位数阈值内未返回时，并行请求下一个服务
+        self.hedging_enabled = self.config.get('hedging_enabled', False)
+        self.hedge_percentile = self.config.get('hedge_percentile', 0.95)
+        self.hedge_initial_delay = self.config.get('hedge_initial_delay', 2.0)  # 延迟样本不足时的对冲阈值
+        self.hedge_min_delay = self.config.get('hedge_min_delay', 0.2)
+        self.hedge_min_samples = self.config.get('hedge_min_samples', 5)
+        self.hedge_max_retries = self.config.get('hedge_max_retries', 1)  # 对冲模式下单个服务的重试次数
+        self.max_retries = self.config.get('max_retries', 3)
+        
+        # 各服务最近的成功响应延迟，用于计算对冲阈值
+        self._latency_samples: Dict[str, Deque[float]] = {}
+        self._latency_window = self.config.get('latency_window', 100)
+        self._latency_lock = threading.Lock()
+        
         # 统计信息
         self.translation_stats = {
             'total_requests': 0,
@@ -45,6 +72,9 @@ class ResilientTranslationManager:
             'failed_translations': 0,
             'fallback_used': 0,
             'rule_translator_used': 0,
+            'hedged_requests': 0,
+            'hedge_wins': 0,
+            'circuit_skips': 0,
             'service_usage': {},
             'average_response_time': 0.0
         }
@@ -75,9 +105,14 @@ class ResilientTranslationManager:
         
         # 尝试外部翻译服务
         if self.services:
-            result = self._try_external_services(
-                text, source_lang, target_lang, self.services, attempts
-            )
+            if self.hedging_enabled and len(self.services) > 1:
+                result = self._try_external_services_hedged(
+                    text, source_lang, target_lang, self.services, attempts
+                )
+            else:
+                result = self._try_external_services(
+                    text, source_lang, target_lang, self.services, attempts
+                )
             
             if result['success']:
                 response_time = time.time() - start_time
@@ -159,8 +194,13 @@ class ResilientTranslationManager:
         for service in services:
             service_name = service.get_service_name()
             
+            if not self.health_monitor.allow_request(service_name):
+                self._record_circuit_skip(service_name, attempts)
+                continue
+            
             # 尝试翻译（带重试）
             result = self._try_service_with_retry(service, text, source_lang, target_lang)
+            self.health_monitor.record_call_result(service_name, result['success'], result.get('error'))
             
             # 记录尝试
             attempts.append(TranslationAttempt(
@@ -183,11 +223,170 @@ class ResilientTranslationManager:
         
         return {'success': False}
     
+    def _try_external_services_hedged(self, text: str, source_lang: str, target_lang: str,
+                                      services: List[ITranslationService],
+                                      attempts: List[TranslationAttempt]) -> Dict:
+        """对冲模式尝试外部翻译服务
+        
+        先请求最高优先级服务；若其在延迟分位数阈值内未返回或已失败，
+        并行请求下一个服务，采用最先返回的有效结果并取消其余请求。
+        进行中的HTTP调用无法中断，取消只会阻止尚未开始的请求和后续重试。
+        每次调用使用独立的线程池，落败请求在后台自然结束，不占用后续调用的并发名额。
+        """
+        if not services:
+            return {'success': False}
+        
+        cancel_event = threading.Event()
+        queue = list(services)
+        executor = ThreadPoolExecutor(max_workers=len(queue), thread_name_prefix="translation-hedge")
+        try:
+            return self._run_hedged_requests(executor, queue, text, source_lang, target_lang,
+                                             cancel_event, attempts)
+        finally:
+            executor.shutdown(wait=False)
+    
+    def _run_hedged_requests(self, executor: ThreadPoolExecutor, queue: List[ITranslationService],
+                             text: str, source_lang: str, target_lang: str,
+                             cancel_event: threading.Event,
+                             attempts: List[TranslationAttempt]) -> Dict:
+        """在给定线程池中依次发起对冲请求，返回最先成功的结果
+        
+        熔断器许可在真正发起请求前才申请，未发起的服务不会占用半开状态的试探名额。
+        """
+        in_flight = {}  # future -> (服务, 启动时间)
+        
+        def launch_next() -> Optional[ITranslationService]:
+            while queue:
+                service = queue.pop(0)
+                if not self.health_monitor.allow_request(service.get_service_name()):
+                    self._record_circuit_skip(service.get_service_name(), attempts)
+                    continue
+                future = executor.submit(
+                    self._try_service_with_retry, service, text, source_lang, target_lang,
+                    self.hedge_max_retries, cancel_event
+                )
+                in_flight[future] = (service, time.time())
+                return service
+            return None
+        
+        first_service = launch_next()
+        if first_service is None:
+            return {'success': False}
+        first_service_name = first_service.get_service_name()
+        
+        while in_flight:
+            # 以最近启动的服务的延迟阈值决定何时发起对冲请求
+            latest_service = max(in_flight.values(), key=lambda item: item[1])[0]
+            timeout = self._get_hedge_delay(latest_service.get_service_name()) if queue else None
+            done, _ = wait(list(in_flight), timeout=timeout, return_when=FIRST_COMPLETED)
+            
+            if not done:
+                hedge_service = launch_next()
+                if hedge_service is None:
+                    continue
+                self.translation_stats['hedged_requests'] += 1
+                self.logger.info(f"服务 {latest_service.get_service_name()} 超过延迟阈值，"
+                                 f"对冲请求 {hedge_service.get_service_name()}")
+                continue
+            
+            for future in done:
+                service, _ = in_flight.pop(future)
+                service_name = service.get_service_name()
+                result = future.result()
+                self.health_monitor.record_call_result(service_name, result['success'], result.get('error'))
+                
+                attempts.append(TranslationAttempt(
+                    service_name=service_name,
+                    success=result['success'],
+                    result=result.get('result'),
+                    error=result.get('error'),
+                    response_time=result['response_time'],
+                    timestamp=datetime.now()
+                ))
+                
+                if result['success']:
+                    self._cancel_hedged_requests(in_flight, cancel_event, attempts)
+                    if service_name != first_service_name:
+                        self.translation_stats['hedge_wins'] += 1
+                    return {
+                        'success': True,
+                        'result': result['result'],
+                        'service_used': service_name
+                    }
+                
+                self.logger.warning(f"服务 {service_name} 翻译失败: {result['error']}")
+            
+            # 失败的服务不再占用并发名额，立即请求下一个服务
+            if queue and len(in_flight) == 0:
+                launch_next()
+        
+        return {'success': False}
+    
+    def _record_circuit_skip(self, service_name: str, attempts: List[TranslationAttempt]):
+        """记录因熔断而跳过的服务"""
+        self.logger.info(f"服务 {service_name} 处于熔断状态，跳过")
+        self.translation_stats['circuit_skips'] += 1
+        attempts.append(TranslationAttempt(
+            service_name=service_name,
+            success=False,
+            result=None,
+            error="熔断中，已跳过",
+            response_time=0.0,
+            timestamp=datetime.now()
+        ))
+    
+    def _cancel_hedged_requests(self, in_flight: Dict, cancel_event: threading.Event,
+                                attempts: List[TranslationAttempt]):
+        """取消落败的对冲请求
+        
+        被取消请求的结果不再记录，因此归还其熔断器许可，既不算成功也不算失败。
+        """
+        cancel_event.set()
+        now = time.time()
+        for future, (service, started_at) in in_flight.items():
+            future.cancel()
+            self.health_monitor.release_permit(service.get_service_name())
+            attempts.append(TranslationAttempt(
+                service_name=service.get_service_name(),
+                success=False,
+                result=None,
+                error="已取消：其他服务先返回了有效结果",
+                response_time=now - started_at,
+                timestamp=datetime.now()
+            ))
+        in_flight.clear()
+    
+    def _record_latency(self, service_name: str, response_time: float):
+        """记录服务的成功响应延迟"""
+        with self._latency_lock:
+            if service_name not in self._latency_samples:
+                self._latency_samples[service_name] = deque(maxlen=self._latency_window)
+            self._latency_samples[service_name].append(response_time)
+    
+    def _get_hedge_delay(self, service_name: str) -> float:
+        """计算服务的对冲阈值（延迟分位数）"""
+        with self._latency_lock:
+            samples = sorted(self._latency_samples.get(service_name, ()))
+        
+        if len(samples) < self.hedge_min_samples:
+            return self.hedge_initial_delay
+        
+        # 最近秩法：第 ceil(p*n) 个样本
+        index = min(len(samples) - 1, max(0, math.ceil(len(samples) * self.hedge_percentile) - 1))
+        return max(self.hedge_min_delay, samples[index])
+    
     def _try_service_with_retry(self, service: ITranslationService, text: str,
-                               source_lang: str, target_lang: str) -> Dict:
-        """带重试机制的服务调用"""
+                               source_lang: str, target_lang: str,
+                               max_retries: Optional[int] = None,
+                               cancel_event: Optional[threading.Event] = None) -> Dict:
+        """带重试机制的服务调用
+        
+        Args:
+            max_retries: 最大重试次数，None表示使用配置值
+            cancel_event: 取消信号，设置后不再重试（对冲模式使用）
+        """
         service_name = service.get_service_name()
-        max_retries = 3
+        max_retries = self.max_retries if max_retries is None else max_retries
         last_error = None
         
         for attempt in range(max_retries + 1):
@@ -204,6 +403,7 @@ class ResilientTranslationManager:
                 if not result.translated_text or result.translated_text.strip() == "":
                     raise Exception("翻译结果为空")
                 
+                self._record_latency(service_name, response_time)
                 return {
                     'success': True,
                     'result': result,
@@ -217,7 +417,11 @@ class ResilientTranslationManager:
                 if attempt < max_retries:
                     delay = 1.0 * (2 ** attempt)  # 指数退避
                     self.logger.warning(f"服务 {service_name} 第{attempt + 1}次尝试失败: {e}，{delay}秒后重试")
-                    time.sleep(delay)
+                    if cancel_event is None:
+                        time.sleep(delay)
+                    elif cancel_event.wait(delay):
+                        last_error = "已取消"
+                        break
                 else:
                     self.logger.error(f"服务 {service_name} 所有重试均失败: {e}")
         
@@ -258,8 +462,13 @@ class ResilientTranslationManager:
     
     def get_service_health_summary(self) -> Dict:
         """获取服务健康摘要"""
+        open_circuits = self.circuit_breakers.get_open_circuits()
         return {
-            'available_services': [service.get_service_name() for service in self.services],
+            'available_services': [
+                service.get_service_name() for service in self.services
+                if service.get_service_name() not in open_circuits
+            ],
+            'open_circuits': open_circuits,
             'rule_translator_available': True,
             'total_services': len(self.services) + 1  # +1 for rule translator
         }
@@ -287,11 +496,13 @@ class ResilientTranslationManager:
         # 外部服务状态
         for i, service in enumerate(self.services):
             service_name = service.get_service_name()
+            health_info = self.health_monitor.get_service_health(service_name)
             
             chain_status.append({
                 'priority': i + 1,
                 'service_name': service_name,
-                'status': 'healthy',  # 简化处理
+                'status': health_info.status.value if health_info else 'unknown',
+                'circuit_state': self.circuit_breakers.get(service_name).state.value,
                 'type': 'external_api'
             })
         
@@ -377,10 +588,11 @@ class ResilientTranslationManager:
         }
     
     def force_health_check(self, service_name: Optional[str] = None):
-        """强制执行健康检查"""
-        # 简化实现，实际使用时会调用健康监控器
+        """强制执行健康检查，结果同时反馈给熔断器"""
         self.logger.info(f"强制健康检查: {service_name or '所有服务'}")
+        self.health_monitor.force_health_check(service_name)
     
     def shutdown(self):
         """关闭管理器"""
-        self.logger.info("正在关闭弹性翻译管理器")
\ No newline at end of file
+        self.logger.info("正在关闭弹性翻译管理器")
+        self.health_monitor.stop_monitoring()
\ No newline at end of file
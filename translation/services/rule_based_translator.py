@@ -12,6 +12,13 @@ from typing import List, Dict, Optional
 from pathlib import Path
 
 from ..core.interfaces import ITranslationService, TranslationResult, ServiceStatus
+from ..core.terminology import TermDictionary, TerminologyEngine
+
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_CHINESE_PUNCTUATION_PATTERN = re.compile(r'\s*([，。！？；：])\s*')
+_ENGLISH_PUNCTUATION_PATTERN = re.compile(r'\s*([,\.!?;:])\s*')
+_NON_WORD_PATTERN = re.compile(r'[^\w\s]')
 
 
 class RuleBasedTranslator(ITranslationService):
@@ -21,8 +28,9 @@ class RuleBasedTranslator(ITranslationService):
         """初始化规则翻译器"""
         self.service_name = "rule_based_translator"
         self.dictionary_path = dictionary_path
-        self.tech_terms_dict = {}
-        self.common_words_dict = {}
+        self.tech_terms_dict = TermDictionary()
+        self.common_words_dict = TermDictionary()
+        self._terminology = None
         
         # 加载翻译词典
         self._load_dictionaries()
@@ -34,7 +42,7 @@ class RuleBasedTranslator(ITranslationService):
     def _load_dictionaries(self):
         """加载翻译词典"""
         # 科技术语词典
-        self.tech_terms_dict = {
+        self.tech_terms_dict = TermDictionary({
             "artificial intelligence": "人工智能",
             "machine learning": "机器学习",
             "deep learning": "深度学习",
@@ -54,10 +62,10 @@ class RuleBasedTranslator(ITranslationService):
             "cryptocurrency": "加密货币",
             "bitcoin": "比特币",
             "ethereum": "以太坊",
-        }
+        })
         
         # 常用词汇词典
-        self.common_words_dict = {
+        self.common_words_dict = TermDictionary({
             "announced": "宣布",
             "released": "发布",
             "launched": "推出",
@@ -70,7 +78,7 @@ class RuleBasedTranslator(ITranslationService):
             "new": "新的",
             "latest": "最新的",
             "advanced": "先进的",
-        }   
+        })
  
     def translate_text(self, text: str, source_lang: str = 'en', target_lang: str = 'zh') -> TranslationResult:
         """翻译单个文本"""
@@ -139,21 +147,19 @@ class RuleBasedTranslator(ITranslationService):
         """获取服务名称"""
         return self.service_name  
   
+    def _get_terminology(self) -> TerminologyEngine:
+        """获取编译好的术语引擎，词典被修改或替换后重新编译"""
+        if self._terminology is None or not self._terminology.is_current(self.tech_terms_dict, self.common_words_dict):
+            # 科技术语优先于常用词汇
+            self._terminology = TerminologyEngine(self.tech_terms_dict, self.common_words_dict)
+        return self._terminology
+    
     def _translate_english_to_chinese(self, text: str) -> str:
         """将英文文本翻译为中文"""
-        result_text = text
-        
-        # 1. 首先翻译科技术语（优先级最高）
-        for en_term, zh_term in self.tech_terms_dict.items():
-            pattern = re.compile(r'\b' + re.escape(en_term) + r'\b', re.IGNORECASE)
-            result_text = pattern.sub(zh_term, result_text)
-        
-        # 2. 翻译常用词汇
-        for en_word, zh_word in self.common_words_dict.items():
-            pattern = re.compile(r'\b' + re.escape(en_word) + r'\b', re.IGNORECASE)
-            result_text = pattern.sub(zh_word, result_text)
+        # 1. 一次扫描替换科技术语和常用词汇（同一位置取最长的术语）
+        result_text = self._get_terminology().replace(text)
         
-        # 3. 清理和格式化
+        # 2. 清理和格式化
         result_text = self._clean_and_format(result_text)
         
         return result_text
@@ -161,11 +167,11 @@ class RuleBasedTranslator(ITranslationService):
     def _clean_and_format(self, text: str) -> str:
         """清理和格式化翻译结果"""
         # 移除多余的空格
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_PATTERN.sub(' ', text)
         
         # 修复标点符号周围的空格
-        text = re.sub(r'\s*([，。！？；：])\s*', r'\1', text)
-        text = re.sub(r'\s*([,\.!?;:])\s*', r'\1 ', text)
+        text = _CHINESE_PUNCTUATION_PATTERN.sub(r'\1', text)
+        text = _ENGLISH_PUNCTUATION_PATTERN.sub(r'\1 ', text)
         
         # 去除首尾空格
         text = text.strip()
@@ -185,14 +191,13 @@ class RuleBasedTranslator(ITranslationService):
         original_words = set(original.lower().split())
         
         # 检查有多少原文词汇被翻译了
-        known_terms = set(self.tech_terms_dict.keys()) | set(self.common_words_dict.keys())
         translated_count = 0
         total_translatable = 0
         
         for word in original_words:
             # 移除标点符号
-            clean_word = re.sub(r'[^\w\s]', '', word)
-            if clean_word in known_terms:
+            clean_word = _NON_WORD_PATTERN.sub('', word)
+            if clean_word in self.tech_terms_dict or clean_word in self.common_words_dict:
                 total_translatable += 1
                 # 检查是否在译文中找到对应的中文
                 if clean_word in self.tech_terms_dict:
@@ -6,19 +6,23 @@
 
 import os
 import json
+import asyncio
 import time
 import urllib.request
 import urllib.parse
 from typing import List, Optional, Dict
 from datetime import datetime
 
-from ..core.interfaces import ITranslationService, TranslationResult, ServiceStatus
+from ..core.interfaces import ITranslationService, IAsyncTranslationService, TranslationResult, ServiceStatus
+from ..core import http_transport, async_http_transport
+from ..core.rate_limiter import RateLimiter
 
 
-class SiliconFlowTranslator(ITranslationService):
+class SiliconFlowTranslator(ITranslationService, IAsyncTranslationService):
     """硅基流动AI翻译适配器"""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "Qwen/Qwen2.5-7B-Instruct"):
+    def __init__(self, api_key: Optional[str] = None, model: str = "Qwen/Qwen2.5-7B-Instruct",
+                 rate_limiter: Optional[RateLimiter] = None):
         """初始化硅基流动翻译服务
         
         Args:
@@ -28,12 +32,14 @@ class SiliconFlowTranslator(ITranslationService):
                 - Qwen/Qwen2.5-14B-Instruct (质量更好)
                 - meta-llama/Meta-Llama-3.1-8B-Instruct (英文翻译优秀)
                 - THUDM/glm-4-9b-chat (中文理解好)
+            rate_limiter: 服务商限流器，每次HTTP请求（含重试）从中申请令牌；None表示不限流
         """
         self.api_key = api_key or os.getenv('SILICONFLOW_API_KEY')
         self.model = model
         self.base_url = "https://api.siliconflow.cn/v1/chat/completions"
         self.max_retries = 3
         self.retry_delay = 1.0
+        self.rate_limiter = rate_limiter
         
         if not self.api_key:
             raise ValueError("硅基流动API密钥未配置，请设置SILICONFLOW_API_KEY环境变量")
@@ -83,8 +89,8 @@ class SiliconFlowTranslator(ITranslationService):
         
         return prompt
     
-    def _make_request(self, messages: List[Dict]) -> dict:
-        """发起硅基流动API请求"""
+    def _build_request(self, messages: List[Dict]) -> urllib.request.Request:
+        """构建硅基流动API请求"""
         payload = {
             "model": self.model,
             "messages": messages,
@@ -99,22 +105,32 @@ class SiliconFlowTranslator(ITranslationService):
             "Content-Type": "application/json"
         }
         
+        return urllib.request.Request(
+            self.base_url,
+            data=json.dumps(payload).encode('utf-8'),
+            headers=headers
+        )
+    
+    def _get_api_error(self, result: dict) -> Optional[str]:
+        """提取API返回的错误信息"""
+        if 'error' in result:
+            error = result['error']
+            return f"{error.get('type', 'Unknown')}: {error.get('message', 'Unknown error')}"
+        return None
+    
+    def _make_request(self, messages: List[Dict]) -> dict:
+        """发起硅基流动API请求"""
         for attempt in range(self.max_retries):
             try:
-                data = json.dumps(payload).encode('utf-8')
-                request = urllib.request.Request(
-                    self.base_url,
-                    data=data,
-                    headers=headers
-                )
+                request = self._build_request(messages)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
                 
-                with urllib.request.urlopen(request, timeout=60) as response:
+                with http_transport.urlopen(request, timeout=60) as response:
                     result = json.loads(response.read().decode('utf-8'))
                     
-                if 'error' in result:
-                    error = result['error']
-                    error_msg = f"{error.get('type', 'Unknown')}: {error.get('message', 'Unknown error')}"
-                    
+                error_msg = self._get_api_error(result)
+                if error_msg:
                     if attempt < self.max_retries - 1:
                         print(f"硅基流动API错误 (尝试 {attempt + 1}/{self.max_retries}): {error_msg}")
                         time.sleep(self.retry_delay * (attempt + 1))
@@ -132,6 +148,35 @@ class SiliconFlowTranslator(ITranslationService):
                 else:
                     raise e
     
+    async def _amake_request(self, messages: List[Dict]) -> dict:
+        """异步发起硅基流动API请求"""
+        for attempt in range(self.max_retries):
+            try:
+                request = self._build_request(messages)
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.aacquire()
+                response = await async_http_transport.urlopen(request, timeout=60)
+                result = json.loads(response.read().decode('utf-8'))
+                
+                error_msg = self._get_api_error(result)
+                if error_msg:
+                    if attempt < self.max_retries - 1:
+                        print(f"硅基流动API错误 (尝试 {attempt + 1}/{self.max_retries}): {error_msg}")
+                        await asyncio.sleep(self.retry_delay * (attempt + 1))
+                        continue
+                    else:
+                        raise Exception(f"硅基流动API错误: {error_msg}")
+                
+                return result
+                
+            except Exception as e:
+                if attempt < self.max_retries - 1:
+                    print(f"硅基流动请求失败 (尝试 {attempt + 1}/{self.max_retries}): {str(e)}")
+                    await asyncio.sleep(self.retry_delay * (attempt + 1))
+                    continue
+                else:
+                    raise e
+    
     def _calculate_confidence(self, original: str, translated: str, usage_info: dict = None) -> float:
         """计算翻译置信度"""
         base_confidence = 0.85  # AI模型基础置信度较高
@@ -158,19 +203,48 @@ class SiliconFlowTranslator(ITranslationService):
         
         return min(max(base_confidence, 0.0), 1.0)
     
-    def translate_text(self, text: str, source_lang: str = 'en', target_lang: str = 'zh') -> TranslationResult:
-        """翻译单个文本"""
-        if not text or not text.strip():
+    def _create_error_result(self, text: str, source_lang: str, target_lang: str, error_message: str) -> TranslationResult:
+        """创建失败的翻译结果"""
+        return TranslationResult(
+            original_text=text,
+            translated_text="",
+            source_language=source_lang,
+            target_language=target_lang,
+            service_name=self.get_service_name(),
+            confidence_score=0.0,
+            timestamp=datetime.now(),
+            error_message=error_message
+        )
+    
+    def _parse_translation_response(self, text: str, result: dict, source_lang: str, target_lang: str) -> TranslationResult:
+        """从API响应中解析翻译结果"""
+        if 'choices' in result and result['choices']:
+            translated_text = result['choices'][0]['message']['content'].strip()
+            
+            # 清理可能的格式问题
+            if translated_text.startswith('翻译：'):
+                translated_text = translated_text[3:].strip()
+            
+            # 计算置信度
+            usage_info = result.get('usage', {})
+            confidence_score = self._calculate_confidence(text, translated_text, usage_info)
+            
             return TranslationResult(
                 original_text=text,
-                translated_text="",
+                translated_text=translated_text,
                 source_language=source_lang,
                 target_language=target_lang,
                 service_name=self.get_service_name(),
-                confidence_score=0.0,
-                timestamp=datetime.now(),
-                error_message="输入文本为空"
+                confidence_score=confidence_score,
+                timestamp=datetime.now()
             )
+        else:
+            raise Exception("翻译结果为空")
+    
+    def translate_text(self, text: str, source_lang: str = 'en', target_lang: str = 'zh') -> TranslationResult:
+        """翻译单个文本"""
+        if not text or not text.strip():
+            return self._create_error_result(text, source_lang, target_lang, "输入文本为空")
         
         try:
             prompt = self._create_translation_prompt(text, source_lang, target_lang)
@@ -179,41 +253,25 @@ class SiliconFlowTranslator(ITranslationService):
             ]
             
             result = self._make_request(messages)
-            
-            if 'choices' in result and result['choices']:
-                translated_text = result['choices'][0]['message']['content'].strip()
+            return self._parse_translation_response(text, result, source_lang, target_lang)
                 
-                # 清理可能的格式问题
-                if translated_text.startswith('翻译：'):
-                    translated_text = translated_text[3:].strip()
-                
-                # 计算置信度
-                usage_info = result.get('usage', {})
-                confidence_score = self._calculate_confidence(text, translated_text, usage_info)
-                
-                return TranslationResult(
-                    original_text=text,
-                    translated_text=translated_text,
-                    source_language=source_lang,
-                    target_language=target_lang,
-                    service_name=self.get_service_name(),
-                    confidence_score=confidence_score,
-                    timestamp=datetime.now()
-                )
-            else:
-                raise Exception("翻译结果为空")
+        except Exception as e:
+            return self._create_error_result(text, source_lang, target_lang, str(e))
+    
+    async def atranslate_text(self, text: str, source_lang: str = 'en', target_lang: str = 'zh') -> TranslationResult:
+        """异步翻译单个文本"""
+        if not text or not text.strip():
+            return self._create_error_result(text, source_lang, target_lang, "输入文本为空")
+        
+        try:
+            prompt = self._create_translation_prompt(text, source_lang, target_lang)
+            messages = [{"role": "user", "content": prompt}]
+            
+            result = await self._amake_request(messages)
+            return self._parse_translation_response(text, result, source_lang, target_lang)
                 
         except Exception as e:
-            return TranslationResult(
-                original_text=text,
-                translated_text="",
-                source_language=source_lang,
-                target_language=target_lang,
-                service_name=self.get_service_name(),
-                confidence_score=0.0,
-                timestamp=datetime.now(),
-                error_message=str(e)
-            )
+            return self._create_error_result(text, source_lang, target_lang, str(e))
     
     def translate_batch(self, texts: List[str], source_lang: str = 'en', target_lang: str = 'zh') -> List[TranslationResult]:
         """批量翻译文本"""
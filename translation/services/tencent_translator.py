@@ -6,27 +6,32 @@
 
 import os
 import json
+import asyncio
 import time
 import hashlib
 import hmac
 import urllib.request
 import urllib.parse
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
-from ..core.interfaces import ITranslationService, TranslationResult, ServiceStatus
+from ..core.interfaces import ITranslationService, IAsyncTranslationService, TranslationResult, ServiceStatus
+from ..core import http_transport, async_http_transport
+from ..core.rate_limiter import RateLimiter
 
 
-class TencentTranslator(ITranslationService):
+class TencentTranslator(ITranslationService, IAsyncTranslationService):
     """腾讯翻译API适配器"""
     
-    def __init__(self, secret_id: Optional[str] = None, secret_key: Optional[str] = None, region: str = "ap-beijing"):
+    def __init__(self, secret_id: Optional[str] = None, secret_key: Optional[str] = None, region: str = "ap-beijing",
+                 rate_limiter: Optional[RateLimiter] = None):
         """初始化腾讯翻译服务
         
         Args:
             secret_id: 腾讯云API的Secret ID
             secret_key: 腾讯云API的Secret Key
             region: 服务地域
+            rate_limiter: 服务商限流器，每次HTTP请求（含重试）从中申请令牌；None表示不限流
         """
         self.secret_id = secret_id or os.getenv('TENCENT_SECRET_ID')
         self.secret_key = secret_key or os.getenv('TENCENT_SECRET_KEY')
@@ -37,6 +42,7 @@ class TencentTranslator(ITranslationService):
         self.version = "2018-03-21"
         self.max_retries = 3
         self.retry_delay = 1.0
+        self.rate_limiter = rate_limiter
         
         if not self.secret_id or not self.secret_key:
             raise ValueError("腾讯翻译API凭证未配置，请设置TENCENT_SECRET_ID和TENCENT_SECRET_KEY环境变量")
@@ -57,8 +63,8 @@ class TencentTranslator(ITranslationService):
         k_signing = self._sign(k_service, 'tc3_request')
         return k_signing
     
-    def _make_request(self, action: str, payload: dict) -> dict:
-        """发起腾讯云API请求"""
+    def _build_request(self, action: str, payload: dict) -> urllib.request.Request:
+        """构建带TC3签名的腾讯云API请求"""
         timestamp = int(time.time())
         date = datetime.utcfromtimestamp(timestamp).strftime('%Y-%m-%d')
         
@@ -98,21 +104,32 @@ class TencentTranslator(ITranslationService):
             'X-TC-Region': self.region
         }
         
+        return urllib.request.Request(
+            self.endpoint,
+            data=payload_json.encode('utf-8'),
+            headers=headers
+        )
+    
+    def _get_api_error(self, result: dict) -> Optional[str]:
+        """提取API返回的错误信息"""
+        if 'Error' in result.get('Response', {}):
+            error = result['Response']['Error']
+            return f"{error['Code']}: {error['Message']}"
+        return None
+    
+    def _make_request(self, action: str, payload: dict) -> dict:
+        """发起腾讯云API请求"""
         for attempt in range(self.max_retries):
             try:
-                request = urllib.request.Request(
-                    self.endpoint,
-                    data=payload_json.encode('utf-8'),
-                    headers=headers
-                )
+                request = self._build_request(action, payload)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
                 
-                with urllib.request.urlopen(request, timeout=10) as response:
+                with http_transport.urlopen(request, timeout=10) as response:
                     result = json.loads(response.read().decode('utf-8'))
                     
-                if 'Error' in result.get('Response', {}):
-                    error = result['Response']['Error']
-                    error_msg = f"{error['Code']}: {error['Message']}"
-                    
+                error_msg = self._get_api_error(result)
+                if error_msg:
                     if attempt < self.max_retries - 1:
                         print(f"腾讯翻译API错误 (尝试 {attempt + 1}/{self.max_retries}): {error_msg}")
                         time.sleep(self.retry_delay * (attempt + 1))
@@ -130,79 +147,123 @@ class TencentTranslator(ITranslationService):
                 else:
                     raise e
     
-    def translate_text(self, text: str, source_lang: str = 'en', target_lang: str = 'zh') -> TranslationResult:
-        """翻译单个文本"""
-        if not text or not text.strip():
+    async def _amake_request(self, action: str, payload: dict) -> dict:
+        """异步发起腾讯云API请求"""
+        for attempt in range(self.max_retries):
+            try:
+                request = self._build_request(action, payload)
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.aacquire()
+                response = await async_http_transport.urlopen(request, timeout=10)
+                result = json.loads(response.read().decode('utf-8'))
+                
+                error_msg = self._get_api_error(result)
+                if error_msg:
+                    if attempt < self.max_retries - 1:
+                        print(f"腾讯翻译API错误 (尝试 {attempt + 1}/{self.max_retries}): {error_msg}")
+                        await asyncio.sleep(self.retry_delay * (attempt + 1))
+                        continue
+                    else:
+                        raise Exception(f"腾讯翻译API错误: {error_msg}")
+                
+                return result
+                
+            except Exception as e:
+                if attempt < self.max_retries - 1:
+                    print(f"腾讯翻译请求失败 (尝试 {attempt + 1}/{self.max_retries}): {str(e)}")
+                    await asyncio.sleep(self.retry_delay * (attempt + 1))
+                    continue
+                else:
+                    raise e
+    
+    def _get_language_codes(self, source_lang: str, target_lang: str) -> Tuple[str, str]:
+        """转换为腾讯翻译语言代码"""
+        lang_map = {
+            'en': 'en',
+            'zh': 'zh',
+            'zh-cn': 'zh',
+            'zh-tw': 'zh-TW',
+            'ja': 'ja',
+            'ko': 'ko',
+            'fr': 'fr',
+            'de': 'de',
+            'es': 'es',
+            'ru': 'ru',
+            'it': 'it',
+            'pt': 'pt',
+            'ar': 'ar',
+            'th': 'th',
+            'vi': 'vi'
+        }
+        
+        return lang_map.get(source_lang.lower(), source_lang), lang_map.get(target_lang.lower(), target_lang)
+    
+    def _create_text_payload(self, text: str, source_lang: str, target_lang: str) -> dict:
+        """构建单文本翻译请求体"""
+        source, target = self._get_language_codes(source_lang, target_lang)
+        return {
+            "SourceText": text,
+            "Source": source,
+            "Target": target,
+            "ProjectId": 0
+        }
+    
+    def _create_error_result(self, text: str, source_lang: str, target_lang: str, error_message: str) -> TranslationResult:
+        """创建失败的翻译结果"""
+        return TranslationResult(
+            original_text=text,
+            translated_text="",
+            source_language=source_lang,
+            target_language=target_lang,
+            service_name=self.get_service_name(),
+            confidence_score=0.0,
+            timestamp=datetime.now(),
+            error_message=error_message
+        )
+    
+    def _parse_translation_response(self, text: str, result: dict, source_lang: str, target_lang: str) -> TranslationResult:
+        """从API响应中解析翻译结果"""
+        if 'Response' in result and 'TargetText' in result['Response']:
+            translated_text = result['Response']['TargetText']
+            confidence_score = 0.85  # 腾讯翻译不提供置信度，使用默认值
+            
             return TranslationResult(
                 original_text=text,
-                translated_text="",
+                translated_text=translated_text,
                 source_language=source_lang,
                 target_language=target_lang,
                 service_name=self.get_service_name(),
-                confidence_score=0.0,
-                timestamp=datetime.now(),
-                error_message="输入文本为空"
+                confidence_score=confidence_score,
+                timestamp=datetime.now()
             )
+        else:
+            raise Exception("翻译结果为空")
+    
+    def translate_text(self, text: str, source_lang: str = 'en', target_lang: str = 'zh') -> TranslationResult:
+        """翻译单个文本"""
+        if not text or not text.strip():
+            return self._create_error_result(text, source_lang, target_lang, "输入文本为空")
         
         try:
-            # 腾讯翻译语言代码映射
-            lang_map = {
-                'en': 'en',
-                'zh': 'zh',
-                'zh-cn': 'zh',
-                'zh-tw': 'zh-TW',
-                'ja': 'ja',
-                'ko': 'ko',
-                'fr': 'fr',
-                'de': 'de',
-                'es': 'es',
-                'ru': 'ru',
-                'it': 'it',
-                'pt': 'pt',
-                'ar': 'ar',
-                'th': 'th',
-                'vi': 'vi'
-            }
-            
-            source = lang_map.get(source_lang.lower(), source_lang)
-            target = lang_map.get(target_lang.lower(), target_lang)
-            
-            payload = {
-                "SourceText": text,
-                "Source": source,
-                "Target": target,
-                "ProjectId": 0
-            }
-            
+            payload = self._create_text_payload(text, source_lang, target_lang)
             result = self._make_request("TextTranslate", payload)
-            
-            if 'Response' in result and 'TargetText' in result['Response']:
-                translated_text = result['Response']['TargetText']
-                confidence_score = 0.85  # 腾讯翻译不提供置信度，使用默认值
+            return self._parse_translation_response(text, result, source_lang, target_lang)
                 
-                return TranslationResult(
-                    original_text=text,
-                    translated_text=translated_text,
-                    source_language=source_lang,
-                    target_language=target_lang,
-                    service_name=self.get_service_name(),
-                    confidence_score=confidence_score,
-                    timestamp=datetime.now()
-                )
-            else:
-                raise Exception("翻译结果为空")
+        except Exception as e:
+            return self._create_error_result(text, source_lang, target_lang, str(e))
+    
+    async def atranslate_text(self, text: str, source_lang: str = 'en', target_lang: str = 'zh') -> TranslationResult:
+        """异步翻译单个文本"""
+        if not text or not text.strip():
+            return self._create_error_result(text, source_lang, target_lang, "输入文本为空")
+        
+        try:
+            payload = self._create_text_payload(text, source_lang, target_lang)
+            result = await self._amake_request("TextTranslate", payload)
+            return self._parse_translation_response(text, result, source_lang, target_lang)
                 
         except Exception as e:
-            return TranslationResult(
-                original_text=text,
-                translated_text="",
-                source_language=source_lang,
-                target_language=target_lang,
-                service_name=self.get_service_name(),
-                confidence_score=0.0,
-                timestamp=datetime.now(),
-                error_message=str(e)
-            )
+            return self._create_error_result(text, source_lang, target_lang, str(e))
     
     def translate_batch(self, texts: List[str], source_lang: str = 'en', target_lang: str = 'zh') -> List[TranslationResult]:
         """批量翻译文本"""
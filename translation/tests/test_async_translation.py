@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+异步翻译接口与异步传输层测试
+"""
+
+import asyncio
+import json
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from ..core.async_http_transport import AsyncHttpTransport
+from ..core.interfaces import IAsyncTranslationService
+from ..services.async_adapter import AsyncTranslationAdapter, as_async_service
+from ..services.rule_based_translator import RuleBasedTranslator
+from ..services.siliconflow_translator import SiliconFlowTranslator
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """测试服务端：普通响应、分块响应和错误响应"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/chunked":
+            self.send_response(200)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for chunk in (b'{"parts": ', b'"chunked"}'):
+                self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+            return
+
+        status = 404 if self.path == "/missing" else 200
+        body = json.dumps({"path": self.path}).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        data = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps({"echo": data.decode('utf-8')}).encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestAsyncHttpTransport(unittest.IsolatedAsyncioTestCase):
+    """异步传输层测试"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    async def asyncSetUp(self):
+        self.transport = AsyncHttpTransport(max_connections_per_host=4, timeout=5)
+
+    async def asyncTearDown(self):
+        self.transport.close()
+
+    async def test_connection_reused(self):
+        """测试顺序请求复用同一连接"""
+        for i in range(3):
+            response = await self.transport.urlopen(f"{self.base_url}/item?i={i}")
+            self.assertEqual(json.loads(response.read())["path"], f"/item?i={i}")
+
+        stats = self.transport.get_statistics()
+        self.assertEqual(stats["connections_created"], 1)
+        self.assertEqual(stats["connections_reused"], 2)
+
+    async def test_post_and_chunked(self):
+        """测试POST请求和分块响应"""
+        request = urllib.request.Request(f"{self.base_url}/echo", data=b"hello")
+        response = await self.transport.urlopen(request)
+        self.assertEqual(json.loads(response.read())["echo"], "hello")
+
+        response = await self.transport.urlopen(f"{self.base_url}/chunked")
+        self.assertEqual(json.loads(response.read())["parts"], "chunked")
+
+    async def test_http_error(self):
+        """测试错误状态码抛出HTTPError"""
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            await self.transport.urlopen(f"{self.base_url}/missing")
+        self.assertEqual(context.exception.code, 404)
+
+    async def test_concurrency_bounded(self):
+        """测试并发请求受每主机连接数限制"""
+        responses = await asyncio.gather(
+            *(self.transport.urlopen(f"{self.base_url}/item?i={i}") for i in range(20))
+        )
+
+        self.assertEqual([json.loads(r.read())["path"] for r in responses],
+                         [f"/item?i={i}" for i in range(20)])
+        self.assertLessEqual(self.transport.get_statistics()["connections_created"], 4)
+
+
+class TestAsyncTranslationServices(unittest.IsolatedAsyncioTestCase):
+    """异步翻译服务测试"""
+
+    @patch('translation.core.async_http_transport.urlopen', new_callable=AsyncMock)
+    async def test_siliconflow_atranslate_text(self, mock_urlopen):
+        """测试硅基流动原生异步翻译"""
+        mock_response = MagicMock()
+        mock_response.read.return_value = json.dumps({
+            "choices": [{"message": {"content": "你好，世界"}}]
+        }).encode('utf-8')
+        mock_urlopen.return_value = mock_response
+
+        translator = SiliconFlowTranslator(api_key="test_api_key")
+        self.assertIsInstance(translator, IAsyncTranslationService)
+
+        results = await translator.atranslate_batch(["Hello world", ""])
+
+        self.assertEqual(results[0].translated_text, "你好，世界")
+        self.assertIsNone(results[0].error_message)
+        self.assertEqual(results[1].error_message, "输入文本为空")
+        self.assertEqual(mock_urlopen.await_count, 1)
+
+    async def test_rule_based_adapter(self):
+        """测试规则翻译器适配为异步服务且不使用线程池"""
+        service = as_async_service(RuleBasedTranslator())
+
+        self.assertIsInstance(service, AsyncTranslationAdapter)
+        self.assertFalse(service.blocking)
+
+        result = await service.atranslate_text("machine learning")
+        self.assertIn("机器学习", result.translated_text)
+        self.assertEqual(service.get_service_name(), "rule_based_translator")
+
+    async def test_blocking_adapter_uses_executor(self):
+        """测试阻塞服务在执行器线程中运行"""
+        sync_service = MagicMock()
+        sync_service.translate_text.side_effect = lambda text, s, t: threading.get_ident()
+
+        worker_thread = await AsyncTranslationAdapter(sync_service).atranslate_text("hello")
+
+        self.assertNotEqual(worker_thread, threading.get_ident())
+
+    def test_native_service_returned_as_is(self):
+        """测试原生异步服务不再包装"""
+        translator = SiliconFlowTranslator(api_key="test_api_key")
+        self.assertIs(as_async_service(translator), translator)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -38,7 +38,7 @@ class TestBaiduTranslator(unittest.TestCase):
         self.assertEqual(self.translator._get_error_message('54004'), '账户余额不足')
         self.assertTrue(self.translator._get_error_message('99999').startswith('未知错误'))
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_translate_text_success(self, mock_urlopen):
         """测试成功翻译文本"""
         # 模拟API响应
@@ -59,7 +59,7 @@ class TestBaiduTranslator(unittest.TestCase):
         self.assertIsNone(result.error_message)
         self.assertIsInstance(result.timestamp, datetime)
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_translate_text_api_error(self, mock_urlopen):
         """测试API错误处理"""
         # 模拟API错误响应
@@ -86,7 +86,7 @@ class TestBaiduTranslator(unittest.TestCase):
         self.assertEqual(result.confidence_score, 0.0)
         self.assertEqual(result.error_message, "输入文本为空")
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_translate_batch(self, mock_urlopen):
         """测试批量翻译"""
         # 模拟API响应
@@ -103,7 +103,7 @@ class TestBaiduTranslator(unittest.TestCase):
         self.assertEqual(results[0].translated_text, "你好")
         self.assertEqual(results[1].translated_text, "世界")
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_get_service_status_healthy(self, mock_urlopen):
         """测试健康服务状态"""
         # 模拟成功响应
@@ -116,7 +116,7 @@ class TestBaiduTranslator(unittest.TestCase):
         status = self.translator.get_service_status()
         self.assertEqual(status, ServiceStatus.HEALTHY)
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_get_service_status_degraded(self, mock_urlopen):
         """测试降级服务状态"""
         # 模拟频率限制错误
@@ -129,7 +129,7 @@ class TestBaiduTranslator(unittest.TestCase):
         status = self.translator.get_service_status()
         self.assertEqual(status, ServiceStatus.DEGRADED)
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_get_service_status_unavailable(self, mock_urlopen):
         """测试不可用服务状态"""
         # 模拟网络异常
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+缓存键规范化与近似重复索引测试
+"""
+
+import unittest
+
+from ..core.cache_keys import KeyNormalizer, MinHashIndex, strip_source_suffix
+
+
+class TestKeyNormalizer(unittest.TestCase):
+    """缓存键规范化测试"""
+
+    def setUp(self):
+        """测试初始化"""
+        self.normalizer = KeyNormalizer()
+
+    def test_equivalent_titles_normalize_equally(self):
+        """测试空白、引号和大小写不同的标题规范化结果相同"""
+        variants = [
+            "Apple’s new “Vision” headset ships today",
+            "Apple's new \"Vision\" headset ships today",
+            "  APPLE'S NEW \"VISION\"   HEADSET SHIPS TODAY  ",
+        ]
+        normalized = {self.normalizer(text) for text in variants}
+
+        self.assertEqual(normalized, {"apple's new \"vision\" headset ships today"})
+
+    def test_default_keeps_dash_clauses(self):
+        """测试默认规范化不会把破折号后的标题内容当作来源后缀去除"""
+        self.assertNotEqual(self.normalizer("Review - Worth It"), self.normalizer("Review - Not Worth It"))
+        self.assertNotEqual(self.normalizer("Bitcoin falls 10% - Market Rebounds"),
+                            self.normalizer("Bitcoin falls 10%"))
+        self.assertNotEqual(self.normalizer("Markets rally - Reuters"), self.normalizer("Markets rally"))
+
+    def test_source_suffix_step_is_opt_in(self):
+        """测试显式启用来源后缀步骤时去除已知来源"""
+        normalizer = KeyNormalizer(['unicode', 'quotes', 'whitespace', 'source_suffix', 'case'])
+        variants = [
+            "Apple’s new “Vision” headset ships today - Reuters",
+            "Apple's new \"Vision\" headset ships today | The Verge",
+            "Apple's new \"Vision\" headset ships today",
+        ]
+        self.assertEqual(len({normalizer(text) for text in variants}), 1)
+        self.assertNotEqual(normalizer("Review - Worth It"), normalizer("Review - Not Worth It"))
+
+    def test_source_suffix_only_for_titles(self):
+        """测试只去除标题长度文本末尾的已知来源后缀"""
+        self.assertEqual(strip_source_suffix("Markets rally - Wall Street Journal"), "Markets rally")
+        self.assertEqual(strip_source_suffix("Microsoft - OpenAI deal explained"), "Microsoft - OpenAI deal explained")
+        self.assertEqual(strip_source_suffix("Review - Worth It"), "Review - Worth It")
+        self.assertEqual(strip_source_suffix("Bitcoin falls 10% - Market Rebounds"),
+                         "Bitcoin falls 10% - Market Rebounds")
+
+        long_text = "word " * 80 + "- Reuters"
+        self.assertEqual(strip_source_suffix(long_text), long_text)
+
+    def test_custom_steps(self):
+        """测试自定义规范化步骤"""
+        normalizer = KeyNormalizer(['whitespace', str.upper])
+        self.assertEqual(normalizer(" a  b "), "A B")
+        self.assertEqual(KeyNormalizer([])(" A "), " A ")
+
+        with self.assertRaises(ValueError):
+            KeyNormalizer(['unknown'])
+
+
+class TestMinHashIndex(unittest.TestCase):
+    """近似重复索引测试"""
+
+    def setUp(self):
+        """测试初始化"""
+        self.index = MinHashIndex(threshold=0.8)
+        self.index.add("apple", "apple unveils new ai features for iphone at developer conference")
+        self.index.add("nvidia", "nvidia shares surge after record quarterly revenue driven by ai chip demand")
+
+    def test_find_near_duplicate(self):
+        """测试找到只差个别词的文本"""
+        match = self.index.find("apple unveils new ai features for iphone at its developer conference")
+
+        self.assertIsNotNone(match)
+        self.assertEqual(match[0], "apple")
+        self.assertGreaterEqual(match[1], 0.8)
+
+    def test_unrelated_text_not_matched(self):
+        """测试不相关或改动较大的文本不匹配"""
+        self.assertIsNone(self.index.find("microsoft stock falls after cloud growth slows in latest quarter"))
+        self.assertIsNone(self.index.find("nvidia shares fall as quarterly revenue misses ai chip demand forecasts"))
+
+    def test_short_text_ignored(self):
+        """测试过短文本不参与近似匹配"""
+        self.index.add("short", "apple news")
+        self.assertFalse(self.index.contains("short"))
+        self.assertIsNone(self.index.find("apple news today"))
+
+    def test_remove(self):
+        """测试移出索引"""
+        self.index.remove("apple")
+        self.assertIsNone(self.index.find("apple unveils new ai features for iphone at developer conference"))
+        self.assertEqual(len(self.index), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+翻译缓存指标测试
+"""
+
+import os
+import tempfile
+import unittest
+
+from ..core.cache_metrics import CacheMetricsStore, LatencyHistogram, TierMetrics, load_cache_metrics
+from ..core.cache_system import SQLiteConnectionPool
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """延迟直方图测试"""
+
+    def test_percentiles(self):
+        """测试分位数取所在桶的上限"""
+        histogram = LatencyHistogram()
+        for _ in range(90):
+            histogram.record(0.00004)  # 40μs
+        for _ in range(10):
+            histogram.record(0.002)  # 2ms
+
+        self.assertEqual(histogram.count, 100)
+        self.assertEqual(histogram.percentile(50), 50)
+        self.assertAlmostEqual(histogram.percentile(95), 2000)  # 桶上限2500，不超过最大值
+        self.assertAlmostEqual(histogram.summary()['avg_us'], 236, places=3)
+
+    def test_overflow_and_merge(self):
+        """测试溢出桶和合并"""
+        first = LatencyHistogram()
+        first.record(3.0)
+        second = LatencyHistogram()
+        second.record(0.000001)
+
+        first.merge(second)
+        self.assertEqual(first.count, 2)
+        self.assertAlmostEqual(first.percentile(100), 3e6)
+        self.assertEqual(first.counts[0], 1)
+        self.assertEqual(first.counts[-1], 1)
+
+        with self.assertRaises(ValueError):
+            first.merge(LatencyHistogram(bounds=(1, 2, 3)))
+
+
+class TestCacheMetricsStore(unittest.TestCase):
+    """缓存指标存储测试"""
+
+    def setUp(self):
+        """测试初始化"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+        self.pool = SQLiteConnectionPool(self.temp_db.name)
+        self.store = CacheMetricsStore(self.pool)
+
+    def tearDown(self):
+        """测试清理"""
+        self.pool.close()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(self.temp_db.name + suffix):
+                os.unlink(self.temp_db.name + suffix)
+
+    def _metrics(self, lookups, hits, latency):
+        metrics = TierMetrics(lookups=lookups, hits=hits, bytes_read=hits * 100, writes=1,
+                              bytes_written=100, evictions=1)
+        metrics.latency.record(latency)
+        return metrics
+
+    def test_add_accumulates(self):
+        """测试多次保存的增量累加"""
+        self.store.add({'memory': self._metrics(10, 5, 0.00002)})
+        self.store.add({'memory': self._metrics(10, 10, 0.003), 'database': TierMetrics()})
+
+        metrics = self.store.load()
+        self.assertEqual(set(metrics), {'memory'})  # 空指标不写入
+        memory = metrics['memory']
+        self.assertEqual((memory.lookups, memory.hits, memory.bytes_read), (20, 15, 1500))
+        self.assertEqual((memory.writes, memory.bytes_written, memory.evictions), (2, 200, 2))
+        self.assertEqual(memory.latency.count, 2)
+        self.assertAlmostEqual(memory.latency.max_us, 3000)
+        self.assertAlmostEqual(memory.latency.percentile(100), 3000)
+
+        self.store.reset()
+        self.assertEqual(self.store.load(), {})
+
+    def test_load_cache_metrics_read_only(self):
+        """测试仪表板只读读取"""
+        self.store.add({'file': self._metrics(4, 1, 0.0001)})
+
+        summary = load_cache_metrics(self.temp_db.name)
+        self.assertEqual(summary['file']['lookups'], 4)
+        self.assertEqual(summary['file']['hit_rate'], 0.25)
+        self.assertEqual(summary['file']['latency']['count'], 1)
+
+        self.assertEqual(load_cache_metrics(os.path.join(tempfile.gettempdir(), 'missing_cache_metrics.db')), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,11 +4,16 @@
 翻译缓存系统测试
 """
 
+import gc
+import time
 import unittest
+import weakref
 import tempfile
 import shutil
 import os
+import sqlite3
 from datetime import datetime, timedelta
+from unittest.mock import patch
 from translation.core.cache_system import (
     MemoryCache, FileCache, DatabaseCache, SmartTranslationCache
 )
@@ -88,6 +93,51 @@ class TestMemoryCache(unittest.TestCase):
         time.sleep(3)
         self.assertIsNone(self.cache.get("key1"))
 
+    def test_clear_expired_with_overwrite(self):
+        """测试清理过期项时跳过已重新写入的键"""
+        cache = MemoryCache(max_size=10, ttl_seconds=0)
+        cache.put("key1", self.test_translation)
+        cache.put("key2", self.test_translation)
+
+        cache.ttl_seconds = 3600
+        cache.put("key2", self.test_translation)  # 重新写入，旧的过期记录失效
+
+        self.assertEqual(cache.clear_expired(), 1)
+        self.assertIsNone(cache.get("key1"))
+        self.assertIsNotNone(cache.get("key2"))
+
+    def test_byte_limit_eviction(self):
+        """测试按字节上限淘汰"""
+        item_bytes = self.cache._estimate_bytes(self.test_translation)
+        cache = MemoryCache(max_size=100, ttl_seconds=60, max_bytes=item_bytes * 2)
+
+        for i in range(3):
+            cache.put(f"key_{i}", self.test_translation)
+
+        self.assertEqual(cache.size(), 2)
+        self.assertEqual(cache.size_bytes(), item_bytes * 2)
+        self.assertIsNone(cache.get("key_0"))
+
+        cache.clear()
+        self.assertEqual(cache.size_bytes(), 0)
+
+    def test_statistics(self):
+        """测试操作统计"""
+        self.cache.put("key1", self.test_translation)
+        self.cache.get("key1")
+        self.cache.get("missing")
+        for i in range(3):
+            self.cache.put(f"key_{i}", self.test_translation)
+
+        stats = self.cache.get_statistics()
+        self.assertEqual(stats['put_count'], 4)
+        self.assertEqual(stats['get_count'], 2)
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['items'], 3)
+        self.assertGreaterEqual(stats['avg_put_us'], 0.0)
+
 
 class TestFileCache(unittest.TestCase):
     """文件缓存测试"""
@@ -114,6 +164,7 @@ class TestFileCache(unittest.TestCase):
     
     def tearDown(self):
         """测试清理"""
+        self.cache.close()
         shutil.rmtree(self.temp_dir, ignore_errors=True)
     
     def test_put_and_get(self):
@@ -147,6 +198,96 @@ class TestFileCache(unittest.TestCase):
         result = self.cache.get("expired_key")
         
         self.assertIsNone(result)  # 应该返回None因为已过期
+    
+    def _make_translation(self, i, hours=1):
+        """构造测试缓存项"""
+        return CachedTranslation(
+            content_hash=f"hash_{i}",
+            translation_result=TranslationResult(
+                original_text=f"Text {i}",
+                translated_text=f"文本 {i}",
+                source_language="en",
+                target_language="zh",
+                service_name="test",
+                confidence_score=0.9,
+                timestamp=datetime.now()
+            ),
+            created_at=datetime.now(),
+            expires_at=datetime.now() + timedelta(hours=hours),
+            usage_count=0
+        )
+    
+    def test_reopen_rebuilds_index(self):
+        """测试重新打开后从分段文件重建索引"""
+        self.cache.put("key_1", self._make_translation(1))
+        self.cache.put("key_2", self._make_translation(2))
+        self.cache.put("key_1", self._make_translation(3))  # 覆盖写入
+        self.cache.delete("key_2")
+        self.cache.close()
+        
+        reopened = FileCache(cache_dir=self.temp_dir, max_files=5)
+        self.assertEqual(reopened.size(), 1)
+        self.assertEqual(reopened.get("key_1").translation_result.translated_text, "文本 3")
+        self.assertIsNone(reopened.get("key_2"))
+        reopened.close()
+    
+    def test_truncated_tail_discarded(self):
+        """测试校验失败的尾部记录在重建索引时被丢弃"""
+        self.cache.put("key_1", self._make_translation(1))
+        self.cache.put("key_2", self._make_translation(2))
+        self.cache.close()
+        
+        segment = sorted(p for p in os.listdir(self.temp_dir) if p.endswith(FileCache.SEGMENT_SUFFIX))[-1]
+        segment_path = os.path.join(self.temp_dir, segment)
+        with open(segment_path, 'r+b') as f:
+            f.truncate(os.path.getsize(segment_path) - 3)  # 模拟写到一半
+        
+        reopened = FileCache(cache_dir=self.temp_dir, max_files=5)
+        self.assertIsNotNone(reopened.get("key_1"))
+        self.assertIsNone(reopened.get("key_2"))
+        self.assertEqual(reopened.get_statistics()['corrupted_records'], 1)
+        
+        reopened.put("key_3", self._make_translation(3))  # 截断后可以继续追加
+        self.assertIsNotNone(reopened.get("key_3"))
+        reopened.close()
+    
+    def test_max_items_eviction(self):
+        """测试超过最大数量时淘汰最早写入的项"""
+        for i in range(6):
+            self.cache.put(f"key_{i}", self._make_translation(i))
+        
+        self.assertLessEqual(self.cache.size(), 5)
+        self.assertIsNone(self.cache.get("key_0"))
+        self.assertIsNotNone(self.cache.get("key_5"))
+    
+    def test_compaction(self):
+        """测试压缩后只保留有效记录"""
+        cache = FileCache(cache_dir=self.temp_dir, max_files=100, segment_max_bytes=2048)
+        for _ in range(5):
+            for i in range(3):
+                cache.put(f"key_{i}", self._make_translation(i))
+        
+        stats = cache.get_statistics()
+        self.assertGreater(stats['compactions'], 0)
+        self.assertEqual(stats['items'], 3)
+        
+        cache.compact()
+        stats = cache.get_statistics()
+        self.assertEqual(stats['dead_bytes'], 0)
+        self.assertEqual(stats['segments'], 1)
+        for i in range(3):
+            self.assertEqual(cache.get(f"key_{i}").translation_result.translated_text, f"文本 {i}")
+        cache.close()
+    
+    def test_usage_count_without_rewrite(self):
+        """测试读取只在内存中累计次数，不追加写入"""
+        self.cache.put("key_1", self._make_translation(1))
+        size_before = self.cache.get_statistics()['live_bytes']
+        
+        self.cache.get("key_1")
+        self.assertEqual(self.cache.get("key_1").usage_count, 2)
+        self.assertEqual(self.cache.get_statistics()['live_bytes'], size_before)
+        self.assertEqual(self.cache.get_statistics()['dead_bytes'], 0)
 
 
 class TestDatabaseCache(unittest.TestCase):
@@ -175,8 +316,10 @@ class TestDatabaseCache(unittest.TestCase):
     
     def tearDown(self):
         """测试清理"""
-        if os.path.exists(self.temp_db.name):
-            os.unlink(self.temp_db.name)
+        self.cache.close()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(self.temp_db.name + suffix):
+                os.unlink(self.temp_db.name + suffix)
     
     def test_put_and_get(self):
         """测试存储和获取"""
@@ -197,6 +340,103 @@ class TestDatabaseCache(unittest.TestCase):
         self.assertEqual(stats['total_items'], 1)
         self.assertEqual(stats['valid_items'], 1)
         self.assertIn('test', stats['service_distribution'])
+    
+    def test_wal_mode(self):
+        """测试连接启用WAL日志模式"""
+        with self.cache.pool.connection() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        
+        self.assertEqual(mode.lower(), 'wal')
+    
+    def test_access_stats_deferred(self):
+        """测试读取命中不立即写库，访问统计批量写回"""
+        key = self.test_translation.content_hash
+        self.cache.put(key, self.test_translation)
+        
+        self.assertEqual(self.cache.get(key).usage_count, 1)
+        self.assertEqual(self.cache.get(key).usage_count, 2)
+        
+        with self.cache.pool.connection() as conn:
+            stored = conn.execute(
+                "SELECT usage_count FROM translation_cache WHERE content_hash = ?", (key,)
+            ).fetchone()[0]
+        self.assertEqual(stored, 0)  # 尚未写回
+        
+        self.assertEqual(self.cache.flush_access_stats(), 1)
+        with self.cache.pool.connection() as conn:
+            stored = conn.execute(
+                "SELECT usage_count FROM translation_cache WHERE content_hash = ?", (key,)
+            ).fetchone()[0]
+        self.assertEqual(stored, 2)
+        self.assertEqual(self.cache.get(key).usage_count, 3)
+    
+    def test_access_stats_flush_threshold(self):
+        """测试待写回记录达到阈值时自动写回"""
+        self.cache.stats_flush_threshold = 2
+        for i in range(2):
+            translation = CachedTranslation(
+                content_hash=f"hash_{i}",
+                translation_result=self.test_translation.translation_result,
+                created_at=datetime.now(),
+                expires_at=datetime.now() + timedelta(hours=1),
+                usage_count=0
+            )
+            self.cache.put(f"hash_{i}", translation)
+            self.cache.get(f"hash_{i}")
+        
+        self.assertEqual(self.cache.flush_access_stats(), 0)  # 已自动写回
+    
+    def test_get_many(self):
+        """测试批量查询"""
+        self.cache.MAX_QUERY_PARAMS = 2  # 强制分块查询
+        for i in range(3):
+            translation = CachedTranslation(
+                content_hash=f"hash_{i}",
+                translation_result=self.test_translation.translation_result,
+                created_at=datetime.now(),
+                expires_at=datetime.now() + timedelta(hours=1 if i else -1),  # hash_0已过期
+                usage_count=0
+            )
+            self.cache.put(f"hash_{i}", translation)
+        
+        found = self.cache.get_many(["hash_0", "hash_1", "hash_2", "missing"])
+        
+        self.assertEqual(set(found), {"hash_1", "hash_2"})
+        self.assertEqual(found["hash_2"].usage_count, 1)
+        self.assertEqual(self.cache.get_cache_stats()['total_items'], 2)  # 过期项已删除
+    
+    def test_migrates_old_schema(self):
+        """测试旧版数据库自动补充指纹列"""
+        self.cache.close()
+        os.unlink(self.temp_db.name)
+        conn = sqlite3.connect(self.temp_db.name)
+        conn.execute("""
+            CREATE TABLE translation_cache (
+                content_hash TEXT PRIMARY KEY, original_text TEXT NOT NULL,
+                translated_text TEXT NOT NULL, source_language TEXT NOT NULL,
+                target_language TEXT NOT NULL, service_name TEXT NOT NULL,
+                confidence_score REAL NOT NULL, quality_score REAL,
+                created_at TEXT NOT NULL, expires_at TEXT NOT NULL,
+                usage_count INTEGER DEFAULT 0, last_accessed TEXT
+            )
+        """)
+        conn.execute(
+            "INSERT INTO translation_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            ("old_hash", "Hello", "你好", "en", "zh", "test", 0.9, None,
+             datetime.now().isoformat(), (datetime.now() + timedelta(hours=1)).isoformat(), 0, None)
+        )
+        conn.commit()
+        conn.close()
+        
+        self.cache = DatabaseCache(db_path=self.temp_db.name)
+        result = self.cache.get("old_hash")
+        self.assertIsNotNone(result)
+        self.assertIsNone(result.fingerprint)
+        
+        self.test_translation.fingerprint = "abc"
+        self.cache.put("test_hash", self.test_translation)
+        self.assertEqual(self.cache.get("test_hash").fingerprint, "abc")
+    
 
 
 class TestSmartTranslationCache(unittest.TestCase):
@@ -212,6 +452,8 @@ class TestSmartTranslationCache(unittest.TestCase):
             'memory_cache_size': 10,
             'file_cache_dir': self.temp_dir,
             'db_cache_path': self.temp_db.name,
+            'write_policy': 'write_behind',
+            'write_flush_interval': 60,  # 由测试控制写入队列的落盘时机
             'auto_cleanup': False  # 禁用自动清理以便测试
         }
         
@@ -228,6 +470,7 @@ class TestSmartTranslationCache(unittest.TestCase):
     
     def tearDown(self):
         """测试清理"""
+        self.cache.close()
         shutil.rmtree(self.temp_dir, ignore_errors=True)
         if os.path.exists(self.temp_db.name):
             os.unlink(self.temp_db.name)
@@ -299,6 +542,285 @@ class TestSmartTranslationCache(unittest.TestCase):
         self.assertGreater(stats['cache_misses'], 0)
         self.assertTrue(0 <= stats['hit_rate'] <= 1)
     
+    def test_batch_cache_and_retrieve(self):
+        """测试批量缓存和检索，下级命中批量提升到内存缓存"""
+        translations = {
+            f"Batch text {i}": TranslationResult(
+                original_text=f"Batch text {i}",
+                translated_text=f"批量文本 {i}",
+                source_language="en",
+                target_language="zh",
+                service_name="test",
+                confidence_score=0.9,
+                timestamp=datetime.now()
+            )
+            for i in range(3)
+        }
+        self.assertTrue(self.cache.cache_translations(translations))
+        
+        # 清空内存缓存和文件缓存，只能从数据库命中
+        self.cache.flush()
+        self.cache.memory_cache.clear()
+        self.cache.file_cache.clear()
+        
+        texts = list(translations) + ["Missing text"]
+        found = self.cache.get_cached_translations(texts)
+        
+        self.assertEqual(set(found), set(translations))
+        self.assertEqual(found["Batch text 1"].translation_result.translated_text, "批量文本 1")
+        self.assertEqual(self.cache.stats.db_cache_hits, 3)
+        self.assertEqual(self.cache.stats.cache_misses, 1)
+        
+        # 再次查询全部命中内存缓存
+        found = self.cache.get_cached_translations(list(translations))
+        self.assertEqual(len(found), 3)
+        self.assertEqual(self.cache.stats.memory_cache_hits, 3)
+    
+    def test_write_behind_batches_lower_tiers(self):
+        """测试写入队列：下级缓存延后批量写入，未落盘时仍可读取"""
+        text = "Write behind test"
+        
+        with patch.object(self.cache.db_cache, 'put_many', wraps=self.cache.db_cache.put_many) as db_put:
+            self.cache.cache_translation(text, self.test_translation)
+            db_put.assert_not_called()
+            
+            self.cache.memory_cache.clear()
+            cached_result = self.cache.get_cached_translation(text)
+            self.assertIsNotNone(cached_result)
+            self.assertEqual(self.cache.stats.write_buffer_hits, 1)
+            
+            self.assertEqual(self.cache.flush(), 1)
+            db_put.assert_called_once()
+        
+        key = self.cache._generate_cache_key(text, 'en', 'zh')
+        self.assertIsNotNone(self.cache.db_cache.get(key))
+        self.assertIsNotNone(self.cache.file_cache.get(key))
+    
+    def test_close_flushes_pending_writes(self):
+        """测试关闭时写入队列中的缓存项"""
+        self.cache.cache_translation("Close flush test", self.test_translation)
+        self.cache.close()
+        
+        reopened = DatabaseCache(db_path=self.temp_db.name)
+        key = self.cache._generate_cache_key("Close flush test", 'en', 'zh')
+        self.assertIsNotNone(reopened.get(key))
+        reopened.close()
+    
+    def test_write_through_is_default(self):
+        """测试默认同步写入，不启动后台写入线程"""
+        cache = SmartTranslationCache({'db_cache_path': self.temp_db.name, 'enable_file_cache': False,
+                                       'auto_cleanup': False})
+        self.assertEqual(cache.write_policy, 'write_through')
+        self.assertIsNone(cache._writer_thread)
+        cache.close()
+    
+    def test_unclosed_write_behind_cache_is_collectable(self):
+        """测试后台写入线程不阻止实例被回收，关闭后注销退出回调"""
+        cache = SmartTranslationCache({'db_cache_path': self.temp_db.name, 'enable_file_cache': False,
+                                       'write_policy': 'write_behind', 'write_flush_interval': 0.05,
+                                       'persist_metrics': False, 'auto_cleanup': False})
+        writer_thread = cache._writer_thread
+        cache_ref = weakref.ref(cache)
+        del cache
+        
+        for _ in range(40):
+            gc.collect()
+            if cache_ref() is None:
+                break
+            time.sleep(0.05)
+        self.assertIsNone(cache_ref())
+        writer_thread.join(timeout=1)
+        self.assertFalse(writer_thread.is_alive())
+        
+        self.cache.close()
+        self.assertIsNone(self.cache._atexit_hook)
+    
+    def test_write_through_without_file_tier(self):
+        """测试同步写入策略并禁用文件缓存"""
+        cache = SmartTranslationCache({
+            'db_cache_path': self.temp_db.name,
+            'enable_file_cache': False,
+            'write_policy': 'write_through',
+            'auto_cleanup': False
+        })
+        self.assertIsNone(cache.file_cache)
+        
+        cache.cache_translation("Write through test", self.test_translation)
+        key = cache._generate_cache_key("Write through test", 'en', 'zh')
+        self.assertIsNotNone(cache.db_cache.get(key))
+        
+        cache.memory_cache.clear()
+        self.assertIsNotNone(cache.get_cached_translation("Write through test"))
+        self.assertEqual(cache.stats.db_cache_hits, 1)
+        self.assertEqual(cache.get_cache_statistics()['write_policy'], 'write_through')
+        cache.close()
+    
+    def test_near_duplicate_lookup(self):
+        """测试近似重复文本复用已缓存的翻译"""
+        cache = SmartTranslationCache({
+            'file_cache_dir': self.temp_dir,
+            'db_cache_path': self.temp_db.name,
+            'near_duplicate_lookup': True,
+            'auto_cleanup': False
+        })
+        title = "Apple unveils new AI features for iPhone at developer conference - Reuters"
+        translation = TranslationResult(
+            original_text=title,
+            translated_text="苹果在开发者大会上发布iPhone新AI功能",
+            source_language="en",
+            target_language="zh",
+            service_name="test",
+            confidence_score=0.9,
+            timestamp=datetime.now()
+        )
+        cache.cache_translation(title, translation)
+        
+        # 空白和大小写不同，规范化后是同一个键
+        exact = cache.get_cached_translation("APPLE unveils new AI features for  iPhone at developer conference - reuters")
+        self.assertIsNotNone(exact)
+        self.assertEqual(cache.stats.near_duplicate_hits, 0)
+        
+        # 多一个词，通过近似重复索引命中
+        near = cache.get_cached_translation("Apple unveils new AI features for iPhone at its developer conference")
+        self.assertIsNotNone(near)
+        self.assertEqual(cache.stats.near_duplicate_hits, 1)
+        
+        self.assertIsNone(cache.get_cached_translation("Microsoft stock falls after cloud growth slows this quarter"))
+        cache.close()
+        
+        # 重新打开时从数据库预热索引
+        reopened = SmartTranslationCache({
+            'file_cache_dir': self.temp_dir,
+            'db_cache_path': self.temp_db.name,
+            'near_duplicate_lookup': True,
+            'auto_cleanup': False
+        })
+        self.assertIsNotNone(reopened.get_cached_translation(
+            "Apple unveils new AI features for iPhone at its developer conference"
+        ))
+        reopened.close()
+    
+    def test_stale_fingerprint_is_miss(self):
+        """测试指纹不一致的缓存项视为未命中"""
+        self.cache.cache_translation("Hello world", self.test_translation, fingerprint="v1")
+        
+        self.assertIsNotNone(self.cache.get_cached_translation("Hello world", fingerprint="v1"))
+        self.assertIsNone(self.cache.get_cached_translation("Hello world", fingerprint="v2"))
+        self.assertEqual(self.cache.stats.stale_hits, 1)
+        
+        # 各级缓存都按同样的规则处理
+        self.cache.flush()
+        self.cache.memory_cache.clear()
+        self.assertIsNone(self.cache.get_cached_translation("Hello world", fingerprint="v2"))
+        self.assertEqual(self.cache.stats.stale_hits, 2)
+        # 不指定指纹时仍然返回旧翻译
+        self.assertIsNotNone(self.cache.get_cached_translation("Hello world"))
+    
+    def test_rewarm_refreshes_hot_stale_entries(self):
+        """测试重新预热访问最多的过时缓存项"""
+        texts = ["Hello world", "Good morning", "Rarely used"]
+        for text in texts:
+            self.cache.cache_translation(text, TranslationResult(
+                original_text=text,
+                translated_text=f"旧:{text}",
+                source_language="en",
+                target_language="zh",
+                service_name="old",
+                confidence_score=0.9,
+                timestamp=datetime.now()
+            ), fingerprint="v1")
+        self.cache.flush()
+        for _ in range(3):
+            self.cache.memory_cache.clear()
+            self.cache.file_cache.clear()
+            self.cache.get_cached_translations(texts[:2])
+        
+        calls = []
+        
+        def translate(text, source_lang, target_lang):
+            calls.append((text, source_lang, target_lang))
+            return TranslationResult(
+                original_text=text,
+                translated_text=f"新:{text}",
+                source_language=source_lang,
+                target_language=target_lang,
+                service_name="new",
+                confidence_score=0.9,
+                timestamp=datetime.now()
+            )
+        
+        refreshed = self.cache.rewarm(translate, "v2", limit=2, min_usage=1)
+        self.assertEqual(refreshed, 2)
+        self.assertEqual(sorted(text for text, _, _ in calls), ["Good morning", "Hello world"])
+        self.assertTrue(all(call[1:] == ("en", "zh") for call in calls))
+        
+        result = self.cache.get_cached_translation("Hello world", fingerprint="v2")
+        self.assertEqual(result.translation_result.translated_text, "新:Hello world")
+        self.assertIsNone(self.cache.get_cached_translation("Rarely used", fingerprint="v2"))
+        
+        # 已刷新的缓存项不再视为过时
+        self.cache.flush()
+        self.assertEqual(self.cache.rewarm(translate, "v2", limit=2), 1)
+        self.assertEqual(self.cache.get_cache_statistics()['rewarmed_items'], 3)
+    
+    def test_tier_metrics_persist_across_runs(self):
+        """测试分级指标关闭时保存并跨运行累计"""
+        self.cache.cache_translation("Hello world", self.test_translation)
+        self.cache.flush()
+        self.cache.memory_cache.clear()
+        self.cache.get_cached_translation("Hello world")
+        self.cache.get_cached_translation("Missing text")
+        
+        metrics = self.cache.get_cache_statistics()['tier_metrics']
+        self.assertEqual(metrics['memory']['lookups'], 2)
+        self.assertEqual(metrics['file']['hits'], 1)
+        self.assertEqual(metrics['database']['lookups'], 1)
+        self.assertEqual(metrics['database']['latency']['count'], 1)
+        self.assertGreater(metrics['file']['bytes_read'], 0)
+        self.assertGreater(metrics['database']['bytes_written'], 0)
+        self.cache.close()
+        
+        self.cache = SmartTranslationCache({
+            'file_cache_dir': self.temp_dir,
+            'db_cache_path': self.temp_db.name,
+            'auto_cleanup': False
+        })
+        self.cache.get_cached_translation("Hello world")
+        
+        self.assertEqual(self.cache.get_tier_metrics()['memory']['lookups'], 1)
+        lifetime = self.cache.get_tier_metrics(lifetime=True)
+        self.assertEqual(lifetime['memory']['lookups'], 3)
+        self.assertEqual(lifetime['file']['hits'], 2)
+        self.assertEqual(lifetime['database']['lookups'], 1)
+    
+    def test_warm_up_seeds_memory_only(self):
+        """测试预热只写入内存缓存"""
+        entries = [
+            (f"Text {i}", TranslationResult(
+                original_text=f"Text {i}",
+                translated_text=f"文本 {i}",
+                source_language="en",
+                target_language="zh",
+                service_name="published",
+                confidence_score=0.8,
+                timestamp=datetime.now()
+            ), "en", "zh|title|AI")
+            for i in range(5)
+        ]
+        
+        warmed = self.cache.warm_up(iter(entries), fingerprint="v1", batch_size=2)
+        self.assertEqual(warmed, 5)
+        self.assertEqual(self.cache.memory_cache.size(), 5)
+        self.assertEqual(self.cache.get_cache_statistics()['warmed_items'], 5)
+        
+        found = self.cache.get_cached_translations(["Text 0", "Text 4"], "en", "zh|title|AI", fingerprint="v1")
+        self.assertEqual(found["Text 4"].translation_result.translated_text, "文本 4")
+        self.assertEqual(self.cache.stats.memory_cache_hits, 2)
+        
+        self.cache.flush()
+        self.assertEqual(self.cache.file_cache.size(), 0)
+        self.assertEqual(self.cache.db_cache.get_cache_stats()['total_items'], 0)
+    
     def test_cache_key_generation(self):
         """测试缓存键生成"""
         key1 = self.cache._generate_cache_key("Hello", "en", "zh")
@@ -310,6 +832,9 @@ class TestSmartTranslationCache(unittest.TestCase):
         
         # 不同内容应该生成不同的键
         self.assertNotEqual(key1, key3)
+        
+        # 空白和大小写不同的文本规范化后键相同
+        self.assertEqual(key1, self.cache._generate_cache_key("  hello ", "en", "zh"))
     
     def test_performance_optimization(self):
         """测试性能优化"""
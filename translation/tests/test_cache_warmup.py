@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+翻译缓存预热测试
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from ..core.cache_warmup import extract_translation_pairs, iter_json_articles
+
+
+class TestIterJsonArticles(unittest.TestCase):
+    """流式读取新闻数据测试"""
+
+    def setUp(self):
+        """测试初始化"""
+        self.temp_file = tempfile.NamedTemporaryFile('w', delete=False, suffix='.json', encoding='utf-8')
+        self.temp_file.close()
+
+    def tearDown(self):
+        """测试清理"""
+        os.unlink(self.temp_file.name)
+
+    def _write(self, data):
+        with open(self.temp_file.name, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def test_object_with_articles_key(self):
+        """测试顶层为对象时跳过其他键读取文章数组"""
+        articles = [{'id': i, 'title': f"标题 {i}", 'score': 12345.678 + i} for i in range(20)]
+        self._write({
+            'last_updated': '2025-01-01T00:00:00',
+            'total_count': 1234567,
+            'categories': [{'name': 'AI', 'items': [1, 2, [3, {'articles': []}]]}],
+            'articles': articles,
+            'tail': 'ignored'
+        })
+
+        # 很小的分块大小覆盖值跨块和数字在块末尾截断的情况
+        for chunk_size in (1, 7, 64, 65536):
+            self.assertEqual(list(iter_json_articles(self.temp_file.name, chunk_size=chunk_size)), articles)
+
+    def test_top_level_list_and_empty(self):
+        """测试顶层为数组以及空数组"""
+        self._write([{'id': 1}, 'not an article', {'id': 2}])
+        self.assertEqual(list(iter_json_articles(self.temp_file.name, chunk_size=3)), [{'id': 1}, {'id': 2}])
+
+        self._write({'articles': []})
+        self.assertEqual(list(iter_json_articles(self.temp_file.name)), [])
+
+        self._write({'total_count': 0})
+        self.assertEqual(list(iter_json_articles(self.temp_file.name)), [])
+
+    def test_invalid_json(self):
+        """测试格式错误的文件"""
+        with open(self.temp_file.name, 'w', encoding='utf-8') as f:
+            f.write('{"articles": [{"id": 1}, {"id": ')
+
+        with self.assertRaises(ValueError):
+            list(iter_json_articles(self.temp_file.name, chunk_size=4))
+
+
+class TestExtractTranslationPairs(unittest.TestCase):
+    """提取译文对测试"""
+
+    def test_accumulator_format(self):
+        """测试累积系统格式只提取AI翻译的字段"""
+        article = {
+            'title': 'OpenAI发布新模型',
+            'original_title': 'OpenAI releases new model',
+            'description': '《英文原文》OpenAI releases new model today',
+            'original_description': 'OpenAI releases new model today',
+            'search_category': 'AI科技',
+            'translation_metadata': {
+                'cache_fingerprint': 'abc',
+                'title_translation': {'is_ai_translated': True, 'service': 'enhanced_news_qwen', 'confidence': 0.9},
+                'description_translation': {'is_ai_translated': False, 'service': 'none'}
+            }
+        }
+
+        pairs = extract_translation_pairs(article)
+        self.assertEqual(len(pairs), 1)
+        self.assertEqual((pairs[0].text_type, pairs[0].category, pairs[0].fingerprint), ('title', 'AI科技', 'abc'))
+        self.assertEqual(pairs[0].service_name, 'enhanced_news_qwen')
+
+    def test_enhanced_formats(self):
+        """测试enhanced和chinese数据格式"""
+        enhanced = {
+            'title': 'Apple unveils new chip',
+            'translated_title': '苹果发布新芯片',
+            'summary': 'Untranslated summary',
+            'translated_summary': 'Untranslated summary'
+        }
+        pairs = extract_translation_pairs(enhanced)
+        self.assertEqual([(p.text_type, p.translated_text, p.category) for p in pairs],
+                         [('title', '苹果发布新芯片', None)])
+
+        chinese = {
+            'title': 'Apple unveils new chip',
+            'description': 'The chip is fast.',
+            'ai_translation': {
+                'translated_title': '苹果发布新芯片',
+                'translated_description': '这款芯片很快。',
+                'translation_service': 'siliconflow',
+                'translation_confidence': {'title': 0.92}
+            }
+        }
+        pairs = extract_translation_pairs(chinese)
+        self.assertEqual([p.text_type for p in pairs], ['title', 'description'])
+        self.assertEqual(pairs[0].confidence, 0.92)
+        self.assertEqual(pairs[1].service_name, 'siliconflow')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+翻译服务熔断器测试
+"""
+
+import time
+import unittest
+from unittest.mock import Mock
+
+from ..core.circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitBreakerRegistry, CircuitState
+from ..core.interfaces import TranslationResult
+from ..core.service_health_monitor import ServiceHealthMonitor
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """熔断器状态机测试"""
+
+    def setUp(self):
+        """测试初始化"""
+        self.breaker = CircuitBreaker("service", CircuitBreakerConfig(failure_threshold=3, recovery_timeout=0.05))
+
+    def test_opens_after_consecutive_failures(self):
+        """测试连续失败达到阈值后熔断"""
+        self.breaker.record_failure("timeout")
+        self.breaker.record_failure("timeout")
+        self.assertTrue(self.breaker.allow_request())
+
+        self.breaker.record_failure("timeout")
+        self.assertEqual(self.breaker.state, CircuitState.OPEN)
+        self.assertFalse(self.breaker.allow_request())
+        self.assertEqual(self.breaker.get_statistics()['rejected_calls'], 1)
+
+    def test_success_resets_failure_count(self):
+        """测试成功调用重置连续失败计数"""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, CircuitState.CLOSED)
+
+    def test_half_open_recovery(self):
+        """测试冷却后半开试探成功则恢复"""
+        for _ in range(3):
+            self.breaker.record_failure()
+        time.sleep(0.06)
+
+        self.assertEqual(self.breaker.state, CircuitState.HALF_OPEN)
+        self.assertTrue(self.breaker.allow_request())
+        self.assertFalse(self.breaker.allow_request())  # 只放行一个试探请求
+
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CircuitState.CLOSED)
+
+    def test_half_open_failure_reopens(self):
+        """测试半开试探失败重新熔断"""
+        for _ in range(3):
+            self.breaker.record_failure()
+        time.sleep(0.06)
+
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.record_failure("still down")
+        self.assertEqual(self.breaker.state, CircuitState.OPEN)
+
+    def test_release_permit_frees_half_open_slot(self):
+        """测试归还许可后半开状态可以再次放行试探请求"""
+        for _ in range(3):
+            self.breaker.record_failure()
+        time.sleep(0.06)
+
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.release_permit()
+        self.assertEqual(self.breaker.state, CircuitState.HALF_OPEN)
+        self.assertTrue(self.breaker.allow_request())
+
+
+class TestHealthMonitorCircuitBreakers(unittest.TestCase):
+    """健康监控与熔断器联动测试"""
+
+    def _make_service(self, error_message=None):
+        """创建模拟服务"""
+        service = Mock()
+        service.get_service_name.return_value = "mock_service"
+        service.translate_text.return_value = TranslationResult(
+            original_text="Hello world",
+            translated_text="" if error_message else "你好世界",
+            source_language="en",
+            target_language="zh",
+            service_name="mock_service",
+            confidence_score=0.9,
+            timestamp=None,
+            error_message=error_message
+        )
+        return service
+
+    def test_health_checks_feed_breaker(self):
+        """测试健康检查失败会触发熔断"""
+        registry = CircuitBreakerRegistry(CircuitBreakerConfig(failure_threshold=2, recovery_timeout=60))
+        monitor = ServiceHealthMonitor([self._make_service("unauthorized")], circuit_breakers=registry)
+
+        monitor.force_health_check("mock_service")
+        self.assertTrue(monitor.allow_request("mock_service"))
+        monitor.force_health_check("mock_service")
+
+        self.assertFalse(monitor.allow_request("mock_service"))
+        self.assertEqual(monitor.get_service_summary()["mock_service"]["circuit_state"], "open")
+
+    def test_call_results_feed_breaker(self):
+        """测试实际调用结果会触发熔断，健康检查成功后转为半开"""
+        registry = CircuitBreakerRegistry(CircuitBreakerConfig(failure_threshold=2, recovery_timeout=60))
+        monitor = ServiceHealthMonitor([self._make_service()], circuit_breakers=registry)
+
+        monitor.record_call_result("mock_service", False, "timeout")
+        monitor.record_call_result("mock_service", False, "timeout")
+        self.assertEqual(registry.get_open_circuits(), ["mock_service"])
+
+        monitor.force_health_check("mock_service")
+        self.assertEqual(registry.get("mock_service").state, CircuitState.HALF_OPEN)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+增强版新闻翻译器单元测试
+"""
+
+import json
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from ..core.rate_limiter import RateLimiterRegistry
+from ..core.terminology import TERMINOLOGY_ENGINE_VERSION
+from ..services.enhanced_news_translator import EnhancedNewsTranslator
+
+
+def _chat_response(content):
+    """构造聊天补全响应"""
+    return {"choices": [{"message": {"content": content}}]}
+
+
+class TestEnhancedNewsTranslatorBatch(unittest.TestCase):
+    """批量翻译模式测试"""
+
+    def setUp(self):
+        """测试初始化"""
+        self.translator = EnhancedNewsTranslator(api_key="test_api_key")
+
+    def test_parse_batch_response(self):
+        """测试解析带序号的批量响应"""
+        content = "[[1]] 苹果发布新款手机\n[[2]] 微软推出新功能\n[[3]]"
+        parsed = self.translator._parse_batch_response(content, 3)
+
+        self.assertEqual(parsed, {0: "苹果发布新款手机", 1: "微软推出新功能"})
+
+    def test_parse_batch_response_rejects_invalid_entries(self):
+        """测试丢弃越界和重复的序号"""
+        content = "[[1]] 第一条\n[[1]] 重复的第一条\n[[2]] 第二条\n[[9]] 越界"
+        parsed = self.translator._parse_batch_response(content, 2)
+
+        self.assertEqual(parsed, {1: "第二条"})
+
+    def test_parse_multiline_entries(self):
+        """测试多行描述译文"""
+        content = "[[1]] 第一段内容。\n第二段内容。\n[[2]] 另一条描述。"
+        parsed = self.translator._parse_batch_response(content, 2)
+
+        self.assertEqual(parsed[0], "第一段内容。\n第二段内容。")
+        self.assertEqual(parsed[1], "另一条描述。")
+
+    def test_titles_batch_single_request(self):
+        """测试多个标题合并为一次请求"""
+        titles = ["Apple launches new iPhone", "Microsoft updates Windows", "Google releases Gemini"]
+        response = _chat_response(
+            "[[1]] 苹果发布新款iPhone手机\n[[2]] 微软更新Windows系统\n[[3]] 谷歌发布Gemini模型"
+        )
+
+        with patch.object(self.translator, '_make_request', return_value=response) as mock_request:
+            results = self.translator.translate_news_titles_batch(titles, "科技创新")
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0].translated_text, "苹果发布新款iPhone手机")
+        self.assertEqual(results[2].original_text, "Google releases Gemini")
+        for result in results:
+            self.assertIsNone(result.error_message)
+            self.assertGreater(result.confidence_score, 0)
+
+    def test_titles_batch_falls_back_per_item(self):
+        """测试只对解析失败的条目逐条回退"""
+        titles = ["Apple launches new iPhone", "Microsoft updates Windows"]
+        batch_response = _chat_response("[[1]] 苹果发布新款iPhone手机")
+        single_response = _chat_response("微软更新Windows系统")
+
+        with patch.object(self.translator, '_make_request',
+                          side_effect=[batch_response, single_response]) as mock_request:
+            results = self.translator.translate_news_titles_batch(titles)
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(results[0].translated_text, "苹果发布新款iPhone手机")
+        self.assertEqual(results[1].translated_text, "微软更新Windows系统")
+
+    def test_batch_chunking(self):
+        """测试按batch_size分块"""
+        self.translator.batch_size = 2
+        titles = [f"Title number {i}" for i in range(5)]
+
+        def fake_request(messages, max_tokens=2048):
+            count = messages[0]['content'].count('[[') - 1  # 格式说明中包含一个示例标记
+            return _chat_response("\n".join(f"[[{i}]] 标题译文{i}" for i in range(1, count + 1)))
+
+        with patch.object(self.translator, '_make_request', side_effect=fake_request) as mock_request:
+            results = self.translator.translate_news_titles_batch(titles)
+
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertTrue(all(result.translated_text for result in results))
+
+    def test_batch_request_failure_falls_back(self):
+        """测试整批请求失败时逐条翻译"""
+        titles = ["Apple launches new iPhone"]
+
+        with patch.object(self.translator, '_make_request',
+                          side_effect=[Exception("Network error"), _chat_response("苹果发布新款iPhone手机")]):
+            results = self.translator.translate_news_titles_batch(titles)
+
+        self.assertEqual(results[0].translated_text, "苹果发布新款iPhone手机")
+
+    def test_batch_without_fallback_returns_none(self):
+        """测试fallback=False时批量失败和解析失败的条目返回None，不逐条重试"""
+        titles = ["Apple launches new iPhone", "Microsoft updates Windows"]
+
+        with patch.object(self.translator, '_make_request',
+                          return_value=_chat_response("[[1]] 苹果发布新款iPhone手机")) as mock_request:
+            results = self.translator.translate_news_titles_batch(titles, fallback=False)
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(results[0].translated_text, "苹果发布新款iPhone手机")
+        self.assertIsNone(results[1])
+
+        with patch.object(self.translator, '_make_request', side_effect=Exception("Network error")) as mock_request:
+            results = self.translator.translate_news_titles_batch(titles, fallback=False)
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(results, [None, None])
+
+    def test_empty_titles_skip_batch(self):
+        """测试空标题不参与批量请求"""
+        with patch.object(self.translator, '_make_request') as mock_request:
+            results = self.translator.translate_news_titles_batch(["", "  "])
+
+        mock_request.assert_not_called()
+        self.assertTrue(all(result.error_message for result in results))
+
+
+class TestEnhancedNewsTranslatorLongDescription(unittest.TestCase):
+    """长文本分段并发翻译测试"""
+
+    def setUp(self):
+        """测试初始化"""
+        self.translator = EnhancedNewsTranslator(api_key="test_api_key")
+        self.translator.rate_limiter = None
+        self.segments = ["First segment text.", "Second segment text.", "", "Fourth segment text."]
+
+    def _segment_index(self, messages):
+        """从提示词中取出段落序号"""
+        content = messages[0]['content']
+        for i, segment in enumerate(self.segments):
+            if segment and segment in content:
+                return i
+        raise AssertionError("unknown segment")
+
+    def test_segments_merged_in_order(self):
+        """测试并发翻译结果按原顺序合并"""
+        def fake_request(messages, max_tokens=2048):
+            index = self._segment_index(messages)
+            time.sleep(0.05 * (len(self.segments) - index))  # 靠前的段落更晚完成
+            return _chat_response(f"第{index + 1}段译文内容")
+
+        with patch.object(self.translator, '_smart_segment_text', return_value=self.segments), \
+                patch.object(self.translator, '_make_request', side_effect=fake_request):
+            result = self.translator._translate_long_description("long text", "Title", "科技创新")
+
+        self.assertEqual(result.translated_text, "第1段译文内容\n\n第2段译文内容\n\n第4段译文内容")
+
+    def test_segments_run_concurrently(self):
+        """测试各段并发请求且受最大线程数限制"""
+        self.translator.segment_max_workers = 2
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def fake_request(messages, max_tokens=2048):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return _chat_response("段落译文内容")
+
+        with patch.object(self.translator, '_smart_segment_text', return_value=self.segments), \
+                patch.object(self.translator, '_make_request', side_effect=fake_request):
+            self.translator._translate_long_description("long text")
+
+        self.assertEqual(peak[0], 2)
+
+    def test_segment_failure_isolated(self):
+        """测试单段失败保留原文，不影响其他段"""
+        def fake_request(messages, max_tokens=2048):
+            index = self._segment_index(messages)
+            if index == 1:
+                raise Exception("Network error")
+            self.assertIn("标题参考：Title", messages[0]['content'])
+            return _chat_response(f"第{index + 1}段译文内容")
+
+        with patch.object(self.translator, '_smart_segment_text', return_value=self.segments), \
+                patch.object(self.translator, '_make_request', side_effect=fake_request):
+            result = self.translator._translate_long_description("long text", "Title")
+
+        self.assertEqual(result.translated_text,
+                         "第1段译文内容\n\nSecond segment text.\n\n第4段译文内容")
+
+    @patch('translation.core.http_transport.urlopen')
+    def test_segments_use_shared_provider_limiter(self, mock_urlopen):
+        """测试分段请求从注入的服务商共享限流器申请令牌"""
+        registry = RateLimiterRegistry()
+        shared = registry.register('siliconflow', 0)
+        translator = EnhancedNewsTranslator(api_key="test_api_key", rate_limiter=registry.get('siliconflow'))
+        self.assertIs(translator.rate_limiter, shared)
+        mock_urlopen.return_value.__enter__.return_value.read.return_value = \
+            json.dumps(_chat_response("段落译文内容")).encode('utf-8')
+
+        with patch.object(translator, '_smart_segment_text', return_value=self.segments):
+            translator._translate_long_description("long text")
+
+        self.assertEqual(mock_urlopen.call_count, 3)  # 空段不请求
+        self.assertEqual(shared.total_acquired, 3)
+
+    @patch('translation.core.http_transport.urlopen')
+    def test_each_retry_takes_a_token(self, mock_urlopen):
+        """测试重试的每次HTTP请求都申请令牌"""
+        shared = RateLimiterRegistry().register('siliconflow', 0)
+        translator = EnhancedNewsTranslator(api_key="test_api_key", rate_limiter=shared)
+        translator.retry_delay = 0
+        mock_urlopen.side_effect = Exception("Network error")
+
+        result = translator.translate_news_title("Apple launches new iPhone")
+
+        self.assertTrue(result.error_message)
+        self.assertEqual(mock_urlopen.call_count, translator.max_retries)
+        self.assertEqual(shared.total_acquired, translator.max_retries)
+
+
+class TestEnhancedNewsTranslatorCacheFingerprint(unittest.TestCase):
+    """翻译缓存指纹测试"""
+
+    def test_fingerprint_tracks_model_prompts_and_terms(self):
+        """测试模型、提示词或术语变化时指纹改变"""
+        translator = EnhancedNewsTranslator(api_key="test_api_key")
+        fingerprint = translator.get_cache_fingerprint()
+        self.assertEqual(fingerprint, EnhancedNewsTranslator(api_key="test_api_key").get_cache_fingerprint())
+
+        other_model = EnhancedNewsTranslator(api_key="test_api_key", model="Qwen/Qwen2.5-14B-Instruct")
+        self.assertNotEqual(fingerprint, other_model.get_cache_fingerprint())
+
+        translator.tech_terms['vector database'] = '向量数据库'
+        self.assertNotEqual(fingerprint, translator.get_cache_fingerprint())
+
+        prompt_changed = EnhancedNewsTranslator(api_key="test_api_key")
+        with patch.object(prompt_changed, '_create_title_translation_prompt', return_value="新的提示词"):
+            self.assertNotEqual(fingerprint, prompt_changed.get_cache_fingerprint())
+
+    def test_fingerprint_tracks_terminology_engine_version(self):
+        """测试术语替换引擎版本变化时指纹改变"""
+        translator = EnhancedNewsTranslator(api_key="test_api_key")
+        fingerprint = translator.get_cache_fingerprint()
+        with patch('translation.services.enhanced_news_translator.TERMINOLOGY_ENGINE_VERSION',
+                   TERMINOLOGY_ENGINE_VERSION + 1):
+            self.assertNotEqual(fingerprint, translator.get_cache_fingerprint())
+
+
+if __name__ == '__main__':
+    unittest.main()
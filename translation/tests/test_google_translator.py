@@ -39,7 +39,7 @@ class TestGoogleTranslator(unittest.TestCase):
         confidence = self.translator._calculate_confidence("hello", "你好", "en")
         self.assertGreater(confidence, 0.8)  # 有语言检测的置信度更高
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_detect_language(self, mock_urlopen):
         """测试语言检测"""
         # 模拟语言检测API响应
@@ -58,7 +58,7 @@ class TestGoogleTranslator(unittest.TestCase):
         detected_lang = self.translator.detect_language("Hello world")
         self.assertEqual(detected_lang, "en")
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_translate_text_success(self, mock_urlopen):
         """测试成功翻译文本"""
         # 模拟API响应
@@ -84,7 +84,7 @@ class TestGoogleTranslator(unittest.TestCase):
         self.assertIsNone(result.error_message)
         self.assertIsInstance(result.timestamp, datetime)
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_translate_text_api_error(self, mock_urlopen):
         """测试API错误处理"""
         # 模拟API错误响应
@@ -114,7 +114,7 @@ class TestGoogleTranslator(unittest.TestCase):
         self.assertEqual(result.confidence_score, 0.0)
         self.assertEqual(result.error_message, "输入文本为空")
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_translate_batch_success(self, mock_urlopen):
         """测试成功批量翻译"""
         # 模拟批量翻译API响应
@@ -137,7 +137,7 @@ class TestGoogleTranslator(unittest.TestCase):
         self.assertEqual(results[0].service_name, "google_translate")
         self.assertEqual(results[1].service_name, "google_translate")
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_translate_batch_fallback(self, mock_urlopen):
         """测试批量翻译回退到单个翻译"""
         # 第一次调用（批量翻译）失败，后续调用（单个翻译）成功
@@ -177,7 +177,7 @@ class TestGoogleTranslator(unittest.TestCase):
         results = self.translator.translate_batch([], "en", "zh")
         self.assertEqual(len(results), 0)
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_get_service_status_healthy(self, mock_urlopen):
         """测试健康服务状态"""
         # 模拟成功响应
@@ -194,7 +194,7 @@ class TestGoogleTranslator(unittest.TestCase):
         status = self.translator.get_service_status()
         self.assertEqual(status, ServiceStatus.HEALTHY)
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_get_service_status_degraded_quota(self, mock_urlopen):
         """测试配额限制导致的降级状态"""
         # 模拟配额限制错误
@@ -210,7 +210,7 @@ class TestGoogleTranslator(unittest.TestCase):
         status = self.translator.get_service_status()
         self.assertEqual(status, ServiceStatus.DEGRADED)
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_get_service_status_unavailable(self, mock_urlopen):
         """测试不可用服务状态"""
         # 模拟认证失败
@@ -226,7 +226,7 @@ class TestGoogleTranslator(unittest.TestCase):
         status = self.translator.get_service_status()
         self.assertEqual(status, ServiceStatus.UNAVAILABLE)
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_get_supported_languages(self, mock_urlopen):
         """测试获取支持的语言列表"""
         # 模拟支持语言API响应
@@ -249,7 +249,7 @@ class TestGoogleTranslator(unittest.TestCase):
         self.assertEqual(languages[1]["language"], "zh")
         self.assertEqual(languages[2]["language"], "ja")
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_check_health(self, mock_urlopen):
         """测试健康检查功能"""
         # 模拟翻译和语言检测成功响应
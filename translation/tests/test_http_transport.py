@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP传输层测试
+"""
+
+import json
+import threading
+import unittest
+import urllib.error
+import urllib.parse
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from ..core.http_transport import HttpTransport
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """回显请求的测试服务端（支持长连接）"""
+
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _redirect(self):
+        """/redirect?code=302&to=<目标地址> 按指定状态码跳转，/loop 始终跳回自身"""
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+        code = int(query.get("code", ["302"])[0])
+        location = query["to"][0] if "to" in query else "/loop"
+        body = b"moved"
+        self.send_response(code)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.startswith("/missing"):
+            self._reply(404, {"error": "not found"})
+        elif self.path.startswith(("/redirect", "/loop")):
+            self._redirect()
+        else:
+            self._reply(200, {"method": "GET", "path": self.path})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        data = self.rfile.read(length).decode('utf-8')
+        if self.path.startswith("/redirect"):
+            self._redirect()
+            return
+        self._reply(200, {"method": "POST", "data": data,
+                          "content_type": self.headers.get("Content-Type")})
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHttpTransport(unittest.TestCase):
+    """长连接池传输层测试"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """测试初始化，排除环境代理配置"""
+        self.transport = HttpTransport(pool_size=2, timeout=5)
+        proxy_patcher = patch('urllib.request.getproxies', return_value={})
+        proxy_patcher.start()
+        self.addCleanup(proxy_patcher.stop)
+        self.addCleanup(self.transport.close)
+
+    def test_connection_reused(self):
+        """测试同一主机的连续请求复用连接"""
+        for i in range(3):
+            with self.transport.urlopen(f"{self.base_url}/item?i={i}", timeout=5) as response:
+                result = json.loads(response.read().decode('utf-8'))
+            self.assertEqual(result["path"], f"/item?i={i}")
+
+        stats = self.transport.get_statistics()
+        self.assertEqual(stats["total_requests"], 3)
+        self.assertEqual(stats["connections_created"], 1)
+        self.assertEqual(stats["connections_reused"], 2)
+
+    def test_post_request(self):
+        """测试POST请求与urllib.request.Request兼容"""
+        request = urllib.request.Request(
+            f"{self.base_url}/translate",
+            data=json.dumps({"q": "hello"}).encode('utf-8'),
+            headers={"Content-Type": "application/json"}
+        )
+
+        with self.transport.urlopen(request, timeout=5) as response:
+            result = json.loads(response.read().decode('utf-8'))
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(result["method"], "POST")
+        self.assertEqual(json.loads(result["data"]), {"q": "hello"})
+        self.assertEqual(result["content_type"], "application/json")
+
+    def test_http_error(self):
+        """测试错误状态码抛出HTTPError且连接仍可复用"""
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self.transport.urlopen(f"{self.base_url}/missing", timeout=5)
+        self.assertEqual(context.exception.code, 404)
+
+        with self.transport.urlopen(f"{self.base_url}/ok", timeout=5) as response:
+            response.read()
+        self.assertEqual(self.transport.get_statistics()["connections_reused"], 1)
+
+    def test_unread_response_not_reused(self):
+        """测试未读完的响应不归还连接池"""
+        with self.transport.urlopen(f"{self.base_url}/ok", timeout=5):
+            pass
+        with self.transport.urlopen(f"{self.base_url}/ok", timeout=5) as response:
+            response.read()
+
+        stats = self.transport.get_statistics()
+        self.assertEqual(stats["connections_created"], 2)
+        self.assertEqual(stats["connections_reused"], 0)
+
+    def test_stale_connection_retried(self):
+        """测试复用的连接被服务端关闭后自动换新连接"""
+        with self.transport.urlopen(f"{self.base_url}/ok", timeout=5) as response:
+            response.read()
+
+        # 模拟服务端关闭空闲连接
+        pool = next(iter(self.transport._pools.values()))
+        connection, _ = pool._idle[-1]
+        connection.sock.close()
+        connection.sock = _ClosedSocket()
+
+        with self.transport.urlopen(f"{self.base_url}/ok", timeout=5) as response:
+            result = json.loads(response.read().decode('utf-8'))
+
+        self.assertEqual(result["path"], "/ok")
+        self.assertEqual(self.transport.get_statistics()["stale_retries"], 1)
+
+    def test_redirect_followed_across_hosts(self):
+        """测试跟随跳转到另一台主机，并从目标主机的连接池取连接"""
+        other = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+        threading.Thread(target=other.serve_forever, daemon=True).start()
+        self.addCleanup(other.server_close)
+        self.addCleanup(other.shutdown)
+        target = f"http://127.0.0.1:{other.server_address[1]}/item?i=1"
+
+        for code in (301, 302, 303, 307, 308):
+            url = f"{self.base_url}/redirect?" + urllib.parse.urlencode({"code": code, "to": target})
+            with self.transport.urlopen(url, timeout=5) as response:
+                result = json.loads(response.read().decode('utf-8'))
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.geturl(), target)
+            self.assertEqual(result["path"], "/item?i=1")
+
+        stats = self.transport.get_statistics()
+        self.assertEqual(stats["redirects_followed"], 5)
+        self.assertEqual(len(stats["hosts"]), 2)
+        self.assertEqual(stats["connections_created"], 2)  # 读完的跳转响应连接归还连接池
+
+    def test_post_redirect(self):
+        """测试POST遇到303改为不带请求体的GET，遇到307不跟随（与urllib一致）"""
+        def post(code):
+            url = f"{self.base_url}/redirect?" + urllib.parse.urlencode({"code": code, "to": "/item"})
+            return self.transport.urlopen(urllib.request.Request(url, data=b'{"q": "hello"}'), timeout=5)
+
+        with post(303) as response:
+            result = json.loads(response.read().decode('utf-8'))
+        self.assertEqual(result, {"method": "GET", "path": "/item"})
+
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            post(307)
+        self.assertEqual(context.exception.code, 307)
+
+    def test_redirect_loop_limited(self):
+        """测试跳转次数超过上限时抛出HTTPError"""
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self.transport.urlopen(f"{self.base_url}/loop", timeout=5)
+
+        self.assertEqual(context.exception.code, 302)
+        self.assertEqual(self.transport.get_statistics()["redirects_followed"], 10)
+
+
+class _ClosedSocket:
+    """已被对端关闭的套接字"""
+
+    def settimeout(self, timeout):
+        pass
+
+    def sendall(self, data):
+        raise BrokenPipeError("closed by peer")
+
+    def close(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+翻译服务限流器测试
+"""
+
+import asyncio
+import threading
+import unittest
+import time
+
+from ..core.rate_limiter import RateLimiter, RateLimiterRegistry
+
+
+class TestRateLimiter(unittest.TestCase):
+    """令牌桶限流器测试"""
+
+    def test_unlimited(self):
+        """测试不限流"""
+        limiter = RateLimiter(0)
+        for _ in range(100):
+            self.assertTrue(limiter.try_acquire())
+        self.assertEqual(limiter.get_wait_time(), 0.0)
+
+    def test_burst_then_limited(self):
+        """测试突发额度用尽后限流"""
+        limiter = RateLimiter(60, burst=2)
+        self.assertTrue(limiter.try_acquire())
+        self.assertTrue(limiter.try_acquire())
+        self.assertFalse(limiter.try_acquire())
+        self.assertGreater(limiter.get_wait_time(), 0.0)
+
+    def test_acquire_waits_for_refill(self):
+        """测试阻塞获取会等待令牌补充"""
+        limiter = RateLimiter(600, burst=1)  # 每0.1秒一个令牌
+        self.assertTrue(limiter.acquire())
+
+        start_time = time.monotonic()
+        self.assertTrue(limiter.acquire())
+        self.assertGreaterEqual(time.monotonic() - start_time, 0.05)
+
+    def test_acquire_timeout(self):
+        """测试获取超时"""
+        limiter = RateLimiter(1, burst=1)
+        self.assertTrue(limiter.acquire())
+        self.assertFalse(limiter.acquire(timeout=0.05))
+
+    def test_aacquire_waits_for_refill(self):
+        """测试异步获取会等待令牌补充"""
+        limiter = RateLimiter(600, burst=1)
+
+        async def acquire_twice():
+            self.assertTrue(await limiter.aacquire())
+            start_time = time.monotonic()
+            self.assertTrue(await limiter.aacquire())
+            return time.monotonic() - start_time
+
+        self.assertGreaterEqual(asyncio.run(acquire_twice()), 0.05)
+        self.assertEqual(limiter.total_acquired, 2)
+
+    def test_concurrent_statistics(self):
+        """测试多线程获取令牌时统计不丢失"""
+        for limiter in (RateLimiter(0), RateLimiter(60000, burst=4000)):
+            threads = [
+                threading.Thread(target=lambda: [limiter.acquire() for _ in range(500)])
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(limiter.get_statistics()['total_acquired'], 4000)
+
+
+class TestRateLimiterRegistry(unittest.TestCase):
+    """限流器注册表测试"""
+
+    def test_register_and_get(self):
+        """测试注册和获取"""
+        registry = RateLimiterRegistry()
+        limiter = registry.register('siliconflow', 120)
+
+        self.assertIs(registry.get('siliconflow'), limiter)
+        self.assertTrue(registry.acquire('siliconflow'))
+        self.assertEqual(registry.get_statistics()['siliconflow']['total_acquired'], 1)
+
+    def test_default_limiter(self):
+        """测试未注册服务商使用默认限流器"""
+        registry = RateLimiterRegistry(default_requests_per_minute=0)
+        self.assertTrue(registry.get('unknown').unlimited)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,6 +11,7 @@ from unittest.mock import Mock, patch
 from ..services.resilient_translation_manager import ResilientTranslationManager
 from ..core.interfaces import TranslationResult, ServiceStatus
 from ..core.service_health_monitor import HealthStatus
+from ..core.circuit_breaker import CircuitState
 
 
 class TestResilientTranslationManager(unittest.TestCase):
@@ -194,5 +195,124 @@ class TestResilientTranslationManagerWithMockServices(unittest.TestCase):
         manager.shutdown()
 
 
+class TestResilientTranslationManagerHedging(unittest.TestCase):
+    """对冲请求模式测试"""
+    
+    def _make_service(self, name, delay, translated_text="你好", error_message=None):
+        """创建指定延迟的模拟服务"""
+        service = Mock()
+        service.get_service_name.return_value = name
+        
+        def translate_text(text, source_lang='en', target_lang='zh'):
+            time.sleep(delay)
+            return TranslationResult(
+                original_text=text,
+                translated_text=translated_text,
+                source_language=source_lang,
+                target_language=target_lang,
+                service_name=name,
+                confidence_score=0.9,
+                timestamp=None,
+                error_message=error_message
+            )
+        
+        service.translate_text.side_effect = translate_text
+        return service
+    
+    def _make_manager(self, services, **config):
+        """创建启用对冲模式的管理器"""
+        config.setdefault('hedging_enabled', True)
+        config.setdefault('hedge_initial_delay', 0.05)
+        with patch.object(ResilientTranslationManager, '_initialize_services', return_value=services):
+            manager = ResilientTranslationManager(config)
+        self.addCleanup(manager.shutdown)
+        return manager
+    
+    def test_slow_primary_is_hedged(self):
+        """测试主服务超过阈值时由备用服务返回结果"""
+        slow = self._make_service("slow_service", 1.0, "慢")
+        fast = self._make_service("fast_service", 0.01, "快")
+        manager = self._make_manager([slow, fast])
+        
+        start_time = time.time()
+        result = manager.translate_with_fallback("Hello")
+        
+        self.assertLess(time.time() - start_time, 0.5)
+        self.assertTrue(result['success'])
+        self.assertEqual(result['service_used'], 'fast_service')
+        self.assertEqual(manager.translation_stats['hedged_requests'], 1)
+        self.assertEqual(manager.translation_stats['hedge_wins'], 1)
+        cancelled = [a for a in result['attempts'] if a.service_name == 'slow_service']
+        self.assertFalse(cancelled[0].success)
+    
+    def test_fast_primary_not_hedged(self):
+        """测试主服务在阈值内返回时不发起对冲"""
+        primary = self._make_service("primary", 0.0)
+        backup = self._make_service("backup", 0.0)
+        manager = self._make_manager([primary, backup], hedge_initial_delay=1.0)
+        
+        result = manager.translate_with_fallback("Hello")
+        
+        self.assertEqual(result['service_used'], 'primary')
+        backup.translate_text.assert_not_called()
+        self.assertEqual(manager.translation_stats['hedged_requests'], 0)
+    
+    def test_failed_primary_falls_through_immediately(self):
+        """测试主服务失败后立即请求下一个服务"""
+        broken = self._make_service("broken", 0.0, "", error_message="quota exceeded")
+        backup = self._make_service("backup", 0.0)
+        manager = self._make_manager([broken, backup], hedge_initial_delay=5.0, hedge_max_retries=0)
+        
+        start_time = time.time()
+        result = manager.translate_with_fallback("Hello")
+        
+        self.assertLess(time.time() - start_time, 1.0)
+        self.assertEqual(result['service_used'], 'backup')
+    
+    def test_hedge_delay_uses_latency_percentile(self):
+        """测试对冲阈值取延迟分位数"""
+        manager = self._make_manager([], hedge_min_samples=5, hedge_percentile=0.9, hedge_min_delay=0.0)
+        for latency in [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]:
+            manager._record_latency("service", latency)
+        
+        self.assertAlmostEqual(manager._get_hedge_delay("service"), 0.9)
+        self.assertEqual(manager._get_hedge_delay("unknown"), 0.05)
+    
+    def test_half_open_permits_not_leaked(self):
+        """测试未发起和被取消的对冲请求不会让熔断器卡在半开状态"""
+        slow = self._make_service("slow_service", 0.5, "慢")
+        fast = self._make_service("fast_service", 0.01, "快")
+        spare = self._make_service("spare_service", 0.0)
+        manager = self._make_manager([slow, fast, spare], hedge_max_retries=0,
+                                     circuit_failure_threshold=1, circuit_recovery_timeout=0.01)
+        for name in ("slow_service", "spare_service"):
+            manager.circuit_breakers.record_failure(name, "down")
+        time.sleep(0.02)
+        
+        result = manager.translate_with_fallback("Hello")
+        self.assertEqual(result['service_used'], 'fast_service')
+        spare.translate_text.assert_not_called()
+        
+        # 被取消的慢服务和未发起的备用服务都应归还半开试探名额
+        for name in ("slow_service", "spare_service"):
+            breaker = manager.circuit_breakers.get(name)
+            self.assertEqual(breaker.state, CircuitState.HALF_OPEN)
+            self.assertTrue(breaker.allow_request())
+    
+    def test_losing_requests_do_not_block_later_calls(self):
+        """测试仍在运行的落败请求不占用后续调用的并发名额"""
+        slow = self._make_service("slow_service", 1.0, "慢")
+        fast = self._make_service("fast_service", 0.01, "快")
+        manager = self._make_manager([slow, fast], hedge_max_retries=0)
+        
+        start_time = time.time()
+        for _ in range(3):
+            result = manager.translate_with_fallback("Hello")
+            self.assertEqual(result['service_used'], 'fast_service')
+        
+        # 共享且容量有限的线程池会让后续调用排在落败的慢请求之后
+        self.assertLess(time.time() - start_time, 0.8)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
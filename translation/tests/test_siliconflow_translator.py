@@ -60,7 +60,7 @@ class TestSiliconFlowTranslator(unittest.TestCase):
         self.assertIn("en", info["languages"])
         self.assertIn("zh", info["languages"])
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_translate_text_success(self, mock_urlopen):
         """测试成功翻译文本"""
         # 模拟API响应
@@ -90,7 +90,7 @@ class TestSiliconFlowTranslator(unittest.TestCase):
         self.assertIsNone(result.error_message)
         self.assertIsInstance(result.timestamp, datetime)
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_translate_text_with_prefix_cleanup(self, mock_urlopen):
         """测试翻译结果前缀清理"""
         # 模拟带前缀的API响应
@@ -108,7 +108,7 @@ class TestSiliconFlowTranslator(unittest.TestCase):
         
         self.assertEqual(result.translated_text, "你好世界")  # 前缀应该被清理
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_translate_text_api_error(self, mock_urlopen):
         """测试API错误处理"""
         # 模拟API错误响应
@@ -138,7 +138,7 @@ class TestSiliconFlowTranslator(unittest.TestCase):
         self.assertEqual(result.confidence_score, 0.0)
         self.assertEqual(result.error_message, "输入文本为空")
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_batch_translate_combined_success(self, mock_urlopen):
         """测试成功的组合批量翻译"""
         # 模拟批量翻译API响应
@@ -158,7 +158,7 @@ class TestSiliconFlowTranslator(unittest.TestCase):
         self.assertEqual(results[0].translated_text, "你好")
         self.assertEqual(results[1].translated_text, "世界")
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_batch_translate_fallback(self, mock_urlopen):
         """测试批量翻译回退到单个翻译"""
         # 第一次调用（批量翻译）失败，后续调用（单个翻译）成功
@@ -202,7 +202,7 @@ class TestSiliconFlowTranslator(unittest.TestCase):
         results = self.translator.translate_batch([], "en", "zh")
         self.assertEqual(len(results), 0)
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_get_service_status_healthy(self, mock_urlopen):
         """测试健康服务状态"""
         # 模拟成功响应
@@ -219,7 +219,7 @@ class TestSiliconFlowTranslator(unittest.TestCase):
         status = self.translator.get_service_status()
         self.assertEqual(status, ServiceStatus.HEALTHY)
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_get_service_status_degraded(self, mock_urlopen):
         """测试降级服务状态"""
         # 模拟限流错误
@@ -235,7 +235,7 @@ class TestSiliconFlowTranslator(unittest.TestCase):
         status = self.translator.get_service_status()
         self.assertEqual(status, ServiceStatus.DEGRADED)
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_get_service_status_unavailable(self, mock_urlopen):
         """测试不可用服务状态"""
         # 模拟认证失败
@@ -251,7 +251,7 @@ class TestSiliconFlowTranslator(unittest.TestCase):
         status = self.translator.get_service_status()
         self.assertEqual(status, ServiceStatus.UNAVAILABLE)
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_check_health(self, mock_urlopen):
         """测试健康检查功能"""
         # 模拟成功响应
@@ -46,7 +46,7 @@ class TestTencentTranslator(unittest.TestCase):
         self.assertIsInstance(signing_key, bytes)
         self.assertEqual(len(signing_key), 32)
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_translate_text_success(self, mock_urlopen):
         """测试成功翻译文本"""
         # 模拟API响应
@@ -72,7 +72,7 @@ class TestTencentTranslator(unittest.TestCase):
         self.assertIsNone(result.error_message)
         self.assertIsInstance(result.timestamp, datetime)
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_translate_text_api_error(self, mock_urlopen):
         """测试API错误处理"""
         # 模拟API错误响应
@@ -104,7 +104,7 @@ class TestTencentTranslator(unittest.TestCase):
         self.assertEqual(result.confidence_score, 0.0)
         self.assertEqual(result.error_message, "输入文本为空")
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_translate_batch_success(self, mock_urlopen):
         """测试成功批量翻译"""
         # 模拟批量翻译API响应
@@ -127,7 +127,7 @@ class TestTencentTranslator(unittest.TestCase):
         self.assertEqual(results[0].service_name, "tencent_translate")
         self.assertEqual(results[1].service_name, "tencent_translate")
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_translate_batch_fallback(self, mock_urlopen):
         """测试批量翻译回退到单个翻译"""
         # 模拟批量翻译失败，然后单个翻译成功
@@ -174,7 +174,7 @@ class TestTencentTranslator(unittest.TestCase):
         results = self.translator.translate_batch([], "en", "zh")
         self.assertEqual(len(results), 0)
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_get_service_status_healthy(self, mock_urlopen):
         """测试健康服务状态"""
         # 模拟成功响应
@@ -191,7 +191,7 @@ class TestTencentTranslator(unittest.TestCase):
         status = self.translator.get_service_status()
         self.assertEqual(status, ServiceStatus.HEALTHY)
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_get_service_status_degraded(self, mock_urlopen):
         """测试降级服务状态"""
         # 模拟限流错误
@@ -209,7 +209,7 @@ class TestTencentTranslator(unittest.TestCase):
         status = self.translator.get_service_status()
         self.assertEqual(status, ServiceStatus.DEGRADED)
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_get_service_status_unavailable(self, mock_urlopen):
         """测试不可用服务状态"""
         # 模拟网络异常
@@ -218,7 +218,7 @@ class TestTencentTranslator(unittest.TestCase):
         status = self.translator.get_service_status()
         self.assertEqual(status, ServiceStatus.UNAVAILABLE)
     
-    @patch('urllib.request.urlopen')
+    @patch('translation.core.http_transport.urlopen')
     def test_check_health(self, mock_urlopen):
         """测试健康检查功能"""
         # 模拟成功响应
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+术语替换引擎测试
+"""
+
+import unittest
+
+from ..core.terminology import TermDictionary, TerminologyEngine
+from ..services.rule_based_translator import RuleBasedTranslator
+
+
+class TestTerminologyEngine(unittest.TestCase):
+    """术语替换引擎测试"""
+
+    def test_longest_match_single_pass(self):
+        """测试最长匹配、整词匹配以及译文不会被再次替换"""
+        engine = TerminologyEngine({
+            'GPT': 'GPT',
+            'GPT-4': 'GPT-4',
+            'Google': '谷歌',
+            'Google Drive': 'Google Drive',
+            'AI': '人工智能',
+        })
+
+        self.assertEqual(engine.replace('google drive and Google use gpt-4 AI'),
+                         'Google Drive and 谷歌 use GPT-4 人工智能')
+        self.assertEqual(engine.replace('GPT-4o AIs'), 'GPT-4o AIs')  # 不是完整的词时回溯到较短的术语
+        self.assertEqual(engine.replace(''), '')
+        self.assertEqual(engine.translate_term('google'), '谷歌')
+
+    def test_dictionary_priority(self):
+        """测试多个词典按顺序优先"""
+        engine = TerminologyEngine({'market': '市场'}, {'Market': '行情', 'stock': '股票'})
+        self.assertEqual(engine.replace('stock market'), '股票 市场')
+        self.assertEqual(len(engine), 2)
+        self.assertEqual(TerminologyEngine({}).replace('text'), 'text')
+
+    def test_change_detection(self):
+        """测试词典修改后需要重新编译"""
+        terms = TermDictionary({'cloud': '云'})
+        plain = {'edge': '边缘'}
+        engine = TerminologyEngine(terms, plain)
+        self.assertTrue(engine.is_current(terms, plain))
+
+        terms['cloud computing'] = '云计算'
+        self.assertFalse(engine.is_current(terms, plain))
+
+        engine = TerminologyEngine(terms, plain)
+        plain['edge'] = '边缘计算'
+        self.assertFalse(engine.is_current(terms, plain))
+        self.assertFalse(engine.is_current(TermDictionary(terms), plain))
+
+    def test_rule_translator_recompiles_custom_terms(self):
+        """测试规则翻译器添加术语后立即生效"""
+        translator = RuleBasedTranslator()
+        self.assertEqual(translator._translate_english_to_chinese('vector database'), 'vector database')
+
+        translator.add_custom_term('Vector Database', '向量数据库')
+        self.assertEqual(translator._translate_english_to_chinese('New vector database'), '新的 向量数据库')
+
+
+if __name__ == '__main__':
+    unittest.main()